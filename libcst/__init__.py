@@ -6,8 +6,10 @@
 from libcst._batched_visitor import BatchableCSTVisitor, visit_batched
 from libcst._exceptions import MetadataException, ParserSyntaxError
 from libcst._flatten_sentinel import FlattenSentinel
+from libcst._iterative_visitor import visit_iterative
 from libcst._maybe_sentinel import MaybeSentinel
 from libcst._metadata_dependent import MetadataDependent
+from libcst._nodes import _node_methods  # noqa: F401
 from libcst._nodes.base import CSTNode, CSTValidationError
 from libcst._nodes.expression import (
     Annotation,
@@ -209,11 +211,20 @@ from libcst._nodes.whitespace import (
     SimpleWhitespace,
     TrailingWhitespace,
 )
-from libcst._parser.entrypoints import parse_expression, parse_module, parse_statement
+from libcst._parser.cache import ParseCache
+from libcst._parser.entrypoints import (
+    parse_expression,
+    parse_file,
+    parse_module,
+    parse_modules,
+    parse_statement,
+)
+from libcst._parser.incremental import incremental_parse, TextEdit
 from libcst._parser.types.config import (
     KNOWN_PYTHON_VERSION_STRINGS,
     PartialParserConfig,
 )
+from libcst._pipelined_transformer import visit_pipelined
 from libcst._removal_sentinel import RemovalSentinel, RemoveFromParent
 from libcst._visitors import CSTNodeT, CSTTransformer, CSTVisitor, CSTVisitorT
 
@@ -243,13 +254,20 @@ __all__ = [
     "FlattenSentinel",
     "MaybeSentinel",
     "MetadataException",
+    "ParseCache",
     "ParserSyntaxError",
     "PartialParserConfig",
     "RemoveFromParent",
     "RemovalSentinel",
+    "TextEdit",
     "ensure_type",  # from libcst import ensure_type is deprecated, will be removed in 0.4.0
     "visit_batched",
+    "visit_iterative",
+    "visit_pipelined",
     "parse_module",
+    "parse_modules",
+    "parse_file",
+    "incremental_parse",
     "parse_expression",
     "parse_statement",
     "CSTNode",
@@ -7,11 +7,15 @@ import inspect
 from typing import (
     Callable,
     cast,
+    Dict,
     Iterable,
     List,
     Mapping,
     MutableMapping,
     Optional,
+    Sequence,
+    Tuple,
+    Type,
     TYPE_CHECKING,
 )
 
@@ -23,7 +27,8 @@ if TYPE_CHECKING:
     from libcst._nodes.base import CSTNode  # noqa: F401
 
 VisitorMethod = Callable[["CSTNode"], None]
-_VisitorMethodCollection = Mapping[str, List[VisitorMethod]]
+_VisitorMethodCollection = Mapping[str, List[Tuple[int, VisitorMethod]]]
+_AttributeMethods = Mapping[str, Sequence[Tuple[int, VisitorMethod]]]
 
 
 class BatchableCSTVisitor(CSTTypedVisitorFunctions, MetadataDependent):
@@ -92,18 +97,68 @@ def _get_visitor_methods(
     """
     Gather all ``visit_<Type[CSTNode]>``, ``visit_<Type[CSTNode]>_<attribute>``,
     ``leave_<Type[CSTNode]>`` amd `leave_<Type[CSTNode]>_<attribute>`` methods
-    from ``batchabled_visitors``.
+    from ``batchabled_visitors``, along with the index of the visitor each one
+    belongs to.
     """
-    visitor_methods: MutableMapping[str, List[VisitorMethod]] = {}
-    for bv in batchable_visitors:
+    visitor_methods: MutableMapping[str, List[Tuple[int, VisitorMethod]]] = {}
+    for index, bv in enumerate(batchable_visitors):
         for name, fn in bv.get_visitors().items():
-            visitor_methods.setdefault(name, []).append(fn)
+            visitor_methods.setdefault(name, []).append((index, fn))
     return visitor_methods
 
 
+class _MethodsByType(Dict[Type["CSTNode"], Sequence[Tuple[int, VisitorMethod]]]):
+    """
+    Caches the batched methods called for each node type, so that the method names
+    are only formatted once per node type instead of once per node.
+    """
+
+    def __init__(self, visitor_methods: _VisitorMethodCollection, prefix: str) -> None:
+        super().__init__()
+        self.visitor_methods = visitor_methods
+        self.prefix = prefix
+
+    def __missing__(
+        self, node_type: Type["CSTNode"]
+    ) -> Sequence[Tuple[int, VisitorMethod]]:
+        methods = tuple(
+            self.visitor_methods.get(f"{self.prefix}{node_type.__name__}", ())
+        )
+        self[node_type] = methods
+        return methods
+
+
+class _AttributeMethodsByType(Dict[Type["CSTNode"], _AttributeMethods]):
+    """
+    Caches the batched attribute methods called for each node type, keyed by the
+    attribute name.
+    """
+
+    def __init__(self, visitor_methods: _VisitorMethodCollection, prefix: str) -> None:
+        super().__init__()
+        self.visitor_methods = visitor_methods
+        self.prefix = prefix
+
+    def __missing__(self, node_type: Type["CSTNode"]) -> _AttributeMethods:
+        name_prefix = f"{self.prefix}{node_type.__name__}_"
+        methods = {
+            name[len(name_prefix) :]: tuple(fns)
+            for name, fns in self.visitor_methods.items()
+            if name.startswith(name_prefix)
+        }
+        self[node_type] = methods
+        return methods
+
+
 class _BatchedCSTVisitor(CSTVisitor):
     """
     Internal visitor class to perform batched traversal over a tree.
+
+    Like a regular :class:`~libcst.CSTVisitor`, a batched visitor can return
+    ``False`` from a ``visit_<Type[CSTNode]>`` method to skip that node's children.
+    Its other methods aren't called until we leave that node again, and the batched
+    traversal only descends into a subtree while at least one visitor (or the
+    ``before_visit`` and ``after_leave`` hooks) still needs it.
     """
 
     visitor_methods: _VisitorMethodCollection
@@ -121,6 +176,27 @@ class _BatchedCSTVisitor(CSTVisitor):
         self.visitor_methods = visitor_methods
         self.before_visit = before_visit
         self.after_leave = after_leave
+        self._visit_methods = _MethodsByType(visitor_methods, "visit_")
+        self._leave_methods = _MethodsByType(visitor_methods, "leave_")
+        self._visit_attribute_methods = _AttributeMethodsByType(
+            visitor_methods, "visit_"
+        )
+        self._leave_attribute_methods = _AttributeMethodsByType(
+            visitor_methods, "leave_"
+        )
+        # Only visitors that define methods can be interested in a subtree.
+        self._interested = len(
+            {index for methods in visitor_methods.values() for index, _ in methods}
+        )
+        self._always_descend = before_visit is not None or after_leave is not None
+        # Maps the index of each visitor skipping a subtree to the root of that
+        # subtree.
+        self._skipping: Dict[int, "CSTNode"] = {}
+        # Skip the attribute callbacks entirely if no visitor defines any.
+        # pyre-ignore[16]: Overrides the class-level default for this instance.
+        self._has_attribute_hooks = any(
+            name.count("_") >= 2 for name in visitor_methods
+        )
 
     def on_visit(self, node: "CSTNode") -> bool:
         """
@@ -129,18 +205,28 @@ class _BatchedCSTVisitor(CSTVisitor):
         before_visit = self.before_visit
         if before_visit is not None:
             before_visit(node)
-        type_name = type(node).__name__
-        for v in self.visitor_methods.get(f"visit_{type_name}", []):
-            v(node)
-        return True
+        skipping = self._skipping
+        for index, v in self._visit_methods[type(node)]:
+            if index not in skipping and v(node) is False:
+                skipping[index] = node
+                self._interested -= 1
+        return self._interested > 0 or self._always_descend
 
     def on_leave(self, original_node: "CSTNode") -> None:
         """
         Call appropriate leave methods on node after visiting children.
         """
-        type_name = type(original_node).__name__
-        for v in self.visitor_methods.get(f"leave_{type_name}", []):
-            v(original_node)
+        skipping = self._skipping
+        if skipping:
+            for index, v in self._leave_methods[type(original_node)]:
+                if skipping.get(index, original_node) is original_node:
+                    v(original_node)
+            for index in [i for i, n in skipping.items() if n is original_node]:
+                del skipping[index]
+                self._interested += 1
+        else:
+            for _, v in self._leave_methods[type(original_node)]:
+                v(original_node)
         after_leave = self.after_leave
         if after_leave is not None:
             after_leave(original_node)
@@ -150,15 +236,19 @@ class _BatchedCSTVisitor(CSTVisitor):
         Call appropriate visit attribute methods on node before visiting
         attribute's children.
         """
-        type_name = type(node).__name__
-        for v in self.visitor_methods.get(f"visit_{type_name}_{attribute}", []):
-            v(node)
+        skipping = self._skipping
+        for index, v in self._visit_attribute_methods[type(node)].get(attribute, ()):
+            if index not in skipping:
+                v(node)
 
     def on_leave_attribute(self, original_node: "CSTNode", attribute: str) -> None:
         """
         Call appropriate leave attribute methods on node after visiting
         attribute's children.
         """
-        type_name = type(original_node).__name__
-        for v in self.visitor_methods.get(f"leave_{type_name}_{attribute}", []):
-            v(original_node)
+        skipping = self._skipping
+        for index, v in self._leave_attribute_methods[type(original_node)].get(
+            attribute, ()
+        ):
+            if index not in skipping:
+                v(original_node)
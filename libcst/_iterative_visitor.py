@@ -0,0 +1,204 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from dataclasses import dataclass, field
+from typing import cast, Iterator, List, Optional, Sequence, Union
+
+from libcst._add_slots import add_slots
+from libcst._flatten_sentinel import FlattenSentinel
+from libcst._nodes.base import CSTNode
+from libcst._nodes.module import Module
+from libcst._removal_sentinel import RemovalSentinel
+from libcst._types import CSTNodeT
+from libcst._visitors import CSTTransformer, CSTVisitor, CSTVisitorT
+
+_LeaveResult = Union[CSTNode, RemovalSentinel, FlattenSentinel[CSTNode]]
+
+
+@add_slots
+@dataclass(frozen=True)
+class _AttributeEvent:
+    node: CSTNode
+    attribute: str
+    leave: bool
+
+
+_Event = Union[CSTNode, _AttributeEvent]
+
+
+@add_slots
+@dataclass(frozen=False)
+class _Frame:
+    # The node whose children we're visiting.
+    node: CSTNode
+    # Its immediate children, interleaved with the attribute callbacks around them.
+    events: Sequence[_Event]
+    # The index of the next event to process.
+    index: int = 0
+    # What the transformer returned for each of the children visited so far.
+    results: List[_LeaveResult] = field(default_factory=list)
+    # Whether any of those results differs from the child it was returned for.
+    changed: bool = False
+
+
+class _ChildRecorder(CSTVisitor):
+    """
+    Records the immediate children of a node, along with the attribute callbacks
+    that a recursive traversal would make around them, without descending any
+    further.
+    """
+
+    def __init__(self, attribute_hooks: bool) -> None:
+        self.events: List[_Event] = []
+        self._has_attribute_hooks = attribute_hooks
+
+    def record(self, node: CSTNode) -> Sequence[_Event]:
+        self.events = events = []
+        node._visit_children(self)
+        return events
+
+    def on_visit(self, node: CSTNode) -> bool:
+        self.events.append(node)
+        return False
+
+    def on_leave(self, original_node: CSTNode) -> None:
+        pass
+
+    def on_visit_attribute(self, node: CSTNode, attribute: str) -> None:
+        self.events.append(_AttributeEvent(node, attribute, False))
+
+    def on_leave_attribute(self, original_node: CSTNode, attribute: str) -> None:
+        self.events.append(_AttributeEvent(original_node, attribute, True))
+
+
+class _ChildReplacer(CSTTransformer):
+    """
+    Rebuilds a node from results that were already computed for each of its
+    immediate children, in the order they're visited.
+    """
+
+    def __init__(self, results: Sequence[_LeaveResult]) -> None:
+        self.results: Iterator[_LeaveResult] = iter(results)
+
+    def on_visit(self, node: CSTNode) -> bool:
+        return False
+
+    def on_leave(self, original_node: CSTNode, updated_node: CSTNode) -> _LeaveResult:
+        return next(self.results)
+
+
+def _attribute_callback(visitor: CSTVisitorT, event: _AttributeEvent) -> None:
+    if event.leave:
+        visitor.on_leave_attribute(event.node, event.attribute)
+    else:
+        visitor.on_visit_attribute(event.node, event.attribute)
+
+
+def _next_child(visitor: CSTVisitorT, frame: _Frame) -> Optional[CSTNode]:
+    """
+    Makes the attribute callbacks up to the next child of ``frame.node``, and
+    returns that child, or None once every child was visited.
+    """
+    events = frame.events
+    while frame.index < len(events):
+        event = events[frame.index]
+        frame.index += 1
+        if isinstance(event, _AttributeEvent):
+            _attribute_callback(visitor, event)
+        else:
+            return event
+    return None
+
+
+def _walk(node: CSTNode, visitor: CSTVisitor) -> None:
+    recorder = _ChildRecorder(visitor._has_attribute_hooks)
+    stack: List[_Frame] = []
+    child: Optional[CSTNode] = node
+    while True:
+        if child is not None:
+            if visitor.on_visit(child):
+                stack.append(_Frame(child, recorder.record(child)))
+            else:
+                visitor.on_leave(child)
+        elif stack:
+            visitor.on_leave(stack.pop().node)
+        else:
+            return
+        child = _next_child(visitor, stack[-1]) if stack else None
+
+
+def _leave(
+    visitor: CSTTransformer, original_node: CSTNode, updated_node: CSTNode
+) -> _LeaveResult:
+    leave_result = visitor.on_leave(original_node, updated_node)
+    # Same as the validation in `CSTNode.visit`.
+    if not isinstance(leave_result, (CSTNode, RemovalSentinel, FlattenSentinel)):
+        raise Exception(
+            "Expected a node of type CSTNode or a RemovalSentinel, "
+            + f"but got a return value of {type(leave_result).__name__}"
+        )
+    return leave_result
+
+
+def _transform(node: CSTNode, visitor: CSTTransformer) -> _LeaveResult:
+    recorder = _ChildRecorder(visitor._has_attribute_hooks)
+    stack: List[_Frame] = []
+    child: Optional[CSTNode] = node
+    while True:
+        if child is not None:
+            if visitor.on_visit(child):
+                stack.append(_Frame(child, recorder.record(child)))
+                child = _next_child(visitor, stack[-1])
+                continue
+            result = _leave(visitor, child, child)
+        else:
+            frame = stack.pop()
+            updated_node = frame.node
+            if frame.changed:
+                # Let the node rebuild itself exactly like it would in a recursive
+                # traversal, including how it handles removed children. Nodes are
+                # rebuilt with `_with_updated_children`, so when no child changed,
+                # the rebuilt node would be the node itself.
+                updated_node = updated_node._visit_and_replace_children(
+                    _ChildReplacer(frame.results)
+                )
+            result = _leave(visitor, frame.node, updated_node)
+        if not stack:
+            return result
+        frame = stack[-1]
+        frame.results.append(result)
+        if result is not frame.events[frame.index - 1]:
+            frame.changed = True
+        child = _next_child(visitor, frame)
+
+
+def visit_iterative(
+    node: CSTNodeT, visitor: CSTVisitorT
+) -> Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]]:
+    """
+    Visits ``node`` with ``visitor`` like :func:`~libcst.CSTNode.visit`, but keeps
+    track of the nodes being visited on an explicit stack instead of recursing
+    once per level of the tree. Use this for extremely deeply nested trees (such
+    as generated code with thousands of chained operators) that would otherwise
+    exceed the interpreter's recursion limit.
+
+    Works with both :class:`~libcst.CSTVisitor` and
+    :class:`~libcst.CSTTransformer`, and makes the same callbacks with the same
+    arguments, in the same order, as :func:`~libcst.CSTNode.visit`. The one
+    difference is that if a transformer removes a child that its parent requires,
+    the resulting error is raised once the parent's remaining children were
+    visited, instead of right away.
+
+    For trees of ordinary depth, :func:`~libcst.CSTNode.visit` is at least as
+    fast.
+    """
+    if isinstance(visitor, CSTVisitor):
+        _walk(node, visitor)
+        return node
+    result = _transform(node, visitor)
+    if isinstance(node, Module):
+        # Handle the result like `Module.visit` does.
+        result = node._visit_result(cast(Union[CSTNode, RemovalSentinel], result))
+    return cast(Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]], result)
@@ -0,0 +1,7157 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+
+# This file was generated by libcst.codegen.gen_node_methods
+"""
+Implementations of `children`, `deep_clone` and `with_changes` for every node
+class, specialized to its fields so that they don't need to inspect them at
+runtime.
+"""
+from typing import Any, List as TypingList, Sequence
+
+from libcst._maybe_sentinel import MaybeSentinel
+from libcst._nodes.base import (
+    _clone_field,
+    _install_generated_methods,
+    _UNCHANGED,
+    CSTNode,
+)
+from libcst._nodes.expression import (
+    Annotation,
+    Arg,
+    Asynchronous,
+    Attribute,
+    Await,
+    BinaryOperation,
+    BooleanOperation,
+    Call,
+    Comparison,
+    ComparisonTarget,
+    CompFor,
+    CompIf,
+    ConcatenatedString,
+    Dict,
+    DictComp,
+    DictElement,
+    Element,
+    Ellipsis,
+    Float,
+    FormattedString,
+    FormattedStringExpression,
+    FormattedStringText,
+    From,
+    GeneratorExp,
+    IfExp,
+    Imaginary,
+    Index,
+    Integer,
+    Lambda,
+    LeftCurlyBrace,
+    LeftParen,
+    LeftSquareBracket,
+    List,
+    ListComp,
+    Name,
+    NamedExpr,
+    Param,
+    Parameters,
+    ParamSlash,
+    ParamStar,
+    RightCurlyBrace,
+    RightParen,
+    RightSquareBracket,
+    Set,
+    SetComp,
+    SimpleString,
+    Slice,
+    StarredDictElement,
+    StarredElement,
+    Subscript,
+    SubscriptElement,
+    Tuple,
+    UnaryOperation,
+    Yield,
+)
+from libcst._nodes.module import Module
+from libcst._nodes.op import (
+    Add,
+    AddAssign,
+    And,
+    AssignEqual,
+    BitAnd,
+    BitAndAssign,
+    BitInvert,
+    BitOr,
+    BitOrAssign,
+    BitXor,
+    BitXorAssign,
+    Colon,
+    Comma,
+    Divide,
+    DivideAssign,
+    Dot,
+    Equal,
+    FloorDivide,
+    FloorDivideAssign,
+    GreaterThan,
+    GreaterThanEqual,
+    ImportStar,
+    In,
+    Is,
+    IsNot,
+    LeftShift,
+    LeftShiftAssign,
+    LessThan,
+    LessThanEqual,
+    MatrixMultiply,
+    MatrixMultiplyAssign,
+    Minus,
+    Modulo,
+    ModuloAssign,
+    Multiply,
+    MultiplyAssign,
+    Not,
+    NotEqual,
+    NotIn,
+    Or,
+    Plus,
+    Power,
+    PowerAssign,
+    RightShift,
+    RightShiftAssign,
+    Semicolon,
+    Subtract,
+    SubtractAssign,
+)
+from libcst._nodes.statement import (
+    AnnAssign,
+    AsName,
+    Assert,
+    Assign,
+    AssignTarget,
+    AugAssign,
+    Break,
+    ClassDef,
+    Continue,
+    Decorator,
+    Del,
+    Else,
+    ExceptHandler,
+    ExceptStarHandler,
+    Expr,
+    Finally,
+    For,
+    FunctionDef,
+    Global,
+    If,
+    Import,
+    ImportAlias,
+    ImportFrom,
+    IndentedBlock,
+    Match,
+    MatchAs,
+    MatchCase,
+    MatchClass,
+    MatchKeywordElement,
+    MatchList,
+    MatchMapping,
+    MatchMappingElement,
+    MatchOr,
+    MatchOrElement,
+    MatchSequenceElement,
+    MatchSingleton,
+    MatchStar,
+    MatchTuple,
+    MatchValue,
+    NameItem,
+    Nonlocal,
+    ParamSpec,
+    Pass,
+    Raise,
+    Return,
+    SimpleStatementLine,
+    SimpleStatementSuite,
+    Try,
+    TryStar,
+    TypeAlias,
+    TypeParam,
+    TypeParameters,
+    TypeVar,
+    TypeVarTuple,
+    While,
+    With,
+    WithItem,
+)
+from libcst._nodes.whitespace import (
+    Comment,
+    EmptyLine,
+    Newline,
+    ParenthesizedWhitespace,
+    SimpleWhitespace,
+    TrailingWhitespace,
+)
+
+
+def _Add_children(self: Add) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Add_deep_clone(self: Add) -> Add:
+    return Add(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Add_with_changes(
+    self: Add,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Add:
+    return Add(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _AddAssign_children(self: AddAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _AddAssign_deep_clone(self: AddAssign) -> AddAssign:
+    return AddAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _AddAssign_with_changes(
+    self: AddAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> AddAssign:
+    return AddAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _And_children(self: And) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _And_deep_clone(self: And) -> And:
+    return And(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _And_with_changes(
+    self: And,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> And:
+    return And(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _AnnAssign_children(self: AnnAssign) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.target, self.annotation]
+    if not isinstance(self.equal, MaybeSentinel):
+        children.append(self.equal)
+    if self.value is not None:
+        children.append(self.value)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _AnnAssign_deep_clone(self: AnnAssign) -> AnnAssign:
+    return AnnAssign(
+        target=self.target.deep_clone(),
+        annotation=self.annotation.deep_clone(),
+        value=None if self.value is None else self.value.deep_clone(),
+        equal=self.equal
+        if isinstance(self.equal, MaybeSentinel)
+        else self.equal.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _AnnAssign_with_changes(
+    self: AnnAssign,
+    *,
+    target: Any = _UNCHANGED,
+    annotation: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    equal: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> AnnAssign:
+    return AnnAssign(
+        target=self.target if target is _UNCHANGED else target,
+        annotation=self.annotation if annotation is _UNCHANGED else annotation,
+        value=self.value if value is _UNCHANGED else value,
+        equal=self.equal if equal is _UNCHANGED else equal,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Annotation_children(self: Annotation) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.whitespace_before_indicator, MaybeSentinel):
+        children.append(self.whitespace_before_indicator)
+    children += [self.whitespace_after_indicator, self.annotation]
+    return children
+
+
+def _Annotation_deep_clone(self: Annotation) -> Annotation:
+    return Annotation(
+        annotation=self.annotation.deep_clone(),
+        whitespace_before_indicator=self.whitespace_before_indicator
+        if isinstance(self.whitespace_before_indicator, MaybeSentinel)
+        else self.whitespace_before_indicator.deep_clone(),
+        whitespace_after_indicator=self.whitespace_after_indicator.deep_clone(),
+    )
+
+
+def _Annotation_with_changes(
+    self: Annotation,
+    *,
+    annotation: Any = _UNCHANGED,
+    whitespace_before_indicator: Any = _UNCHANGED,
+    whitespace_after_indicator: Any = _UNCHANGED,
+) -> Annotation:
+    return Annotation(
+        annotation=self.annotation if annotation is _UNCHANGED else annotation,
+        whitespace_before_indicator=self.whitespace_before_indicator
+        if whitespace_before_indicator is _UNCHANGED
+        else whitespace_before_indicator,
+        whitespace_after_indicator=self.whitespace_after_indicator
+        if whitespace_after_indicator is _UNCHANGED
+        else whitespace_after_indicator,
+    )
+
+
+def _Arg_children(self: Arg) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.whitespace_after_star)
+    if self.keyword is not None:
+        children.append(self.keyword)
+    if not isinstance(self.equal, MaybeSentinel):
+        children.append(self.equal)
+    children.append(self.value)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    children.append(self.whitespace_after_arg)
+    return children
+
+
+def _Arg_deep_clone(self: Arg) -> Arg:
+    return Arg(
+        value=self.value.deep_clone(),
+        keyword=None if self.keyword is None else self.keyword.deep_clone(),
+        equal=self.equal
+        if isinstance(self.equal, MaybeSentinel)
+        else self.equal.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        star=self.star,
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+        whitespace_after_arg=self.whitespace_after_arg.deep_clone(),
+    )
+
+
+def _Arg_with_changes(
+    self: Arg,
+    *,
+    value: Any = _UNCHANGED,
+    keyword: Any = _UNCHANGED,
+    equal: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    star: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+    whitespace_after_arg: Any = _UNCHANGED,
+) -> Arg:
+    return Arg(
+        value=self.value if value is _UNCHANGED else value,
+        keyword=self.keyword if keyword is _UNCHANGED else keyword,
+        equal=self.equal if equal is _UNCHANGED else equal,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        star=self.star if star is _UNCHANGED else star,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+        whitespace_after_arg=self.whitespace_after_arg
+        if whitespace_after_arg is _UNCHANGED
+        else whitespace_after_arg,
+    )
+
+
+def _AsName_children(self: AsName) -> Sequence[CSTNode]:
+    return [self.whitespace_before_as, self.name, self.whitespace_after_as]
+
+
+def _AsName_deep_clone(self: AsName) -> AsName:
+    return AsName(
+        name=self.name.deep_clone(),
+        whitespace_before_as=self.whitespace_before_as.deep_clone(),
+        whitespace_after_as=self.whitespace_after_as.deep_clone(),
+    )
+
+
+def _AsName_with_changes(
+    self: AsName,
+    *,
+    name: Any = _UNCHANGED,
+    whitespace_before_as: Any = _UNCHANGED,
+    whitespace_after_as: Any = _UNCHANGED,
+) -> AsName:
+    return AsName(
+        name=self.name if name is _UNCHANGED else name,
+        whitespace_before_as=self.whitespace_before_as
+        if whitespace_before_as is _UNCHANGED
+        else whitespace_before_as,
+        whitespace_after_as=self.whitespace_after_as
+        if whitespace_after_as is _UNCHANGED
+        else whitespace_after_as,
+    )
+
+
+def _Assert_children(self: Assert) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_assert, self.test]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    if self.msg is not None:
+        children.append(self.msg)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Assert_deep_clone(self: Assert) -> Assert:
+    return Assert(
+        test=self.test.deep_clone(),
+        msg=None if self.msg is None else self.msg.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_after_assert=self.whitespace_after_assert.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Assert_with_changes(
+    self: Assert,
+    *,
+    test: Any = _UNCHANGED,
+    msg: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_after_assert: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Assert:
+    return Assert(
+        test=self.test if test is _UNCHANGED else test,
+        msg=self.msg if msg is _UNCHANGED else msg,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_after_assert=self.whitespace_after_assert
+        if whitespace_after_assert is _UNCHANGED
+        else whitespace_after_assert,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Assign_children(self: Assign) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.targets, self.value]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Assign_deep_clone(self: Assign) -> Assign:
+    return Assign(
+        targets=tuple([child.deep_clone() for child in self.targets]),
+        value=self.value.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Assign_with_changes(
+    self: Assign,
+    *,
+    targets: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Assign:
+    return Assign(
+        targets=self.targets if targets is _UNCHANGED else targets,
+        value=self.value if value is _UNCHANGED else value,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _AssignEqual_children(self: AssignEqual) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _AssignEqual_deep_clone(self: AssignEqual) -> AssignEqual:
+    return AssignEqual(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _AssignEqual_with_changes(
+    self: AssignEqual,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> AssignEqual:
+    return AssignEqual(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _AssignTarget_children(self: AssignTarget) -> Sequence[CSTNode]:
+    return [self.target, self.whitespace_before_equal, self.whitespace_after_equal]
+
+
+def _AssignTarget_deep_clone(self: AssignTarget) -> AssignTarget:
+    return AssignTarget(
+        target=self.target.deep_clone(),
+        whitespace_before_equal=self.whitespace_before_equal.deep_clone(),
+        whitespace_after_equal=self.whitespace_after_equal.deep_clone(),
+    )
+
+
+def _AssignTarget_with_changes(
+    self: AssignTarget,
+    *,
+    target: Any = _UNCHANGED,
+    whitespace_before_equal: Any = _UNCHANGED,
+    whitespace_after_equal: Any = _UNCHANGED,
+) -> AssignTarget:
+    return AssignTarget(
+        target=self.target if target is _UNCHANGED else target,
+        whitespace_before_equal=self.whitespace_before_equal
+        if whitespace_before_equal is _UNCHANGED
+        else whitespace_before_equal,
+        whitespace_after_equal=self.whitespace_after_equal
+        if whitespace_after_equal is _UNCHANGED
+        else whitespace_after_equal,
+    )
+
+
+def _Asynchronous_children(self: Asynchronous) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _Asynchronous_deep_clone(self: Asynchronous) -> Asynchronous:
+    return Asynchronous(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Asynchronous_with_changes(
+    self: Asynchronous, *, whitespace_after: Any = _UNCHANGED
+) -> Asynchronous:
+    return Asynchronous(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Attribute_children(self: Attribute) -> Sequence[CSTNode]:
+    return [*self.lpar, self.value, self.dot, self.attr, *self.rpar]
+
+
+def _Attribute_deep_clone(self: Attribute) -> Attribute:
+    return Attribute(
+        value=self.value.deep_clone(),
+        attr=self.attr.deep_clone(),
+        dot=self.dot.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Attribute_with_changes(
+    self: Attribute,
+    *,
+    value: Any = _UNCHANGED,
+    attr: Any = _UNCHANGED,
+    dot: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Attribute:
+    return Attribute(
+        value=self.value if value is _UNCHANGED else value,
+        attr=self.attr if attr is _UNCHANGED else attr,
+        dot=self.dot if dot is _UNCHANGED else dot,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _AugAssign_children(self: AugAssign) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.target, self.operator, self.value]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _AugAssign_deep_clone(self: AugAssign) -> AugAssign:
+    return AugAssign(
+        target=self.target.deep_clone(),
+        operator=self.operator.deep_clone(),
+        value=self.value.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _AugAssign_with_changes(
+    self: AugAssign,
+    *,
+    target: Any = _UNCHANGED,
+    operator: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> AugAssign:
+    return AugAssign(
+        target=self.target if target is _UNCHANGED else target,
+        operator=self.operator if operator is _UNCHANGED else operator,
+        value=self.value if value is _UNCHANGED else value,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Await_children(self: Await) -> Sequence[CSTNode]:
+    return [*self.lpar, self.whitespace_after_await, self.expression, *self.rpar]
+
+
+def _Await_deep_clone(self: Await) -> Await:
+    return Await(
+        expression=self.expression.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_after_await=self.whitespace_after_await.deep_clone(),
+    )
+
+
+def _Await_with_changes(
+    self: Await,
+    *,
+    expression: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_await: Any = _UNCHANGED,
+) -> Await:
+    return Await(
+        expression=self.expression if expression is _UNCHANGED else expression,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_await=self.whitespace_after_await
+        if whitespace_after_await is _UNCHANGED
+        else whitespace_after_await,
+    )
+
+
+def _BinaryOperation_children(self: BinaryOperation) -> Sequence[CSTNode]:
+    return [*self.lpar, self.left, self.operator, self.right, *self.rpar]
+
+
+def _BinaryOperation_deep_clone(self: BinaryOperation) -> BinaryOperation:
+    return BinaryOperation(
+        left=self.left.deep_clone(),
+        operator=self.operator.deep_clone(),
+        right=self.right.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _BinaryOperation_with_changes(
+    self: BinaryOperation,
+    *,
+    left: Any = _UNCHANGED,
+    operator: Any = _UNCHANGED,
+    right: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> BinaryOperation:
+    return BinaryOperation(
+        left=self.left if left is _UNCHANGED else left,
+        operator=self.operator if operator is _UNCHANGED else operator,
+        right=self.right if right is _UNCHANGED else right,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _BitAnd_children(self: BitAnd) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitAnd_deep_clone(self: BitAnd) -> BitAnd:
+    return BitAnd(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitAnd_with_changes(
+    self: BitAnd,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitAnd:
+    return BitAnd(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitAndAssign_children(self: BitAndAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitAndAssign_deep_clone(self: BitAndAssign) -> BitAndAssign:
+    return BitAndAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitAndAssign_with_changes(
+    self: BitAndAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitAndAssign:
+    return BitAndAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitInvert_children(self: BitInvert) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _BitInvert_deep_clone(self: BitInvert) -> BitInvert:
+    return BitInvert(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitInvert_with_changes(
+    self: BitInvert, *, whitespace_after: Any = _UNCHANGED
+) -> BitInvert:
+    return BitInvert(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitOr_children(self: BitOr) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitOr_deep_clone(self: BitOr) -> BitOr:
+    return BitOr(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitOr_with_changes(
+    self: BitOr,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitOr:
+    return BitOr(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitOrAssign_children(self: BitOrAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitOrAssign_deep_clone(self: BitOrAssign) -> BitOrAssign:
+    return BitOrAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitOrAssign_with_changes(
+    self: BitOrAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitOrAssign:
+    return BitOrAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitXor_children(self: BitXor) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitXor_deep_clone(self: BitXor) -> BitXor:
+    return BitXor(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitXor_with_changes(
+    self: BitXor,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitXor:
+    return BitXor(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BitXorAssign_children(self: BitXorAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _BitXorAssign_deep_clone(self: BitXorAssign) -> BitXorAssign:
+    return BitXorAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _BitXorAssign_with_changes(
+    self: BitXorAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> BitXorAssign:
+    return BitXorAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _BooleanOperation_children(self: BooleanOperation) -> Sequence[CSTNode]:
+    return [*self.lpar, self.left, self.operator, self.right, *self.rpar]
+
+
+def _BooleanOperation_deep_clone(self: BooleanOperation) -> BooleanOperation:
+    return BooleanOperation(
+        left=self.left.deep_clone(),
+        operator=self.operator.deep_clone(),
+        right=self.right.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _BooleanOperation_with_changes(
+    self: BooleanOperation,
+    *,
+    left: Any = _UNCHANGED,
+    operator: Any = _UNCHANGED,
+    right: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> BooleanOperation:
+    return BooleanOperation(
+        left=self.left if left is _UNCHANGED else left,
+        operator=self.operator if operator is _UNCHANGED else operator,
+        right=self.right if right is _UNCHANGED else right,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Break_children(self: Break) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Break_deep_clone(self: Break) -> Break:
+    return Break(
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Break_with_changes(self: Break, *, semicolon: Any = _UNCHANGED) -> Break:
+    return Break(
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Call_children(self: Call) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.func,
+        self.whitespace_after_func,
+        self.whitespace_before_args,
+        *self.args,
+        *self.rpar,
+    ]
+
+
+def _Call_deep_clone(self: Call) -> Call:
+    return Call(
+        func=self.func.deep_clone(),
+        args=tuple([child.deep_clone() for child in self.args]),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_after_func=self.whitespace_after_func.deep_clone(),
+        whitespace_before_args=self.whitespace_before_args.deep_clone(),
+    )
+
+
+def _Call_with_changes(
+    self: Call,
+    *,
+    func: Any = _UNCHANGED,
+    args: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_func: Any = _UNCHANGED,
+    whitespace_before_args: Any = _UNCHANGED,
+) -> Call:
+    return Call(
+        func=self.func if func is _UNCHANGED else func,
+        args=self.args if args is _UNCHANGED else args,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_func=self.whitespace_after_func
+        if whitespace_after_func is _UNCHANGED
+        else whitespace_after_func,
+        whitespace_before_args=self.whitespace_before_args
+        if whitespace_before_args is _UNCHANGED
+        else whitespace_before_args,
+    )
+
+
+def _ClassDef_children(self: ClassDef) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        *self.decorators,
+        *self.lines_after_decorators,
+        self.whitespace_after_class,
+        self.name,
+        self.whitespace_after_name,
+    ]
+    if self.type_parameters is not None:
+        children.append(self.type_parameters)
+    children.append(self.whitespace_after_type_parameters)
+    if not isinstance(self.lpar, MaybeSentinel):
+        children.append(self.lpar)
+    children += [*self.bases, *self.keywords]
+    if not isinstance(self.rpar, MaybeSentinel):
+        children.append(self.rpar)
+    children += [self.whitespace_before_colon, self.body]
+    return children
+
+
+def _ClassDef_deep_clone(self: ClassDef) -> ClassDef:
+    return ClassDef(
+        name=self.name.deep_clone(),
+        body=self.body.deep_clone(),
+        bases=tuple([child.deep_clone() for child in self.bases]),
+        keywords=tuple([child.deep_clone() for child in self.keywords]),
+        decorators=tuple([child.deep_clone() for child in self.decorators]),
+        lpar=self.lpar
+        if isinstance(self.lpar, MaybeSentinel)
+        else self.lpar.deep_clone(),
+        rpar=self.rpar
+        if isinstance(self.rpar, MaybeSentinel)
+        else self.rpar.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        lines_after_decorators=tuple(
+            [child.deep_clone() for child in self.lines_after_decorators]
+        ),
+        whitespace_after_class=self.whitespace_after_class.deep_clone(),
+        whitespace_after_name=self.whitespace_after_name.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        type_parameters=None
+        if self.type_parameters is None
+        else self.type_parameters.deep_clone(),
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters.deep_clone(),
+    )
+
+
+def _ClassDef_with_changes(
+    self: ClassDef,
+    *,
+    name: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    bases: Any = _UNCHANGED,
+    keywords: Any = _UNCHANGED,
+    decorators: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    lines_after_decorators: Any = _UNCHANGED,
+    whitespace_after_class: Any = _UNCHANGED,
+    whitespace_after_name: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    type_parameters: Any = _UNCHANGED,
+    whitespace_after_type_parameters: Any = _UNCHANGED,
+) -> ClassDef:
+    return ClassDef(
+        name=self.name if name is _UNCHANGED else name,
+        body=self.body if body is _UNCHANGED else body,
+        bases=self.bases if bases is _UNCHANGED else bases,
+        keywords=self.keywords if keywords is _UNCHANGED else keywords,
+        decorators=self.decorators if decorators is _UNCHANGED else decorators,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        lines_after_decorators=self.lines_after_decorators
+        if lines_after_decorators is _UNCHANGED
+        else lines_after_decorators,
+        whitespace_after_class=self.whitespace_after_class
+        if whitespace_after_class is _UNCHANGED
+        else whitespace_after_class,
+        whitespace_after_name=self.whitespace_after_name
+        if whitespace_after_name is _UNCHANGED
+        else whitespace_after_name,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        type_parameters=self.type_parameters
+        if type_parameters is _UNCHANGED
+        else type_parameters,
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters
+        if whitespace_after_type_parameters is _UNCHANGED
+        else whitespace_after_type_parameters,
+    )
+
+
+def _Colon_children(self: Colon) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Colon_deep_clone(self: Colon) -> Colon:
+    return Colon(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Colon_with_changes(
+    self: Colon,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Colon:
+    return Colon(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Comma_children(self: Comma) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Comma_deep_clone(self: Comma) -> Comma:
+    return Comma(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Comma_with_changes(
+    self: Comma,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Comma:
+    return Comma(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Comment_deep_clone(self: Comment) -> Comment:
+    return Comment(
+        value=self.value,
+    )
+
+
+def _Comment_with_changes(self: Comment, *, value: Any = _UNCHANGED) -> Comment:
+    return Comment(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _CompFor_children(self: CompFor) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.whitespace_before)
+    if self.asynchronous is not None:
+        children.append(self.asynchronous)
+    children += [
+        self.whitespace_after_for,
+        self.target,
+        self.whitespace_before_in,
+        self.whitespace_after_in,
+        self.iter,
+        *self.ifs,
+    ]
+    if self.inner_for_in is not None:
+        children.append(self.inner_for_in)
+    return children
+
+
+def _CompFor_deep_clone(self: CompFor) -> CompFor:
+    return CompFor(
+        target=self.target.deep_clone(),
+        iter=self.iter.deep_clone(),
+        ifs=tuple([child.deep_clone() for child in self.ifs]),
+        inner_for_in=None
+        if self.inner_for_in is None
+        else self.inner_for_in.deep_clone(),
+        asynchronous=None
+        if self.asynchronous is None
+        else self.asynchronous.deep_clone(),
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after_for=self.whitespace_after_for.deep_clone(),
+        whitespace_before_in=self.whitespace_before_in.deep_clone(),
+        whitespace_after_in=self.whitespace_after_in.deep_clone(),
+    )
+
+
+def _CompFor_with_changes(
+    self: CompFor,
+    *,
+    target: Any = _UNCHANGED,
+    iter: Any = _UNCHANGED,
+    ifs: Any = _UNCHANGED,
+    inner_for_in: Any = _UNCHANGED,
+    asynchronous: Any = _UNCHANGED,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after_for: Any = _UNCHANGED,
+    whitespace_before_in: Any = _UNCHANGED,
+    whitespace_after_in: Any = _UNCHANGED,
+) -> CompFor:
+    return CompFor(
+        target=self.target if target is _UNCHANGED else target,
+        iter=self.iter if iter is _UNCHANGED else iter,
+        ifs=self.ifs if ifs is _UNCHANGED else ifs,
+        inner_for_in=self.inner_for_in if inner_for_in is _UNCHANGED else inner_for_in,
+        asynchronous=self.asynchronous if asynchronous is _UNCHANGED else asynchronous,
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after_for=self.whitespace_after_for
+        if whitespace_after_for is _UNCHANGED
+        else whitespace_after_for,
+        whitespace_before_in=self.whitespace_before_in
+        if whitespace_before_in is _UNCHANGED
+        else whitespace_before_in,
+        whitespace_after_in=self.whitespace_after_in
+        if whitespace_after_in is _UNCHANGED
+        else whitespace_after_in,
+    )
+
+
+def _CompIf_children(self: CompIf) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_before_test, self.test]
+
+
+def _CompIf_deep_clone(self: CompIf) -> CompIf:
+    return CompIf(
+        test=self.test.deep_clone(),
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_before_test=self.whitespace_before_test.deep_clone(),
+    )
+
+
+def _CompIf_with_changes(
+    self: CompIf,
+    *,
+    test: Any = _UNCHANGED,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_before_test: Any = _UNCHANGED,
+) -> CompIf:
+    return CompIf(
+        test=self.test if test is _UNCHANGED else test,
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_before_test=self.whitespace_before_test
+        if whitespace_before_test is _UNCHANGED
+        else whitespace_before_test,
+    )
+
+
+def _Comparison_children(self: Comparison) -> Sequence[CSTNode]:
+    return [*self.lpar, self.left, *self.comparisons, *self.rpar]
+
+
+def _Comparison_deep_clone(self: Comparison) -> Comparison:
+    return Comparison(
+        left=self.left.deep_clone(),
+        comparisons=tuple([child.deep_clone() for child in self.comparisons]),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Comparison_with_changes(
+    self: Comparison,
+    *,
+    left: Any = _UNCHANGED,
+    comparisons: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Comparison:
+    return Comparison(
+        left=self.left if left is _UNCHANGED else left,
+        comparisons=self.comparisons if comparisons is _UNCHANGED else comparisons,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _ComparisonTarget_children(self: ComparisonTarget) -> Sequence[CSTNode]:
+    return [self.operator, self.comparator]
+
+
+def _ComparisonTarget_deep_clone(self: ComparisonTarget) -> ComparisonTarget:
+    return ComparisonTarget(
+        operator=self.operator.deep_clone(),
+        comparator=self.comparator.deep_clone(),
+    )
+
+
+def _ComparisonTarget_with_changes(
+    self: ComparisonTarget, *, operator: Any = _UNCHANGED, comparator: Any = _UNCHANGED
+) -> ComparisonTarget:
+    return ComparisonTarget(
+        operator=self.operator if operator is _UNCHANGED else operator,
+        comparator=self.comparator if comparator is _UNCHANGED else comparator,
+    )
+
+
+def _ConcatenatedString_children(self: ConcatenatedString) -> Sequence[CSTNode]:
+    return [*self.lpar, self.left, self.whitespace_between, self.right, *self.rpar]
+
+
+def _ConcatenatedString_deep_clone(self: ConcatenatedString) -> ConcatenatedString:
+    return ConcatenatedString(
+        left=self.left.deep_clone(),
+        right=self.right.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_between=self.whitespace_between.deep_clone(),
+    )
+
+
+def _ConcatenatedString_with_changes(
+    self: ConcatenatedString,
+    *,
+    left: Any = _UNCHANGED,
+    right: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_between: Any = _UNCHANGED,
+) -> ConcatenatedString:
+    return ConcatenatedString(
+        left=self.left if left is _UNCHANGED else left,
+        right=self.right if right is _UNCHANGED else right,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_between=self.whitespace_between
+        if whitespace_between is _UNCHANGED
+        else whitespace_between,
+    )
+
+
+def _Continue_children(self: Continue) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Continue_deep_clone(self: Continue) -> Continue:
+    return Continue(
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Continue_with_changes(self: Continue, *, semicolon: Any = _UNCHANGED) -> Continue:
+    return Continue(
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Decorator_children(self: Decorator) -> Sequence[CSTNode]:
+    return [
+        *self.leading_lines,
+        self.whitespace_after_at,
+        self.decorator,
+        self.trailing_whitespace,
+    ]
+
+
+def _Decorator_deep_clone(self: Decorator) -> Decorator:
+    return Decorator(
+        decorator=self.decorator.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_at=self.whitespace_after_at.deep_clone(),
+        trailing_whitespace=self.trailing_whitespace.deep_clone(),
+    )
+
+
+def _Decorator_with_changes(
+    self: Decorator,
+    *,
+    decorator: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_at: Any = _UNCHANGED,
+    trailing_whitespace: Any = _UNCHANGED,
+) -> Decorator:
+    return Decorator(
+        decorator=self.decorator if decorator is _UNCHANGED else decorator,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_at=self.whitespace_after_at
+        if whitespace_after_at is _UNCHANGED
+        else whitespace_after_at,
+        trailing_whitespace=self.trailing_whitespace
+        if trailing_whitespace is _UNCHANGED
+        else trailing_whitespace,
+    )
+
+
+def _Del_children(self: Del) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.target, self.whitespace_after_del]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Del_deep_clone(self: Del) -> Del:
+    return Del(
+        target=self.target.deep_clone(),
+        whitespace_after_del=self.whitespace_after_del.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Del_with_changes(
+    self: Del,
+    *,
+    target: Any = _UNCHANGED,
+    whitespace_after_del: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Del:
+    return Del(
+        target=self.target if target is _UNCHANGED else target,
+        whitespace_after_del=self.whitespace_after_del
+        if whitespace_after_del is _UNCHANGED
+        else whitespace_after_del,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Dict_children(self: Dict) -> Sequence[CSTNode]:
+    return [*self.lpar, self.lbrace, *self.elements, self.rbrace, *self.rpar]
+
+
+def _Dict_deep_clone(self: Dict) -> Dict:
+    return Dict(
+        elements=tuple([child.deep_clone() for child in self.elements]),
+        lbrace=self.lbrace.deep_clone(),
+        rbrace=self.rbrace.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Dict_with_changes(
+    self: Dict,
+    *,
+    elements: Any = _UNCHANGED,
+    lbrace: Any = _UNCHANGED,
+    rbrace: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Dict:
+    return Dict(
+        elements=self.elements if elements is _UNCHANGED else elements,
+        lbrace=self.lbrace if lbrace is _UNCHANGED else lbrace,
+        rbrace=self.rbrace if rbrace is _UNCHANGED else rbrace,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _DictComp_children(self: DictComp) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.lbrace,
+        self.key,
+        self.whitespace_before_colon,
+        self.whitespace_after_colon,
+        self.value,
+        self.for_in,
+        self.rbrace,
+        *self.rpar,
+    ]
+
+
+def _DictComp_deep_clone(self: DictComp) -> DictComp:
+    return DictComp(
+        key=self.key.deep_clone(),
+        value=self.value.deep_clone(),
+        for_in=self.for_in.deep_clone(),
+        lbrace=self.lbrace.deep_clone(),
+        rbrace=self.rbrace.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        whitespace_after_colon=self.whitespace_after_colon.deep_clone(),
+    )
+
+
+def _DictComp_with_changes(
+    self: DictComp,
+    *,
+    key: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    for_in: Any = _UNCHANGED,
+    lbrace: Any = _UNCHANGED,
+    rbrace: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    whitespace_after_colon: Any = _UNCHANGED,
+) -> DictComp:
+    return DictComp(
+        key=self.key if key is _UNCHANGED else key,
+        value=self.value if value is _UNCHANGED else value,
+        for_in=self.for_in if for_in is _UNCHANGED else for_in,
+        lbrace=self.lbrace if lbrace is _UNCHANGED else lbrace,
+        rbrace=self.rbrace if rbrace is _UNCHANGED else rbrace,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        whitespace_after_colon=self.whitespace_after_colon
+        if whitespace_after_colon is _UNCHANGED
+        else whitespace_after_colon,
+    )
+
+
+def _DictElement_children(self: DictElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        self.key,
+        self.whitespace_before_colon,
+        self.whitespace_after_colon,
+        self.value,
+    ]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _DictElement_deep_clone(self: DictElement) -> DictElement:
+    return DictElement(
+        key=self.key.deep_clone(),
+        value=self.value.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        whitespace_after_colon=self.whitespace_after_colon.deep_clone(),
+    )
+
+
+def _DictElement_with_changes(
+    self: DictElement,
+    *,
+    key: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    whitespace_after_colon: Any = _UNCHANGED,
+) -> DictElement:
+    return DictElement(
+        key=self.key if key is _UNCHANGED else key,
+        value=self.value if value is _UNCHANGED else value,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        whitespace_after_colon=self.whitespace_after_colon
+        if whitespace_after_colon is _UNCHANGED
+        else whitespace_after_colon,
+    )
+
+
+def _Divide_children(self: Divide) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Divide_deep_clone(self: Divide) -> Divide:
+    return Divide(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Divide_with_changes(
+    self: Divide,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Divide:
+    return Divide(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _DivideAssign_children(self: DivideAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _DivideAssign_deep_clone(self: DivideAssign) -> DivideAssign:
+    return DivideAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _DivideAssign_with_changes(
+    self: DivideAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> DivideAssign:
+    return DivideAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Dot_children(self: Dot) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Dot_deep_clone(self: Dot) -> Dot:
+    return Dot(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Dot_with_changes(
+    self: Dot,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Dot:
+    return Dot(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Element_children(self: Element) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.value)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _Element_deep_clone(self: Element) -> Element:
+    return Element(
+        value=self.value.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _Element_with_changes(
+    self: Element, *, value: Any = _UNCHANGED, comma: Any = _UNCHANGED
+) -> Element:
+    return Element(
+        value=self.value if value is _UNCHANGED else value,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _Ellipsis_children(self: Ellipsis) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _Ellipsis_deep_clone(self: Ellipsis) -> Ellipsis:
+    return Ellipsis(
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Ellipsis_with_changes(
+    self: Ellipsis, *, lpar: Any = _UNCHANGED, rpar: Any = _UNCHANGED
+) -> Ellipsis:
+    return Ellipsis(
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Else_children(self: Else) -> Sequence[CSTNode]:
+    return [*self.leading_lines, self.whitespace_before_colon, self.body]
+
+
+def _Else_deep_clone(self: Else) -> Else:
+    return Else(
+        body=self.body.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _Else_with_changes(
+    self: Else,
+    *,
+    body: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> Else:
+    return Else(
+        body=self.body if body is _UNCHANGED else body,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _EmptyLine_children(self: EmptyLine) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.whitespace)
+    if self.comment is not None:
+        children.append(self.comment)
+    children.append(self.newline)
+    return children
+
+
+def _EmptyLine_deep_clone(self: EmptyLine) -> EmptyLine:
+    return EmptyLine(
+        indent=self.indent,
+        whitespace=self.whitespace.deep_clone(),
+        comment=None if self.comment is None else self.comment.deep_clone(),
+        newline=self.newline.deep_clone(),
+    )
+
+
+def _EmptyLine_with_changes(
+    self: EmptyLine,
+    *,
+    indent: Any = _UNCHANGED,
+    whitespace: Any = _UNCHANGED,
+    comment: Any = _UNCHANGED,
+    newline: Any = _UNCHANGED,
+) -> EmptyLine:
+    return EmptyLine(
+        indent=self.indent if indent is _UNCHANGED else indent,
+        whitespace=self.whitespace if whitespace is _UNCHANGED else whitespace,
+        comment=self.comment if comment is _UNCHANGED else comment,
+        newline=self.newline if newline is _UNCHANGED else newline,
+    )
+
+
+def _Equal_children(self: Equal) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Equal_deep_clone(self: Equal) -> Equal:
+    return Equal(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Equal_with_changes(
+    self: Equal,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Equal:
+    return Equal(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _ExceptHandler_children(self: ExceptHandler) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.leading_lines, self.whitespace_after_except]
+    if self.type is not None:
+        children.append(self.type)
+    if self.name is not None:
+        children.append(self.name)
+    children += [self.whitespace_before_colon, self.body]
+    return children
+
+
+def _ExceptHandler_deep_clone(self: ExceptHandler) -> ExceptHandler:
+    return ExceptHandler(
+        body=self.body.deep_clone(),
+        type=None if self.type is None else self.type.deep_clone(),
+        name=None if self.name is None else self.name.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_except=self.whitespace_after_except.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _ExceptHandler_with_changes(
+    self: ExceptHandler,
+    *,
+    body: Any = _UNCHANGED,
+    type: Any = _UNCHANGED,
+    name: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_except: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> ExceptHandler:
+    return ExceptHandler(
+        body=self.body if body is _UNCHANGED else body,
+        type=self.type if type is _UNCHANGED else type,
+        name=self.name if name is _UNCHANGED else name,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_except=self.whitespace_after_except
+        if whitespace_after_except is _UNCHANGED
+        else whitespace_after_except,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _ExceptStarHandler_children(self: ExceptStarHandler) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        self.whitespace_after_except,
+        self.whitespace_after_star,
+        self.type,
+    ]
+    if self.name is not None:
+        children.append(self.name)
+    children += [self.whitespace_before_colon, self.body]
+    return children
+
+
+def _ExceptStarHandler_deep_clone(self: ExceptStarHandler) -> ExceptStarHandler:
+    return ExceptStarHandler(
+        body=self.body.deep_clone(),
+        type=self.type.deep_clone(),
+        name=None if self.name is None else self.name.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_except=self.whitespace_after_except.deep_clone(),
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _ExceptStarHandler_with_changes(
+    self: ExceptStarHandler,
+    *,
+    body: Any = _UNCHANGED,
+    type: Any = _UNCHANGED,
+    name: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_except: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> ExceptStarHandler:
+    return ExceptStarHandler(
+        body=self.body if body is _UNCHANGED else body,
+        type=self.type if type is _UNCHANGED else type,
+        name=self.name if name is _UNCHANGED else name,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_except=self.whitespace_after_except
+        if whitespace_after_except is _UNCHANGED
+        else whitespace_after_except,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _Expr_children(self: Expr) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.value)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Expr_deep_clone(self: Expr) -> Expr:
+    return Expr(
+        value=self.value.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Expr_with_changes(
+    self: Expr, *, value: Any = _UNCHANGED, semicolon: Any = _UNCHANGED
+) -> Expr:
+    return Expr(
+        value=self.value if value is _UNCHANGED else value,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Finally_children(self: Finally) -> Sequence[CSTNode]:
+    return [*self.leading_lines, self.whitespace_before_colon, self.body]
+
+
+def _Finally_deep_clone(self: Finally) -> Finally:
+    return Finally(
+        body=self.body.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _Finally_with_changes(
+    self: Finally,
+    *,
+    body: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> Finally:
+    return Finally(
+        body=self.body if body is _UNCHANGED else body,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _Float_children(self: Float) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _Float_deep_clone(self: Float) -> Float:
+    return Float(
+        value=self.value,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Float_with_changes(
+    self: Float,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Float:
+    return Float(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _FloorDivide_children(self: FloorDivide) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _FloorDivide_deep_clone(self: FloorDivide) -> FloorDivide:
+    return FloorDivide(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _FloorDivide_with_changes(
+    self: FloorDivide,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> FloorDivide:
+    return FloorDivide(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _FloorDivideAssign_children(self: FloorDivideAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _FloorDivideAssign_deep_clone(self: FloorDivideAssign) -> FloorDivideAssign:
+    return FloorDivideAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _FloorDivideAssign_with_changes(
+    self: FloorDivideAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> FloorDivideAssign:
+    return FloorDivideAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _For_children(self: For) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.leading_lines)
+    if self.asynchronous is not None:
+        children.append(self.asynchronous)
+    children += [
+        self.whitespace_after_for,
+        self.target,
+        self.whitespace_before_in,
+        self.whitespace_after_in,
+        self.iter,
+        self.whitespace_before_colon,
+        self.body,
+    ]
+    if self.orelse is not None:
+        children.append(self.orelse)
+    return children
+
+
+def _For_deep_clone(self: For) -> For:
+    return For(
+        target=self.target.deep_clone(),
+        iter=self.iter.deep_clone(),
+        body=self.body.deep_clone(),
+        orelse=None if self.orelse is None else self.orelse.deep_clone(),
+        asynchronous=None
+        if self.asynchronous is None
+        else self.asynchronous.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_for=self.whitespace_after_for.deep_clone(),
+        whitespace_before_in=self.whitespace_before_in.deep_clone(),
+        whitespace_after_in=self.whitespace_after_in.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _For_with_changes(
+    self: For,
+    *,
+    target: Any = _UNCHANGED,
+    iter: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    asynchronous: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_for: Any = _UNCHANGED,
+    whitespace_before_in: Any = _UNCHANGED,
+    whitespace_after_in: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> For:
+    return For(
+        target=self.target if target is _UNCHANGED else target,
+        iter=self.iter if iter is _UNCHANGED else iter,
+        body=self.body if body is _UNCHANGED else body,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        asynchronous=self.asynchronous if asynchronous is _UNCHANGED else asynchronous,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_for=self.whitespace_after_for
+        if whitespace_after_for is _UNCHANGED
+        else whitespace_after_for,
+        whitespace_before_in=self.whitespace_before_in
+        if whitespace_before_in is _UNCHANGED
+        else whitespace_before_in,
+        whitespace_after_in=self.whitespace_after_in
+        if whitespace_after_in is _UNCHANGED
+        else whitespace_after_in,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _FormattedString_children(self: FormattedString) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.parts, *self.rpar]
+
+
+def _FormattedString_deep_clone(self: FormattedString) -> FormattedString:
+    return FormattedString(
+        parts=tuple([child.deep_clone() for child in self.parts]),
+        start=self.start,
+        end=self.end,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _FormattedString_with_changes(
+    self: FormattedString,
+    *,
+    parts: Any = _UNCHANGED,
+    start: Any = _UNCHANGED,
+    end: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> FormattedString:
+    return FormattedString(
+        parts=self.parts if parts is _UNCHANGED else parts,
+        start=self.start if start is _UNCHANGED else start,
+        end=self.end if end is _UNCHANGED else end,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _FormattedStringExpression_children(
+    self: FormattedStringExpression,
+) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    format_spec = self.format_spec
+    children += [self.whitespace_before_expression, self.expression]
+    if self.equal is not None:
+        children.append(self.equal)
+    children.append(self.whitespace_after_expression)
+    if format_spec is not None:
+        children.extend(format_spec)
+    return children
+
+
+def _FormattedStringExpression_deep_clone(
+    self: FormattedStringExpression,
+) -> FormattedStringExpression:
+    return FormattedStringExpression(
+        expression=self.expression.deep_clone(),
+        conversion=self.conversion,
+        format_spec=_clone_field(self.format_spec),
+        whitespace_before_expression=self.whitespace_before_expression.deep_clone(),
+        whitespace_after_expression=self.whitespace_after_expression.deep_clone(),
+        equal=None if self.equal is None else self.equal.deep_clone(),
+    )
+
+
+def _FormattedStringExpression_with_changes(
+    self: FormattedStringExpression,
+    *,
+    expression: Any = _UNCHANGED,
+    conversion: Any = _UNCHANGED,
+    format_spec: Any = _UNCHANGED,
+    whitespace_before_expression: Any = _UNCHANGED,
+    whitespace_after_expression: Any = _UNCHANGED,
+    equal: Any = _UNCHANGED,
+) -> FormattedStringExpression:
+    return FormattedStringExpression(
+        expression=self.expression if expression is _UNCHANGED else expression,
+        conversion=self.conversion if conversion is _UNCHANGED else conversion,
+        format_spec=self.format_spec if format_spec is _UNCHANGED else format_spec,
+        whitespace_before_expression=self.whitespace_before_expression
+        if whitespace_before_expression is _UNCHANGED
+        else whitespace_before_expression,
+        whitespace_after_expression=self.whitespace_after_expression
+        if whitespace_after_expression is _UNCHANGED
+        else whitespace_after_expression,
+        equal=self.equal if equal is _UNCHANGED else equal,
+    )
+
+
+def _FormattedStringText_deep_clone(self: FormattedStringText) -> FormattedStringText:
+    return FormattedStringText(
+        value=self.value,
+    )
+
+
+def _FormattedStringText_with_changes(
+    self: FormattedStringText, *, value: Any = _UNCHANGED
+) -> FormattedStringText:
+    return FormattedStringText(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _From_children(self: From) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.whitespace_before_from, MaybeSentinel):
+        children.append(self.whitespace_before_from)
+    children += [self.whitespace_after_from, self.item]
+    return children
+
+
+def _From_deep_clone(self: From) -> From:
+    return From(
+        item=self.item.deep_clone(),
+        whitespace_before_from=self.whitespace_before_from
+        if isinstance(self.whitespace_before_from, MaybeSentinel)
+        else self.whitespace_before_from.deep_clone(),
+        whitespace_after_from=self.whitespace_after_from.deep_clone(),
+    )
+
+
+def _From_with_changes(
+    self: From,
+    *,
+    item: Any = _UNCHANGED,
+    whitespace_before_from: Any = _UNCHANGED,
+    whitespace_after_from: Any = _UNCHANGED,
+) -> From:
+    return From(
+        item=self.item if item is _UNCHANGED else item,
+        whitespace_before_from=self.whitespace_before_from
+        if whitespace_before_from is _UNCHANGED
+        else whitespace_before_from,
+        whitespace_after_from=self.whitespace_after_from
+        if whitespace_after_from is _UNCHANGED
+        else whitespace_after_from,
+    )
+
+
+def _FunctionDef_children(self: FunctionDef) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.leading_lines, *self.decorators, *self.lines_after_decorators]
+    if self.asynchronous is not None:
+        children.append(self.asynchronous)
+    children += [self.whitespace_after_def, self.name, self.whitespace_after_name]
+    if self.type_parameters is not None:
+        children.append(self.type_parameters)
+    children += [
+        self.whitespace_after_type_parameters,
+        self.whitespace_before_params,
+        self.params,
+    ]
+    if self.returns is not None:
+        children.append(self.returns)
+    children += [self.whitespace_before_colon, self.body]
+    return children
+
+
+def _FunctionDef_deep_clone(self: FunctionDef) -> FunctionDef:
+    return FunctionDef(
+        name=self.name.deep_clone(),
+        params=self.params.deep_clone(),
+        body=self.body.deep_clone(),
+        decorators=tuple([child.deep_clone() for child in self.decorators]),
+        returns=None if self.returns is None else self.returns.deep_clone(),
+        asynchronous=None
+        if self.asynchronous is None
+        else self.asynchronous.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        lines_after_decorators=tuple(
+            [child.deep_clone() for child in self.lines_after_decorators]
+        ),
+        whitespace_after_def=self.whitespace_after_def.deep_clone(),
+        whitespace_after_name=self.whitespace_after_name.deep_clone(),
+        whitespace_before_params=self.whitespace_before_params.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        type_parameters=None
+        if self.type_parameters is None
+        else self.type_parameters.deep_clone(),
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters.deep_clone(),
+    )
+
+
+def _FunctionDef_with_changes(
+    self: FunctionDef,
+    *,
+    name: Any = _UNCHANGED,
+    params: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    decorators: Any = _UNCHANGED,
+    returns: Any = _UNCHANGED,
+    asynchronous: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    lines_after_decorators: Any = _UNCHANGED,
+    whitespace_after_def: Any = _UNCHANGED,
+    whitespace_after_name: Any = _UNCHANGED,
+    whitespace_before_params: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    type_parameters: Any = _UNCHANGED,
+    whitespace_after_type_parameters: Any = _UNCHANGED,
+) -> FunctionDef:
+    return FunctionDef(
+        name=self.name if name is _UNCHANGED else name,
+        params=self.params if params is _UNCHANGED else params,
+        body=self.body if body is _UNCHANGED else body,
+        decorators=self.decorators if decorators is _UNCHANGED else decorators,
+        returns=self.returns if returns is _UNCHANGED else returns,
+        asynchronous=self.asynchronous if asynchronous is _UNCHANGED else asynchronous,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        lines_after_decorators=self.lines_after_decorators
+        if lines_after_decorators is _UNCHANGED
+        else lines_after_decorators,
+        whitespace_after_def=self.whitespace_after_def
+        if whitespace_after_def is _UNCHANGED
+        else whitespace_after_def,
+        whitespace_after_name=self.whitespace_after_name
+        if whitespace_after_name is _UNCHANGED
+        else whitespace_after_name,
+        whitespace_before_params=self.whitespace_before_params
+        if whitespace_before_params is _UNCHANGED
+        else whitespace_before_params,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        type_parameters=self.type_parameters
+        if type_parameters is _UNCHANGED
+        else type_parameters,
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters
+        if whitespace_after_type_parameters is _UNCHANGED
+        else whitespace_after_type_parameters,
+    )
+
+
+def _GeneratorExp_children(self: GeneratorExp) -> Sequence[CSTNode]:
+    return [*self.lpar, self.elt, self.for_in, *self.rpar]
+
+
+def _GeneratorExp_deep_clone(self: GeneratorExp) -> GeneratorExp:
+    return GeneratorExp(
+        elt=self.elt.deep_clone(),
+        for_in=self.for_in.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _GeneratorExp_with_changes(
+    self: GeneratorExp,
+    *,
+    elt: Any = _UNCHANGED,
+    for_in: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> GeneratorExp:
+    return GeneratorExp(
+        elt=self.elt if elt is _UNCHANGED else elt,
+        for_in=self.for_in if for_in is _UNCHANGED else for_in,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Global_children(self: Global) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_global, *self.names]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Global_deep_clone(self: Global) -> Global:
+    return Global(
+        names=tuple([child.deep_clone() for child in self.names]),
+        whitespace_after_global=self.whitespace_after_global.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Global_with_changes(
+    self: Global,
+    *,
+    names: Any = _UNCHANGED,
+    whitespace_after_global: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Global:
+    return Global(
+        names=self.names if names is _UNCHANGED else names,
+        whitespace_after_global=self.whitespace_after_global
+        if whitespace_after_global is _UNCHANGED
+        else whitespace_after_global,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _GreaterThan_children(self: GreaterThan) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _GreaterThan_deep_clone(self: GreaterThan) -> GreaterThan:
+    return GreaterThan(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _GreaterThan_with_changes(
+    self: GreaterThan,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> GreaterThan:
+    return GreaterThan(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _GreaterThanEqual_children(self: GreaterThanEqual) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _GreaterThanEqual_deep_clone(self: GreaterThanEqual) -> GreaterThanEqual:
+    return GreaterThanEqual(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _GreaterThanEqual_with_changes(
+    self: GreaterThanEqual,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> GreaterThanEqual:
+    return GreaterThanEqual(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _If_children(self: If) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        self.whitespace_before_test,
+        self.test,
+        self.whitespace_after_test,
+        self.body,
+    ]
+    if self.orelse is not None:
+        children.append(self.orelse)
+    return children
+
+
+def _If_deep_clone(self: If) -> If:
+    return If(
+        test=self.test.deep_clone(),
+        body=self.body.deep_clone(),
+        orelse=None if self.orelse is None else self.orelse.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_before_test=self.whitespace_before_test.deep_clone(),
+        whitespace_after_test=self.whitespace_after_test.deep_clone(),
+    )
+
+
+def _If_with_changes(
+    self: If,
+    *,
+    test: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_before_test: Any = _UNCHANGED,
+    whitespace_after_test: Any = _UNCHANGED,
+) -> If:
+    return If(
+        test=self.test if test is _UNCHANGED else test,
+        body=self.body if body is _UNCHANGED else body,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_before_test=self.whitespace_before_test
+        if whitespace_before_test is _UNCHANGED
+        else whitespace_before_test,
+        whitespace_after_test=self.whitespace_after_test
+        if whitespace_after_test is _UNCHANGED
+        else whitespace_after_test,
+    )
+
+
+def _IfExp_children(self: IfExp) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.body,
+        self.whitespace_before_if,
+        self.whitespace_after_if,
+        self.test,
+        self.whitespace_before_else,
+        self.whitespace_after_else,
+        self.orelse,
+        *self.rpar,
+    ]
+
+
+def _IfExp_deep_clone(self: IfExp) -> IfExp:
+    return IfExp(
+        test=self.test.deep_clone(),
+        body=self.body.deep_clone(),
+        orelse=self.orelse.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_before_if=self.whitespace_before_if.deep_clone(),
+        whitespace_after_if=self.whitespace_after_if.deep_clone(),
+        whitespace_before_else=self.whitespace_before_else.deep_clone(),
+        whitespace_after_else=self.whitespace_after_else.deep_clone(),
+    )
+
+
+def _IfExp_with_changes(
+    self: IfExp,
+    *,
+    test: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_before_if: Any = _UNCHANGED,
+    whitespace_after_if: Any = _UNCHANGED,
+    whitespace_before_else: Any = _UNCHANGED,
+    whitespace_after_else: Any = _UNCHANGED,
+) -> IfExp:
+    return IfExp(
+        test=self.test if test is _UNCHANGED else test,
+        body=self.body if body is _UNCHANGED else body,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_before_if=self.whitespace_before_if
+        if whitespace_before_if is _UNCHANGED
+        else whitespace_before_if,
+        whitespace_after_if=self.whitespace_after_if
+        if whitespace_after_if is _UNCHANGED
+        else whitespace_after_if,
+        whitespace_before_else=self.whitespace_before_else
+        if whitespace_before_else is _UNCHANGED
+        else whitespace_before_else,
+        whitespace_after_else=self.whitespace_after_else
+        if whitespace_after_else is _UNCHANGED
+        else whitespace_after_else,
+    )
+
+
+def _Imaginary_children(self: Imaginary) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _Imaginary_deep_clone(self: Imaginary) -> Imaginary:
+    return Imaginary(
+        value=self.value,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Imaginary_with_changes(
+    self: Imaginary,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Imaginary:
+    return Imaginary(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Import_children(self: Import) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_import, *self.names]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Import_deep_clone(self: Import) -> Import:
+    return Import(
+        names=tuple([child.deep_clone() for child in self.names]),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+        whitespace_after_import=self.whitespace_after_import.deep_clone(),
+    )
+
+
+def _Import_with_changes(
+    self: Import,
+    *,
+    names: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+    whitespace_after_import: Any = _UNCHANGED,
+) -> Import:
+    return Import(
+        names=self.names if names is _UNCHANGED else names,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+        whitespace_after_import=self.whitespace_after_import
+        if whitespace_after_import is _UNCHANGED
+        else whitespace_after_import,
+    )
+
+
+def _ImportAlias_children(self: ImportAlias) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.name)
+    if self.asname is not None:
+        children.append(self.asname)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _ImportAlias_deep_clone(self: ImportAlias) -> ImportAlias:
+    return ImportAlias(
+        name=self.name.deep_clone(),
+        asname=None if self.asname is None else self.asname.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _ImportAlias_with_changes(
+    self: ImportAlias,
+    *,
+    name: Any = _UNCHANGED,
+    asname: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+) -> ImportAlias:
+    return ImportAlias(
+        name=self.name if name is _UNCHANGED else name,
+        asname=self.asname if asname is _UNCHANGED else asname,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _ImportFrom_children(self: ImportFrom) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    names = self.names
+    children += [self.whitespace_after_from, *self.relative]
+    if self.module is not None:
+        children.append(self.module)
+    children += [self.whitespace_before_import, self.whitespace_after_import]
+    if self.lpar is not None:
+        children.append(self.lpar)
+    if isinstance(names, ImportStar):
+        children.append(names)
+    else:
+        children.extend(names)
+    if self.rpar is not None:
+        children.append(self.rpar)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _ImportFrom_deep_clone(self: ImportFrom) -> ImportFrom:
+    return ImportFrom(
+        module=None if self.module is None else self.module.deep_clone(),
+        names=_clone_field(self.names),
+        relative=tuple([child.deep_clone() for child in self.relative]),
+        lpar=None if self.lpar is None else self.lpar.deep_clone(),
+        rpar=None if self.rpar is None else self.rpar.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+        whitespace_after_from=self.whitespace_after_from.deep_clone(),
+        whitespace_before_import=self.whitespace_before_import.deep_clone(),
+        whitespace_after_import=self.whitespace_after_import.deep_clone(),
+    )
+
+
+def _ImportFrom_with_changes(
+    self: ImportFrom,
+    *,
+    module: Any = _UNCHANGED,
+    names: Any = _UNCHANGED,
+    relative: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+    whitespace_after_from: Any = _UNCHANGED,
+    whitespace_before_import: Any = _UNCHANGED,
+    whitespace_after_import: Any = _UNCHANGED,
+) -> ImportFrom:
+    return ImportFrom(
+        module=self.module if module is _UNCHANGED else module,
+        names=self.names if names is _UNCHANGED else names,
+        relative=self.relative if relative is _UNCHANGED else relative,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+        whitespace_after_from=self.whitespace_after_from
+        if whitespace_after_from is _UNCHANGED
+        else whitespace_after_from,
+        whitespace_before_import=self.whitespace_before_import
+        if whitespace_before_import is _UNCHANGED
+        else whitespace_before_import,
+        whitespace_after_import=self.whitespace_after_import
+        if whitespace_after_import is _UNCHANGED
+        else whitespace_after_import,
+    )
+
+
+def _ImportStar_deep_clone(self: ImportStar) -> ImportStar:
+    return ImportStar()
+
+
+def _ImportStar_with_changes(self: ImportStar) -> ImportStar:
+    return ImportStar()
+
+
+def _In_children(self: In) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _In_deep_clone(self: In) -> In:
+    return In(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _In_with_changes(
+    self: In, *, whitespace_before: Any = _UNCHANGED, whitespace_after: Any = _UNCHANGED
+) -> In:
+    return In(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _IndentedBlock_children(self: IndentedBlock) -> Sequence[CSTNode]:
+    return [self.header, *self.body, *self.footer]
+
+
+def _IndentedBlock_deep_clone(self: IndentedBlock) -> IndentedBlock:
+    return IndentedBlock(
+        body=tuple([child.deep_clone() for child in self.body]),
+        header=self.header.deep_clone(),
+        indent=self.indent,
+        footer=tuple([child.deep_clone() for child in self.footer]),
+    )
+
+
+def _IndentedBlock_with_changes(
+    self: IndentedBlock,
+    *,
+    body: Any = _UNCHANGED,
+    header: Any = _UNCHANGED,
+    indent: Any = _UNCHANGED,
+    footer: Any = _UNCHANGED,
+) -> IndentedBlock:
+    return IndentedBlock(
+        body=self.body if body is _UNCHANGED else body,
+        header=self.header if header is _UNCHANGED else header,
+        indent=self.indent if indent is _UNCHANGED else indent,
+        footer=self.footer if footer is _UNCHANGED else footer,
+    )
+
+
+def _Index_children(self: Index) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if self.whitespace_after_star is not None:
+        children.append(self.whitespace_after_star)
+    children.append(self.value)
+    return children
+
+
+def _Index_deep_clone(self: Index) -> Index:
+    return Index(
+        value=self.value.deep_clone(),
+        star=self.star,
+        whitespace_after_star=None
+        if self.whitespace_after_star is None
+        else self.whitespace_after_star.deep_clone(),
+    )
+
+
+def _Index_with_changes(
+    self: Index,
+    *,
+    value: Any = _UNCHANGED,
+    star: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+) -> Index:
+    return Index(
+        value=self.value if value is _UNCHANGED else value,
+        star=self.star if star is _UNCHANGED else star,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+    )
+
+
+def _Integer_children(self: Integer) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _Integer_deep_clone(self: Integer) -> Integer:
+    return Integer(
+        value=self.value,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Integer_with_changes(
+    self: Integer,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Integer:
+    return Integer(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Is_children(self: Is) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Is_deep_clone(self: Is) -> Is:
+    return Is(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Is_with_changes(
+    self: Is, *, whitespace_before: Any = _UNCHANGED, whitespace_after: Any = _UNCHANGED
+) -> Is:
+    return Is(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _IsNot_children(self: IsNot) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_between, self.whitespace_after]
+
+
+def _IsNot_deep_clone(self: IsNot) -> IsNot:
+    return IsNot(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_between=self.whitespace_between.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _IsNot_with_changes(
+    self: IsNot,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_between: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> IsNot:
+    return IsNot(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_between=self.whitespace_between
+        if whitespace_between is _UNCHANGED
+        else whitespace_between,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Lambda_children(self: Lambda) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.lpar)
+    if not isinstance(self.whitespace_after_lambda, MaybeSentinel):
+        children.append(self.whitespace_after_lambda)
+    children += [self.params, self.colon, self.body, *self.rpar]
+    return children
+
+
+def _Lambda_deep_clone(self: Lambda) -> Lambda:
+    return Lambda(
+        params=self.params.deep_clone(),
+        body=self.body.deep_clone(),
+        colon=self.colon.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_after_lambda=self.whitespace_after_lambda
+        if isinstance(self.whitespace_after_lambda, MaybeSentinel)
+        else self.whitespace_after_lambda.deep_clone(),
+    )
+
+
+def _Lambda_with_changes(
+    self: Lambda,
+    *,
+    params: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    colon: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_lambda: Any = _UNCHANGED,
+) -> Lambda:
+    return Lambda(
+        params=self.params if params is _UNCHANGED else params,
+        body=self.body if body is _UNCHANGED else body,
+        colon=self.colon if colon is _UNCHANGED else colon,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_lambda=self.whitespace_after_lambda
+        if whitespace_after_lambda is _UNCHANGED
+        else whitespace_after_lambda,
+    )
+
+
+def _LeftCurlyBrace_children(self: LeftCurlyBrace) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _LeftCurlyBrace_deep_clone(self: LeftCurlyBrace) -> LeftCurlyBrace:
+    return LeftCurlyBrace(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LeftCurlyBrace_with_changes(
+    self: LeftCurlyBrace, *, whitespace_after: Any = _UNCHANGED
+) -> LeftCurlyBrace:
+    return LeftCurlyBrace(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LeftParen_children(self: LeftParen) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _LeftParen_deep_clone(self: LeftParen) -> LeftParen:
+    return LeftParen(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LeftParen_with_changes(
+    self: LeftParen, *, whitespace_after: Any = _UNCHANGED
+) -> LeftParen:
+    return LeftParen(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LeftShift_children(self: LeftShift) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _LeftShift_deep_clone(self: LeftShift) -> LeftShift:
+    return LeftShift(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LeftShift_with_changes(
+    self: LeftShift,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> LeftShift:
+    return LeftShift(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LeftShiftAssign_children(self: LeftShiftAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _LeftShiftAssign_deep_clone(self: LeftShiftAssign) -> LeftShiftAssign:
+    return LeftShiftAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LeftShiftAssign_with_changes(
+    self: LeftShiftAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> LeftShiftAssign:
+    return LeftShiftAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LeftSquareBracket_children(self: LeftSquareBracket) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _LeftSquareBracket_deep_clone(self: LeftSquareBracket) -> LeftSquareBracket:
+    return LeftSquareBracket(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LeftSquareBracket_with_changes(
+    self: LeftSquareBracket, *, whitespace_after: Any = _UNCHANGED
+) -> LeftSquareBracket:
+    return LeftSquareBracket(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LessThan_children(self: LessThan) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _LessThan_deep_clone(self: LessThan) -> LessThan:
+    return LessThan(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LessThan_with_changes(
+    self: LessThan,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> LessThan:
+    return LessThan(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _LessThanEqual_children(self: LessThanEqual) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _LessThanEqual_deep_clone(self: LessThanEqual) -> LessThanEqual:
+    return LessThanEqual(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _LessThanEqual_with_changes(
+    self: LessThanEqual,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> LessThanEqual:
+    return LessThanEqual(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _List_children(self: List) -> Sequence[CSTNode]:
+    return [*self.lpar, self.lbracket, *self.elements, self.rbracket, *self.rpar]
+
+
+def _List_deep_clone(self: List) -> List:
+    return List(
+        elements=tuple([child.deep_clone() for child in self.elements]),
+        lbracket=self.lbracket.deep_clone(),
+        rbracket=self.rbracket.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _List_with_changes(
+    self: List,
+    *,
+    elements: Any = _UNCHANGED,
+    lbracket: Any = _UNCHANGED,
+    rbracket: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> List:
+    return List(
+        elements=self.elements if elements is _UNCHANGED else elements,
+        lbracket=self.lbracket if lbracket is _UNCHANGED else lbracket,
+        rbracket=self.rbracket if rbracket is _UNCHANGED else rbracket,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _ListComp_children(self: ListComp) -> Sequence[CSTNode]:
+    return [*self.lpar, self.lbracket, self.elt, self.for_in, self.rbracket, *self.rpar]
+
+
+def _ListComp_deep_clone(self: ListComp) -> ListComp:
+    return ListComp(
+        elt=self.elt.deep_clone(),
+        for_in=self.for_in.deep_clone(),
+        lbracket=self.lbracket.deep_clone(),
+        rbracket=self.rbracket.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _ListComp_with_changes(
+    self: ListComp,
+    *,
+    elt: Any = _UNCHANGED,
+    for_in: Any = _UNCHANGED,
+    lbracket: Any = _UNCHANGED,
+    rbracket: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> ListComp:
+    return ListComp(
+        elt=self.elt if elt is _UNCHANGED else elt,
+        for_in=self.for_in if for_in is _UNCHANGED else for_in,
+        lbracket=self.lbracket if lbracket is _UNCHANGED else lbracket,
+        rbracket=self.rbracket if rbracket is _UNCHANGED else rbracket,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _Match_children(self: Match) -> Sequence[CSTNode]:
+    return [
+        *self.leading_lines,
+        self.whitespace_after_match,
+        self.subject,
+        self.whitespace_before_colon,
+        self.whitespace_after_colon,
+        *self.cases,
+        *self.footer,
+    ]
+
+
+def _Match_deep_clone(self: Match) -> Match:
+    return Match(
+        subject=self.subject.deep_clone(),
+        cases=tuple([child.deep_clone() for child in self.cases]),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_match=self.whitespace_after_match.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        whitespace_after_colon=self.whitespace_after_colon.deep_clone(),
+        indent=self.indent,
+        footer=tuple([child.deep_clone() for child in self.footer]),
+    )
+
+
+def _Match_with_changes(
+    self: Match,
+    *,
+    subject: Any = _UNCHANGED,
+    cases: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_match: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    whitespace_after_colon: Any = _UNCHANGED,
+    indent: Any = _UNCHANGED,
+    footer: Any = _UNCHANGED,
+) -> Match:
+    return Match(
+        subject=self.subject if subject is _UNCHANGED else subject,
+        cases=self.cases if cases is _UNCHANGED else cases,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_match=self.whitespace_after_match
+        if whitespace_after_match is _UNCHANGED
+        else whitespace_after_match,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        whitespace_after_colon=self.whitespace_after_colon
+        if whitespace_after_colon is _UNCHANGED
+        else whitespace_after_colon,
+        indent=self.indent if indent is _UNCHANGED else indent,
+        footer=self.footer if footer is _UNCHANGED else footer,
+    )
+
+
+def _MatchAs_children(self: MatchAs) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.lpar)
+    if self.pattern is not None:
+        children.append(self.pattern)
+    if not isinstance(self.whitespace_before_as, MaybeSentinel):
+        children.append(self.whitespace_before_as)
+    if not isinstance(self.whitespace_after_as, MaybeSentinel):
+        children.append(self.whitespace_after_as)
+    if self.name is not None:
+        children.append(self.name)
+    children.extend(self.rpar)
+    return children
+
+
+def _MatchAs_deep_clone(self: MatchAs) -> MatchAs:
+    return MatchAs(
+        pattern=None if self.pattern is None else self.pattern.deep_clone(),
+        name=None if self.name is None else self.name.deep_clone(),
+        whitespace_before_as=self.whitespace_before_as
+        if isinstance(self.whitespace_before_as, MaybeSentinel)
+        else self.whitespace_before_as.deep_clone(),
+        whitespace_after_as=self.whitespace_after_as
+        if isinstance(self.whitespace_after_as, MaybeSentinel)
+        else self.whitespace_after_as.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _MatchAs_with_changes(
+    self: MatchAs,
+    *,
+    pattern: Any = _UNCHANGED,
+    name: Any = _UNCHANGED,
+    whitespace_before_as: Any = _UNCHANGED,
+    whitespace_after_as: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchAs:
+    return MatchAs(
+        pattern=self.pattern if pattern is _UNCHANGED else pattern,
+        name=self.name if name is _UNCHANGED else name,
+        whitespace_before_as=self.whitespace_before_as
+        if whitespace_before_as is _UNCHANGED
+        else whitespace_before_as,
+        whitespace_after_as=self.whitespace_after_as
+        if whitespace_after_as is _UNCHANGED
+        else whitespace_after_as,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchCase_children(self: MatchCase) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.leading_lines, self.whitespace_after_case, self.pattern]
+    if self.whitespace_before_if is not None:
+        children.append(self.whitespace_before_if)
+    if self.whitespace_after_if is not None:
+        children.append(self.whitespace_after_if)
+    if self.guard is not None:
+        children.append(self.guard)
+    children.append(self.body)
+    return children
+
+
+def _MatchCase_deep_clone(self: MatchCase) -> MatchCase:
+    return MatchCase(
+        pattern=self.pattern.deep_clone(),
+        body=self.body.deep_clone(),
+        guard=None if self.guard is None else self.guard.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_case=self.whitespace_after_case.deep_clone(),
+        whitespace_before_if=None
+        if self.whitespace_before_if is None
+        else self.whitespace_before_if.deep_clone(),
+        whitespace_after_if=None
+        if self.whitespace_after_if is None
+        else self.whitespace_after_if.deep_clone(),
+        whitespace_before_colon=_clone_field(self.whitespace_before_colon),
+    )
+
+
+def _MatchCase_with_changes(
+    self: MatchCase,
+    *,
+    pattern: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    guard: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_case: Any = _UNCHANGED,
+    whitespace_before_if: Any = _UNCHANGED,
+    whitespace_after_if: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> MatchCase:
+    return MatchCase(
+        pattern=self.pattern if pattern is _UNCHANGED else pattern,
+        body=self.body if body is _UNCHANGED else body,
+        guard=self.guard if guard is _UNCHANGED else guard,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_case=self.whitespace_after_case
+        if whitespace_after_case is _UNCHANGED
+        else whitespace_after_case,
+        whitespace_before_if=self.whitespace_before_if
+        if whitespace_before_if is _UNCHANGED
+        else whitespace_before_if,
+        whitespace_after_if=self.whitespace_after_if
+        if whitespace_after_if is _UNCHANGED
+        else whitespace_after_if,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _MatchClass_children(self: MatchClass) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.cls,
+        self.whitespace_after_cls,
+        self.whitespace_before_patterns,
+        *self.patterns,
+        *self.kwds,
+        self.whitespace_after_kwds,
+    ]
+
+
+def _MatchClass_deep_clone(self: MatchClass) -> MatchClass:
+    return MatchClass(
+        cls=self.cls.deep_clone(),
+        patterns=tuple([child.deep_clone() for child in self.patterns]),
+        kwds=tuple([child.deep_clone() for child in self.kwds]),
+        whitespace_after_cls=self.whitespace_after_cls.deep_clone(),
+        whitespace_before_patterns=self.whitespace_before_patterns.deep_clone(),
+        whitespace_after_kwds=self.whitespace_after_kwds.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=_clone_field(self.rpar),
+    )
+
+
+def _MatchClass_with_changes(
+    self: MatchClass,
+    *,
+    cls: Any = _UNCHANGED,
+    patterns: Any = _UNCHANGED,
+    kwds: Any = _UNCHANGED,
+    whitespace_after_cls: Any = _UNCHANGED,
+    whitespace_before_patterns: Any = _UNCHANGED,
+    whitespace_after_kwds: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchClass:
+    return MatchClass(
+        cls=self.cls if cls is _UNCHANGED else cls,
+        patterns=self.patterns if patterns is _UNCHANGED else patterns,
+        kwds=self.kwds if kwds is _UNCHANGED else kwds,
+        whitespace_after_cls=self.whitespace_after_cls
+        if whitespace_after_cls is _UNCHANGED
+        else whitespace_after_cls,
+        whitespace_before_patterns=self.whitespace_before_patterns
+        if whitespace_before_patterns is _UNCHANGED
+        else whitespace_before_patterns,
+        whitespace_after_kwds=self.whitespace_after_kwds
+        if whitespace_after_kwds is _UNCHANGED
+        else whitespace_after_kwds,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchKeywordElement_children(self: MatchKeywordElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        self.key,
+        self.whitespace_before_equal,
+        self.whitespace_after_equal,
+        self.pattern,
+    ]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _MatchKeywordElement_deep_clone(self: MatchKeywordElement) -> MatchKeywordElement:
+    return MatchKeywordElement(
+        key=self.key.deep_clone(),
+        pattern=self.pattern.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_before_equal=self.whitespace_before_equal.deep_clone(),
+        whitespace_after_equal=self.whitespace_after_equal.deep_clone(),
+    )
+
+
+def _MatchKeywordElement_with_changes(
+    self: MatchKeywordElement,
+    *,
+    key: Any = _UNCHANGED,
+    pattern: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_before_equal: Any = _UNCHANGED,
+    whitespace_after_equal: Any = _UNCHANGED,
+) -> MatchKeywordElement:
+    return MatchKeywordElement(
+        key=self.key if key is _UNCHANGED else key,
+        pattern=self.pattern if pattern is _UNCHANGED else pattern,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_before_equal=self.whitespace_before_equal
+        if whitespace_before_equal is _UNCHANGED
+        else whitespace_before_equal,
+        whitespace_after_equal=self.whitespace_after_equal
+        if whitespace_after_equal is _UNCHANGED
+        else whitespace_after_equal,
+    )
+
+
+def _MatchList_children(self: MatchList) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.lpar)
+    if self.lbracket is not None:
+        children.append(self.lbracket)
+    children.extend(self.patterns)
+    if self.rbracket is not None:
+        children.append(self.rbracket)
+    children.extend(self.rpar)
+    return children
+
+
+def _MatchList_deep_clone(self: MatchList) -> MatchList:
+    return MatchList(
+        patterns=tuple([child.deep_clone() for child in self.patterns]),
+        lbracket=None if self.lbracket is None else self.lbracket.deep_clone(),
+        rbracket=None if self.rbracket is None else self.rbracket.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _MatchList_with_changes(
+    self: MatchList,
+    *,
+    patterns: Any = _UNCHANGED,
+    lbracket: Any = _UNCHANGED,
+    rbracket: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchList:
+    return MatchList(
+        patterns=self.patterns if patterns is _UNCHANGED else patterns,
+        lbracket=self.lbracket if lbracket is _UNCHANGED else lbracket,
+        rbracket=self.rbracket if rbracket is _UNCHANGED else rbracket,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchMapping_children(self: MatchMapping) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.lpar, self.lbrace, *self.elements, self.whitespace_before_rest]
+    if self.rest is not None:
+        children.append(self.rest)
+    if self.trailing_comma is not None:
+        children.append(self.trailing_comma)
+    children += [self.rbrace, *self.rpar]
+    return children
+
+
+def _MatchMapping_deep_clone(self: MatchMapping) -> MatchMapping:
+    return MatchMapping(
+        elements=tuple([child.deep_clone() for child in self.elements]),
+        lbrace=self.lbrace.deep_clone(),
+        rbrace=self.rbrace.deep_clone(),
+        rest=None if self.rest is None else self.rest.deep_clone(),
+        whitespace_before_rest=self.whitespace_before_rest.deep_clone(),
+        trailing_comma=None
+        if self.trailing_comma is None
+        else self.trailing_comma.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _MatchMapping_with_changes(
+    self: MatchMapping,
+    *,
+    elements: Any = _UNCHANGED,
+    lbrace: Any = _UNCHANGED,
+    rbrace: Any = _UNCHANGED,
+    rest: Any = _UNCHANGED,
+    whitespace_before_rest: Any = _UNCHANGED,
+    trailing_comma: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchMapping:
+    return MatchMapping(
+        elements=self.elements if elements is _UNCHANGED else elements,
+        lbrace=self.lbrace if lbrace is _UNCHANGED else lbrace,
+        rbrace=self.rbrace if rbrace is _UNCHANGED else rbrace,
+        rest=self.rest if rest is _UNCHANGED else rest,
+        whitespace_before_rest=self.whitespace_before_rest
+        if whitespace_before_rest is _UNCHANGED
+        else whitespace_before_rest,
+        trailing_comma=self.trailing_comma
+        if trailing_comma is _UNCHANGED
+        else trailing_comma,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchMappingElement_children(self: MatchMappingElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        self.key,
+        self.whitespace_before_colon,
+        self.whitespace_after_colon,
+        self.pattern,
+    ]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _MatchMappingElement_deep_clone(self: MatchMappingElement) -> MatchMappingElement:
+    return MatchMappingElement(
+        key=self.key.deep_clone(),
+        pattern=self.pattern.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+        whitespace_after_colon=self.whitespace_after_colon.deep_clone(),
+    )
+
+
+def _MatchMappingElement_with_changes(
+    self: MatchMappingElement,
+    *,
+    key: Any = _UNCHANGED,
+    pattern: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+    whitespace_after_colon: Any = _UNCHANGED,
+) -> MatchMappingElement:
+    return MatchMappingElement(
+        key=self.key if key is _UNCHANGED else key,
+        pattern=self.pattern if pattern is _UNCHANGED else pattern,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+        whitespace_after_colon=self.whitespace_after_colon
+        if whitespace_after_colon is _UNCHANGED
+        else whitespace_after_colon,
+    )
+
+
+def _MatchOr_children(self: MatchOr) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.patterns, *self.rpar]
+
+
+def _MatchOr_deep_clone(self: MatchOr) -> MatchOr:
+    return MatchOr(
+        patterns=tuple([child.deep_clone() for child in self.patterns]),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _MatchOr_with_changes(
+    self: MatchOr,
+    *,
+    patterns: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchOr:
+    return MatchOr(
+        patterns=self.patterns if patterns is _UNCHANGED else patterns,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchOrElement_children(self: MatchOrElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.pattern)
+    if not isinstance(self.separator, MaybeSentinel):
+        children.append(self.separator)
+    return children
+
+
+def _MatchOrElement_deep_clone(self: MatchOrElement) -> MatchOrElement:
+    return MatchOrElement(
+        pattern=self.pattern.deep_clone(),
+        separator=self.separator
+        if isinstance(self.separator, MaybeSentinel)
+        else self.separator.deep_clone(),
+    )
+
+
+def _MatchOrElement_with_changes(
+    self: MatchOrElement, *, pattern: Any = _UNCHANGED, separator: Any = _UNCHANGED
+) -> MatchOrElement:
+    return MatchOrElement(
+        pattern=self.pattern if pattern is _UNCHANGED else pattern,
+        separator=self.separator if separator is _UNCHANGED else separator,
+    )
+
+
+def _MatchSequenceElement_children(self: MatchSequenceElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.value)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _MatchSequenceElement_deep_clone(
+    self: MatchSequenceElement,
+) -> MatchSequenceElement:
+    return MatchSequenceElement(
+        value=self.value.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _MatchSequenceElement_with_changes(
+    self: MatchSequenceElement, *, value: Any = _UNCHANGED, comma: Any = _UNCHANGED
+) -> MatchSequenceElement:
+    return MatchSequenceElement(
+        value=self.value if value is _UNCHANGED else value,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _MatchSingleton_children(self: MatchSingleton) -> Sequence[CSTNode]:
+    return [self.value]
+
+
+def _MatchSingleton_deep_clone(self: MatchSingleton) -> MatchSingleton:
+    return MatchSingleton(
+        value=self.value.deep_clone(),
+    )
+
+
+def _MatchSingleton_with_changes(
+    self: MatchSingleton, *, value: Any = _UNCHANGED
+) -> MatchSingleton:
+    return MatchSingleton(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _MatchStar_children(self: MatchStar) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.whitespace_before_name)
+    if self.name is not None:
+        children.append(self.name)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _MatchStar_deep_clone(self: MatchStar) -> MatchStar:
+    return MatchStar(
+        name=None if self.name is None else self.name.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_before_name=self.whitespace_before_name.deep_clone(),
+    )
+
+
+def _MatchStar_with_changes(
+    self: MatchStar,
+    *,
+    name: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_before_name: Any = _UNCHANGED,
+) -> MatchStar:
+    return MatchStar(
+        name=self.name if name is _UNCHANGED else name,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_before_name=self.whitespace_before_name
+        if whitespace_before_name is _UNCHANGED
+        else whitespace_before_name,
+    )
+
+
+def _MatchTuple_children(self: MatchTuple) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.patterns, *self.rpar]
+
+
+def _MatchTuple_deep_clone(self: MatchTuple) -> MatchTuple:
+    return MatchTuple(
+        patterns=tuple([child.deep_clone() for child in self.patterns]),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _MatchTuple_with_changes(
+    self: MatchTuple,
+    *,
+    patterns: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> MatchTuple:
+    return MatchTuple(
+        patterns=self.patterns if patterns is _UNCHANGED else patterns,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _MatchValue_children(self: MatchValue) -> Sequence[CSTNode]:
+    return [self.value]
+
+
+def _MatchValue_deep_clone(self: MatchValue) -> MatchValue:
+    return MatchValue(
+        value=self.value.deep_clone(),
+    )
+
+
+def _MatchValue_with_changes(
+    self: MatchValue, *, value: Any = _UNCHANGED
+) -> MatchValue:
+    return MatchValue(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _MatrixMultiply_children(self: MatrixMultiply) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _MatrixMultiply_deep_clone(self: MatrixMultiply) -> MatrixMultiply:
+    return MatrixMultiply(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _MatrixMultiply_with_changes(
+    self: MatrixMultiply,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> MatrixMultiply:
+    return MatrixMultiply(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _MatrixMultiplyAssign_children(self: MatrixMultiplyAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _MatrixMultiplyAssign_deep_clone(
+    self: MatrixMultiplyAssign,
+) -> MatrixMultiplyAssign:
+    return MatrixMultiplyAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _MatrixMultiplyAssign_with_changes(
+    self: MatrixMultiplyAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> MatrixMultiplyAssign:
+    return MatrixMultiplyAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Minus_children(self: Minus) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _Minus_deep_clone(self: Minus) -> Minus:
+    return Minus(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Minus_with_changes(self: Minus, *, whitespace_after: Any = _UNCHANGED) -> Minus:
+    return Minus(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Module_children(self: Module) -> Sequence[CSTNode]:
+    return [*self.header, *self.body, *self.footer]
+
+
+def _Module_deep_clone(self: Module) -> Module:
+    return Module(
+        body=tuple([child.deep_clone() for child in self.body]),
+        header=tuple([child.deep_clone() for child in self.header]),
+        footer=tuple([child.deep_clone() for child in self.footer]),
+        encoding=self.encoding,
+        default_indent=self.default_indent,
+        default_newline=self.default_newline,
+        has_trailing_newline=self.has_trailing_newline,
+    )
+
+
+def _Module_with_changes(
+    self: Module,
+    *,
+    body: Any = _UNCHANGED,
+    header: Any = _UNCHANGED,
+    footer: Any = _UNCHANGED,
+    encoding: Any = _UNCHANGED,
+    default_indent: Any = _UNCHANGED,
+    default_newline: Any = _UNCHANGED,
+    has_trailing_newline: Any = _UNCHANGED,
+) -> Module:
+    return Module(
+        body=self.body if body is _UNCHANGED else body,
+        header=self.header if header is _UNCHANGED else header,
+        footer=self.footer if footer is _UNCHANGED else footer,
+        encoding=self.encoding if encoding is _UNCHANGED else encoding,
+        default_indent=self.default_indent
+        if default_indent is _UNCHANGED
+        else default_indent,
+        default_newline=self.default_newline
+        if default_newline is _UNCHANGED
+        else default_newline,
+        has_trailing_newline=self.has_trailing_newline
+        if has_trailing_newline is _UNCHANGED
+        else has_trailing_newline,
+    )
+
+
+def _Modulo_children(self: Modulo) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Modulo_deep_clone(self: Modulo) -> Modulo:
+    return Modulo(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Modulo_with_changes(
+    self: Modulo,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Modulo:
+    return Modulo(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _ModuloAssign_children(self: ModuloAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _ModuloAssign_deep_clone(self: ModuloAssign) -> ModuloAssign:
+    return ModuloAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _ModuloAssign_with_changes(
+    self: ModuloAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> ModuloAssign:
+    return ModuloAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Multiply_children(self: Multiply) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Multiply_deep_clone(self: Multiply) -> Multiply:
+    return Multiply(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Multiply_with_changes(
+    self: Multiply,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Multiply:
+    return Multiply(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _MultiplyAssign_children(self: MultiplyAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _MultiplyAssign_deep_clone(self: MultiplyAssign) -> MultiplyAssign:
+    return MultiplyAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _MultiplyAssign_with_changes(
+    self: MultiplyAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> MultiplyAssign:
+    return MultiplyAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Name_children(self: Name) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _Name_deep_clone(self: Name) -> Name:
+    return Name(
+        value=self.value,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Name_with_changes(
+    self: Name,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Name:
+    return Name(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _NameItem_children(self: NameItem) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.name)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _NameItem_deep_clone(self: NameItem) -> NameItem:
+    return NameItem(
+        name=self.name.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _NameItem_with_changes(
+    self: NameItem, *, name: Any = _UNCHANGED, comma: Any = _UNCHANGED
+) -> NameItem:
+    return NameItem(
+        name=self.name if name is _UNCHANGED else name,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _NamedExpr_children(self: NamedExpr) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.target,
+        self.whitespace_before_walrus,
+        self.whitespace_after_walrus,
+        self.value,
+        *self.rpar,
+    ]
+
+
+def _NamedExpr_deep_clone(self: NamedExpr) -> NamedExpr:
+    return NamedExpr(
+        target=self.target.deep_clone(),
+        value=self.value.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_before_walrus=self.whitespace_before_walrus.deep_clone(),
+        whitespace_after_walrus=self.whitespace_after_walrus.deep_clone(),
+    )
+
+
+def _NamedExpr_with_changes(
+    self: NamedExpr,
+    *,
+    target: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_before_walrus: Any = _UNCHANGED,
+    whitespace_after_walrus: Any = _UNCHANGED,
+) -> NamedExpr:
+    return NamedExpr(
+        target=self.target if target is _UNCHANGED else target,
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_before_walrus=self.whitespace_before_walrus
+        if whitespace_before_walrus is _UNCHANGED
+        else whitespace_before_walrus,
+        whitespace_after_walrus=self.whitespace_after_walrus
+        if whitespace_after_walrus is _UNCHANGED
+        else whitespace_after_walrus,
+    )
+
+
+def _Newline_deep_clone(self: Newline) -> Newline:
+    return Newline(
+        value=self.value,
+    )
+
+
+def _Newline_with_changes(self: Newline, *, value: Any = _UNCHANGED) -> Newline:
+    return Newline(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _Nonlocal_children(self: Nonlocal) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_nonlocal, *self.names]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Nonlocal_deep_clone(self: Nonlocal) -> Nonlocal:
+    return Nonlocal(
+        names=tuple([child.deep_clone() for child in self.names]),
+        whitespace_after_nonlocal=self.whitespace_after_nonlocal.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Nonlocal_with_changes(
+    self: Nonlocal,
+    *,
+    names: Any = _UNCHANGED,
+    whitespace_after_nonlocal: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Nonlocal:
+    return Nonlocal(
+        names=self.names if names is _UNCHANGED else names,
+        whitespace_after_nonlocal=self.whitespace_after_nonlocal
+        if whitespace_after_nonlocal is _UNCHANGED
+        else whitespace_after_nonlocal,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Not_children(self: Not) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _Not_deep_clone(self: Not) -> Not:
+    return Not(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Not_with_changes(self: Not, *, whitespace_after: Any = _UNCHANGED) -> Not:
+    return Not(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _NotEqual_children(self: NotEqual) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _NotEqual_deep_clone(self: NotEqual) -> NotEqual:
+    return NotEqual(
+        value=self.value,
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _NotEqual_with_changes(
+    self: NotEqual,
+    *,
+    value: Any = _UNCHANGED,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> NotEqual:
+    return NotEqual(
+        value=self.value if value is _UNCHANGED else value,
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _NotIn_children(self: NotIn) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_between, self.whitespace_after]
+
+
+def _NotIn_deep_clone(self: NotIn) -> NotIn:
+    return NotIn(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_between=self.whitespace_between.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _NotIn_with_changes(
+    self: NotIn,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_between: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> NotIn:
+    return NotIn(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_between=self.whitespace_between
+        if whitespace_between is _UNCHANGED
+        else whitespace_between,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Or_children(self: Or) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Or_deep_clone(self: Or) -> Or:
+    return Or(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Or_with_changes(
+    self: Or, *, whitespace_before: Any = _UNCHANGED, whitespace_after: Any = _UNCHANGED
+) -> Or:
+    return Or(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Param_children(self: Param) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_star, self.name]
+    if self.annotation is not None:
+        children.append(self.annotation)
+    if not isinstance(self.equal, MaybeSentinel):
+        children.append(self.equal)
+    if self.default is not None:
+        children.append(self.default)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    children.append(self.whitespace_after_param)
+    return children
+
+
+def _Param_deep_clone(self: Param) -> Param:
+    return Param(
+        name=self.name.deep_clone(),
+        annotation=None if self.annotation is None else self.annotation.deep_clone(),
+        equal=self.equal
+        if isinstance(self.equal, MaybeSentinel)
+        else self.equal.deep_clone(),
+        default=None if self.default is None else self.default.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        star=self.star,
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+        whitespace_after_param=self.whitespace_after_param.deep_clone(),
+    )
+
+
+def _Param_with_changes(
+    self: Param,
+    *,
+    name: Any = _UNCHANGED,
+    annotation: Any = _UNCHANGED,
+    equal: Any = _UNCHANGED,
+    default: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    star: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+    whitespace_after_param: Any = _UNCHANGED,
+) -> Param:
+    return Param(
+        name=self.name if name is _UNCHANGED else name,
+        annotation=self.annotation if annotation is _UNCHANGED else annotation,
+        equal=self.equal if equal is _UNCHANGED else equal,
+        default=self.default if default is _UNCHANGED else default,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        star=self.star if star is _UNCHANGED else star,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+        whitespace_after_param=self.whitespace_after_param
+        if whitespace_after_param is _UNCHANGED
+        else whitespace_after_param,
+    )
+
+
+def _ParamSlash_children(self: ParamSlash) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    children.append(self.whitespace_after)
+    return children
+
+
+def _ParamSlash_deep_clone(self: ParamSlash) -> ParamSlash:
+    return ParamSlash(
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _ParamSlash_with_changes(
+    self: ParamSlash, *, comma: Any = _UNCHANGED, whitespace_after: Any = _UNCHANGED
+) -> ParamSlash:
+    return ParamSlash(
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _ParamSpec_children(self: ParamSpec) -> Sequence[CSTNode]:
+    return [self.name, self.whitespace_after_star]
+
+
+def _ParamSpec_deep_clone(self: ParamSpec) -> ParamSpec:
+    return ParamSpec(
+        name=self.name.deep_clone(),
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+    )
+
+
+def _ParamSpec_with_changes(
+    self: ParamSpec, *, name: Any = _UNCHANGED, whitespace_after_star: Any = _UNCHANGED
+) -> ParamSpec:
+    return ParamSpec(
+        name=self.name if name is _UNCHANGED else name,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+    )
+
+
+def _ParamStar_children(self: ParamStar) -> Sequence[CSTNode]:
+    return [self.comma]
+
+
+def _ParamStar_deep_clone(self: ParamStar) -> ParamStar:
+    return ParamStar(
+        comma=self.comma.deep_clone(),
+    )
+
+
+def _ParamStar_with_changes(self: ParamStar, *, comma: Any = _UNCHANGED) -> ParamStar:
+    return ParamStar(
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _Parameters_children(self: Parameters) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.posonly_params)
+    if not isinstance(self.posonly_ind, MaybeSentinel):
+        children.append(self.posonly_ind)
+    children.extend(self.params)
+    if not isinstance(self.star_arg, MaybeSentinel):
+        children.append(self.star_arg)
+    children.extend(self.kwonly_params)
+    if self.star_kwarg is not None:
+        children.append(self.star_kwarg)
+    return children
+
+
+def _Parameters_deep_clone(self: Parameters) -> Parameters:
+    return Parameters(
+        params=tuple([child.deep_clone() for child in self.params]),
+        star_arg=self.star_arg
+        if isinstance(self.star_arg, MaybeSentinel)
+        else self.star_arg.deep_clone(),
+        kwonly_params=tuple([child.deep_clone() for child in self.kwonly_params]),
+        star_kwarg=None if self.star_kwarg is None else self.star_kwarg.deep_clone(),
+        posonly_params=tuple([child.deep_clone() for child in self.posonly_params]),
+        posonly_ind=self.posonly_ind
+        if isinstance(self.posonly_ind, MaybeSentinel)
+        else self.posonly_ind.deep_clone(),
+    )
+
+
+def _Parameters_with_changes(
+    self: Parameters,
+    *,
+    params: Any = _UNCHANGED,
+    star_arg: Any = _UNCHANGED,
+    kwonly_params: Any = _UNCHANGED,
+    star_kwarg: Any = _UNCHANGED,
+    posonly_params: Any = _UNCHANGED,
+    posonly_ind: Any = _UNCHANGED,
+) -> Parameters:
+    return Parameters(
+        params=self.params if params is _UNCHANGED else params,
+        star_arg=self.star_arg if star_arg is _UNCHANGED else star_arg,
+        kwonly_params=self.kwonly_params
+        if kwonly_params is _UNCHANGED
+        else kwonly_params,
+        star_kwarg=self.star_kwarg if star_kwarg is _UNCHANGED else star_kwarg,
+        posonly_params=self.posonly_params
+        if posonly_params is _UNCHANGED
+        else posonly_params,
+        posonly_ind=self.posonly_ind if posonly_ind is _UNCHANGED else posonly_ind,
+    )
+
+
+def _ParenthesizedWhitespace_children(
+    self: ParenthesizedWhitespace,
+) -> Sequence[CSTNode]:
+    return [self.first_line, *self.empty_lines, self.last_line]
+
+
+def _ParenthesizedWhitespace_deep_clone(
+    self: ParenthesizedWhitespace,
+) -> ParenthesizedWhitespace:
+    return ParenthesizedWhitespace(
+        first_line=self.first_line.deep_clone(),
+        empty_lines=tuple([child.deep_clone() for child in self.empty_lines]),
+        indent=self.indent,
+        last_line=self.last_line.deep_clone(),
+    )
+
+
+def _ParenthesizedWhitespace_with_changes(
+    self: ParenthesizedWhitespace,
+    *,
+    first_line: Any = _UNCHANGED,
+    empty_lines: Any = _UNCHANGED,
+    indent: Any = _UNCHANGED,
+    last_line: Any = _UNCHANGED,
+) -> ParenthesizedWhitespace:
+    return ParenthesizedWhitespace(
+        first_line=self.first_line if first_line is _UNCHANGED else first_line,
+        empty_lines=self.empty_lines if empty_lines is _UNCHANGED else empty_lines,
+        indent=self.indent if indent is _UNCHANGED else indent,
+        last_line=self.last_line if last_line is _UNCHANGED else last_line,
+    )
+
+
+def _Pass_children(self: Pass) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Pass_deep_clone(self: Pass) -> Pass:
+    return Pass(
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Pass_with_changes(self: Pass, *, semicolon: Any = _UNCHANGED) -> Pass:
+    return Pass(
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Plus_children(self: Plus) -> Sequence[CSTNode]:
+    return [self.whitespace_after]
+
+
+def _Plus_deep_clone(self: Plus) -> Plus:
+    return Plus(
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Plus_with_changes(self: Plus, *, whitespace_after: Any = _UNCHANGED) -> Plus:
+    return Plus(
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Power_children(self: Power) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Power_deep_clone(self: Power) -> Power:
+    return Power(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Power_with_changes(
+    self: Power,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Power:
+    return Power(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _PowerAssign_children(self: PowerAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _PowerAssign_deep_clone(self: PowerAssign) -> PowerAssign:
+    return PowerAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _PowerAssign_with_changes(
+    self: PowerAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> PowerAssign:
+    return PowerAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Raise_children(self: Raise) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.whitespace_after_raise, MaybeSentinel):
+        children.append(self.whitespace_after_raise)
+    if self.exc is not None:
+        children.append(self.exc)
+    if self.cause is not None:
+        children.append(self.cause)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Raise_deep_clone(self: Raise) -> Raise:
+    return Raise(
+        exc=None if self.exc is None else self.exc.deep_clone(),
+        cause=None if self.cause is None else self.cause.deep_clone(),
+        whitespace_after_raise=self.whitespace_after_raise
+        if isinstance(self.whitespace_after_raise, MaybeSentinel)
+        else self.whitespace_after_raise.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Raise_with_changes(
+    self: Raise,
+    *,
+    exc: Any = _UNCHANGED,
+    cause: Any = _UNCHANGED,
+    whitespace_after_raise: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Raise:
+    return Raise(
+        exc=self.exc if exc is _UNCHANGED else exc,
+        cause=self.cause if cause is _UNCHANGED else cause,
+        whitespace_after_raise=self.whitespace_after_raise
+        if whitespace_after_raise is _UNCHANGED
+        else whitespace_after_raise,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _Return_children(self: Return) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if not isinstance(self.whitespace_after_return, MaybeSentinel):
+        children.append(self.whitespace_after_return)
+    if self.value is not None:
+        children.append(self.value)
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _Return_deep_clone(self: Return) -> Return:
+    return Return(
+        value=None if self.value is None else self.value.deep_clone(),
+        whitespace_after_return=self.whitespace_after_return
+        if isinstance(self.whitespace_after_return, MaybeSentinel)
+        else self.whitespace_after_return.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _Return_with_changes(
+    self: Return,
+    *,
+    value: Any = _UNCHANGED,
+    whitespace_after_return: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> Return:
+    return Return(
+        value=self.value if value is _UNCHANGED else value,
+        whitespace_after_return=self.whitespace_after_return
+        if whitespace_after_return is _UNCHANGED
+        else whitespace_after_return,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _RightCurlyBrace_children(self: RightCurlyBrace) -> Sequence[CSTNode]:
+    return [self.whitespace_before]
+
+
+def _RightCurlyBrace_deep_clone(self: RightCurlyBrace) -> RightCurlyBrace:
+    return RightCurlyBrace(
+        whitespace_before=self.whitespace_before.deep_clone(),
+    )
+
+
+def _RightCurlyBrace_with_changes(
+    self: RightCurlyBrace, *, whitespace_before: Any = _UNCHANGED
+) -> RightCurlyBrace:
+    return RightCurlyBrace(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+    )
+
+
+def _RightParen_children(self: RightParen) -> Sequence[CSTNode]:
+    return [self.whitespace_before]
+
+
+def _RightParen_deep_clone(self: RightParen) -> RightParen:
+    return RightParen(
+        whitespace_before=self.whitespace_before.deep_clone(),
+    )
+
+
+def _RightParen_with_changes(
+    self: RightParen, *, whitespace_before: Any = _UNCHANGED
+) -> RightParen:
+    return RightParen(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+    )
+
+
+def _RightShift_children(self: RightShift) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _RightShift_deep_clone(self: RightShift) -> RightShift:
+    return RightShift(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _RightShift_with_changes(
+    self: RightShift,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> RightShift:
+    return RightShift(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _RightShiftAssign_children(self: RightShiftAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _RightShiftAssign_deep_clone(self: RightShiftAssign) -> RightShiftAssign:
+    return RightShiftAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _RightShiftAssign_with_changes(
+    self: RightShiftAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> RightShiftAssign:
+    return RightShiftAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _RightSquareBracket_children(self: RightSquareBracket) -> Sequence[CSTNode]:
+    return [self.whitespace_before]
+
+
+def _RightSquareBracket_deep_clone(self: RightSquareBracket) -> RightSquareBracket:
+    return RightSquareBracket(
+        whitespace_before=self.whitespace_before.deep_clone(),
+    )
+
+
+def _RightSquareBracket_with_changes(
+    self: RightSquareBracket, *, whitespace_before: Any = _UNCHANGED
+) -> RightSquareBracket:
+    return RightSquareBracket(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+    )
+
+
+def _Semicolon_children(self: Semicolon) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Semicolon_deep_clone(self: Semicolon) -> Semicolon:
+    return Semicolon(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Semicolon_with_changes(
+    self: Semicolon,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Semicolon:
+    return Semicolon(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _Set_children(self: Set) -> Sequence[CSTNode]:
+    return [*self.lpar, self.lbrace, *self.elements, self.rbrace, *self.rpar]
+
+
+def _Set_deep_clone(self: Set) -> Set:
+    return Set(
+        elements=tuple([child.deep_clone() for child in self.elements]),
+        lbrace=self.lbrace.deep_clone(),
+        rbrace=self.rbrace.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Set_with_changes(
+    self: Set,
+    *,
+    elements: Any = _UNCHANGED,
+    lbrace: Any = _UNCHANGED,
+    rbrace: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Set:
+    return Set(
+        elements=self.elements if elements is _UNCHANGED else elements,
+        lbrace=self.lbrace if lbrace is _UNCHANGED else lbrace,
+        rbrace=self.rbrace if rbrace is _UNCHANGED else rbrace,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _SetComp_children(self: SetComp) -> Sequence[CSTNode]:
+    return [*self.lpar, self.lbrace, self.elt, self.for_in, self.rbrace, *self.rpar]
+
+
+def _SetComp_deep_clone(self: SetComp) -> SetComp:
+    return SetComp(
+        elt=self.elt.deep_clone(),
+        for_in=self.for_in.deep_clone(),
+        lbrace=self.lbrace.deep_clone(),
+        rbrace=self.rbrace.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _SetComp_with_changes(
+    self: SetComp,
+    *,
+    elt: Any = _UNCHANGED,
+    for_in: Any = _UNCHANGED,
+    lbrace: Any = _UNCHANGED,
+    rbrace: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> SetComp:
+    return SetComp(
+        elt=self.elt if elt is _UNCHANGED else elt,
+        for_in=self.for_in if for_in is _UNCHANGED else for_in,
+        lbrace=self.lbrace if lbrace is _UNCHANGED else lbrace,
+        rbrace=self.rbrace if rbrace is _UNCHANGED else rbrace,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _SimpleStatementLine_children(self: SimpleStatementLine) -> Sequence[CSTNode]:
+    return [*self.leading_lines, *self.body, self.trailing_whitespace]
+
+
+def _SimpleStatementLine_deep_clone(self: SimpleStatementLine) -> SimpleStatementLine:
+    return SimpleStatementLine(
+        body=tuple([child.deep_clone() for child in self.body]),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        trailing_whitespace=self.trailing_whitespace.deep_clone(),
+    )
+
+
+def _SimpleStatementLine_with_changes(
+    self: SimpleStatementLine,
+    *,
+    body: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    trailing_whitespace: Any = _UNCHANGED,
+) -> SimpleStatementLine:
+    return SimpleStatementLine(
+        body=self.body if body is _UNCHANGED else body,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        trailing_whitespace=self.trailing_whitespace
+        if trailing_whitespace is _UNCHANGED
+        else trailing_whitespace,
+    )
+
+
+def _SimpleStatementSuite_children(self: SimpleStatementSuite) -> Sequence[CSTNode]:
+    return [self.leading_whitespace, *self.body, self.trailing_whitespace]
+
+
+def _SimpleStatementSuite_deep_clone(
+    self: SimpleStatementSuite,
+) -> SimpleStatementSuite:
+    return SimpleStatementSuite(
+        body=tuple([child.deep_clone() for child in self.body]),
+        leading_whitespace=self.leading_whitespace.deep_clone(),
+        trailing_whitespace=self.trailing_whitespace.deep_clone(),
+    )
+
+
+def _SimpleStatementSuite_with_changes(
+    self: SimpleStatementSuite,
+    *,
+    body: Any = _UNCHANGED,
+    leading_whitespace: Any = _UNCHANGED,
+    trailing_whitespace: Any = _UNCHANGED,
+) -> SimpleStatementSuite:
+    return SimpleStatementSuite(
+        body=self.body if body is _UNCHANGED else body,
+        leading_whitespace=self.leading_whitespace
+        if leading_whitespace is _UNCHANGED
+        else leading_whitespace,
+        trailing_whitespace=self.trailing_whitespace
+        if trailing_whitespace is _UNCHANGED
+        else trailing_whitespace,
+    )
+
+
+def _SimpleString_children(self: SimpleString) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.rpar]
+
+
+def _SimpleString_deep_clone(self: SimpleString) -> SimpleString:
+    return SimpleString(
+        value=self.value,
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _SimpleString_with_changes(
+    self: SimpleString,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> SimpleString:
+    return SimpleString(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _SimpleWhitespace_deep_clone(self: SimpleWhitespace) -> SimpleWhitespace:
+    return SimpleWhitespace(
+        value=self.value,
+    )
+
+
+def _SimpleWhitespace_with_changes(
+    self: SimpleWhitespace, *, value: Any = _UNCHANGED
+) -> SimpleWhitespace:
+    return SimpleWhitespace(
+        value=self.value if value is _UNCHANGED else value,
+    )
+
+
+def _Slice_children(self: Slice) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    if self.lower is not None:
+        children.append(self.lower)
+    children.append(self.first_colon)
+    if self.upper is not None:
+        children.append(self.upper)
+    if not isinstance(self.second_colon, MaybeSentinel):
+        children.append(self.second_colon)
+    if self.step is not None:
+        children.append(self.step)
+    return children
+
+
+def _Slice_deep_clone(self: Slice) -> Slice:
+    return Slice(
+        lower=None if self.lower is None else self.lower.deep_clone(),
+        upper=None if self.upper is None else self.upper.deep_clone(),
+        step=None if self.step is None else self.step.deep_clone(),
+        first_colon=self.first_colon.deep_clone(),
+        second_colon=self.second_colon
+        if isinstance(self.second_colon, MaybeSentinel)
+        else self.second_colon.deep_clone(),
+    )
+
+
+def _Slice_with_changes(
+    self: Slice,
+    *,
+    lower: Any = _UNCHANGED,
+    upper: Any = _UNCHANGED,
+    step: Any = _UNCHANGED,
+    first_colon: Any = _UNCHANGED,
+    second_colon: Any = _UNCHANGED,
+) -> Slice:
+    return Slice(
+        lower=self.lower if lower is _UNCHANGED else lower,
+        upper=self.upper if upper is _UNCHANGED else upper,
+        step=self.step if step is _UNCHANGED else step,
+        first_colon=self.first_colon if first_colon is _UNCHANGED else first_colon,
+        second_colon=self.second_colon if second_colon is _UNCHANGED else second_colon,
+    )
+
+
+def _StarredDictElement_children(self: StarredDictElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_before_value, self.value]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _StarredDictElement_deep_clone(self: StarredDictElement) -> StarredDictElement:
+    return StarredDictElement(
+        value=self.value.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        whitespace_before_value=self.whitespace_before_value.deep_clone(),
+    )
+
+
+def _StarredDictElement_with_changes(
+    self: StarredDictElement,
+    *,
+    value: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    whitespace_before_value: Any = _UNCHANGED,
+) -> StarredDictElement:
+    return StarredDictElement(
+        value=self.value if value is _UNCHANGED else value,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        whitespace_before_value=self.whitespace_before_value
+        if whitespace_before_value is _UNCHANGED
+        else whitespace_before_value,
+    )
+
+
+def _StarredElement_children(self: StarredElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [*self.lpar, self.whitespace_before_value, self.value, *self.rpar]
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _StarredElement_deep_clone(self: StarredElement) -> StarredElement:
+    return StarredElement(
+        value=self.value.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_before_value=self.whitespace_before_value.deep_clone(),
+    )
+
+
+def _StarredElement_with_changes(
+    self: StarredElement,
+    *,
+    value: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_before_value: Any = _UNCHANGED,
+) -> StarredElement:
+    return StarredElement(
+        value=self.value if value is _UNCHANGED else value,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_before_value=self.whitespace_before_value
+        if whitespace_before_value is _UNCHANGED
+        else whitespace_before_value,
+    )
+
+
+def _Subscript_children(self: Subscript) -> Sequence[CSTNode]:
+    return [
+        *self.lpar,
+        self.value,
+        self.whitespace_after_value,
+        self.lbracket,
+        *self.slice,
+        self.rbracket,
+        *self.rpar,
+    ]
+
+
+def _Subscript_deep_clone(self: Subscript) -> Subscript:
+    return Subscript(
+        value=self.value.deep_clone(),
+        slice=tuple([child.deep_clone() for child in self.slice]),
+        lbracket=self.lbracket.deep_clone(),
+        rbracket=self.rbracket.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_after_value=self.whitespace_after_value.deep_clone(),
+    )
+
+
+def _Subscript_with_changes(
+    self: Subscript,
+    *,
+    value: Any = _UNCHANGED,
+    slice: Any = _UNCHANGED,
+    lbracket: Any = _UNCHANGED,
+    rbracket: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_value: Any = _UNCHANGED,
+) -> Subscript:
+    return Subscript(
+        value=self.value if value is _UNCHANGED else value,
+        slice=self.slice if slice is _UNCHANGED else slice,
+        lbracket=self.lbracket if lbracket is _UNCHANGED else lbracket,
+        rbracket=self.rbracket if rbracket is _UNCHANGED else rbracket,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_value=self.whitespace_after_value
+        if whitespace_after_value is _UNCHANGED
+        else whitespace_after_value,
+    )
+
+
+def _SubscriptElement_children(self: SubscriptElement) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.slice)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _SubscriptElement_deep_clone(self: SubscriptElement) -> SubscriptElement:
+    return SubscriptElement(
+        slice=self.slice.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _SubscriptElement_with_changes(
+    self: SubscriptElement, *, slice: Any = _UNCHANGED, comma: Any = _UNCHANGED
+) -> SubscriptElement:
+    return SubscriptElement(
+        slice=self.slice if slice is _UNCHANGED else slice,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _Subtract_children(self: Subtract) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _Subtract_deep_clone(self: Subtract) -> Subtract:
+    return Subtract(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _Subtract_with_changes(
+    self: Subtract,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> Subtract:
+    return Subtract(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _SubtractAssign_children(self: SubtractAssign) -> Sequence[CSTNode]:
+    return [self.whitespace_before, self.whitespace_after]
+
+
+def _SubtractAssign_deep_clone(self: SubtractAssign) -> SubtractAssign:
+    return SubtractAssign(
+        whitespace_before=self.whitespace_before.deep_clone(),
+        whitespace_after=self.whitespace_after.deep_clone(),
+    )
+
+
+def _SubtractAssign_with_changes(
+    self: SubtractAssign,
+    *,
+    whitespace_before: Any = _UNCHANGED,
+    whitespace_after: Any = _UNCHANGED,
+) -> SubtractAssign:
+    return SubtractAssign(
+        whitespace_before=self.whitespace_before
+        if whitespace_before is _UNCHANGED
+        else whitespace_before,
+        whitespace_after=self.whitespace_after
+        if whitespace_after is _UNCHANGED
+        else whitespace_after,
+    )
+
+
+def _TrailingWhitespace_children(self: TrailingWhitespace) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.whitespace)
+    if self.comment is not None:
+        children.append(self.comment)
+    children.append(self.newline)
+    return children
+
+
+def _TrailingWhitespace_deep_clone(self: TrailingWhitespace) -> TrailingWhitespace:
+    return TrailingWhitespace(
+        whitespace=self.whitespace.deep_clone(),
+        comment=None if self.comment is None else self.comment.deep_clone(),
+        newline=self.newline.deep_clone(),
+    )
+
+
+def _TrailingWhitespace_with_changes(
+    self: TrailingWhitespace,
+    *,
+    whitespace: Any = _UNCHANGED,
+    comment: Any = _UNCHANGED,
+    newline: Any = _UNCHANGED,
+) -> TrailingWhitespace:
+    return TrailingWhitespace(
+        whitespace=self.whitespace if whitespace is _UNCHANGED else whitespace,
+        comment=self.comment if comment is _UNCHANGED else comment,
+        newline=self.newline if newline is _UNCHANGED else newline,
+    )
+
+
+def _Try_children(self: Try) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        self.whitespace_before_colon,
+        self.body,
+        *self.handlers,
+    ]
+    if self.orelse is not None:
+        children.append(self.orelse)
+    if self.finalbody is not None:
+        children.append(self.finalbody)
+    return children
+
+
+def _Try_deep_clone(self: Try) -> Try:
+    return Try(
+        body=self.body.deep_clone(),
+        handlers=tuple([child.deep_clone() for child in self.handlers]),
+        orelse=None if self.orelse is None else self.orelse.deep_clone(),
+        finalbody=None if self.finalbody is None else self.finalbody.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _Try_with_changes(
+    self: Try,
+    *,
+    body: Any = _UNCHANGED,
+    handlers: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    finalbody: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> Try:
+    return Try(
+        body=self.body if body is _UNCHANGED else body,
+        handlers=self.handlers if handlers is _UNCHANGED else handlers,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        finalbody=self.finalbody if finalbody is _UNCHANGED else finalbody,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _TryStar_children(self: TryStar) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        self.whitespace_before_colon,
+        self.body,
+        *self.handlers,
+    ]
+    if self.orelse is not None:
+        children.append(self.orelse)
+    if self.finalbody is not None:
+        children.append(self.finalbody)
+    return children
+
+
+def _TryStar_deep_clone(self: TryStar) -> TryStar:
+    return TryStar(
+        body=self.body.deep_clone(),
+        handlers=tuple([child.deep_clone() for child in self.handlers]),
+        orelse=None if self.orelse is None else self.orelse.deep_clone(),
+        finalbody=None if self.finalbody is None else self.finalbody.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _TryStar_with_changes(
+    self: TryStar,
+    *,
+    body: Any = _UNCHANGED,
+    handlers: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    finalbody: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> TryStar:
+    return TryStar(
+        body=self.body if body is _UNCHANGED else body,
+        handlers=self.handlers if handlers is _UNCHANGED else handlers,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        finalbody=self.finalbody if finalbody is _UNCHANGED else finalbody,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _Tuple_children(self: Tuple) -> Sequence[CSTNode]:
+    return [*self.lpar, *self.elements, *self.rpar]
+
+
+def _Tuple_deep_clone(self: Tuple) -> Tuple:
+    return Tuple(
+        elements=tuple([child.deep_clone() for child in self.elements]),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _Tuple_with_changes(
+    self: Tuple,
+    *,
+    elements: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> Tuple:
+    return Tuple(
+        elements=self.elements if elements is _UNCHANGED else elements,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _TypeAlias_children(self: TypeAlias) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [self.whitespace_after_type, self.name]
+    if not isinstance(self.whitespace_after_name, MaybeSentinel):
+        children.append(self.whitespace_after_name)
+    if self.type_parameters is not None:
+        children.append(self.type_parameters)
+    if not isinstance(self.whitespace_after_type_parameters, MaybeSentinel):
+        children.append(self.whitespace_after_type_parameters)
+    children += [self.whitespace_after_equals, self.value]
+    if not isinstance(self.semicolon, MaybeSentinel):
+        children.append(self.semicolon)
+    return children
+
+
+def _TypeAlias_deep_clone(self: TypeAlias) -> TypeAlias:
+    return TypeAlias(
+        name=self.name.deep_clone(),
+        value=self.value.deep_clone(),
+        type_parameters=None
+        if self.type_parameters is None
+        else self.type_parameters.deep_clone(),
+        whitespace_after_type=self.whitespace_after_type.deep_clone(),
+        whitespace_after_name=self.whitespace_after_name
+        if isinstance(self.whitespace_after_name, MaybeSentinel)
+        else self.whitespace_after_name.deep_clone(),
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters
+        if isinstance(self.whitespace_after_type_parameters, MaybeSentinel)
+        else self.whitespace_after_type_parameters.deep_clone(),
+        whitespace_after_equals=self.whitespace_after_equals.deep_clone(),
+        semicolon=self.semicolon
+        if isinstance(self.semicolon, MaybeSentinel)
+        else self.semicolon.deep_clone(),
+    )
+
+
+def _TypeAlias_with_changes(
+    self: TypeAlias,
+    *,
+    name: Any = _UNCHANGED,
+    value: Any = _UNCHANGED,
+    type_parameters: Any = _UNCHANGED,
+    whitespace_after_type: Any = _UNCHANGED,
+    whitespace_after_name: Any = _UNCHANGED,
+    whitespace_after_type_parameters: Any = _UNCHANGED,
+    whitespace_after_equals: Any = _UNCHANGED,
+    semicolon: Any = _UNCHANGED,
+) -> TypeAlias:
+    return TypeAlias(
+        name=self.name if name is _UNCHANGED else name,
+        value=self.value if value is _UNCHANGED else value,
+        type_parameters=self.type_parameters
+        if type_parameters is _UNCHANGED
+        else type_parameters,
+        whitespace_after_type=self.whitespace_after_type
+        if whitespace_after_type is _UNCHANGED
+        else whitespace_after_type,
+        whitespace_after_name=self.whitespace_after_name
+        if whitespace_after_name is _UNCHANGED
+        else whitespace_after_name,
+        whitespace_after_type_parameters=self.whitespace_after_type_parameters
+        if whitespace_after_type_parameters is _UNCHANGED
+        else whitespace_after_type_parameters,
+        whitespace_after_equals=self.whitespace_after_equals
+        if whitespace_after_equals is _UNCHANGED
+        else whitespace_after_equals,
+        semicolon=self.semicolon if semicolon is _UNCHANGED else semicolon,
+    )
+
+
+def _TypeParam_children(self: TypeParam) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.param)
+    if not isinstance(self.equal, MaybeSentinel):
+        children.append(self.equal)
+    children.append(self.whitespace_after_star)
+    if self.default is not None:
+        children.append(self.default)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _TypeParam_deep_clone(self: TypeParam) -> TypeParam:
+    return TypeParam(
+        param=self.param.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+        equal=self.equal
+        if isinstance(self.equal, MaybeSentinel)
+        else self.equal.deep_clone(),
+        star=self.star,
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+        default=None if self.default is None else self.default.deep_clone(),
+    )
+
+
+def _TypeParam_with_changes(
+    self: TypeParam,
+    *,
+    param: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+    equal: Any = _UNCHANGED,
+    star: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+    default: Any = _UNCHANGED,
+) -> TypeParam:
+    return TypeParam(
+        param=self.param if param is _UNCHANGED else param,
+        comma=self.comma if comma is _UNCHANGED else comma,
+        equal=self.equal if equal is _UNCHANGED else equal,
+        star=self.star if star is _UNCHANGED else star,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+        default=self.default if default is _UNCHANGED else default,
+    )
+
+
+def _TypeParameters_children(self: TypeParameters) -> Sequence[CSTNode]:
+    return [self.lbracket, *self.params, self.rbracket]
+
+
+def _TypeParameters_deep_clone(self: TypeParameters) -> TypeParameters:
+    return TypeParameters(
+        params=tuple([child.deep_clone() for child in self.params]),
+        lbracket=self.lbracket.deep_clone(),
+        rbracket=self.rbracket.deep_clone(),
+    )
+
+
+def _TypeParameters_with_changes(
+    self: TypeParameters,
+    *,
+    params: Any = _UNCHANGED,
+    lbracket: Any = _UNCHANGED,
+    rbracket: Any = _UNCHANGED,
+) -> TypeParameters:
+    return TypeParameters(
+        params=self.params if params is _UNCHANGED else params,
+        lbracket=self.lbracket if lbracket is _UNCHANGED else lbracket,
+        rbracket=self.rbracket if rbracket is _UNCHANGED else rbracket,
+    )
+
+
+def _TypeVar_children(self: TypeVar) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.name)
+    if not isinstance(self.colon, MaybeSentinel):
+        children.append(self.colon)
+    if self.bound is not None:
+        children.append(self.bound)
+    return children
+
+
+def _TypeVar_deep_clone(self: TypeVar) -> TypeVar:
+    return TypeVar(
+        name=self.name.deep_clone(),
+        bound=None if self.bound is None else self.bound.deep_clone(),
+        colon=self.colon
+        if isinstance(self.colon, MaybeSentinel)
+        else self.colon.deep_clone(),
+    )
+
+
+def _TypeVar_with_changes(
+    self: TypeVar,
+    *,
+    name: Any = _UNCHANGED,
+    bound: Any = _UNCHANGED,
+    colon: Any = _UNCHANGED,
+) -> TypeVar:
+    return TypeVar(
+        name=self.name if name is _UNCHANGED else name,
+        bound=self.bound if bound is _UNCHANGED else bound,
+        colon=self.colon if colon is _UNCHANGED else colon,
+    )
+
+
+def _TypeVarTuple_children(self: TypeVarTuple) -> Sequence[CSTNode]:
+    return [self.name, self.whitespace_after_star]
+
+
+def _TypeVarTuple_deep_clone(self: TypeVarTuple) -> TypeVarTuple:
+    return TypeVarTuple(
+        name=self.name.deep_clone(),
+        whitespace_after_star=self.whitespace_after_star.deep_clone(),
+    )
+
+
+def _TypeVarTuple_with_changes(
+    self: TypeVarTuple,
+    *,
+    name: Any = _UNCHANGED,
+    whitespace_after_star: Any = _UNCHANGED,
+) -> TypeVarTuple:
+    return TypeVarTuple(
+        name=self.name if name is _UNCHANGED else name,
+        whitespace_after_star=self.whitespace_after_star
+        if whitespace_after_star is _UNCHANGED
+        else whitespace_after_star,
+    )
+
+
+def _UnaryOperation_children(self: UnaryOperation) -> Sequence[CSTNode]:
+    return [*self.lpar, self.operator, self.expression, *self.rpar]
+
+
+def _UnaryOperation_deep_clone(self: UnaryOperation) -> UnaryOperation:
+    return UnaryOperation(
+        operator=self.operator.deep_clone(),
+        expression=self.expression.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+    )
+
+
+def _UnaryOperation_with_changes(
+    self: UnaryOperation,
+    *,
+    operator: Any = _UNCHANGED,
+    expression: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+) -> UnaryOperation:
+    return UnaryOperation(
+        operator=self.operator if operator is _UNCHANGED else operator,
+        expression=self.expression if expression is _UNCHANGED else expression,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+    )
+
+
+def _While_children(self: While) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children += [
+        *self.leading_lines,
+        self.whitespace_after_while,
+        self.test,
+        self.whitespace_before_colon,
+        self.body,
+    ]
+    if self.orelse is not None:
+        children.append(self.orelse)
+    return children
+
+
+def _While_deep_clone(self: While) -> While:
+    return While(
+        test=self.test.deep_clone(),
+        body=self.body.deep_clone(),
+        orelse=None if self.orelse is None else self.orelse.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        whitespace_after_while=self.whitespace_after_while.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _While_with_changes(
+    self: While,
+    *,
+    test: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    orelse: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    whitespace_after_while: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> While:
+    return While(
+        test=self.test if test is _UNCHANGED else test,
+        body=self.body if body is _UNCHANGED else body,
+        orelse=self.orelse if orelse is _UNCHANGED else orelse,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        whitespace_after_while=self.whitespace_after_while
+        if whitespace_after_while is _UNCHANGED
+        else whitespace_after_while,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _With_children(self: With) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.leading_lines)
+    if self.asynchronous is not None:
+        children.append(self.asynchronous)
+    children.append(self.whitespace_after_with)
+    if not isinstance(self.lpar, MaybeSentinel):
+        children.append(self.lpar)
+    children.extend(self.items)
+    if not isinstance(self.rpar, MaybeSentinel):
+        children.append(self.rpar)
+    children += [self.whitespace_before_colon, self.body]
+    return children
+
+
+def _With_deep_clone(self: With) -> With:
+    return With(
+        items=tuple([child.deep_clone() for child in self.items]),
+        body=self.body.deep_clone(),
+        asynchronous=None
+        if self.asynchronous is None
+        else self.asynchronous.deep_clone(),
+        leading_lines=tuple([child.deep_clone() for child in self.leading_lines]),
+        lpar=self.lpar
+        if isinstance(self.lpar, MaybeSentinel)
+        else self.lpar.deep_clone(),
+        rpar=self.rpar
+        if isinstance(self.rpar, MaybeSentinel)
+        else self.rpar.deep_clone(),
+        whitespace_after_with=self.whitespace_after_with.deep_clone(),
+        whitespace_before_colon=self.whitespace_before_colon.deep_clone(),
+    )
+
+
+def _With_with_changes(
+    self: With,
+    *,
+    items: Any = _UNCHANGED,
+    body: Any = _UNCHANGED,
+    asynchronous: Any = _UNCHANGED,
+    leading_lines: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_with: Any = _UNCHANGED,
+    whitespace_before_colon: Any = _UNCHANGED,
+) -> With:
+    return With(
+        items=self.items if items is _UNCHANGED else items,
+        body=self.body if body is _UNCHANGED else body,
+        asynchronous=self.asynchronous if asynchronous is _UNCHANGED else asynchronous,
+        leading_lines=self.leading_lines
+        if leading_lines is _UNCHANGED
+        else leading_lines,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_with=self.whitespace_after_with
+        if whitespace_after_with is _UNCHANGED
+        else whitespace_after_with,
+        whitespace_before_colon=self.whitespace_before_colon
+        if whitespace_before_colon is _UNCHANGED
+        else whitespace_before_colon,
+    )
+
+
+def _WithItem_children(self: WithItem) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.append(self.item)
+    if self.asname is not None:
+        children.append(self.asname)
+    if not isinstance(self.comma, MaybeSentinel):
+        children.append(self.comma)
+    return children
+
+
+def _WithItem_deep_clone(self: WithItem) -> WithItem:
+    return WithItem(
+        item=self.item.deep_clone(),
+        asname=None if self.asname is None else self.asname.deep_clone(),
+        comma=self.comma
+        if isinstance(self.comma, MaybeSentinel)
+        else self.comma.deep_clone(),
+    )
+
+
+def _WithItem_with_changes(
+    self: WithItem,
+    *,
+    item: Any = _UNCHANGED,
+    asname: Any = _UNCHANGED,
+    comma: Any = _UNCHANGED,
+) -> WithItem:
+    return WithItem(
+        item=self.item if item is _UNCHANGED else item,
+        asname=self.asname if asname is _UNCHANGED else asname,
+        comma=self.comma if comma is _UNCHANGED else comma,
+    )
+
+
+def _Yield_children(self: Yield) -> Sequence[CSTNode]:
+    children: TypingList[CSTNode] = []
+    children.extend(self.lpar)
+    if not isinstance(self.whitespace_after_yield, MaybeSentinel):
+        children.append(self.whitespace_after_yield)
+    if self.value is not None:
+        children.append(self.value)
+    children.extend(self.rpar)
+    return children
+
+
+def _Yield_deep_clone(self: Yield) -> Yield:
+    return Yield(
+        value=None if self.value is None else self.value.deep_clone(),
+        lpar=tuple([child.deep_clone() for child in self.lpar]),
+        rpar=tuple([child.deep_clone() for child in self.rpar]),
+        whitespace_after_yield=self.whitespace_after_yield
+        if isinstance(self.whitespace_after_yield, MaybeSentinel)
+        else self.whitespace_after_yield.deep_clone(),
+    )
+
+
+def _Yield_with_changes(
+    self: Yield,
+    *,
+    value: Any = _UNCHANGED,
+    lpar: Any = _UNCHANGED,
+    rpar: Any = _UNCHANGED,
+    whitespace_after_yield: Any = _UNCHANGED,
+) -> Yield:
+    return Yield(
+        value=self.value if value is _UNCHANGED else value,
+        lpar=self.lpar if lpar is _UNCHANGED else lpar,
+        rpar=self.rpar if rpar is _UNCHANGED else rpar,
+        whitespace_after_yield=self.whitespace_after_yield
+        if whitespace_after_yield is _UNCHANGED
+        else whitespace_after_yield,
+    )
+
+
+_install_generated_methods(
+    Add,
+    ("whitespace_before", "whitespace_after"),
+    _Add_children,
+    _Add_deep_clone,
+    _Add_with_changes,
+)
+_install_generated_methods(
+    AddAssign,
+    ("whitespace_before", "whitespace_after"),
+    _AddAssign_children,
+    _AddAssign_deep_clone,
+    _AddAssign_with_changes,
+)
+_install_generated_methods(
+    And,
+    ("whitespace_before", "whitespace_after"),
+    _And_children,
+    _And_deep_clone,
+    _And_with_changes,
+)
+_install_generated_methods(
+    AnnAssign,
+    ("target", "annotation", "value", "equal", "semicolon"),
+    _AnnAssign_children,
+    _AnnAssign_deep_clone,
+    _AnnAssign_with_changes,
+)
+_install_generated_methods(
+    Annotation,
+    ("annotation", "whitespace_before_indicator", "whitespace_after_indicator"),
+    _Annotation_children,
+    _Annotation_deep_clone,
+    _Annotation_with_changes,
+)
+_install_generated_methods(
+    Arg,
+    (
+        "value",
+        "keyword",
+        "equal",
+        "comma",
+        "star",
+        "whitespace_after_star",
+        "whitespace_after_arg",
+    ),
+    _Arg_children,
+    _Arg_deep_clone,
+    _Arg_with_changes,
+)
+_install_generated_methods(
+    AsName,
+    ("name", "whitespace_before_as", "whitespace_after_as"),
+    _AsName_children,
+    _AsName_deep_clone,
+    _AsName_with_changes,
+)
+_install_generated_methods(
+    Assert,
+    ("test", "msg", "comma", "whitespace_after_assert", "semicolon"),
+    _Assert_children,
+    _Assert_deep_clone,
+    _Assert_with_changes,
+)
+_install_generated_methods(
+    Assign,
+    ("targets", "value", "semicolon"),
+    _Assign_children,
+    _Assign_deep_clone,
+    _Assign_with_changes,
+)
+_install_generated_methods(
+    AssignEqual,
+    ("whitespace_before", "whitespace_after"),
+    _AssignEqual_children,
+    _AssignEqual_deep_clone,
+    _AssignEqual_with_changes,
+)
+_install_generated_methods(
+    AssignTarget,
+    ("target", "whitespace_before_equal", "whitespace_after_equal"),
+    _AssignTarget_children,
+    _AssignTarget_deep_clone,
+    _AssignTarget_with_changes,
+)
+_install_generated_methods(
+    Asynchronous,
+    ("whitespace_after",),
+    _Asynchronous_children,
+    _Asynchronous_deep_clone,
+    _Asynchronous_with_changes,
+)
+_install_generated_methods(
+    Attribute,
+    ("value", "attr", "dot", "lpar", "rpar"),
+    _Attribute_children,
+    _Attribute_deep_clone,
+    _Attribute_with_changes,
+)
+_install_generated_methods(
+    AugAssign,
+    ("target", "operator", "value", "semicolon"),
+    _AugAssign_children,
+    _AugAssign_deep_clone,
+    _AugAssign_with_changes,
+)
+_install_generated_methods(
+    Await,
+    ("expression", "lpar", "rpar", "whitespace_after_await"),
+    _Await_children,
+    _Await_deep_clone,
+    _Await_with_changes,
+)
+_install_generated_methods(
+    BinaryOperation,
+    ("left", "operator", "right", "lpar", "rpar"),
+    _BinaryOperation_children,
+    _BinaryOperation_deep_clone,
+    _BinaryOperation_with_changes,
+)
+_install_generated_methods(
+    BitAnd,
+    ("whitespace_before", "whitespace_after"),
+    _BitAnd_children,
+    _BitAnd_deep_clone,
+    _BitAnd_with_changes,
+)
+_install_generated_methods(
+    BitAndAssign,
+    ("whitespace_before", "whitespace_after"),
+    _BitAndAssign_children,
+    _BitAndAssign_deep_clone,
+    _BitAndAssign_with_changes,
+)
+_install_generated_methods(
+    BitInvert,
+    ("whitespace_after",),
+    _BitInvert_children,
+    _BitInvert_deep_clone,
+    _BitInvert_with_changes,
+)
+_install_generated_methods(
+    BitOr,
+    ("whitespace_before", "whitespace_after"),
+    _BitOr_children,
+    _BitOr_deep_clone,
+    _BitOr_with_changes,
+)
+_install_generated_methods(
+    BitOrAssign,
+    ("whitespace_before", "whitespace_after"),
+    _BitOrAssign_children,
+    _BitOrAssign_deep_clone,
+    _BitOrAssign_with_changes,
+)
+_install_generated_methods(
+    BitXor,
+    ("whitespace_before", "whitespace_after"),
+    _BitXor_children,
+    _BitXor_deep_clone,
+    _BitXor_with_changes,
+)
+_install_generated_methods(
+    BitXorAssign,
+    ("whitespace_before", "whitespace_after"),
+    _BitXorAssign_children,
+    _BitXorAssign_deep_clone,
+    _BitXorAssign_with_changes,
+)
+_install_generated_methods(
+    BooleanOperation,
+    ("left", "operator", "right", "lpar", "rpar"),
+    _BooleanOperation_children,
+    _BooleanOperation_deep_clone,
+    _BooleanOperation_with_changes,
+)
+_install_generated_methods(
+    Break, ("semicolon",), _Break_children, _Break_deep_clone, _Break_with_changes
+)
+_install_generated_methods(
+    Call,
+    ("func", "args", "lpar", "rpar", "whitespace_after_func", "whitespace_before_args"),
+    _Call_children,
+    _Call_deep_clone,
+    _Call_with_changes,
+)
+_install_generated_methods(
+    ClassDef,
+    (
+        "name",
+        "body",
+        "bases",
+        "keywords",
+        "decorators",
+        "lpar",
+        "rpar",
+        "leading_lines",
+        "lines_after_decorators",
+        "whitespace_after_class",
+        "whitespace_after_name",
+        "whitespace_before_colon",
+        "type_parameters",
+        "whitespace_after_type_parameters",
+    ),
+    _ClassDef_children,
+    _ClassDef_deep_clone,
+    _ClassDef_with_changes,
+)
+_install_generated_methods(
+    Colon,
+    ("whitespace_before", "whitespace_after"),
+    _Colon_children,
+    _Colon_deep_clone,
+    _Colon_with_changes,
+)
+_install_generated_methods(
+    Comma,
+    ("whitespace_before", "whitespace_after"),
+    _Comma_children,
+    _Comma_deep_clone,
+    _Comma_with_changes,
+)
+_install_generated_methods(
+    Comment, ("value",), None, _Comment_deep_clone, _Comment_with_changes
+)
+_install_generated_methods(
+    CompFor,
+    (
+        "target",
+        "iter",
+        "ifs",
+        "inner_for_in",
+        "asynchronous",
+        "whitespace_before",
+        "whitespace_after_for",
+        "whitespace_before_in",
+        "whitespace_after_in",
+    ),
+    _CompFor_children,
+    _CompFor_deep_clone,
+    _CompFor_with_changes,
+)
+_install_generated_methods(
+    CompIf,
+    ("test", "whitespace_before", "whitespace_before_test"),
+    _CompIf_children,
+    _CompIf_deep_clone,
+    _CompIf_with_changes,
+)
+_install_generated_methods(
+    Comparison,
+    ("left", "comparisons", "lpar", "rpar"),
+    _Comparison_children,
+    _Comparison_deep_clone,
+    _Comparison_with_changes,
+)
+_install_generated_methods(
+    ComparisonTarget,
+    ("operator", "comparator"),
+    _ComparisonTarget_children,
+    _ComparisonTarget_deep_clone,
+    _ComparisonTarget_with_changes,
+)
+_install_generated_methods(
+    ConcatenatedString,
+    ("left", "right", "lpar", "rpar", "whitespace_between"),
+    _ConcatenatedString_children,
+    _ConcatenatedString_deep_clone,
+    _ConcatenatedString_with_changes,
+)
+_install_generated_methods(
+    Continue,
+    ("semicolon",),
+    _Continue_children,
+    _Continue_deep_clone,
+    _Continue_with_changes,
+)
+_install_generated_methods(
+    Decorator,
+    ("decorator", "leading_lines", "whitespace_after_at", "trailing_whitespace"),
+    _Decorator_children,
+    _Decorator_deep_clone,
+    _Decorator_with_changes,
+)
+_install_generated_methods(
+    Del,
+    ("target", "whitespace_after_del", "semicolon"),
+    _Del_children,
+    _Del_deep_clone,
+    _Del_with_changes,
+)
+_install_generated_methods(
+    Dict,
+    ("elements", "lbrace", "rbrace", "lpar", "rpar"),
+    _Dict_children,
+    _Dict_deep_clone,
+    _Dict_with_changes,
+)
+_install_generated_methods(
+    DictComp,
+    (
+        "key",
+        "value",
+        "for_in",
+        "lbrace",
+        "rbrace",
+        "lpar",
+        "rpar",
+        "whitespace_before_colon",
+        "whitespace_after_colon",
+    ),
+    _DictComp_children,
+    _DictComp_deep_clone,
+    _DictComp_with_changes,
+)
+_install_generated_methods(
+    DictElement,
+    ("key", "value", "comma", "whitespace_before_colon", "whitespace_after_colon"),
+    _DictElement_children,
+    _DictElement_deep_clone,
+    _DictElement_with_changes,
+)
+_install_generated_methods(
+    Divide,
+    ("whitespace_before", "whitespace_after"),
+    _Divide_children,
+    _Divide_deep_clone,
+    _Divide_with_changes,
+)
+_install_generated_methods(
+    DivideAssign,
+    ("whitespace_before", "whitespace_after"),
+    _DivideAssign_children,
+    _DivideAssign_deep_clone,
+    _DivideAssign_with_changes,
+)
+_install_generated_methods(
+    Dot,
+    ("whitespace_before", "whitespace_after"),
+    _Dot_children,
+    _Dot_deep_clone,
+    _Dot_with_changes,
+)
+_install_generated_methods(
+    Element,
+    ("value", "comma"),
+    _Element_children,
+    _Element_deep_clone,
+    _Element_with_changes,
+)
+_install_generated_methods(
+    Ellipsis,
+    ("lpar", "rpar"),
+    _Ellipsis_children,
+    _Ellipsis_deep_clone,
+    _Ellipsis_with_changes,
+)
+_install_generated_methods(
+    Else,
+    ("body", "leading_lines", "whitespace_before_colon"),
+    _Else_children,
+    _Else_deep_clone,
+    _Else_with_changes,
+)
+_install_generated_methods(
+    EmptyLine,
+    ("indent", "whitespace", "comment", "newline"),
+    _EmptyLine_children,
+    _EmptyLine_deep_clone,
+    _EmptyLine_with_changes,
+)
+_install_generated_methods(
+    Equal,
+    ("whitespace_before", "whitespace_after"),
+    _Equal_children,
+    _Equal_deep_clone,
+    _Equal_with_changes,
+)
+_install_generated_methods(
+    ExceptHandler,
+    (
+        "body",
+        "type",
+        "name",
+        "leading_lines",
+        "whitespace_after_except",
+        "whitespace_before_colon",
+    ),
+    _ExceptHandler_children,
+    _ExceptHandler_deep_clone,
+    _ExceptHandler_with_changes,
+)
+_install_generated_methods(
+    ExceptStarHandler,
+    (
+        "body",
+        "type",
+        "name",
+        "leading_lines",
+        "whitespace_after_except",
+        "whitespace_after_star",
+        "whitespace_before_colon",
+    ),
+    _ExceptStarHandler_children,
+    _ExceptStarHandler_deep_clone,
+    _ExceptStarHandler_with_changes,
+)
+_install_generated_methods(
+    Expr, ("value", "semicolon"), _Expr_children, _Expr_deep_clone, _Expr_with_changes
+)
+_install_generated_methods(
+    Finally,
+    ("body", "leading_lines", "whitespace_before_colon"),
+    _Finally_children,
+    _Finally_deep_clone,
+    _Finally_with_changes,
+)
+_install_generated_methods(
+    Float,
+    ("value", "lpar", "rpar"),
+    _Float_children,
+    _Float_deep_clone,
+    _Float_with_changes,
+)
+_install_generated_methods(
+    FloorDivide,
+    ("whitespace_before", "whitespace_after"),
+    _FloorDivide_children,
+    _FloorDivide_deep_clone,
+    _FloorDivide_with_changes,
+)
+_install_generated_methods(
+    FloorDivideAssign,
+    ("whitespace_before", "whitespace_after"),
+    _FloorDivideAssign_children,
+    _FloorDivideAssign_deep_clone,
+    _FloorDivideAssign_with_changes,
+)
+_install_generated_methods(
+    For,
+    (
+        "target",
+        "iter",
+        "body",
+        "orelse",
+        "asynchronous",
+        "leading_lines",
+        "whitespace_after_for",
+        "whitespace_before_in",
+        "whitespace_after_in",
+        "whitespace_before_colon",
+    ),
+    _For_children,
+    _For_deep_clone,
+    _For_with_changes,
+)
+_install_generated_methods(
+    FormattedString,
+    ("parts", "start", "end", "lpar", "rpar"),
+    _FormattedString_children,
+    _FormattedString_deep_clone,
+    _FormattedString_with_changes,
+)
+_install_generated_methods(
+    FormattedStringExpression,
+    (
+        "expression",
+        "conversion",
+        "format_spec",
+        "whitespace_before_expression",
+        "whitespace_after_expression",
+        "equal",
+    ),
+    _FormattedStringExpression_children,
+    _FormattedStringExpression_deep_clone,
+    _FormattedStringExpression_with_changes,
+)
+_install_generated_methods(
+    FormattedStringText,
+    ("value",),
+    None,
+    _FormattedStringText_deep_clone,
+    _FormattedStringText_with_changes,
+)
+_install_generated_methods(
+    From,
+    ("item", "whitespace_before_from", "whitespace_after_from"),
+    _From_children,
+    _From_deep_clone,
+    _From_with_changes,
+)
+_install_generated_methods(
+    FunctionDef,
+    (
+        "name",
+        "params",
+        "body",
+        "decorators",
+        "returns",
+        "asynchronous",
+        "leading_lines",
+        "lines_after_decorators",
+        "whitespace_after_def",
+        "whitespace_after_name",
+        "whitespace_before_params",
+        "whitespace_before_colon",
+        "type_parameters",
+        "whitespace_after_type_parameters",
+    ),
+    _FunctionDef_children,
+    _FunctionDef_deep_clone,
+    _FunctionDef_with_changes,
+)
+_install_generated_methods(
+    GeneratorExp,
+    ("elt", "for_in", "lpar", "rpar"),
+    _GeneratorExp_children,
+    _GeneratorExp_deep_clone,
+    _GeneratorExp_with_changes,
+)
+_install_generated_methods(
+    Global,
+    ("names", "whitespace_after_global", "semicolon"),
+    _Global_children,
+    _Global_deep_clone,
+    _Global_with_changes,
+)
+_install_generated_methods(
+    GreaterThan,
+    ("whitespace_before", "whitespace_after"),
+    _GreaterThan_children,
+    _GreaterThan_deep_clone,
+    _GreaterThan_with_changes,
+)
+_install_generated_methods(
+    GreaterThanEqual,
+    ("whitespace_before", "whitespace_after"),
+    _GreaterThanEqual_children,
+    _GreaterThanEqual_deep_clone,
+    _GreaterThanEqual_with_changes,
+)
+_install_generated_methods(
+    If,
+    (
+        "test",
+        "body",
+        "orelse",
+        "leading_lines",
+        "whitespace_before_test",
+        "whitespace_after_test",
+    ),
+    _If_children,
+    _If_deep_clone,
+    _If_with_changes,
+)
+_install_generated_methods(
+    IfExp,
+    (
+        "test",
+        "body",
+        "orelse",
+        "lpar",
+        "rpar",
+        "whitespace_before_if",
+        "whitespace_after_if",
+        "whitespace_before_else",
+        "whitespace_after_else",
+    ),
+    _IfExp_children,
+    _IfExp_deep_clone,
+    _IfExp_with_changes,
+)
+_install_generated_methods(
+    Imaginary,
+    ("value", "lpar", "rpar"),
+    _Imaginary_children,
+    _Imaginary_deep_clone,
+    _Imaginary_with_changes,
+)
+_install_generated_methods(
+    Import,
+    ("names", "semicolon", "whitespace_after_import"),
+    _Import_children,
+    _Import_deep_clone,
+    _Import_with_changes,
+)
+_install_generated_methods(
+    ImportAlias,
+    ("name", "asname", "comma"),
+    _ImportAlias_children,
+    _ImportAlias_deep_clone,
+    _ImportAlias_with_changes,
+)
+_install_generated_methods(
+    ImportFrom,
+    (
+        "module",
+        "names",
+        "relative",
+        "lpar",
+        "rpar",
+        "semicolon",
+        "whitespace_after_from",
+        "whitespace_before_import",
+        "whitespace_after_import",
+    ),
+    _ImportFrom_children,
+    _ImportFrom_deep_clone,
+    _ImportFrom_with_changes,
+)
+_install_generated_methods(
+    ImportStar, (), None, _ImportStar_deep_clone, _ImportStar_with_changes
+)
+_install_generated_methods(
+    In,
+    ("whitespace_before", "whitespace_after"),
+    _In_children,
+    _In_deep_clone,
+    _In_with_changes,
+)
+_install_generated_methods(
+    IndentedBlock,
+    ("body", "header", "indent", "footer"),
+    _IndentedBlock_children,
+    _IndentedBlock_deep_clone,
+    _IndentedBlock_with_changes,
+)
+_install_generated_methods(
+    Index,
+    ("value", "star", "whitespace_after_star"),
+    _Index_children,
+    _Index_deep_clone,
+    _Index_with_changes,
+)
+_install_generated_methods(
+    Integer,
+    ("value", "lpar", "rpar"),
+    _Integer_children,
+    _Integer_deep_clone,
+    _Integer_with_changes,
+)
+_install_generated_methods(
+    Is,
+    ("whitespace_before", "whitespace_after"),
+    _Is_children,
+    _Is_deep_clone,
+    _Is_with_changes,
+)
+_install_generated_methods(
+    IsNot,
+    ("whitespace_before", "whitespace_between", "whitespace_after"),
+    _IsNot_children,
+    _IsNot_deep_clone,
+    _IsNot_with_changes,
+)
+_install_generated_methods(
+    Lambda,
+    ("params", "body", "colon", "lpar", "rpar", "whitespace_after_lambda"),
+    _Lambda_children,
+    _Lambda_deep_clone,
+    _Lambda_with_changes,
+)
+_install_generated_methods(
+    LeftCurlyBrace,
+    ("whitespace_after",),
+    _LeftCurlyBrace_children,
+    _LeftCurlyBrace_deep_clone,
+    _LeftCurlyBrace_with_changes,
+)
+_install_generated_methods(
+    LeftParen,
+    ("whitespace_after",),
+    _LeftParen_children,
+    _LeftParen_deep_clone,
+    _LeftParen_with_changes,
+)
+_install_generated_methods(
+    LeftShift,
+    ("whitespace_before", "whitespace_after"),
+    _LeftShift_children,
+    _LeftShift_deep_clone,
+    _LeftShift_with_changes,
+)
+_install_generated_methods(
+    LeftShiftAssign,
+    ("whitespace_before", "whitespace_after"),
+    _LeftShiftAssign_children,
+    _LeftShiftAssign_deep_clone,
+    _LeftShiftAssign_with_changes,
+)
+_install_generated_methods(
+    LeftSquareBracket,
+    ("whitespace_after",),
+    _LeftSquareBracket_children,
+    _LeftSquareBracket_deep_clone,
+    _LeftSquareBracket_with_changes,
+)
+_install_generated_methods(
+    LessThan,
+    ("whitespace_before", "whitespace_after"),
+    _LessThan_children,
+    _LessThan_deep_clone,
+    _LessThan_with_changes,
+)
+_install_generated_methods(
+    LessThanEqual,
+    ("whitespace_before", "whitespace_after"),
+    _LessThanEqual_children,
+    _LessThanEqual_deep_clone,
+    _LessThanEqual_with_changes,
+)
+_install_generated_methods(
+    List,
+    ("elements", "lbracket", "rbracket", "lpar", "rpar"),
+    _List_children,
+    _List_deep_clone,
+    _List_with_changes,
+)
+_install_generated_methods(
+    ListComp,
+    ("elt", "for_in", "lbracket", "rbracket", "lpar", "rpar"),
+    _ListComp_children,
+    _ListComp_deep_clone,
+    _ListComp_with_changes,
+)
+_install_generated_methods(
+    Match,
+    (
+        "subject",
+        "cases",
+        "leading_lines",
+        "whitespace_after_match",
+        "whitespace_before_colon",
+        "whitespace_after_colon",
+        "indent",
+        "footer",
+    ),
+    _Match_children,
+    _Match_deep_clone,
+    _Match_with_changes,
+)
+_install_generated_methods(
+    MatchAs,
+    ("pattern", "name", "whitespace_before_as", "whitespace_after_as", "lpar", "rpar"),
+    _MatchAs_children,
+    _MatchAs_deep_clone,
+    _MatchAs_with_changes,
+)
+_install_generated_methods(
+    MatchCase,
+    (
+        "pattern",
+        "body",
+        "guard",
+        "leading_lines",
+        "whitespace_after_case",
+        "whitespace_before_if",
+        "whitespace_after_if",
+        "whitespace_before_colon",
+    ),
+    _MatchCase_children,
+    _MatchCase_deep_clone,
+    _MatchCase_with_changes,
+)
+_install_generated_methods(
+    MatchClass,
+    (
+        "cls",
+        "patterns",
+        "kwds",
+        "whitespace_after_cls",
+        "whitespace_before_patterns",
+        "whitespace_after_kwds",
+        "lpar",
+        "rpar",
+    ),
+    _MatchClass_children,
+    _MatchClass_deep_clone,
+    _MatchClass_with_changes,
+)
+_install_generated_methods(
+    MatchKeywordElement,
+    ("key", "pattern", "comma", "whitespace_before_equal", "whitespace_after_equal"),
+    _MatchKeywordElement_children,
+    _MatchKeywordElement_deep_clone,
+    _MatchKeywordElement_with_changes,
+)
+_install_generated_methods(
+    MatchList,
+    ("patterns", "lbracket", "rbracket", "lpar", "rpar"),
+    _MatchList_children,
+    _MatchList_deep_clone,
+    _MatchList_with_changes,
+)
+_install_generated_methods(
+    MatchMapping,
+    (
+        "elements",
+        "lbrace",
+        "rbrace",
+        "rest",
+        "whitespace_before_rest",
+        "trailing_comma",
+        "lpar",
+        "rpar",
+    ),
+    _MatchMapping_children,
+    _MatchMapping_deep_clone,
+    _MatchMapping_with_changes,
+)
+_install_generated_methods(
+    MatchMappingElement,
+    ("key", "pattern", "comma", "whitespace_before_colon", "whitespace_after_colon"),
+    _MatchMappingElement_children,
+    _MatchMappingElement_deep_clone,
+    _MatchMappingElement_with_changes,
+)
+_install_generated_methods(
+    MatchOr,
+    ("patterns", "lpar", "rpar"),
+    _MatchOr_children,
+    _MatchOr_deep_clone,
+    _MatchOr_with_changes,
+)
+_install_generated_methods(
+    MatchOrElement,
+    ("pattern", "separator"),
+    _MatchOrElement_children,
+    _MatchOrElement_deep_clone,
+    _MatchOrElement_with_changes,
+)
+_install_generated_methods(
+    MatchSequenceElement,
+    ("value", "comma"),
+    _MatchSequenceElement_children,
+    _MatchSequenceElement_deep_clone,
+    _MatchSequenceElement_with_changes,
+)
+_install_generated_methods(
+    MatchSingleton,
+    ("value",),
+    _MatchSingleton_children,
+    _MatchSingleton_deep_clone,
+    _MatchSingleton_with_changes,
+)
+_install_generated_methods(
+    MatchStar,
+    ("name", "comma", "whitespace_before_name"),
+    _MatchStar_children,
+    _MatchStar_deep_clone,
+    _MatchStar_with_changes,
+)
+_install_generated_methods(
+    MatchTuple,
+    ("patterns", "lpar", "rpar"),
+    _MatchTuple_children,
+    _MatchTuple_deep_clone,
+    _MatchTuple_with_changes,
+)
+_install_generated_methods(
+    MatchValue,
+    ("value",),
+    _MatchValue_children,
+    _MatchValue_deep_clone,
+    _MatchValue_with_changes,
+)
+_install_generated_methods(
+    MatrixMultiply,
+    ("whitespace_before", "whitespace_after"),
+    _MatrixMultiply_children,
+    _MatrixMultiply_deep_clone,
+    _MatrixMultiply_with_changes,
+)
+_install_generated_methods(
+    MatrixMultiplyAssign,
+    ("whitespace_before", "whitespace_after"),
+    _MatrixMultiplyAssign_children,
+    _MatrixMultiplyAssign_deep_clone,
+    _MatrixMultiplyAssign_with_changes,
+)
+_install_generated_methods(
+    Minus,
+    ("whitespace_after",),
+    _Minus_children,
+    _Minus_deep_clone,
+    _Minus_with_changes,
+)
+_install_generated_methods(
+    Module,
+    (
+        "body",
+        "header",
+        "footer",
+        "encoding",
+        "default_indent",
+        "default_newline",
+        "has_trailing_newline",
+        "_source",
+        "_statement_offsets",
+    ),
+    _Module_children,
+    _Module_deep_clone,
+    _Module_with_changes,
+)
+_install_generated_methods(
+    Modulo,
+    ("whitespace_before", "whitespace_after"),
+    _Modulo_children,
+    _Modulo_deep_clone,
+    _Modulo_with_changes,
+)
+_install_generated_methods(
+    ModuloAssign,
+    ("whitespace_before", "whitespace_after"),
+    _ModuloAssign_children,
+    _ModuloAssign_deep_clone,
+    _ModuloAssign_with_changes,
+)
+_install_generated_methods(
+    Multiply,
+    ("whitespace_before", "whitespace_after"),
+    _Multiply_children,
+    _Multiply_deep_clone,
+    _Multiply_with_changes,
+)
+_install_generated_methods(
+    MultiplyAssign,
+    ("whitespace_before", "whitespace_after"),
+    _MultiplyAssign_children,
+    _MultiplyAssign_deep_clone,
+    _MultiplyAssign_with_changes,
+)
+_install_generated_methods(
+    Name,
+    ("value", "lpar", "rpar"),
+    _Name_children,
+    _Name_deep_clone,
+    _Name_with_changes,
+)
+_install_generated_methods(
+    NameItem,
+    ("name", "comma"),
+    _NameItem_children,
+    _NameItem_deep_clone,
+    _NameItem_with_changes,
+)
+_install_generated_methods(
+    NamedExpr,
+    (
+        "target",
+        "value",
+        "lpar",
+        "rpar",
+        "whitespace_before_walrus",
+        "whitespace_after_walrus",
+    ),
+    _NamedExpr_children,
+    _NamedExpr_deep_clone,
+    _NamedExpr_with_changes,
+)
+_install_generated_methods(
+    Newline, ("value",), None, _Newline_deep_clone, _Newline_with_changes
+)
+_install_generated_methods(
+    Nonlocal,
+    ("names", "whitespace_after_nonlocal", "semicolon"),
+    _Nonlocal_children,
+    _Nonlocal_deep_clone,
+    _Nonlocal_with_changes,
+)
+_install_generated_methods(
+    Not, ("whitespace_after",), _Not_children, _Not_deep_clone, _Not_with_changes
+)
+_install_generated_methods(
+    NotEqual,
+    ("value", "whitespace_before", "whitespace_after"),
+    _NotEqual_children,
+    _NotEqual_deep_clone,
+    _NotEqual_with_changes,
+)
+_install_generated_methods(
+    NotIn,
+    ("whitespace_before", "whitespace_between", "whitespace_after"),
+    _NotIn_children,
+    _NotIn_deep_clone,
+    _NotIn_with_changes,
+)
+_install_generated_methods(
+    Or,
+    ("whitespace_before", "whitespace_after"),
+    _Or_children,
+    _Or_deep_clone,
+    _Or_with_changes,
+)
+_install_generated_methods(
+    Param,
+    (
+        "name",
+        "annotation",
+        "equal",
+        "default",
+        "comma",
+        "star",
+        "whitespace_after_star",
+        "whitespace_after_param",
+    ),
+    _Param_children,
+    _Param_deep_clone,
+    _Param_with_changes,
+)
+_install_generated_methods(
+    ParamSlash,
+    ("comma", "whitespace_after"),
+    _ParamSlash_children,
+    _ParamSlash_deep_clone,
+    _ParamSlash_with_changes,
+)
+_install_generated_methods(
+    ParamSpec,
+    ("name", "whitespace_after_star"),
+    _ParamSpec_children,
+    _ParamSpec_deep_clone,
+    _ParamSpec_with_changes,
+)
+_install_generated_methods(
+    ParamStar,
+    ("comma",),
+    _ParamStar_children,
+    _ParamStar_deep_clone,
+    _ParamStar_with_changes,
+)
+_install_generated_methods(
+    Parameters,
+    (
+        "params",
+        "star_arg",
+        "kwonly_params",
+        "star_kwarg",
+        "posonly_params",
+        "posonly_ind",
+    ),
+    _Parameters_children,
+    _Parameters_deep_clone,
+    _Parameters_with_changes,
+)
+_install_generated_methods(
+    ParenthesizedWhitespace,
+    ("first_line", "empty_lines", "indent", "last_line"),
+    _ParenthesizedWhitespace_children,
+    _ParenthesizedWhitespace_deep_clone,
+    _ParenthesizedWhitespace_with_changes,
+)
+_install_generated_methods(
+    Pass, ("semicolon",), _Pass_children, _Pass_deep_clone, _Pass_with_changes
+)
+_install_generated_methods(
+    Plus, ("whitespace_after",), _Plus_children, _Plus_deep_clone, _Plus_with_changes
+)
+_install_generated_methods(
+    Power,
+    ("whitespace_before", "whitespace_after"),
+    _Power_children,
+    _Power_deep_clone,
+    _Power_with_changes,
+)
+_install_generated_methods(
+    PowerAssign,
+    ("whitespace_before", "whitespace_after"),
+    _PowerAssign_children,
+    _PowerAssign_deep_clone,
+    _PowerAssign_with_changes,
+)
+_install_generated_methods(
+    Raise,
+    ("exc", "cause", "whitespace_after_raise", "semicolon"),
+    _Raise_children,
+    _Raise_deep_clone,
+    _Raise_with_changes,
+)
+_install_generated_methods(
+    Return,
+    ("value", "whitespace_after_return", "semicolon"),
+    _Return_children,
+    _Return_deep_clone,
+    _Return_with_changes,
+)
+_install_generated_methods(
+    RightCurlyBrace,
+    ("whitespace_before",),
+    _RightCurlyBrace_children,
+    _RightCurlyBrace_deep_clone,
+    _RightCurlyBrace_with_changes,
+)
+_install_generated_methods(
+    RightParen,
+    ("whitespace_before",),
+    _RightParen_children,
+    _RightParen_deep_clone,
+    _RightParen_with_changes,
+)
+_install_generated_methods(
+    RightShift,
+    ("whitespace_before", "whitespace_after"),
+    _RightShift_children,
+    _RightShift_deep_clone,
+    _RightShift_with_changes,
+)
+_install_generated_methods(
+    RightShiftAssign,
+    ("whitespace_before", "whitespace_after"),
+    _RightShiftAssign_children,
+    _RightShiftAssign_deep_clone,
+    _RightShiftAssign_with_changes,
+)
+_install_generated_methods(
+    RightSquareBracket,
+    ("whitespace_before",),
+    _RightSquareBracket_children,
+    _RightSquareBracket_deep_clone,
+    _RightSquareBracket_with_changes,
+)
+_install_generated_methods(
+    Semicolon,
+    ("whitespace_before", "whitespace_after"),
+    _Semicolon_children,
+    _Semicolon_deep_clone,
+    _Semicolon_with_changes,
+)
+_install_generated_methods(
+    Set,
+    ("elements", "lbrace", "rbrace", "lpar", "rpar"),
+    _Set_children,
+    _Set_deep_clone,
+    _Set_with_changes,
+)
+_install_generated_methods(
+    SetComp,
+    ("elt", "for_in", "lbrace", "rbrace", "lpar", "rpar"),
+    _SetComp_children,
+    _SetComp_deep_clone,
+    _SetComp_with_changes,
+)
+_install_generated_methods(
+    SimpleStatementLine,
+    ("body", "leading_lines", "trailing_whitespace"),
+    _SimpleStatementLine_children,
+    _SimpleStatementLine_deep_clone,
+    _SimpleStatementLine_with_changes,
+)
+_install_generated_methods(
+    SimpleStatementSuite,
+    ("body", "leading_whitespace", "trailing_whitespace"),
+    _SimpleStatementSuite_children,
+    _SimpleStatementSuite_deep_clone,
+    _SimpleStatementSuite_with_changes,
+)
+_install_generated_methods(
+    SimpleString,
+    ("value", "lpar", "rpar"),
+    _SimpleString_children,
+    _SimpleString_deep_clone,
+    _SimpleString_with_changes,
+)
+_install_generated_methods(
+    SimpleWhitespace,
+    ("value",),
+    None,
+    _SimpleWhitespace_deep_clone,
+    _SimpleWhitespace_with_changes,
+)
+_install_generated_methods(
+    Slice,
+    ("lower", "upper", "step", "first_colon", "second_colon"),
+    _Slice_children,
+    _Slice_deep_clone,
+    _Slice_with_changes,
+)
+_install_generated_methods(
+    StarredDictElement,
+    ("value", "comma", "whitespace_before_value"),
+    _StarredDictElement_children,
+    _StarredDictElement_deep_clone,
+    _StarredDictElement_with_changes,
+)
+_install_generated_methods(
+    StarredElement,
+    ("value", "comma", "lpar", "rpar", "whitespace_before_value"),
+    _StarredElement_children,
+    _StarredElement_deep_clone,
+    _StarredElement_with_changes,
+)
+_install_generated_methods(
+    Subscript,
+    (
+        "value",
+        "slice",
+        "lbracket",
+        "rbracket",
+        "lpar",
+        "rpar",
+        "whitespace_after_value",
+    ),
+    _Subscript_children,
+    _Subscript_deep_clone,
+    _Subscript_with_changes,
+)
+_install_generated_methods(
+    SubscriptElement,
+    ("slice", "comma"),
+    _SubscriptElement_children,
+    _SubscriptElement_deep_clone,
+    _SubscriptElement_with_changes,
+)
+_install_generated_methods(
+    Subtract,
+    ("whitespace_before", "whitespace_after"),
+    _Subtract_children,
+    _Subtract_deep_clone,
+    _Subtract_with_changes,
+)
+_install_generated_methods(
+    SubtractAssign,
+    ("whitespace_before", "whitespace_after"),
+    _SubtractAssign_children,
+    _SubtractAssign_deep_clone,
+    _SubtractAssign_with_changes,
+)
+_install_generated_methods(
+    TrailingWhitespace,
+    ("whitespace", "comment", "newline"),
+    _TrailingWhitespace_children,
+    _TrailingWhitespace_deep_clone,
+    _TrailingWhitespace_with_changes,
+)
+_install_generated_methods(
+    Try,
+    (
+        "body",
+        "handlers",
+        "orelse",
+        "finalbody",
+        "leading_lines",
+        "whitespace_before_colon",
+    ),
+    _Try_children,
+    _Try_deep_clone,
+    _Try_with_changes,
+)
+_install_generated_methods(
+    TryStar,
+    (
+        "body",
+        "handlers",
+        "orelse",
+        "finalbody",
+        "leading_lines",
+        "whitespace_before_colon",
+    ),
+    _TryStar_children,
+    _TryStar_deep_clone,
+    _TryStar_with_changes,
+)
+_install_generated_methods(
+    Tuple,
+    ("elements", "lpar", "rpar"),
+    _Tuple_children,
+    _Tuple_deep_clone,
+    _Tuple_with_changes,
+)
+_install_generated_methods(
+    TypeAlias,
+    (
+        "name",
+        "value",
+        "type_parameters",
+        "whitespace_after_type",
+        "whitespace_after_name",
+        "whitespace_after_type_parameters",
+        "whitespace_after_equals",
+        "semicolon",
+    ),
+    _TypeAlias_children,
+    _TypeAlias_deep_clone,
+    _TypeAlias_with_changes,
+)
+_install_generated_methods(
+    TypeParam,
+    ("param", "comma", "equal", "star", "whitespace_after_star", "default"),
+    _TypeParam_children,
+    _TypeParam_deep_clone,
+    _TypeParam_with_changes,
+)
+_install_generated_methods(
+    TypeParameters,
+    ("params", "lbracket", "rbracket"),
+    _TypeParameters_children,
+    _TypeParameters_deep_clone,
+    _TypeParameters_with_changes,
+)
+_install_generated_methods(
+    TypeVar,
+    ("name", "bound", "colon"),
+    _TypeVar_children,
+    _TypeVar_deep_clone,
+    _TypeVar_with_changes,
+)
+_install_generated_methods(
+    TypeVarTuple,
+    ("name", "whitespace_after_star"),
+    _TypeVarTuple_children,
+    _TypeVarTuple_deep_clone,
+    _TypeVarTuple_with_changes,
+)
+_install_generated_methods(
+    UnaryOperation,
+    ("operator", "expression", "lpar", "rpar"),
+    _UnaryOperation_children,
+    _UnaryOperation_deep_clone,
+    _UnaryOperation_with_changes,
+)
+_install_generated_methods(
+    While,
+    (
+        "test",
+        "body",
+        "orelse",
+        "leading_lines",
+        "whitespace_after_while",
+        "whitespace_before_colon",
+    ),
+    _While_children,
+    _While_deep_clone,
+    _While_with_changes,
+)
+_install_generated_methods(
+    With,
+    (
+        "items",
+        "body",
+        "asynchronous",
+        "leading_lines",
+        "lpar",
+        "rpar",
+        "whitespace_after_with",
+        "whitespace_before_colon",
+    ),
+    _With_children,
+    _With_deep_clone,
+    _With_with_changes,
+)
+_install_generated_methods(
+    WithItem,
+    ("item", "asname", "comma"),
+    _WithItem_children,
+    _WithItem_deep_clone,
+    _WithItem_with_changes,
+)
+_install_generated_methods(
+    Yield,
+    ("value", "lpar", "rpar", "whitespace_after_yield"),
+    _Yield_children,
+    _Yield_deep_clone,
+    _Yield_with_changes,
+)
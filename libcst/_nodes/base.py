@@ -3,10 +3,28 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass, field, fields, replace
-from typing import Any, cast, ClassVar, Dict, List, Mapping, Sequence, TypeVar, Union
+from operator import is_
+from typing import (
+    Any,
+    Callable,
+    cast,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from libcst._flatten_sentinel import FlattenSentinel
 from libcst._nodes.internal import CodegenState
@@ -17,6 +35,12 @@ from libcst._visitors import CSTTransformer, CSTVisitor, CSTVisitorT
 
 _CSTNodeSelfT = TypeVar("_CSTNodeSelfT", bound="CSTNode")
 _EMPTY_SEQUENCE: Sequence["CSTNode"] = ()
+# The default value of every argument of a generated `with_changes` implementation,
+# standing for a field that isn't being changed.
+_UNCHANGED: Any = object()
+# The generated implementations installed by `_install_generated_methods`.
+_generated_methods: Set[object] = set()
+_GENERATED_METHOD_NAMES: Sequence[str] = ("children", "deep_clone", "with_changes")
 
 
 class CSTValidationError(SyntaxError):
@@ -27,6 +51,29 @@ class CSTCodegenError(SyntaxError):
     pass
 
 
+class _ConstructionState(threading.local):
+    trusted: bool = False
+
+
+_construction_state = _ConstructionState()
+
+
+@contextmanager
+def _trusted_construction() -> Iterator[None]:
+    """
+    Skips `CSTNode._validate` for every node constructed on the current thread inside
+    this context. This is used by the native parser, which only builds nodes for
+    source that its grammar already accepted. Use :func:`CSTNode.validate_deep` to
+    validate such a tree explicitly.
+    """
+    previous = _construction_state.trusted
+    _construction_state.trusted = True
+    try:
+        yield
+    finally:
+        _construction_state.trusted = previous
+
+
 class _ChildrenCollectionVisitor(CSTVisitor):
     def __init__(self) -> None:
         self.children: List[CSTNode] = []
@@ -36,42 +83,91 @@ class _ChildrenCollectionVisitor(CSTVisitor):
         return False  # Don't include transitive children
 
 
+class _TargetAncestorsVisitor(CSTVisitor):
+    """
+    Collects every node that has one of ``targets`` among its transitive children,
+    so that a transformer rewriting the targets only needs to descend into those.
+    """
+
+    def __init__(self, targets: Mapping["CSTNode", object], nested: bool) -> None:
+        self.targets = targets
+        # Whether targets can also be found inside other targets.
+        self.nested = nested
+        self.ancestors: Set[CSTNode] = set()
+        self._stack: List[CSTNode] = []
+
+    def on_visit(self, node: "CSTNode") -> bool:
+        is_target = node in self.targets
+        if is_target:
+            # Every node above the closest ancestor that's already known is known too.
+            for ancestor in reversed(self._stack):
+                if ancestor in self.ancestors:
+                    break
+                self.ancestors.add(ancestor)
+        self._stack.append(node)
+        return self.nested or not is_target
+
+    def on_leave(self, original_node: "CSTNode") -> None:
+        self._stack.pop()
+
+
 class _ChildReplacementTransformer(CSTTransformer):
     def __init__(
-        self, old_node: "CSTNode", new_node: Union["CSTNode", RemovalSentinel]
+        self,
+        replacements: Mapping["CSTNode", Union["CSTNode", RemovalSentinel]],
+        ancestors: Set["CSTNode"],
     ) -> None:
-        self.old_node = old_node
-        self.new_node = new_node
+        self.replacements = replacements
+        self.ancestors = ancestors
 
     def on_visit(self, node: "CSTNode") -> bool:
         # If the node is one we are about to replace, we shouldn't
-        # recurse down it, that would be a waste of time.
-        return node is not self.old_node
+        # recurse down it, that would be a waste of time. The same goes for
+        # subtrees that don't contain anything to replace.
+        return node not in self.replacements and node in self.ancestors
 
     def on_leave(
         self, original_node: "CSTNode", updated_node: "CSTNode"
     ) -> Union["CSTNode", RemovalSentinel]:
-        if original_node is self.old_node:
-            return self.new_node
-        return updated_node
+        return self.replacements.get(original_node, updated_node)
 
 
 class _ChildWithChangesTransformer(CSTTransformer):
-    def __init__(self, old_node: "CSTNode", changes: Mapping[str, Any]) -> None:
-        self.old_node = old_node
+    def __init__(
+        self, changes: Mapping["CSTNode", Mapping[str, Any]], ancestors: Set["CSTNode"]
+    ) -> None:
         self.changes = changes
+        self.ancestors = ancestors
 
     def on_visit(self, node: "CSTNode") -> bool:
-        # If the node is one we are about to replace, we shouldn't
-        # recurse down it, that would be a waste of time.
-        return node is not self.old_node
+        # Only subtrees containing a node to change need to be rebuilt, including
+        # those of nodes we're about to change themselves.
+        return node in self.ancestors
 
     def on_leave(self, original_node: "CSTNode", updated_node: "CSTNode") -> "CSTNode":
-        if original_node is self.old_node:
-            return updated_node.with_changes(**self.changes)
+        changes = self.changes.get(original_node)
+        if changes is not None:
+            return updated_node.with_changes(**changes)
         return updated_node
 
 
+def _replace_children(
+    root: "CSTNode",
+    replacements: Mapping["CSTNode", Union["CSTNode", RemovalSentinel]],
+) -> Union["CSTNode", RemovalSentinel, FlattenSentinel["CSTNode"]]:
+    finder = _TargetAncestorsVisitor(replacements, nested=False)
+    root.visit(finder)
+    return root.visit(_ChildReplacementTransformer(replacements, finder.ancestors))
+
+
+def _change_children(
+    root: "CSTNode", changes: Mapping["CSTNode", Mapping[str, Any]]
+) -> Union["CSTNode", RemovalSentinel, FlattenSentinel["CSTNode"]]:
+    finder = _TargetAncestorsVisitor(changes, nested=True)
+    root.visit(finder)
+    return root.visit(_ChildWithChangesTransformer(changes, finder.ancestors))
+
+
 class _NOOPVisitor(CSTTransformer):
     pass
 
@@ -94,6 +190,17 @@ def _indent(value: str) -> str:
     return "\n".join(f"    {line}" for line in value.split("\n"))
 
 
+def _is_same_sequence(old: object, new: Sequence[object]) -> bool:
+    # Avoid isinstance checks against the Sequence ABC for the same performance reasons
+    # described in _clone. Sequence fields are stored as tuples or lists, apart from
+    # the statements of function bodies that are parsed lazily.
+    return (
+        (isinstance(old, (tuple, list)) or isinstance(old, Sequence))
+        and len(old) == len(new)
+        and all(map(is_, old, new))
+    )
+
+
 def _clone(val: object) -> object:
     # We can't use isinstance(val, CSTNode) here due to poor performance
     # of isinstance checks against ABC direct subclasses. What we're trying
@@ -107,14 +214,62 @@ def _clone(val: object) -> object:
         return deepcopy(val)
 
 
+def _clone_field(val: object) -> object:
+    # Much like the comment on _clone itself, we are allergic to instance
+    # checks against Sequence because of speed issues with ABC classes. So,
+    # instead, first handle sequence types that we do not want to iterate on
+    # and then just try to iterate and clone.
+    if isinstance(val, (str, bytes)):
+        return _clone(val)
+    try:
+        # pyre-ignore We know this might not be iterable, that's the point of the
+        # type error and try block.
+        return tuple(_clone(v) for v in val)
+    except TypeError:
+        return _clone(val)
+
+
+def _install_generated_methods(
+    cls: Type["CSTNode"],
+    field_names: Sequence[str],
+    children: Optional[Callable[[Any], Sequence["CSTNode"]]],
+    deep_clone: Callable[[Any], "CSTNode"],
+    with_changes: Callable[..., "CSTNode"],
+) -> None:
+    """
+    Replaces the generic implementations of `children`, `deep_clone` and
+    `with_changes` on ``cls`` with ones generated by
+    `libcst.codegen.gen_node_methods`, which know the fields of ``cls`` ahead of
+    time. ``children`` is None for nodes that never have any children. If the
+    generated code is out of date with the fields of ``cls``, the generic
+    implementations are kept.
+    """
+    if tuple(f.name for f in fields(cls)) != tuple(field_names):
+        return
+    deep_clone.__doc__ = CSTNode.deep_clone.__doc__
+    with_changes.__doc__ = CSTNode.with_changes.__doc__
+    methods: Dict[str, object] = {
+        "deep_clone": deep_clone,
+        "with_changes": with_changes,
+    }
+    if children is not None:
+        methods["children"] = property(children, doc=CSTNode.children.__doc__)
+    for name, method in methods.items():
+        setattr(cls, name, method)
+        _generated_methods.add(method)
+
+
 @dataclass(frozen=True)
 class CSTNode(ABC):
-    __slots__: ClassVar[Sequence[str]] = ()
+    # The memoized result of `structural_hash`. It's not a field, so it isn't
+    # compared, copied, or pickled.
+    __slots__: ClassVar[Sequence[str]] = ("_structural_hash",)
 
     def __post_init__(self) -> None:
-        # PERF: It might make more sense to move validation work into the visitor, which
-        # would allow us to avoid validating the tree when parsing a file.
-        self._validate()
+        # Nodes built by the native parser are valid by construction, so it skips
+        # validation with `_trusted_construction`.
+        if not _construction_state.trusted:
+            self._validate()
 
     @classmethod
     def __init_subclass__(cls, **kwargs: Any) -> None:
@@ -135,6 +290,12 @@ class CSTNode(ABC):
         if "__hash__" not in cls.__dict__:
             cls.__hash__ = CSTNode.__hash__
 
+        # Generated implementations only know about the fields of the class they
+        # were generated for, so subclasses fall back to the generic ones.
+        for name in _GENERATED_METHOD_NAMES:
+            if name not in cls.__dict__ and getattr(cls, name) in _generated_methods:
+                setattr(cls, name, CSTNode.__dict__[name])
+
     def _validate(self) -> None:
         """
         Override this to perform runtime validation of a newly created node.
@@ -147,6 +308,20 @@ class CSTNode(ABC):
         """
         pass
 
+    def validate_deep(self) -> None:
+        """
+        Runs the validation that is normally performed when a node is constructed on
+        this node and all of its transitive children, raising a
+        :class:`~libcst.CSTValidationError` for the first invalid node found.
+
+        Nodes created by the native parser skip this validation, since they were built
+        from source that the parser has already accepted. This is useful if you want to
+        check such a tree anyway.
+        """
+        self._validate()
+        for ch in self.children:
+            ch.validate_deep()
+
     def validate_types_shallow(self) -> None:
         """
         Compares the type annotations on a node's fields with those field's actual
@@ -195,16 +370,16 @@ class CSTNode(ABC):
         lexically in the code.
         """
 
-        # We're hooking into _visit_and_replace_children, which means that our current
-        # implementation is slow. We may need to rethink and/or cache this if it becomes
-        # a frequently accessed property.
+        # We're hooking into _visit_children, which doesn't rebuild the node, but still
+        # has the overhead of a visitor dispatch per child. We may need to rethink
+        # and/or cache this if it becomes a frequently accessed property.
         #
         # This probably won't be called frequently, because most child access will
         # probably through visit, or directly through named property access, not through
         # children.
 
         visitor = _ChildrenCollectionVisitor()
-        self._visit_and_replace_children(visitor)
+        self._visit_children(visitor)
         return visitor.children
 
     def visit(
@@ -214,10 +389,17 @@ class CSTNode(ABC):
         Visits the current node, its children, and all transitive children using
         the given visitor's callbacks.
         """
+        if isinstance(visitor, CSTVisitor):
+            # A CSTVisitor can't modify the tree, so there's no need to rebuild this
+            # node. Walk the children in place instead.
+            if visitor.on_visit(self):
+                self._visit_children(visitor)
+            visitor.on_leave(self)
+            return self
+
         # visit self
         should_visit_children = visitor.on_visit(self)
 
-        # TODO: provide traversal where children are not replaced
         # visit children (optionally)
         if should_visit_children:
             # It's not possible to define `_visit_and_replace_children` with the correct
@@ -229,11 +411,7 @@ class CSTNode(ABC):
         else:
             with_updated_children = self
 
-        if isinstance(visitor, CSTVisitor):
-            visitor.on_leave(self)
-            leave_result = self
-        else:
-            leave_result = visitor.on_leave(self, with_updated_children)
+        leave_result = visitor.on_leave(self, with_updated_children)
 
         # validate return type of the user-defined `visitor.on_leave` method
         if not isinstance(leave_result, (CSTNode, RemovalSentinel, FlattenSentinel)):
@@ -279,10 +457,42 @@ class CSTNode(ABC):
         `children` property instead.
 
         The general expectation is that children should be visited in the order in which
-        they appear lexically.
+        they appear lexically, and that the result is built with
+        `_with_updated_children`, so that unchanged nodes are reused.
         """
         ...
 
+    def _with_updated_children(self: _CSTNodeSelfT, **children: Any) -> _CSTNodeSelfT:
+        """
+        Used by implementations of `_visit_and_replace_children` to build the updated
+        node. ``children`` must contain every field of the node.
+
+        If every value is identical (by identity) to the current value of that field,
+        returns ``self`` instead of constructing a copy. This lets a transform share
+        every subtree that it didn't change with the original tree. Sequences are
+        compared element-wise, because `visit_sequence` always builds a new tuple.
+        """
+        for key, value in children.items():
+            old_value = getattr(self, key)
+            if value is old_value:
+                continue
+            if type(value) is tuple and _is_same_sequence(old_value, value):
+                continue
+            return type(self)(**children)
+        return self
+
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        """
+        A read-only counterpart to `_visit_and_replace_children`, used when visiting
+        with a :class:`~libcst.CSTVisitor`. Subclasses should override this to visit
+        the same children in the same order, without constructing a new node.
+
+        The default implementation falls back to `_visit_and_replace_children` and
+        discards the result, so subclasses that don't override this are still visited
+        correctly.
+        """
+        self._visit_and_replace_children(visitor)
+
     def _is_removable(self) -> bool:
         """
         Intended to be overridden by nodes that will be iterated over inside
@@ -345,19 +555,7 @@ class CSTNode(ABC):
             key = field.name
             if key[0] == "_":
                 continue
-            val = getattr(self, key)
-
-            # Much like the comment on _clone itself, we are allergic to instance
-            # checks against Sequence because of speed issues with ABC classes. So,
-            # instead, first handle sequence types that we do not want to iterate on
-            # and then just try to iterate and clone.
-            if isinstance(val, (str, bytes)):
-                cloned_fields[key] = _clone(val)
-            else:
-                try:
-                    cloned_fields[key] = tuple(_clone(v) for v in val)
-                except TypeError:
-                    cloned_fields[key] = _clone(val)
+            cloned_fields[key] = _clone_field(getattr(self, key))
 
         return type(self)(**cloned_fields)
 
@@ -365,11 +563,44 @@ class CSTNode(ABC):
         """
         Recursively inspects the entire tree under ``self`` and ``other`` to determine if
         the two trees are equal by representation instead of identity (``==``).
+
+        If the :meth:`structural_hash` of both trees is already memoized, trees with
+        different hashes are rejected without inspecting them, so comparing a tree
+        against many other trees is cheap after hashing all of them once, unless the
+        trees are equal. The hashes are never computed just for the comparison.
         """
         from libcst._nodes.deep_equals import deep_equals as deep_equals_impl
 
         return deep_equals_impl(self, other)
 
+    def structural_hash(self) -> int:
+        """
+        Returns a hash of the entire tree under ``self`` that's consistent with
+        :meth:`deep_equals`: trees that are deeply equal always have the same
+        structural hash, so trees with different hashes can't be deeply equal.
+
+        Nodes are immutable, so the hash of every node in the tree is computed once
+        and memoized, unless the node's subtree holds children in a list, which
+        could be mutated. The native parser and :meth:`deep_clone` build tuples. Trees derived from this one with :meth:`with_changes` or
+        transforms share their unchanged subtrees with it, so only the nodes along
+        the changed paths need to be hashed again.
+
+        Use this to group trees by their shape, for example to find duplicated
+        code. Because nodes are compared by identity, key dictionaries and sets
+        with the structural hash instead of the node, and compare trees with equal
+        hashes using :meth:`deep_equals`, since different trees may collide. Like
+        Python's own string hashes, structural hashes aren't stable across
+        processes.
+
+        >>> cst.parse_expression("f(a, b)").structural_hash() == (
+        ...     cst.parse_expression("f(a, b)").structural_hash()
+        ... )
+        True
+        """
+        from libcst._nodes.deep_equals import structural_hash as structural_hash_impl
+
+        return structural_hash_impl(self)
+
     def deep_replace(
         self: _CSTNodeSelfT, old_node: "CSTNode", new_node: CSTNodeT
     ) -> Union[_CSTNodeSelfT, CSTNodeT]:
@@ -380,12 +611,34 @@ class CSTNode(ABC):
         modified the tree in a way that ``old_node`` appears more than once as a deep
         child, all instances will be replaced.
         """
-        new_tree = self.visit(_ChildReplacementTransformer(old_node, new_node))
+        new_tree = _replace_children(self, {old_node: new_node})
         if isinstance(new_tree, (FlattenSentinel, RemovalSentinel)):
             # The above transform never returns *Sentinel, so this isn't possible
             raise Exception("Logic error, cannot get a *Sentinel here!")
         return new_tree
 
+    def deep_replace_many(
+        self: _CSTNodeSelfT,
+        replacements: Mapping["CSTNode", Union["CSTNode", RemovalSentinel]],
+    ) -> Union[_CSTNodeSelfT, "CSTNode", RemovalSentinel]:
+        """
+        Like :meth:`deep_replace`, but replaces every key of ``replacements`` (by
+        identity) with its value. Values may also be :attr:`~libcst.RemoveFromParent`
+        to remove their key, like :meth:`deep_remove`. Use this instead of calling
+        :meth:`deep_replace` once per node, which rebuilds the tree every time.
+
+        The tree is walked once, without rebuilding it, to find the keys. Only the
+        nodes containing them are then rebuilt; other subtrees are kept as they are.
+
+        The descendants of replaced nodes are not visited, so any keys among them are
+        ignored.
+        """
+        new_tree = _replace_children(self, replacements)
+        if isinstance(new_tree, FlattenSentinel):
+            # The above transform never returns FlattenSentinel, so this isn't possible
+            raise Exception("Logic error, cannot get a FlattenSentinel here!")
+        return new_tree
+
     def deep_remove(
         self: _CSTNodeSelfT, old_node: "CSTNode"
     ) -> Union[_CSTNodeSelfT, RemovalSentinel]:
@@ -394,9 +647,7 @@ class CSTNode(ABC):
         have previously modified the tree in a way that ``old_node`` appears more than
         once as a deep child, all instances will be removed.
         """
-        new_tree = self.visit(
-            _ChildReplacementTransformer(old_node, RemovalSentinel.REMOVE)
-        )
+        new_tree = _replace_children(self, {old_node: RemovalSentinel.REMOVE})
 
         if isinstance(new_tree, FlattenSentinel):
             # The above transform never returns FlattenSentinel, so this isn't possible
@@ -419,7 +670,26 @@ class CSTNode(ABC):
         current feature-set, but we should still think about ways to type this or a
         similar API in the future.
         """
-        new_tree = self.visit(_ChildWithChangesTransformer(old_node, changes))
+        new_tree = _change_children(self, {old_node: changes})
+        if isinstance(new_tree, (FlattenSentinel, RemovalSentinel)):
+            # This is impossible with the above transform.
+            raise Exception("Logic error, cannot get a *Sentinel here!")
+        return new_tree
+
+    def with_deep_changes_many(
+        self: _CSTNodeSelfT, changes: Mapping["CSTNode", Mapping[str, Any]]
+    ) -> _CSTNodeSelfT:
+        """
+        Like :meth:`with_deep_changes`, but applies :attr:`with_changes` to every key
+        of ``changes`` (by identity), with the keyword arguments in its value. Use this
+        instead of calling :meth:`with_deep_changes` once per node, which rebuilds the
+        tree every time. Like :meth:`deep_replace_many`, only the nodes containing the
+        keys are rebuilt.
+
+        Nodes may be nested inside other nodes being changed, as long as the changes
+        to the outer node don't replace the attribute holding the inner one.
+        """
+        new_tree = _change_children(self, changes)
         if isinstance(new_tree, (FlattenSentinel, RemovalSentinel)):
             # This is impossible with the above transform.
             raise Exception("Logic error, cannot get a *Sentinel here!")
@@ -482,6 +752,9 @@ class BaseLeaf(CSTNode, ABC):
     ) -> _CSTNodeSelfT:
         return self
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        pass
+
 
 class BaseValueToken(BaseLeaf, ABC):
     """
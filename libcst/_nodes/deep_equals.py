@@ -4,24 +4,40 @@
 # LICENSE file in the root directory of this source tree.
 
 """
-Provides the implementation of `CSTNode.deep_equals`.
+Provides the implementation of `CSTNode.deep_equals` and `CSTNode.structural_hash`.
 """
 
 from dataclasses import fields
-from typing import Sequence
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
 from libcst._nodes.base import CSTNode
 
+# The names of the fields that are compared by `deep_equals` for each node type.
+_compared_fields: Dict[Type[CSTNode], Tuple[str, ...]] = {}
+
+
+def _get_compared_fields(node_type: Type[CSTNode]) -> Tuple[str, ...]:
+    names = _compared_fields.get(node_type)
+    if names is None:
+        # Ignore metadata and other hidden fields
+        names = tuple(f.name for f in fields(node_type) if f.compare is True)
+        _compared_fields[node_type] = names
+    return names
+
+
+def _is_sequence(value: object) -> bool:
+    # Node fields almost always hold tuples or lists, so check for those before
+    # falling back to the much slower check against the `Sequence` ABC.
+    if isinstance(value, (tuple, list)):
+        return True
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+
 
 def deep_equals(a: object, b: object) -> bool:
     if isinstance(a, CSTNode) and isinstance(b, CSTNode):
         return _deep_equals_cst_node(a, b)
-    elif (
-        isinstance(a, Sequence)
-        and not isinstance(a, (str, bytes))
-        and isinstance(b, Sequence)
-        and not isinstance(b, (str, bytes))
-    ):
+    elif _is_sequence(a) and _is_sequence(b):
+        # pyre-ignore[6]: Both are sequences, per the check above.
         return _deep_equals_sequence(a, b)
     else:
         return a == b
@@ -47,10 +63,64 @@ def _deep_equals_cst_node(a: "CSTNode", b: "CSTNode") -> bool:
         return False
     if a is b:  # short-circuit
         return True
-    # Ignore metadata and other hidden fields
-    for field in (f for f in fields(a) if f.compare is True):
-        a_value = getattr(a, field.name)
-        b_value = getattr(b, field.name)
-        if not deep_equals(a_value, b_value):
+    # Hashing a tree takes as long as comparing it, so hashes are only used when
+    # they're already known, e.g. after comparing a tree against other trees.
+    a_hash = _get_cached_hash(a)
+    b_hash = _get_cached_hash(b)
+    if a_hash is not None and b_hash is not None and a_hash != b_hash:
+        return False
+    for name in _get_compared_fields(type(a)):
+        if not deep_equals(getattr(a, name), getattr(b, name)):
             return False
     return True
+
+
+def _get_cached_hash(node: CSTNode) -> Optional[int]:
+    return getattr(node, "_structural_hash", None)
+
+
+def structural_hash(value: object) -> int:
+    """
+    Computes a hash of ``value`` that's consistent with `deep_equals`: values that
+    are deeply equal have the same structural hash. The hash of every node whose
+    subtree only holds its children in tuples is memoized on the node, so it's only
+    computed once for every such node, and updated trees only need to hash the
+    nodes that changed.
+    """
+    return _structural_hash(value)[0]
+
+
+def _structural_hash(value: object) -> Tuple[int, bool]:
+    """
+    Returns the structural hash of ``value``, and whether it can be memoized, which
+    it can't if any node in ``value`` holds children in a sequence that can be
+    mutated (e.g. a list), since that would make the memoized hash stale.
+    """
+    if isinstance(value, CSTNode):
+        cached = _get_cached_hash(value)
+        if cached is not None:
+            return cached, True
+        hashes: List[object] = [type(value)]
+        memoize = True
+        for name in _get_compared_fields(type(value)):
+            field_hash, field_memoize = _structural_hash(getattr(value, name))
+            hashes.append(field_hash)
+            memoize = memoize and field_memoize
+        node_hash = hash(tuple(hashes))
+        if memoize:
+            # Nodes are frozen, so bypass the dataclass' `__setattr__`.
+            object.__setattr__(value, "_structural_hash", node_hash)
+        return node_hash, memoize
+    elif _is_sequence(value):
+        # Sequences of equal values are deeply equal regardless of their type, so
+        # they're all hashed like tuples.
+        hashes: List[int] = []
+        memoize = type(value) is tuple
+        # pyre-ignore[16]: `value` is a sequence, per the check above.
+        for el in value:
+            el_hash, el_memoize = _structural_hash(el)
+            hashes.append(el_hash)
+            memoize = memoize and el_memoize
+        return hash(tuple(hashes)), memoize
+    else:
+        return hash(value), True
@@ -26,6 +26,10 @@ from libcst._nodes.internal import (
     visit_required,
     visit_sentinel,
     visit_sequence,
+    walk_optional,
+    walk_required,
+    walk_sentinel,
+    walk_sequence,
 )
 from libcst._nodes.op import (
     AssignEqual,
@@ -43,7 +47,7 @@ from libcst._nodes.op import (
     NotIn,
 )
 from libcst._nodes.whitespace import BaseParenthesizableWhitespace, SimpleWhitespace
-from libcst._visitors import CSTVisitorT
+from libcst._visitors import CSTVisitor, CSTVisitorT
 
 
 @add_slots
@@ -58,12 +62,15 @@ class LeftSquareBracket(CSTNode):
     whitespace_after: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "LeftSquareBracket":
-        return LeftSquareBracket(
+        return self._with_updated_children(
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token("[")
         self.whitespace_after._codegen(state)
@@ -81,12 +88,15 @@ class RightSquareBracket(CSTNode):
     whitespace_before: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "RightSquareBracket":
-        return RightSquareBracket(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         state.add_token("]")
@@ -104,12 +114,15 @@ class LeftCurlyBrace(CSTNode):
     whitespace_after: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "LeftCurlyBrace":
-        return LeftCurlyBrace(
+        return self._with_updated_children(
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token("{")
         self.whitespace_after._codegen(state)
@@ -127,12 +140,15 @@ class RightCurlyBrace(CSTNode):
     whitespace_before: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "RightCurlyBrace":
-        return RightCurlyBrace(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         state.add_token("}")
@@ -150,12 +166,15 @@ class LeftParen(CSTNode):
     whitespace_after: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "LeftParen":
-        return LeftParen(
+        return self._with_updated_children(
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token("(")
         self.whitespace_after._codegen(state)
@@ -173,12 +192,15 @@ class RightParen(CSTNode):
     whitespace_before: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "RightParen":
-        return RightParen(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         state.add_token(")")
@@ -200,12 +222,15 @@ class Asynchronous(CSTNode):
             raise CSTValidationError("Must have at least one space after Asynchronous.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Asynchronous":
-        return Asynchronous(
+        return self._with_updated_children(
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with state.record_syntactic_position(self):
             state.add_token("async")
@@ -341,12 +366,16 @@ class Name(BaseAssignTargetExpression, BaseDelTargetExpression):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Name":
-        return Name(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=self.value,
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _validate(self) -> None:
         super(Name, self)._validate()
         if len(self.value) == 0:
@@ -376,11 +405,15 @@ class Ellipsis(BaseExpression):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Ellipsis":
-        return Ellipsis(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         return True
 
@@ -422,12 +455,16 @@ class Integer(BaseNumber):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Integer":
-        return Integer(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=self.value,
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _validate(self) -> None:
         super(Integer, self)._validate()
         if not re.fullmatch(INTNUMBER_RE, self.value):
@@ -460,12 +497,16 @@ class Float(BaseNumber):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Float":
-        return Float(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=self.value,
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _validate(self) -> None:
         super(Float, self)._validate()
         if not re.fullmatch(FLOATNUMBER_RE, self.value):
@@ -497,12 +538,16 @@ class Imaginary(BaseNumber):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Imaginary":
-        return Imaginary(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=self.value,
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _validate(self) -> None:
         super(Imaginary, self)._validate()
         if not re.fullmatch(IMAGNUMBER_RE, self.value):
@@ -686,12 +731,16 @@ class SimpleString(_BasePrefixedString):
         return self.value[(prefix_len + quote_len) : (-quote_len)]
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "SimpleString":
-        return SimpleString(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=self.value,
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             state.add_token(self.value)
@@ -734,7 +783,10 @@ class FormattedStringText(BaseFormattedStringContent):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "FormattedStringText":
-        return FormattedStringText(value=self.value)
+        return self._with_updated_children(value=self.value)
+
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        pass
 
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token(self.value)
@@ -794,7 +846,7 @@ class FormattedStringExpression(BaseFormattedStringContent):
         self, visitor: CSTVisitorT
     ) -> "FormattedStringExpression":
         format_spec = self.format_spec
-        return FormattedStringExpression(
+        return self._with_updated_children(
             whitespace_before_expression=visit_required(
                 self,
                 "whitespace_before_expression",
@@ -817,6 +869,25 @@ class FormattedStringExpression(BaseFormattedStringContent):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        format_spec = self.format_spec
+        walk_required(
+            self,
+            "whitespace_before_expression",
+            self.whitespace_before_expression,
+            visitor,
+        )
+        walk_required(self, "expression", self.expression, visitor)
+        walk_optional(self, "equal", self.equal, visitor)
+        walk_required(
+            self,
+            "whitespace_after_expression",
+            self.whitespace_after_expression,
+            visitor,
+        )
+        if format_spec is not None:
+            walk_sequence(self, "format_spec", format_spec, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token("{")
         self.whitespace_before_expression._codegen(state)
@@ -940,7 +1011,7 @@ class FormattedString(_BasePrefixedString):
         return self.end
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "FormattedString":
-        return FormattedString(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             start=self.start,
             parts=visit_sequence(self, "parts", self.parts, visitor),
@@ -948,6 +1019,11 @@ class FormattedString(_BasePrefixedString):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "parts", self.parts, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             state.add_token(self.start)
@@ -1015,7 +1091,7 @@ class ConcatenatedString(BaseString):
             raise CSTValidationError("Cannot concatenate string and bytes.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ConcatenatedString":
-        return ConcatenatedString(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             left=visit_required(self, "left", self.left, visitor),
             whitespace_between=visit_required(
@@ -1025,6 +1101,13 @@ class ConcatenatedString(BaseString):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "left", self.left, visitor)
+        walk_required(self, "whitespace_between", self.whitespace_between, visitor)
+        walk_required(self, "right", self.right, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.left._codegen(state)
@@ -1082,11 +1165,15 @@ class ComparisonTarget(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ComparisonTarget":
-        return ComparisonTarget(
+        return self._with_updated_children(
             operator=visit_required(self, "operator", self.operator, visitor),
             comparator=visit_required(self, "comparator", self.comparator, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "operator", self.operator, visitor)
+        walk_required(self, "comparator", self.comparator, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.operator._codegen(state)
         self.comparator._codegen(state)
@@ -1167,13 +1254,19 @@ class Comparison(BaseExpression):
             previous_comparator = target.comparator
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Comparison":
-        return Comparison(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             left=visit_required(self, "left", self.left, visitor),
             comparisons=visit_sequence(self, "comparisons", self.comparisons, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "left", self.left, visitor)
+        walk_sequence(self, "comparisons", self.comparisons, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.left._codegen(state)
@@ -1215,13 +1308,19 @@ class UnaryOperation(BaseExpression):
             raise CSTValidationError("Must have at least one space after not operator.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "UnaryOperation":
-        return UnaryOperation(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             operator=visit_required(self, "operator", self.operator, visitor),
             expression=visit_required(self, "expression", self.expression, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "operator", self.operator, visitor)
+        walk_required(self, "expression", self.expression, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         """
         As long as we aren't comprised of the Not unary operator, we are safe to use
@@ -1274,7 +1373,7 @@ class BinaryOperation(BaseExpression):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "BinaryOperation":
-        return BinaryOperation(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             left=visit_required(self, "left", self.left, visitor),
             operator=visit_required(self, "operator", self.operator, visitor),
@@ -1282,6 +1381,13 @@ class BinaryOperation(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "left", self.left, visitor)
+        walk_required(self, "operator", self.operator, visitor)
+        walk_required(self, "right", self.right, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         if super(BinaryOperation, self)._safe_to_use_with_word_operator(position):
             return True
@@ -1346,7 +1452,7 @@ class BooleanOperation(BaseExpression):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "BooleanOperation":
-        return BooleanOperation(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             left=visit_required(self, "left", self.left, visitor),
             operator=visit_required(self, "operator", self.operator, visitor),
@@ -1354,6 +1460,13 @@ class BooleanOperation(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "left", self.left, visitor)
+        walk_required(self, "operator", self.operator, visitor)
+        walk_required(self, "right", self.right, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         if super(BooleanOperation, self)._safe_to_use_with_word_operator(position):
             return True
@@ -1403,7 +1516,7 @@ class Attribute(BaseAssignTargetExpression, BaseDelTargetExpression):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Attribute":
-        return Attribute(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=visit_required(self, "value", self.value, visitor),
             dot=visit_required(self, "dot", self.dot, visitor),
@@ -1411,6 +1524,13 @@ class Attribute(BaseAssignTargetExpression, BaseDelTargetExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "value", self.value, visitor)
+        walk_required(self, "dot", self.dot, visitor)
+        walk_required(self, "attr", self.attr, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         if super(Attribute, self)._safe_to_use_with_word_operator(position):
             return True
@@ -1453,7 +1573,7 @@ class Index(BaseSlice):
     whitespace_after_star: Optional[BaseParenthesizableWhitespace] = None
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Index":
-        return Index(
+        return self._with_updated_children(
             star=self.star,
             whitespace_after_star=visit_optional(
                 self, "whitespace_after_star", self.whitespace_after_star, visitor
@@ -1461,6 +1581,12 @@ class Index(BaseSlice):
             value=visit_required(self, "value", self.value, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_optional(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         star = self.star
         if star is not None:
@@ -1497,7 +1623,7 @@ class Slice(BaseSlice):
     second_colon: Union[Colon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Slice":
-        return Slice(
+        return self._with_updated_children(
             lower=visit_optional(self, "lower", self.lower, visitor),
             first_colon=visit_required(self, "first_colon", self.first_colon, visitor),
             upper=visit_optional(self, "upper", self.upper, visitor),
@@ -1507,6 +1633,13 @@ class Slice(BaseSlice):
             step=visit_optional(self, "step", self.step, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_optional(self, "lower", self.lower, visitor)
+        walk_required(self, "first_colon", self.first_colon, visitor)
+        walk_optional(self, "upper", self.upper, visitor)
+        walk_sentinel(self, "second_colon", self.second_colon, visitor)
+        walk_optional(self, "step", self.step, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         lower = self.lower
         if lower is not None:
@@ -1543,11 +1676,15 @@ class SubscriptElement(CSTNode):
     comma: Union[Comma, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "SubscriptElement":
-        return SubscriptElement(
+        return self._with_updated_children(
             slice=visit_required(self, "slice", self.slice, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "slice", self.slice, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.slice._codegen(state)
@@ -1592,7 +1729,7 @@ class Subscript(BaseAssignTargetExpression, BaseDelTargetExpression):
             raise CSTValidationError("Cannot have empty SubscriptElement.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Subscript":
-        return Subscript(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             value=visit_required(self, "value", self.value, visitor),
             whitespace_after_value=visit_required(
@@ -1604,6 +1741,17 @@ class Subscript(BaseAssignTargetExpression, BaseDelTargetExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "value", self.value, visitor)
+        walk_required(
+            self, "whitespace_after_value", self.whitespace_after_value, visitor
+        )
+        walk_required(self, "lbracket", self.lbracket, visitor)
+        walk_sequence(self, "slice", self.slice, visitor)
+        walk_required(self, "rbracket", self.rbracket, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         if position == ExpressionPosition.LEFT:
             return True
@@ -1655,7 +1803,7 @@ class Annotation(CSTNode):
     )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Annotation":
-        return Annotation(
+        return self._with_updated_children(
             whitespace_before_indicator=visit_sentinel(
                 self,
                 "whitespace_before_indicator",
@@ -1671,6 +1819,18 @@ class Annotation(CSTNode):
             annotation=visit_required(self, "annotation", self.annotation, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(
+            self,
+            "whitespace_before_indicator",
+            self.whitespace_before_indicator,
+            visitor,
+        )
+        walk_required(
+            self, "whitespace_after_indicator", self.whitespace_after_indicator, visitor
+        )
+        walk_required(self, "annotation", self.annotation, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_indicator: Optional[str] = None
     ) -> None:
@@ -1714,7 +1874,12 @@ class ParamStar(CSTNode):
     comma: Comma = Comma.field(whitespace_after=SimpleWhitespace(" "))
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ParamStar":
-        return ParamStar(comma=visit_required(self, "comma", self.comma, visitor))
+        return self._with_updated_children(
+            comma=visit_required(self, "comma", self.comma, visitor)
+        )
+
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "comma", self.comma, visitor)
 
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token("*")
@@ -1742,13 +1907,17 @@ class ParamSlash(CSTNode):
     whitespace_after: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ParamSlash":
-        return ParamSlash(
+        return self._with_updated_children(
             comma=visit_sentinel(self, "comma", self.comma, visitor),
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(self, "comma", self.comma, visitor)
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         state.add_token("/")
 
@@ -1805,7 +1974,7 @@ class Param(CSTNode):
             raise CSTValidationError("Must specify either '', '*' or '**' for star.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Param":
-        return Param(
+        return self._with_updated_children(
             star=self.star,
             whitespace_after_star=visit_required(
                 self, "whitespace_after_star", self.whitespace_after_star, visitor
@@ -1820,6 +1989,19 @@ class Param(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+        walk_required(self, "name", self.name, visitor)
+        walk_optional(self, "annotation", self.annotation, visitor)
+        walk_sentinel(self, "equal", self.equal, visitor)
+        walk_optional(self, "default", self.default, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+        walk_required(
+            self, "whitespace_after_param", self.whitespace_after_param, visitor
+        )
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -1968,7 +2150,7 @@ class Parameters(CSTNode):
         self._validate_stars()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Parameters":
-        return Parameters(
+        return self._with_updated_children(
             posonly_params=visit_sequence(
                 self, "posonly_params", self.posonly_params, visitor
             ),
@@ -1981,6 +2163,14 @@ class Parameters(CSTNode):
             star_kwarg=visit_optional(self, "star_kwarg", self.star_kwarg, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "posonly_params", self.posonly_params, visitor)
+        walk_sentinel(self, "posonly_ind", self.posonly_ind, visitor)
+        walk_sequence(self, "params", self.params, visitor)
+        walk_sentinel(self, "star_arg", self.star_arg, visitor)
+        walk_sequence(self, "kwonly_params", self.kwonly_params, visitor)
+        walk_optional(self, "star_kwarg", self.star_kwarg, visitor)
+
     def _safe_to_join_with_lambda(self) -> bool:
         """
         Determine if Parameters need a space after the `lambda` keyword. Returns True
@@ -2146,7 +2336,7 @@ class Lambda(BaseExpression):
                 )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Lambda":
-        return Lambda(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             whitespace_after_lambda=visit_sentinel(
                 self, "whitespace_after_lambda", self.whitespace_after_lambda, visitor
@@ -2157,6 +2347,16 @@ class Lambda(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sentinel(
+            self, "whitespace_after_lambda", self.whitespace_after_lambda, visitor
+        )
+        walk_required(self, "params", self.params, visitor)
+        walk_required(self, "colon", self.colon, visitor)
+        walk_required(self, "body", self.body, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             state.add_token("lambda")
@@ -2223,7 +2423,7 @@ class Arg(CSTNode):
             raise CSTValidationError("Cannot specify a star and a keyword together.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Arg":
-        return Arg(
+        return self._with_updated_children(
             star=self.star,
             whitespace_after_star=visit_required(
                 self, "whitespace_after_star", self.whitespace_after_star, visitor
@@ -2237,6 +2437,16 @@ class Arg(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+        walk_optional(self, "keyword", self.keyword, visitor)
+        walk_sentinel(self, "equal", self.equal, visitor)
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+        walk_required(self, "whitespace_after_arg", self.whitespace_after_arg, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             state.add_token(self.star)
@@ -2409,7 +2619,7 @@ class Call(_BaseExpressionWithArgs):
         return False
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Call":
-        return Call(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             func=visit_required(self, "func", self.func, visitor),
             whitespace_after_func=visit_required(
@@ -2422,6 +2632,18 @@ class Call(_BaseExpressionWithArgs):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "func", self.func, visitor)
+        walk_required(
+            self, "whitespace_after_func", self.whitespace_after_func, visitor
+        )
+        walk_required(
+            self, "whitespace_before_args", self.whitespace_before_args, visitor
+        )
+        walk_sequence(self, "args", self.args, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.func._codegen(state)
@@ -2467,7 +2689,7 @@ class Await(BaseExpression):
             raise CSTValidationError("Must have at least one space after await")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Await":
-        return Await(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             whitespace_after_await=visit_required(
                 self, "whitespace_after_await", self.whitespace_after_await, visitor
@@ -2476,6 +2698,14 @@ class Await(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(
+            self, "whitespace_after_await", self.whitespace_after_await, visitor
+        )
+        walk_required(self, "expression", self.expression, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             state.add_token("await")
@@ -2557,7 +2787,7 @@ class IfExp(BaseExpression):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "IfExp":
-        return IfExp(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             body=visit_required(self, "body", self.body, visitor),
             whitespace_before_if=visit_required(
@@ -2577,6 +2807,21 @@ class IfExp(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "body", self.body, visitor)
+        walk_required(self, "whitespace_before_if", self.whitespace_before_if, visitor)
+        walk_required(self, "whitespace_after_if", self.whitespace_after_if, visitor)
+        walk_required(self, "test", self.test, visitor)
+        walk_required(
+            self, "whitespace_before_else", self.whitespace_before_else, visitor
+        )
+        walk_required(
+            self, "whitespace_after_else", self.whitespace_after_else, visitor
+        )
+        walk_required(self, "orelse", self.orelse, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.body._codegen(state)
@@ -2619,7 +2864,7 @@ class From(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "From":
-        return From(
+        return self._with_updated_children(
             whitespace_before_from=visit_sentinel(
                 self, "whitespace_before_from", self.whitespace_before_from, visitor
             ),
@@ -2629,6 +2874,15 @@ class From(CSTNode):
             item=visit_required(self, "item", self.item, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(
+            self, "whitespace_before_from", self.whitespace_before_from, visitor
+        )
+        walk_required(
+            self, "whitespace_after_from", self.whitespace_after_from, visitor
+        )
+        walk_required(self, "item", self.item, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_space: str = "") -> None:
         whitespace_before_from = self.whitespace_before_from
         if isinstance(whitespace_before_from, BaseParenthesizableWhitespace):
@@ -2688,7 +2942,7 @@ class Yield(BaseExpression):
                 )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Yield":
-        return Yield(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             whitespace_after_yield=visit_sentinel(
                 self, "whitespace_after_yield", self.whitespace_after_yield, visitor
@@ -2697,6 +2951,14 @@ class Yield(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sentinel(
+            self, "whitespace_after_yield", self.whitespace_after_yield, visitor
+        )
+        walk_optional(self, "value", self.value, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             state.add_token("yield")
@@ -2786,11 +3048,15 @@ class Element(BaseElement):
     comma: Union[Comma, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Element":
-        return Element(
+        return self._with_updated_children(
             value=visit_required(self, "value", self.value, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -2826,7 +3092,7 @@ class DictElement(BaseDictElement):
     whitespace_after_colon: BaseParenthesizableWhitespace = SimpleWhitespace.field(" ")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "DictElement":
-        return DictElement(
+        return self._with_updated_children(
             key=visit_required(self, "key", self.key, visitor),
             whitespace_before_colon=visit_required(
                 self, "whitespace_before_colon", self.whitespace_before_colon, visitor
@@ -2838,6 +3104,17 @@ class DictElement(BaseDictElement):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "key", self.key, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(
+            self, "whitespace_after_colon", self.whitespace_after_colon, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -2891,7 +3168,7 @@ class StarredElement(BaseElement, BaseExpression, _BaseParenthesizedNode):
     whitespace_before_value: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "StarredElement":
-        return StarredElement(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             whitespace_before_value=visit_required(
                 self, "whitespace_before_value", self.whitespace_before_value, visitor
@@ -2901,6 +3178,15 @@ class StarredElement(BaseElement, BaseExpression, _BaseParenthesizedNode):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(
+            self, "whitespace_before_value", self.whitespace_before_value, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -2938,7 +3224,7 @@ class StarredDictElement(BaseDictElement):
     whitespace_before_value: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "StarredDictElement":
-        return StarredDictElement(
+        return self._with_updated_children(
             whitespace_before_value=visit_required(
                 self, "whitespace_before_value", self.whitespace_before_value, visitor
             ),
@@ -2946,6 +3232,13 @@ class StarredDictElement(BaseDictElement):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_before_value", self.whitespace_before_value, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -3023,12 +3316,17 @@ class Tuple(BaseAssignTargetExpression, BaseDelTargetExpression):
         # is a comma where required.
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Tuple":
-        return Tuple(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             elements=visit_sequence(self, "elements", self.elements, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "elements", self.elements, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             elements = self.elements
@@ -3105,7 +3403,7 @@ class List(BaseList, BaseAssignTargetExpression, BaseDelTargetExpression):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "List":
-        return List(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbracket=visit_required(self, "lbracket", self.lbracket, visitor),
             elements=visit_sequence(self, "elements", self.elements, visitor),
@@ -3113,6 +3411,13 @@ class List(BaseList, BaseAssignTargetExpression, BaseDelTargetExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbracket", self.lbracket, visitor)
+        walk_sequence(self, "elements", self.elements, visitor)
+        walk_required(self, "rbracket", self.rbracket, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._bracketize(state):
             elements = self.elements
@@ -3206,7 +3511,7 @@ class Set(BaseSet):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Set":
-        return Set(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbrace=visit_required(self, "lbrace", self.lbrace, visitor),
             elements=visit_sequence(self, "elements", self.elements, visitor),
@@ -3214,6 +3519,13 @@ class Set(BaseSet):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbrace", self.lbrace, visitor)
+        walk_sequence(self, "elements", self.elements, visitor)
+        walk_required(self, "rbrace", self.rbrace, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._braceize(state):
             elements = self.elements
@@ -3264,7 +3576,7 @@ class Dict(BaseDict):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Dict":
-        return Dict(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbrace=visit_required(self, "lbrace", self.lbrace, visitor),
             elements=visit_sequence(self, "elements", self.elements, visitor),
@@ -3272,6 +3584,13 @@ class Dict(BaseDict):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbrace", self.lbrace, visitor)
+        walk_sequence(self, "elements", self.elements, visitor)
+        walk_required(self, "rbrace", self.rbrace, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._braceize(state):
             elements = self.elements
@@ -3415,7 +3734,7 @@ class CompFor(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "CompFor":
-        return CompFor(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             ),
@@ -3439,6 +3758,17 @@ class CompFor(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+        walk_optional(self, "asynchronous", self.asynchronous, visitor)
+        walk_required(self, "whitespace_after_for", self.whitespace_after_for, visitor)
+        walk_required(self, "target", self.target, visitor)
+        walk_required(self, "whitespace_before_in", self.whitespace_before_in, visitor)
+        walk_required(self, "whitespace_after_in", self.whitespace_after_in, visitor)
+        walk_required(self, "iter", self.iter, visitor)
+        walk_sequence(self, "ifs", self.ifs, visitor)
+        walk_optional(self, "inner_for_in", self.inner_for_in, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         asynchronous = self.asynchronous
@@ -3486,7 +3816,7 @@ class CompIf(CSTNode):
             raise CSTValidationError("Must have at least one space after 'if' keyword.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "CompIf":
-        return CompIf(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             ),
@@ -3496,6 +3826,13 @@ class CompIf(CSTNode):
             test=visit_required(self, "test", self.test, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+        walk_required(
+            self, "whitespace_before_test", self.whitespace_before_test, visitor
+        )
+        walk_required(self, "test", self.test, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         state.add_token("if")
@@ -3585,13 +3922,19 @@ class GeneratorExp(BaseSimpleComp):
     # it's not worth the effort.
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "GeneratorExp":
-        return GeneratorExp(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             elt=visit_required(self, "elt", self.elt, visitor),
             for_in=visit_required(self, "for_in", self.for_in, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "elt", self.elt, visitor)
+        walk_required(self, "for_in", self.for_in, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.elt._codegen(state)
@@ -3625,7 +3968,7 @@ class ListComp(BaseList, BaseSimpleComp):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ListComp":
-        return ListComp(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbracket=visit_required(self, "lbracket", self.lbracket, visitor),
             elt=visit_required(self, "elt", self.elt, visitor),
@@ -3634,6 +3977,14 @@ class ListComp(BaseList, BaseSimpleComp):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbracket", self.lbracket, visitor)
+        walk_required(self, "elt", self.elt, visitor)
+        walk_required(self, "for_in", self.for_in, visitor)
+        walk_required(self, "rbracket", self.rbracket, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._bracketize(state):
             self.elt._codegen(state)
@@ -3667,7 +4018,7 @@ class SetComp(BaseSet, BaseSimpleComp):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "SetComp":
-        return SetComp(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbrace=visit_required(self, "lbrace", self.lbrace, visitor),
             elt=visit_required(self, "elt", self.elt, visitor),
@@ -3676,6 +4027,14 @@ class SetComp(BaseSet, BaseSimpleComp):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbrace", self.lbrace, visitor)
+        walk_required(self, "elt", self.elt, visitor)
+        walk_required(self, "for_in", self.for_in, visitor)
+        walk_required(self, "rbrace", self.rbrace, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._braceize(state):
             self.elt._codegen(state)
@@ -3731,7 +4090,7 @@ class DictComp(BaseDict, BaseComp):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "DictComp":
-        return DictComp(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbrace=visit_required(self, "lbrace", self.lbrace, visitor),
             key=visit_required(self, "key", self.key, visitor),
@@ -3747,6 +4106,21 @@ class DictComp(BaseDict, BaseComp):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbrace", self.lbrace, visitor)
+        walk_required(self, "key", self.key, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(
+            self, "whitespace_after_colon", self.whitespace_after_colon, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_required(self, "for_in", self.for_in, visitor)
+        walk_required(self, "rbrace", self.rbrace, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state), self._braceize(state):
             self.key._codegen(state)
@@ -3788,7 +4162,7 @@ class NamedExpr(BaseExpression):
     whitespace_after_walrus: BaseParenthesizableWhitespace = SimpleWhitespace.field(" ")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "NamedExpr":
-        return NamedExpr(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             target=visit_required(self, "target", self.target, visitor),
             whitespace_before_walrus=visit_required(
@@ -3801,6 +4175,18 @@ class NamedExpr(BaseExpression):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "target", self.target, visitor)
+        walk_required(
+            self, "whitespace_before_walrus", self.whitespace_before_walrus, visitor
+        )
+        walk_required(
+            self, "whitespace_after_walrus", self.whitespace_after_walrus, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _safe_to_use_with_word_operator(self, position: ExpressionPosition) -> bool:
         if position == ExpressionPosition.LEFT:
             return len(self.rpar) > 0 or self.value._safe_to_use_with_word_operator(
@@ -17,7 +17,7 @@ from libcst._types import CSTNodeT
 if TYPE_CHECKING:
     # These are circular dependencies only used for typing purposes
     from libcst._nodes.base import CSTNode  # noqa: F401
-    from libcst._visitors import CSTVisitorT
+    from libcst._visitors import CSTVisitor, CSTVisitorT
 
 
 @add_slots
@@ -77,7 +77,9 @@ def visit_required(
     Given a node, visits the node using `visitor`. If removal is attempted by the
     visitor, an exception is raised.
     """
-    visitor.on_visit_attribute(parent, fieldname)
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
     result = node.visit(visitor)
     if isinstance(result, RemovalSentinel):
         raise TypeError(
@@ -91,7 +93,8 @@ def visit_required(
             + "sequence."
         )
 
-    visitor.on_leave_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
     return result
 
 
@@ -102,11 +105,14 @@ def visit_optional(
     Given an optional node, visits the node if it exists with `visitor`. If the node is
     removed, returns None.
     """
+    hooks = visitor._has_attribute_hooks
     if node is None:
-        visitor.on_visit_attribute(parent, fieldname)
-        visitor.on_leave_attribute(parent, fieldname)
+        if hooks:
+            visitor.on_visit_attribute(parent, fieldname)
+            visitor.on_leave_attribute(parent, fieldname)
         return None
-    visitor.on_visit_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
     result = node.visit(visitor)
     if isinstance(result, FlattenSentinel):
         raise TypeError(
@@ -114,7 +120,8 @@ def visit_optional(
             + "node's parent does not allow for it to be it to be replaced with a "
             + "sequence."
         )
-    visitor.on_leave_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
     return None if isinstance(result, RemovalSentinel) else result
 
 
@@ -128,11 +135,14 @@ def visit_sentinel(
     Given a node that can be a real value or a sentinel value, visits the node if it
     is real with `visitor`. If the node is removed, returns MaybeSentinel.
     """
+    hooks = visitor._has_attribute_hooks
     if isinstance(node, MaybeSentinel):
-        visitor.on_visit_attribute(parent, fieldname)
-        visitor.on_leave_attribute(parent, fieldname)
+        if hooks:
+            visitor.on_visit_attribute(parent, fieldname)
+            visitor.on_leave_attribute(parent, fieldname)
         return MaybeSentinel.DEFAULT
-    visitor.on_visit_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
     result = node.visit(visitor)
     if isinstance(result, FlattenSentinel):
         raise TypeError(
@@ -140,7 +150,8 @@ def visit_sentinel(
             + "node's parent does not allow for it to be it to be replaced with a "
             + "sequence."
         )
-    visitor.on_leave_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
     return MaybeSentinel.DEFAULT if isinstance(result, RemovalSentinel) else result
 
 
@@ -154,14 +165,17 @@ def visit_iterable(
     Given an iterable of children, visits each child with `visitor`, and yields the new
     children with any `RemovalSentinel` values removed.
     """
-    visitor.on_visit_attribute(parent, fieldname)
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
     for child in children:
         new_child = child.visit(visitor)
         if isinstance(new_child, FlattenSentinel):
             yield from new_child
         elif not isinstance(new_child, RemovalSentinel):
             yield new_child
-    visitor.on_leave_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
 
 
 def visit_sequence(
@@ -188,7 +202,9 @@ def visit_body_iterable(
     nodes in order to preserve correct pass insertion behavior.
     """
 
-    visitor.on_visit_attribute(parent, fieldname)
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
     for child in children:
         new_child = child.visit(visitor)
 
@@ -211,7 +227,8 @@ def visit_body_iterable(
                 continue
             # Safe to yield child in this case.
             yield new_child
-    visitor.on_leave_attribute(parent, fieldname)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
 
 
 def visit_body_sequence(
@@ -225,3 +242,75 @@ def visit_body_sequence(
     instead of an iterable.
     """
     return tuple(visit_body_iterable(parent, fieldname, children, visitor))
+
+
+def walk_required(
+    parent: "CSTNode", fieldname: str, node: "CSTNode", visitor: "CSTVisitor"
+) -> None:
+    """
+    The read-only counterpart of `visit_required`, used by `_visit_children`. Visits
+    the node using `visitor` without collecting a replacement for it.
+    """
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
+    node.visit(visitor)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
+
+
+def walk_optional(
+    parent: "CSTNode",
+    fieldname: str,
+    node: Optional["CSTNode"],
+    visitor: "CSTVisitor",
+) -> None:
+    """
+    The read-only counterpart of `visit_optional`. Visits the node if it exists with
+    `visitor`.
+    """
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
+    if node is not None:
+        node.visit(visitor)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
+
+
+def walk_sentinel(
+    parent: "CSTNode",
+    fieldname: str,
+    node: Union["CSTNode", MaybeSentinel],
+    visitor: "CSTVisitor",
+) -> None:
+    """
+    The read-only counterpart of `visit_sentinel`. Visits the node if it is real with
+    `visitor`.
+    """
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
+    if not isinstance(node, MaybeSentinel):
+        node.visit(visitor)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
+
+
+def walk_sequence(
+    parent: "CSTNode",
+    fieldname: str,
+    children: Iterable["CSTNode"],
+    visitor: "CSTVisitor",
+) -> None:
+    """
+    The read-only counterpart of `visit_sequence` and `visit_body_sequence`. Visits
+    each child with `visitor` without building a new sequence.
+    """
+    hooks = visitor._has_attribute_hooks
+    if hooks:
+        visitor.on_visit_attribute(parent, fieldname)
+    for child in children:
+        child.visit(visitor)
+    if hooks:
+        visitor.on_leave_attribute(parent, fieldname)
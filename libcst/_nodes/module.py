@@ -3,12 +3,17 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from dataclasses import dataclass
-from typing import cast, Optional, Sequence, TYPE_CHECKING, TypeVar, Union
+from dataclasses import dataclass, field
+from typing import cast, List, Optional, Sequence, TYPE_CHECKING, TypeVar, Union
 
 from libcst._add_slots import add_slots
 from libcst._nodes.base import CSTNode
-from libcst._nodes.internal import CodegenState, visit_body_sequence, visit_sequence
+from libcst._nodes.internal import (
+    CodegenState,
+    visit_body_sequence,
+    visit_sequence,
+    walk_sequence,
+)
 from libcst._nodes.statement import (
     BaseCompoundStatement,
     get_docstring_impl,
@@ -16,7 +21,7 @@ from libcst._nodes.statement import (
 )
 from libcst._nodes.whitespace import EmptyLine
 from libcst._removal_sentinel import RemovalSentinel
-from libcst._visitors import CSTVisitorT
+from libcst._visitors import CSTVisitor, CSTVisitorT
 
 if TYPE_CHECKING:
     # This is circular, so import the type only in type checking
@@ -68,8 +73,25 @@ class Module(CSTNode):
     #: Whether the module has a trailing newline or not.
     has_trailing_newline: bool = True
 
+    # The source code this module was parsed from, if it was returned by the parser.
+    # It isn't passed on to modules derived from this one (e.g. by a transform that
+    # changed something), since their code may differ. This uses a default factory
+    # because `add_slots` removes class-level defaults, which would otherwise be
+    # what provides the value of fields that aren't initialized by `__init__`. Bytes
+    # are decoded (and replaced by the decoded source) when `code` is first needed.
+    _source: Optional[Union[str, builtin_bytes]] = field(
+        default_factory=lambda: None, init=False, repr=False, compare=False
+    )
+
+    # The offset in `code` at which each statement of `body` starts, once
+    # `incremental_parse` has needed them. Like `_source`, it isn't passed on to
+    # modules derived from this one.
+    _statement_offsets: Optional[Sequence[int]] = field(
+        default_factory=lambda: None, init=False, repr=False, compare=False
+    )
+
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Module":
-        return Module(
+        return self._with_updated_children(
             header=visit_sequence(self, "header", self.header, visitor),
             body=visit_body_sequence(self, "body", self.body, visitor),
             footer=visit_sequence(self, "footer", self.footer, visitor),
@@ -79,6 +101,11 @@ class Module(CSTNode):
             has_trailing_newline=self.has_trailing_newline,
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "header", self.header, visitor)
+        walk_sequence(self, "body", self.body, visitor)
+        walk_sequence(self, "footer", self.footer, visitor)
+
     def visit(self: _ModuleSelfT, visitor: CSTVisitorT) -> _ModuleSelfT:
         """
         Returns the result of running a visitor over this module.
@@ -86,7 +113,15 @@ class Module(CSTNode):
         :class:`Module` overrides the default visitor entry point to resolve metadata
         dependencies declared by 'visitor'.
         """
-        result = super(Module, self).visit(visitor)
+        return self._visit_result(super(Module, self).visit(visitor))
+
+    def _visit_result(
+        self: _ModuleSelfT, result: Union[CSTNode, RemovalSentinel]
+    ) -> _ModuleSelfT:
+        """
+        Returns the module that visiting this module gives, given what the visitor
+        returned for it. Shared by every entry point that visits a module.
+        """
         if isinstance(result, RemovalSentinel):
             return self.with_changes(body=(), header=(), footer=())
         else:  # is a Module
@@ -112,7 +147,22 @@ class Module(CSTNode):
         """
         The string representation of this module, respecting the inferred indentation
         and newline type.
+
+        For a module returned by the parser, this is the source code it was parsed
+        from, without having to generate it again. This also holds for modules that
+        a transform left unchanged, since transforms return the same module in that
+        case. Such modules keep a reference to their source for this, which is small
+        next to the tree itself (for LibCST's own modules, 3-4% of the memory the
+        tree retains), and which is pickled along with the module.
+        :class:`~libcst.ParseCache` leaves it out of its entries.
         """
+        source = self._source
+        if isinstance(source, str):
+            return source
+        if source is not None:
+            code = source.decode(self.encoding)
+            object.__setattr__(self, "_source", code)
+            return code
         return self.code_for_node(self)
 
     @property
@@ -121,6 +171,10 @@ class Module(CSTNode):
         The bytes representation of this module, respecting the inferred indentation
         and newline type, using the current encoding.
         """
+        source = self._source
+        if isinstance(source, builtin_bytes):
+            # The bytes this module was parsed from, which it doesn't need to decode.
+            return source
         return self.code.encode(self.encoding)
 
     def code_for_node(self, node: CSTNode) -> str:
@@ -136,6 +190,20 @@ class Module(CSTNode):
         node._codegen(state)
         return "".join(state.tokens)
 
+    def materialize(self: _ModuleSelfT) -> _ModuleSelfT:
+        """
+        Parses the bodies of functions that were left unparsed because this module
+        was parsed with :attr:`~libcst.PartialParserConfig.lazy_function_bodies`, and
+        converts the statements that were left in the native parser's tree by
+        :attr:`~libcst.PartialParserConfig.lazy_statements`, which otherwise happens
+        when they're first accessed. Returns this module, since its value doesn't
+        change.
+        """
+        nodes: List[CSTNode] = [self]
+        while nodes:
+            nodes.extend(nodes.pop().children)
+        return self
+
     @property
     def config_for_parsing(self) -> "PartialParserConfig":
         """
@@ -9,9 +9,9 @@ from typing import Tuple
 
 from libcst._add_slots import add_slots
 from libcst._nodes.base import BaseLeaf, CSTNode, CSTValidationError
-from libcst._nodes.internal import CodegenState, visit_required
+from libcst._nodes.internal import CodegenState, visit_required, walk_required
 from libcst._nodes.whitespace import BaseParenthesizableWhitespace, SimpleWhitespace
-from libcst._visitors import CSTVisitorT
+from libcst._visitors import CSTVisitor, CSTVisitorT
 
 
 class _BaseOneTokenOp(CSTNode, ABC):
@@ -26,8 +26,7 @@ class _BaseOneTokenOp(CSTNode, ABC):
     whitespace_after: BaseParenthesizableWhitespace
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "_BaseOneTokenOp":
-        # pyre-ignore Pyre thinks that self.__class__ is CSTNode, not _BaseOneTokenOp
-        return self.__class__(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             ),
@@ -36,6 +35,10 @@ class _BaseOneTokenOp(CSTNode, ABC):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         with state.record_syntactic_position(self):
@@ -66,8 +69,7 @@ class _BaseTwoTokenOp(CSTNode, ABC):
             raise CSTValidationError("Must have at least one space between not and in.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "_BaseTwoTokenOp":
-        # pyre-ignore Pyre thinks that self.__class__ is CSTNode, not _BaseTwoTokenOp
-        return self.__class__(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             ),
@@ -79,6 +81,11 @@ class _BaseTwoTokenOp(CSTNode, ABC):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+        walk_required(self, "whitespace_between", self.whitespace_between, visitor)
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before._codegen(state)
         with state.record_syntactic_position(self):
@@ -103,13 +110,15 @@ class BaseUnaryOp(CSTNode, ABC):
     whitespace_after: BaseParenthesizableWhitespace
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "BaseUnaryOp":
-        # pyre-ignore Pyre thinks that self.__class__ is CSTNode, not BaseUnaryOp
-        return self.__class__(
+        return self._with_updated_children(
             whitespace_after=visit_required(
                 self, "whitespace_after", self.whitespace_after, visitor
             )
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         state.add_token(self._get_token())
         self.whitespace_after._codegen(state)
@@ -706,7 +715,7 @@ class NotEqual(BaseCompOp, _BaseOneTokenOp):
             raise CSTValidationError("Invalid value for NotEqual node.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "NotEqual":
-        return self.__class__(
+        return self._with_updated_children(
             whitespace_before=visit_required(
                 self, "whitespace_before", self.whitespace_before, visitor
             ),
@@ -716,6 +725,10 @@ class NotEqual(BaseCompOp, _BaseOneTokenOp):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before", self.whitespace_before, visitor)
+        walk_required(self, "whitespace_after", self.whitespace_after, visitor)
+
     def _get_token(self) -> str:
         return self.value
 
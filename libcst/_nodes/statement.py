@@ -43,6 +43,10 @@ from libcst._nodes.internal import (
     visit_required,
     visit_sentinel,
     visit_sequence,
+    walk_optional,
+    walk_required,
+    walk_sentinel,
+    walk_sequence,
 )
 from libcst._nodes.op import (
     AssignEqual,
@@ -61,7 +65,7 @@ from libcst._nodes.whitespace import (
     SimpleWhitespace,
     TrailingWhitespace,
 )
-from libcst._visitors import CSTVisitorT
+from libcst._visitors import CSTVisitor, CSTVisitorT
 
 _INDENT_WHITESPACE_RE: Pattern[str] = re.compile(r"[ \f\t]+", re.UNICODE)
 
@@ -145,7 +149,7 @@ class Del(BaseSmallStatement):
             raise CSTValidationError("Must have at least one space after 'del'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Del":
-        return Del(
+        return self._with_updated_children(
             target=visit_required(self, "target", self.target, visitor),
             whitespace_after_del=visit_required(
                 self, "whitespace_after_del", self.whitespace_after_del, visitor
@@ -153,6 +157,11 @@ class Del(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "target", self.target, visitor)
+        walk_required(self, "whitespace_after_del", self.whitespace_after_del, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -181,10 +190,13 @@ class Pass(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Pass":
-        return Pass(
+        return self._with_updated_children(
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor)
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -212,10 +224,13 @@ class Break(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Break":
-        return Break(
+        return self._with_updated_children(
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor)
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -243,10 +258,13 @@ class Continue(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Continue":
-        return Continue(
+        return self._with_updated_children(
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor)
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -295,7 +313,7 @@ class Return(BaseSmallStatement):
                 raise CSTValidationError("Must have at least one space after 'return'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Return":
-        return Return(
+        return self._with_updated_children(
             whitespace_after_return=visit_sentinel(
                 self, "whitespace_after_return", self.whitespace_after_return, visitor
             ),
@@ -303,6 +321,13 @@ class Return(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(
+            self, "whitespace_after_return", self.whitespace_after_return, visitor
+        )
+        walk_optional(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -344,11 +369,15 @@ class Expr(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Expr":
-        return Expr(
+        return self._with_updated_children(
             value=visit_required(self, "value", self.value, visitor),
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -436,7 +465,7 @@ class SimpleStatementLine(_BaseSimpleStatement, BaseStatement):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "SimpleStatementLine":
-        return SimpleStatementLine(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -446,6 +475,11 @@ class SimpleStatementLine(_BaseSimpleStatement, BaseStatement):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_sequence(self, "body", self.body, visitor)
+        walk_required(self, "trailing_whitespace", self.trailing_whitespace, visitor)
+
     def _is_removable(self) -> bool:
         # If we have an empty body, we are removable since we don't represent
         # anything concrete.
@@ -488,7 +522,7 @@ class SimpleStatementSuite(_BaseSimpleStatement, BaseSuite):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "SimpleStatementSuite":
-        return SimpleStatementSuite(
+        return self._with_updated_children(
             leading_whitespace=visit_required(
                 self, "leading_whitespace", self.leading_whitespace, visitor
             ),
@@ -498,6 +532,11 @@ class SimpleStatementSuite(_BaseSimpleStatement, BaseSuite):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "leading_whitespace", self.leading_whitespace, visitor)
+        walk_sequence(self, "body", self.body, visitor)
+        walk_required(self, "trailing_whitespace", self.trailing_whitespace, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.leading_whitespace._codegen(state)
         _BaseSimpleStatement._codegen_impl(self, state)
@@ -525,7 +564,7 @@ class Else(CSTNode):
     whitespace_before_colon: SimpleWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Else":
-        return Else(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -535,6 +574,13 @@ class Else(CSTNode):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -602,7 +648,7 @@ class If(BaseCompoundStatement):
     # TODO: _validate
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "If":
-        return If(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -617,6 +663,18 @@ class If(BaseCompoundStatement):
             orelse=visit_optional(self, "orelse", self.orelse, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_before_test", self.whitespace_before_test, visitor
+        )
+        walk_required(self, "test", self.test, visitor)
+        walk_required(
+            self, "whitespace_after_test", self.whitespace_after_test, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+        walk_optional(self, "orelse", self.orelse, visitor)
+
     def _codegen_impl(self, state: CodegenState, is_elif: bool = False) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -692,20 +750,31 @@ class IndentedBlock(BaseSuite):
                 )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "IndentedBlock":
-        return IndentedBlock(
+        return self._with_updated_children(
             header=visit_required(self, "header", self.header, visitor),
             indent=self.indent,
             body=visit_body_sequence(self, "body", self.body, visitor),
             footer=visit_sequence(self, "footer", self.footer, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "header", self.header, visitor)
+        walk_sequence(self, "body", self.body, visitor)
+        walk_sequence(self, "footer", self.footer, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.header._codegen(state)
 
         indent = self.indent
         state.increase_indent(state.default_indent if indent is None else indent)
 
-        if self.body:
+        # The statements of function bodies that were left unparsed by
+        # `PartialParserConfig.lazy_function_bodies` generate their code from their
+        # source, as long as it's still valid where they are.
+        codegen_unparsed = getattr(self.body, "codegen_unparsed", None)
+        if codegen_unparsed is not None and codegen_unparsed(state):
+            pass
+        elif self.body:
             with state.record_syntactic_position(
                 self, start_node=self.body[0], end_node=self.body[-1]
             ):
@@ -755,7 +824,7 @@ class AsName(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "AsName":
-        return AsName(
+        return self._with_updated_children(
             whitespace_before_as=visit_required(
                 self, "whitespace_before_as", self.whitespace_before_as, visitor
             ),
@@ -765,6 +834,11 @@ class AsName(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace_before_as", self.whitespace_before_as, visitor)
+        walk_required(self, "name", self.name, visitor)
+        walk_required(self, "whitespace_after_as", self.whitespace_after_as, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace_before_as._codegen(state)
         state.add_token("as")
@@ -828,7 +902,7 @@ class ExceptHandler(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ExceptHandler":
-        return ExceptHandler(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -843,6 +917,18 @@ class ExceptHandler(CSTNode):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_after_except", self.whitespace_after_except, visitor
+        )
+        walk_optional(self, "type", self.type, visitor)
+        walk_optional(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -899,7 +985,7 @@ class ExceptStarHandler(CSTNode):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ExceptStarHandler":
-        return ExceptStarHandler(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -917,6 +1003,21 @@ class ExceptStarHandler(CSTNode):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_after_except", self.whitespace_after_except, visitor
+        )
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+        walk_required(self, "type", self.type, visitor)
+        walk_optional(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -956,7 +1057,7 @@ class Finally(CSTNode):
     whitespace_before_colon: SimpleWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Finally":
-        return Finally(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -966,6 +1067,13 @@ class Finally(CSTNode):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -1021,7 +1129,7 @@ class Try(BaseCompoundStatement):
             raise CSTValidationError("The bare except: handler must be the last one.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Try":
-        return Try(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -1034,6 +1142,16 @@ class Try(BaseCompoundStatement):
             finalbody=visit_optional(self, "finalbody", self.finalbody, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+        walk_sequence(self, "handlers", self.handlers, visitor)
+        walk_optional(self, "orelse", self.orelse, visitor)
+        walk_optional(self, "finalbody", self.finalbody, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -1092,7 +1210,7 @@ class TryStar(BaseCompoundStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TryStar":
-        return TryStar(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -1105,6 +1223,16 @@ class TryStar(BaseCompoundStatement):
             finalbody=visit_optional(self, "finalbody", self.finalbody, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+        walk_sequence(self, "handlers", self.handlers, visitor)
+        walk_optional(self, "orelse", self.orelse, visitor)
+        walk_optional(self, "finalbody", self.finalbody, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -1169,12 +1297,17 @@ class ImportAlias(CSTNode):
             raise e
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ImportAlias":
-        return ImportAlias(
+        return self._with_updated_children(
             name=visit_required(self, "name", self.name, visitor),
             asname=visit_optional(self, "asname", self.asname, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "name", self.name, visitor)
+        walk_optional(self, "asname", self.asname, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.name._codegen(state)
@@ -1247,7 +1380,7 @@ class Import(BaseSmallStatement):
             raise CSTValidationError("Must have at least one space after import.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Import":
-        return Import(
+        return self._with_updated_children(
             whitespace_after_import=visit_required(
                 self, "whitespace_after_import", self.whitespace_after_import, visitor
             ),
@@ -1255,6 +1388,13 @@ class Import(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_import", self.whitespace_after_import, visitor
+        )
+        walk_sequence(self, "names", self.names, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -1360,7 +1500,7 @@ class ImportFrom(BaseSmallStatement):
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ImportFrom":
         names = self.names
-        return ImportFrom(
+        return self._with_updated_children(
             whitespace_after_from=visit_required(
                 self, "whitespace_after_from", self.whitespace_after_from, visitor
             ),
@@ -1382,6 +1522,27 @@ class ImportFrom(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        names = self.names
+        walk_required(
+            self, "whitespace_after_from", self.whitespace_after_from, visitor
+        )
+        walk_sequence(self, "relative", self.relative, visitor)
+        walk_optional(self, "module", self.module, visitor)
+        walk_required(
+            self, "whitespace_before_import", self.whitespace_before_import, visitor
+        )
+        walk_required(
+            self, "whitespace_after_import", self.whitespace_after_import, visitor
+        )
+        walk_optional(self, "lpar", self.lpar, visitor)
+        if isinstance(names, ImportStar):
+            walk_required(self, "names", names, visitor)
+        else:
+            walk_sequence(self, "names", names, visitor)
+        walk_optional(self, "rpar", self.rpar, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -1437,7 +1598,7 @@ class AssignTarget(CSTNode):
     whitespace_after_equal: SimpleWhitespace = SimpleWhitespace.field(" ")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "AssignTarget":
-        return AssignTarget(
+        return self._with_updated_children(
             target=visit_required(self, "target", self.target, visitor),
             whitespace_before_equal=visit_required(
                 self, "whitespace_before_equal", self.whitespace_before_equal, visitor
@@ -1447,6 +1608,15 @@ class AssignTarget(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "target", self.target, visitor)
+        walk_required(
+            self, "whitespace_before_equal", self.whitespace_before_equal, visitor
+        )
+        walk_required(
+            self, "whitespace_after_equal", self.whitespace_after_equal, visitor
+        )
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with state.record_syntactic_position(self):
             self.target._codegen(state)
@@ -1482,12 +1652,17 @@ class Assign(BaseSmallStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Assign":
-        return Assign(
+        return self._with_updated_children(
             targets=visit_sequence(self, "targets", self.targets, visitor),
             value=visit_required(self, "value", self.value, visitor),
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "targets", self.targets, visitor)
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -1538,7 +1713,7 @@ class AnnAssign(BaseSmallStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "AnnAssign":
-        return AnnAssign(
+        return self._with_updated_children(
             target=visit_required(self, "target", self.target, visitor),
             annotation=visit_required(self, "annotation", self.annotation, visitor),
             equal=visit_sentinel(self, "equal", self.equal, visitor),
@@ -1546,6 +1721,13 @@ class AnnAssign(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "target", self.target, visitor)
+        walk_required(self, "annotation", self.annotation, visitor)
+        walk_sentinel(self, "equal", self.equal, visitor)
+        walk_optional(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -1590,13 +1772,19 @@ class AugAssign(BaseSmallStatement):
     semicolon: Union[Semicolon, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "AugAssign":
-        return AugAssign(
+        return self._with_updated_children(
             target=visit_required(self, "target", self.target, visitor),
             operator=visit_required(self, "operator", self.operator, visitor),
             value=visit_required(self, "value", self.value, visitor),
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "target", self.target, visitor)
+        walk_required(self, "operator", self.operator, visitor)
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -1636,7 +1824,7 @@ class Decorator(CSTNode):
     trailing_whitespace: TrailingWhitespace = TrailingWhitespace.field()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Decorator":
-        return Decorator(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -1649,6 +1837,12 @@ class Decorator(CSTNode):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(self, "whitespace_after_at", self.whitespace_after_at, visitor)
+        walk_required(self, "decorator", self.decorator, visitor)
+        walk_required(self, "trailing_whitespace", self.trailing_whitespace, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -1776,7 +1970,7 @@ class FunctionDef(BaseCompoundStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "FunctionDef":
-        return FunctionDef(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -1814,6 +2008,35 @@ class FunctionDef(BaseCompoundStatement):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_sequence(self, "decorators", self.decorators, visitor)
+        walk_sequence(
+            self, "lines_after_decorators", self.lines_after_decorators, visitor
+        )
+        walk_optional(self, "asynchronous", self.asynchronous, visitor)
+        walk_required(self, "whitespace_after_def", self.whitespace_after_def, visitor)
+        walk_required(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_after_name", self.whitespace_after_name, visitor
+        )
+        walk_optional(self, "type_parameters", self.type_parameters, visitor)
+        walk_required(
+            self,
+            "whitespace_after_type_parameters",
+            self.whitespace_after_type_parameters,
+            visitor,
+        )
+        walk_required(
+            self, "whitespace_before_params", self.whitespace_before_params, visitor
+        )
+        walk_required(self, "params", self.params, visitor)
+        walk_optional(self, "returns", self.returns, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -1951,7 +2174,7 @@ class ClassDef(BaseCompoundStatement):
         self._validate_args()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ClassDef":
-        return ClassDef(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -1985,6 +2208,35 @@ class ClassDef(BaseCompoundStatement):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_sequence(self, "decorators", self.decorators, visitor)
+        walk_sequence(
+            self, "lines_after_decorators", self.lines_after_decorators, visitor
+        )
+        walk_required(
+            self, "whitespace_after_class", self.whitespace_after_class, visitor
+        )
+        walk_required(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_after_name", self.whitespace_after_name, visitor
+        )
+        walk_optional(self, "type_parameters", self.type_parameters, visitor)
+        walk_required(
+            self,
+            "whitespace_after_type_parameters",
+            self.whitespace_after_type_parameters,
+            visitor,
+        )
+        walk_sentinel(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "bases", self.bases, visitor)
+        walk_sequence(self, "keywords", self.keywords, visitor)
+        walk_sentinel(self, "rpar", self.rpar, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:  # noqa: C901
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2058,12 +2310,17 @@ class WithItem(CSTNode):
             raise CSTValidationError("Must have at least one space before as keyword.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "WithItem":
-        return WithItem(
+        return self._with_updated_children(
             item=visit_required(self, "item", self.item, visitor),
             asname=visit_optional(self, "asname", self.asname, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "item", self.item, visitor)
+        walk_optional(self, "asname", self.asname, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.item._codegen(state)
@@ -2141,7 +2398,7 @@ class With(BaseCompoundStatement):
             raise CSTValidationError("Must have at least one space after with keyword.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "With":
-        return With(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -2160,6 +2417,20 @@ class With(BaseCompoundStatement):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_optional(self, "asynchronous", self.asynchronous, visitor)
+        walk_required(
+            self, "whitespace_after_with", self.whitespace_after_with, visitor
+        )
+        walk_sentinel(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "items", self.items, visitor)
+        walk_sentinel(self, "rpar", self.rpar, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2264,7 +2535,7 @@ class For(BaseCompoundStatement):
             raise CSTValidationError("Must have at least one space after 'in' keyword.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "For":
-        return For(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -2289,6 +2560,20 @@ class For(BaseCompoundStatement):
             orelse=visit_optional(self, "orelse", self.orelse, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_optional(self, "asynchronous", self.asynchronous, visitor)
+        walk_required(self, "whitespace_after_for", self.whitespace_after_for, visitor)
+        walk_required(self, "target", self.target, visitor)
+        walk_required(self, "whitespace_before_in", self.whitespace_before_in, visitor)
+        walk_required(self, "whitespace_after_in", self.whitespace_after_in, visitor)
+        walk_required(self, "iter", self.iter, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+        walk_optional(self, "orelse", self.orelse, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2350,7 +2635,7 @@ class While(BaseCompoundStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "While":
-        return While(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -2365,6 +2650,18 @@ class While(BaseCompoundStatement):
             orelse=visit_optional(self, "orelse", self.orelse, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_after_while", self.whitespace_after_while, visitor
+        )
+        walk_required(self, "test", self.test, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(self, "body", self.body, visitor)
+        walk_optional(self, "orelse", self.orelse, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2440,7 +2737,7 @@ class Raise(BaseSmallStatement):
                 raise CSTValidationError("Must have at least one space before 'from'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Raise":
-        return Raise(
+        return self._with_updated_children(
             whitespace_after_raise=visit_sentinel(
                 self, "whitespace_after_raise", self.whitespace_after_raise, visitor
             ),
@@ -2449,6 +2746,14 @@ class Raise(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sentinel(
+            self, "whitespace_after_raise", self.whitespace_after_raise, visitor
+        )
+        walk_optional(self, "exc", self.exc, visitor)
+        walk_optional(self, "cause", self.cause, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -2511,7 +2816,7 @@ class Assert(BaseSmallStatement):
             raise CSTValidationError("Cannot have trailing comma after 'test'.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Assert":
-        return Assert(
+        return self._with_updated_children(
             whitespace_after_assert=visit_required(
                 self, "whitespace_after_assert", self.whitespace_after_assert, visitor
             ),
@@ -2521,6 +2826,15 @@ class Assert(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_assert", self.whitespace_after_assert, visitor
+        )
+        walk_required(self, "test", self.test, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+        walk_optional(self, "msg", self.msg, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -2571,11 +2885,15 @@ class NameItem(CSTNode):
             raise CSTValidationError("Cannot have parens around names in NameItem.")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "NameItem":
-        return NameItem(
+        return self._with_updated_children(
             name=visit_required(self, "name", self.name, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "name", self.name, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.name._codegen(state)
@@ -2619,7 +2937,7 @@ class Global(BaseSmallStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Global":
-        return Global(
+        return self._with_updated_children(
             whitespace_after_global=visit_required(
                 self, "whitespace_after_global", self.whitespace_after_global, visitor
             ),
@@ -2627,6 +2945,13 @@ class Global(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_global", self.whitespace_after_global, visitor
+        )
+        walk_sequence(self, "names", self.names, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -2677,7 +3002,7 @@ class Nonlocal(BaseSmallStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Nonlocal":
-        return Nonlocal(
+        return self._with_updated_children(
             whitespace_after_nonlocal=visit_required(
                 self,
                 "whitespace_after_nonlocal",
@@ -2688,6 +3013,13 @@ class Nonlocal(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_nonlocal", self.whitespace_after_nonlocal, visitor
+        )
+        walk_sequence(self, "names", self.names, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
@@ -2770,7 +3102,7 @@ class Match(BaseCompoundStatement):
                 )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "Match":
-        return Match(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -2789,6 +3121,21 @@ class Match(BaseCompoundStatement):
             footer=visit_sequence(self, "footer", self.footer, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_after_match", self.whitespace_after_match, visitor
+        )
+        walk_required(self, "subject", self.subject, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(
+            self, "whitespace_after_colon", self.whitespace_after_colon, visitor
+        )
+        walk_sequence(self, "cases", self.cases, visitor)
+        walk_sequence(self, "footer", self.footer, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2846,7 +3193,7 @@ class MatchCase(CSTNode):
     whitespace_before_colon: SimpleWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "CSTNode":
-        return MatchCase(
+        return self._with_updated_children(
             leading_lines=visit_sequence(
                 self, "leading_lines", self.leading_lines, visitor
             ),
@@ -2854,13 +3201,9 @@ class MatchCase(CSTNode):
                 self, "whitespace_after_case", self.whitespace_after_case, visitor
             ),
             pattern=visit_required(self, "pattern", self.pattern, visitor),
-            # pyre-fixme[6]: Expected `SimpleWhitespace` for 4th param but got
-            #  `Optional[SimpleWhitespace]`.
             whitespace_before_if=visit_optional(
                 self, "whitespace_before_if", self.whitespace_before_if, visitor
             ),
-            # pyre-fixme[6]: Expected `SimpleWhitespace` for 5th param but got
-            #  `Optional[SimpleWhitespace]`.
             whitespace_after_if=visit_optional(
                 self, "whitespace_after_if", self.whitespace_after_if, visitor
             ),
@@ -2868,6 +3211,17 @@ class MatchCase(CSTNode):
             body=visit_required(self, "body", self.body, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "leading_lines", self.leading_lines, visitor)
+        walk_required(
+            self, "whitespace_after_case", self.whitespace_after_case, visitor
+        )
+        walk_required(self, "pattern", self.pattern, visitor)
+        walk_optional(self, "whitespace_before_if", self.whitespace_before_if, visitor)
+        walk_optional(self, "whitespace_after_if", self.whitespace_after_if, visitor)
+        walk_optional(self, "guard", self.guard, visitor)
+        walk_required(self, "body", self.body, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         for ll in self.leading_lines:
             ll._codegen(state)
@@ -2900,7 +3254,12 @@ class MatchValue(MatchPattern):
     value: BaseExpression
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "CSTNode":
-        return MatchValue(value=visit_required(self, "value", self.value, visitor))
+        return self._with_updated_children(
+            value=visit_required(self, "value", self.value, visitor)
+        )
+
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "value", self.value, visitor)
 
     def _codegen_impl(self, state: CodegenState) -> None:
         with state.record_syntactic_position(self):
@@ -2934,7 +3293,12 @@ class MatchSingleton(MatchPattern):
     value: Name
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "CSTNode":
-        return MatchSingleton(value=visit_required(self, "value", self.value, visitor))
+        return self._with_updated_children(
+            value=visit_required(self, "value", self.value, visitor)
+        )
+
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "value", self.value, visitor)
 
     def _validate(self) -> None:
         if self.value.value not in {"True", "False", "None"}:
@@ -2980,11 +3344,15 @@ class MatchSequenceElement(CSTNode):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "MatchSequenceElement":
-        return MatchSequenceElement(
+        return self._with_updated_children(
             value=visit_required(self, "value", self.value, visitor),
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -3017,7 +3385,7 @@ class MatchStar(CSTNode):
     whitespace_before_name: BaseParenthesizableWhitespace = SimpleWhitespace.field("")
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchStar":
-        return MatchStar(
+        return self._with_updated_children(
             whitespace_before_name=visit_required(
                 self, "whitespace_before_name", self.whitespace_before_name, visitor
             ),
@@ -3025,6 +3393,13 @@ class MatchStar(CSTNode):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_before_name", self.whitespace_before_name, visitor
+        )
+        walk_optional(self, "name", self.name, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(
         self,
         state: CodegenState,
@@ -3095,7 +3470,7 @@ class MatchList(MatchSequence):
         super(MatchList, self)._validate()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchList":
-        return MatchList(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbracket=visit_optional(self, "lbracket", self.lbracket, visitor),
             patterns=visit_sequence(self, "patterns", self.patterns, visitor),
@@ -3103,6 +3478,13 @@ class MatchList(MatchSequence):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_optional(self, "lbracket", self.lbracket, visitor)
+        walk_sequence(self, "patterns", self.patterns, visitor)
+        walk_optional(self, "rbracket", self.rbracket, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             lbracket = self.lbracket
@@ -3140,12 +3522,17 @@ class MatchTuple(MatchSequence):
         super(MatchTuple, self)._validate()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchTuple":
-        return MatchTuple(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             patterns=visit_sequence(self, "patterns", self.patterns, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "patterns", self.patterns, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             pats = self.patterns
@@ -3182,7 +3569,7 @@ class MatchMappingElement(CSTNode):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "MatchMappingElement":
-        return MatchMappingElement(
+        return self._with_updated_children(
             key=visit_required(self, "key", self.key, visitor),
             whitespace_before_colon=visit_required(
                 self, "whitespace_before_colon", self.whitespace_before_colon, visitor
@@ -3194,6 +3581,17 @@ class MatchMappingElement(CSTNode):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "key", self.key, visitor)
+        walk_required(
+            self, "whitespace_before_colon", self.whitespace_before_colon, visitor
+        )
+        walk_required(
+            self, "whitespace_after_colon", self.whitespace_after_colon, visitor
+        )
+        walk_required(self, "pattern", self.pattern, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.key._codegen(state)
@@ -3244,7 +3642,7 @@ class MatchMapping(MatchPattern):
         super(MatchMapping, self)._validate()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchMapping":
-        return MatchMapping(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             lbrace=visit_required(self, "lbrace", self.lbrace, visitor),
             elements=visit_sequence(self, "elements", self.elements, visitor),
@@ -3259,6 +3657,18 @@ class MatchMapping(MatchPattern):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "lbrace", self.lbrace, visitor)
+        walk_sequence(self, "elements", self.elements, visitor)
+        walk_required(
+            self, "whitespace_before_rest", self.whitespace_before_rest, visitor
+        )
+        walk_optional(self, "rest", self.rest, visitor)
+        walk_optional(self, "trailing_comma", self.trailing_comma, visitor)
+        walk_required(self, "rbrace", self.rbrace, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.lbrace._codegen(state)
@@ -3304,7 +3714,7 @@ class MatchKeywordElement(CSTNode):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "MatchKeywordElement":
-        return MatchKeywordElement(
+        return self._with_updated_children(
             key=visit_required(self, "key", self.key, visitor),
             whitespace_before_equal=visit_required(
                 self, "whitespace_before_equal", self.whitespace_before_equal, visitor
@@ -3316,6 +3726,17 @@ class MatchKeywordElement(CSTNode):
             comma=visit_sentinel(self, "comma", self.comma, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "key", self.key, visitor)
+        walk_required(
+            self, "whitespace_before_equal", self.whitespace_before_equal, visitor
+        )
+        walk_required(
+            self, "whitespace_after_equal", self.whitespace_after_equal, visitor
+        )
+        walk_required(self, "pattern", self.pattern, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _codegen_impl(self, state: CodegenState, default_comma: bool = False) -> None:
         with state.record_syntactic_position(self):
             self.key._codegen(state)
@@ -3365,7 +3786,7 @@ class MatchClass(MatchPattern):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchClass":
-        return MatchClass(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             cls=visit_required(self, "cls", self.cls, visitor),
             whitespace_after_cls=visit_required(
@@ -3384,6 +3805,19 @@ class MatchClass(MatchPattern):
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_required(self, "cls", self.cls, visitor)
+        walk_required(self, "whitespace_after_cls", self.whitespace_after_cls, visitor)
+        walk_required(
+            self, "whitespace_before_patterns", self.whitespace_before_patterns, visitor
+        )
+        walk_sequence(self, "patterns", self.patterns, visitor)
+        walk_sequence(self, "kwds", self.kwds, visitor)
+        walk_required(
+            self, "whitespace_after_kwds", self.whitespace_after_kwds, visitor
+        )
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             self.cls._codegen(state)
@@ -3434,7 +3868,7 @@ class MatchAs(MatchPattern):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchAs":
-        return MatchAs(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             pattern=visit_optional(self, "pattern", self.pattern, visitor),
             whitespace_before_as=visit_sentinel(
@@ -3447,6 +3881,14 @@ class MatchAs(MatchPattern):
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_optional(self, "pattern", self.pattern, visitor)
+        walk_sentinel(self, "whitespace_before_as", self.whitespace_before_as, visitor)
+        walk_sentinel(self, "whitespace_after_as", self.whitespace_after_as, visitor)
+        walk_optional(self, "name", self.name, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _validate(self) -> None:
         if self.name is None and self.pattern is not None:
             raise CSTValidationError("Pattern must be None if name is None")
@@ -3488,11 +3930,15 @@ class MatchOrElement(CSTNode):
     separator: Union[BitOr, MaybeSentinel] = MaybeSentinel.DEFAULT
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchOrElement":
-        return MatchOrElement(
+        return self._with_updated_children(
             pattern=visit_required(self, "pattern", self.pattern, visitor),
             separator=visit_sentinel(self, "separator", self.separator, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "pattern", self.pattern, visitor)
+        walk_sentinel(self, "separator", self.separator, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_separator: bool = False
     ) -> None:
@@ -3523,12 +3969,17 @@ class MatchOr(MatchPattern):
     rpar: Sequence[RightParen] = ()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "MatchOr":
-        return MatchOr(
+        return self._with_updated_children(
             lpar=visit_sequence(self, "lpar", self.lpar, visitor),
             patterns=visit_sequence(self, "patterns", self.patterns, visitor),
             rpar=visit_sequence(self, "rpar", self.rpar, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_sequence(self, "lpar", self.lpar, visitor)
+        walk_sequence(self, "patterns", self.patterns, visitor)
+        walk_sequence(self, "rpar", self.rpar, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         with self._parenthesize(state):
             pats = self.patterns
@@ -3571,12 +4022,17 @@ class TypeVar(CSTNode):
                 bound._codegen(state)
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TypeVar":
-        return TypeVar(
+        return self._with_updated_children(
             name=visit_required(self, "name", self.name, visitor),
             colon=visit_sentinel(self, "colon", self.colon, visitor),
             bound=visit_optional(self, "bound", self.bound, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "name", self.name, visitor)
+        walk_sentinel(self, "colon", self.colon, visitor)
+        walk_optional(self, "bound", self.bound, visitor)
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -3599,13 +4055,19 @@ class TypeVarTuple(CSTNode):
             self.name._codegen(state)
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TypeVarTuple":
-        return TypeVarTuple(
+        return self._with_updated_children(
             name=visit_required(self, "name", self.name, visitor),
             whitespace_after_star=visit_required(
                 self, "whitespace_after_star", self.whitespace_after_star, visitor
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -3631,13 +4093,19 @@ class ParamSpec(CSTNode):
             self.name._codegen(state)
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "ParamSpec":
-        return ParamSpec(
+        return self._with_updated_children(
             name=visit_required(self, "name", self.name, visitor),
             whitespace_after_star=visit_required(
                 self, "whitespace_after_star", self.whitespace_after_star, visitor
             ),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "name", self.name, visitor)
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -3689,7 +4157,7 @@ class TypeParam(CSTNode):
             comma._codegen(state)
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TypeParam":
-        ret = TypeParam(
+        ret = self._with_updated_children(
             param=visit_required(self, "param", self.param, visitor),
             equal=visit_sentinel(self, "equal", self.equal, visitor),
             star=self.star,
@@ -3701,6 +4169,15 @@ class TypeParam(CSTNode):
         )
         return ret
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "param", self.param, visitor)
+        walk_sentinel(self, "equal", self.equal, visitor)
+        walk_required(
+            self, "whitespace_after_star", self.whitespace_after_star, visitor
+        )
+        walk_optional(self, "default", self.default, visitor)
+        walk_sentinel(self, "comma", self.comma, visitor)
+
     def _validate(self) -> None:
         if self.default is None and isinstance(self.equal, AssignEqual):
             raise CSTValidationError(
@@ -3737,12 +4214,17 @@ class TypeParameters(CSTNode):
         self.rbracket._codegen(state)
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TypeParameters":
-        return TypeParameters(
+        return self._with_updated_children(
             lbracket=visit_required(self, "lbracket", self.lbracket, visitor),
             params=visit_sequence(self, "params", self.params, visitor),
             rbracket=visit_required(self, "rbracket", self.rbracket, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "lbracket", self.lbracket, visitor)
+        walk_sequence(self, "params", self.params, visitor)
+        walk_required(self, "rbracket", self.rbracket, visitor)
+
 
 @add_slots
 @dataclass(frozen=True)
@@ -3801,7 +4283,7 @@ class TypeAlias(BaseSmallStatement):
             )
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TypeAlias":
-        return TypeAlias(
+        return self._with_updated_children(
             whitespace_after_type=visit_required(
                 self, "whitespace_after_type", self.whitespace_after_type, visitor
             ),
@@ -3825,6 +4307,27 @@ class TypeAlias(BaseSmallStatement):
             semicolon=visit_sentinel(self, "semicolon", self.semicolon, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(
+            self, "whitespace_after_type", self.whitespace_after_type, visitor
+        )
+        walk_required(self, "name", self.name, visitor)
+        walk_sentinel(
+            self, "whitespace_after_name", self.whitespace_after_name, visitor
+        )
+        walk_optional(self, "type_parameters", self.type_parameters, visitor)
+        walk_sentinel(
+            self,
+            "whitespace_after_type_parameters",
+            self.whitespace_after_type_parameters,
+            visitor,
+        )
+        walk_required(
+            self, "whitespace_after_equals", self.whitespace_after_equals, visitor
+        )
+        walk_required(self, "value", self.value, visitor)
+        walk_sentinel(self, "semicolon", self.semicolon, visitor)
+
     def _codegen_impl(
         self, state: CodegenState, default_semicolon: bool = False
     ) -> None:
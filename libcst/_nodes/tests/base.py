@@ -12,7 +12,7 @@ from unittest.mock import patch
 import libcst as cst
 from libcst._nodes.internal import CodegenState, visit_required
 from libcst._types import CSTNodeT
-from libcst._visitors import CSTTransformer, CSTVisitorT
+from libcst._visitors import CSTTransformer, CSTVisitor, CSTVisitorT
 from libcst.metadata import CodeRange, PositionProvider
 from libcst.metadata.position_provider import PositionProvidingCodegenState
 from libcst.testing.utils import UnitTest
@@ -29,6 +29,21 @@ class _NOOPVisitor(CSTTransformer):
     pass
 
 
+class _ShallowRecordingVisitor(CSTVisitor):
+    def __init__(self) -> None:
+        self.events: List[object] = []
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        self.events.append(("visit", node))
+        return False
+
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        self.events.append(("visit_attribute", attribute))
+
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        self.events.append(("leave_attribute", attribute))
+
+
 def _cst_node_equality_func(
     a: cst.CSTNode, b: cst.CSTNode, msg: Optional[str] = None
 ) -> None:
@@ -87,6 +102,7 @@ class CSTNodeTest(UnitTest):
             unwrapped_node = unwrapped_node.child
         self.__assert_children_match_codegen(unwrapped_node)
         self.__assert_children_match_fields(unwrapped_node)
+        self.__assert_visit_children_matches_replace(unwrapped_node)
         self.__assert_visit_returns_identity(unwrapped_node)
 
     def assert_invalid(
@@ -226,15 +242,23 @@ class CSTNodeTest(UnitTest):
             msg="`node.children` doesn't match what we found through introspection",
         )
 
+    def __assert_visit_children_matches_replace(self, node: cst.CSTNode) -> None:
+        """
+        The read-only `_visit_children` must visit the same children and attributes,
+        in the same order, as `_visit_and_replace_children`.
+        """
+        read_only = _ShallowRecordingVisitor()
+        node._visit_children(read_only)
+        replacing = _ShallowRecordingVisitor()
+        node._visit_and_replace_children(replacing)
+        self.assertEqual(read_only.events, replacing.events)
+
     def __assert_visit_returns_identity(self, node: cst.CSTNode) -> None:
         """
         When visit is called with a visitor that acts as a no-op, the visit method
         should return the same node it started with.
         """
-        # TODO: We're only checking equality right now, because visit currently clones
-        # the node, since that was easier to implement. We should fix that behavior in a
-        # later version and tighten this check.
-        self.assertEqual(node, node.visit(_NOOPVisitor()))
+        self.assertIs(node, node.visit(_NOOPVisitor()))
 
     def assert_parses(
         self,
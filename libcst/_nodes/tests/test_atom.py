@@ -9,7 +9,6 @@ from typing import Any
 import libcst as cst
 from libcst import parse_expression
 from libcst._nodes.tests.base import CSTNodeTest, parse_expression_as
-from libcst._parser.entrypoints import is_native
 from libcst.metadata import CodeRange
 from libcst.testing.utils import data_provider
 
@@ -1181,11 +1180,34 @@ class AtomTest(CSTNodeTest):
                 "parser": parse_expression_as(python_version="3.1"),
                 "expect_success": False,
             },
+            {
+                "code": "f'{x}'",
+                "parser": parse_expression_as(python_version="3.6"),
+                "expect_success": True,
+            },
+            {
+                "code": "f'{x}'",
+                "parser": parse_expression_as(python_version="3.5"),
+                "expect_success": False,
+            },
+            {
+                "code": "1_000",
+                "parser": parse_expression_as(python_version="3.6"),
+                "expect_success": True,
+            },
+            {
+                "code": "1_000",
+                "parser": parse_expression_as(python_version="3.5"),
+                "expect_success": False,
+            },
+            {
+                "code": "1_0.5j",
+                "parser": parse_expression_as(python_version="3.5"),
+                "expect_success": False,
+            },
         )
     )
     def test_versions(self, **kwargs: Any) -> None:
-        if is_native() and not kwargs.get("expect_success", True):
-            self.skipTest("parse errors are disabled for native parser")
         self.assert_parses(**kwargs)
 
 
@@ -3,10 +3,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import pickle
+from dataclasses import dataclass, replace
 from textwrap import dedent
-from typing import Union
+from typing import List, Union
 
 import libcst as cst
+from libcst._add_slots import add_slots
+from libcst._nodes.base import _ChildrenCollectionVisitor, _trusted_construction
 from libcst._removal_sentinel import RemovalSentinel
 from libcst._types import CSTNodeT
 from libcst._visitors import CSTTransformer
@@ -52,6 +56,29 @@ class _TestVisitor(CSTTransformer):
         return return_node
 
 
+_CODE = """
+from a import (b as c, d)
+from . import *
+
+@decorator
+async def foo(x: int = 1, *args, y, **kwargs) -> None:
+    '''docstring'''
+    return [i async for i in bar(x, *args, key=y) if i]; f"{x!r:>{y}}"
+
+class Baz(Base, metaclass=Meta):
+    x: int = 5
+    with open(x) as f, g:
+        pass
+"""
+
+
+def _all_nodes(node: cst.CSTNode) -> List[cst.CSTNode]:
+    nodes = [node]
+    for child in node.children:
+        nodes.extend(_all_nodes(child))
+    return nodes
+
+
 class CSTNodeTest(UnitTest):
     def test_with_changes(self) -> None:
         initial = cst.TrailingWhitespace(
@@ -70,6 +97,34 @@ class CSTNodeTest(UnitTest):
         # ensure no mutation actually happened
         self.assertEqual(none_throws(initial.comment).value, "# initial")
 
+    def test_generated_methods_match_generic(self) -> None:
+        for node in _all_nodes(cst.parse_module(_CODE)):
+            visitor = _ChildrenCollectionVisitor()
+            node._visit_children(visitor)
+            self.assertEqual(list(node.children), visitor.children)
+
+            clone = node.deep_clone()
+            self.assertIsNot(clone, node)
+            self.assertTrue(clone.deep_equals(cst.CSTNode.deep_clone(node)))
+
+            changed = node.with_changes()
+            self.assertIsNot(changed, node)
+            self.assertTrue(changed.deep_equals(replace(node)))
+
+        with self.assertRaises(TypeError):
+            cst.Name("x").with_changes(unknown="y")
+
+    def test_subclasses_use_generic_methods(self) -> None:
+        @add_slots
+        @dataclass(frozen=True)
+        class AnnotatedName(cst.Name):
+            note: cst.Comment = cst.Comment("# note")
+
+        node = AnnotatedName("x", note=cst.Comment("# changed"))
+        self.assertEqual(node.with_changes(value="y").note.value, "# changed")
+        self.assertEqual(node.deep_clone().note.value, "# changed")
+        self.assertEqual(node.children, [])
+
     def test_default_eq(self) -> None:
         sw1 = cst.SimpleWhitespace("")
         sw2 = cst.SimpleWhitespace("")
@@ -119,6 +174,74 @@ class CSTNodeTest(UnitTest):
     def test_deep_equals_fails(self, a: cst.CSTNode, b: cst.CSTNode) -> None:
         self.assertFalse(a.deep_equals(b))
 
+    def test_structural_hash(self) -> None:
+        module = cst.parse_module("def f(a, b):\n    return a + b  # sum\n")
+        self.assertEqual(
+            module.structural_hash(), module.deep_clone().structural_hash()
+        )
+        self.assertEqual(
+            cst.SimpleStatementLine(body=[cst.Pass()]).structural_hash(),
+            cst.SimpleStatementLine(body=(cst.Pass(),)).structural_hash(),
+        )
+        changed = module.deep_replace(
+            cst.ensure_type(module.body[0], cst.FunctionDef).name, cst.Name("g")
+        )
+        self.assertNotEqual(module.structural_hash(), changed.structural_hash())
+        self.assertFalse(module.deep_equals(changed))
+        # Trees can be grouped by their shape.
+        shapes = {
+            node.structural_hash(): node
+            for node in (cst.Name("a"), cst.Name("b"), cst.Name("a"))
+        }
+        self.assertEqual(len(shapes), 2)
+
+    def test_structural_hash_is_memoized(self) -> None:
+        # Cloned trees hold their children in tuples, like the ones the native
+        # parser builds.
+        module = cst.parse_module("x = 1\ny = 2\n").deep_clone()
+        module.structural_hash()
+        self.assertTrue(
+            all(
+                getattr(node, "_structural_hash", None) is not None
+                for node in (module, *module.body)
+            )
+        )
+        # Derived trees only hash the nodes that aren't shared with the original.
+        changed = module.with_changes(body=module.body[:1])
+        self.assertIsNone(getattr(changed, "_structural_hash", None))
+        self.assertIsNone(getattr(module.deep_clone(), "_structural_hash", None))
+        self.assertIsNone(
+            getattr(pickle.loads(pickle.dumps(module)), "_structural_hash", None)
+        )
+
+    def test_structural_hash_of_lists_is_not_memoized(self) -> None:
+        body = [cst.Pass()]
+        line = cst.SimpleStatementLine(body=body)
+        module = cst.Module(body=(line,))
+        before = module.structural_hash()
+        self.assertIsNotNone(getattr(body[0], "_structural_hash", None))
+        self.assertIsNone(getattr(line, "_structural_hash", None))
+        self.assertIsNone(getattr(module, "_structural_hash", None))
+        body.append(cst.Pass())
+        self.assertNotEqual(module.structural_hash(), before)
+        self.assertTrue(
+            module.deep_equals(
+                cst.Module(body=(cst.SimpleStatementLine((cst.Pass(), cst.Pass())),))
+            )
+        )
+
+    def test_deep_equals_does_not_hash(self) -> None:
+        a = cst.parse_module("x = 1\ny = 2\n")
+        b = cst.parse_module("x = 1\ny = 3\n")
+        self.assertFalse(a.deep_equals(b))
+        self.assertTrue(a.deep_equals(a.deep_clone()))
+        self.assertIsNone(getattr(a, "_structural_hash", None))
+        self.assertIsNone(getattr(b, "_structural_hash", None))
+        # Once both trees are hashed, unequal trees are rejected by their hashes.
+        a.structural_hash()
+        b.structural_hash()
+        self.assertFalse(a.deep_equals(b))
+
     def test_repr(self) -> None:
         self.assertEqual(
             repr(
@@ -195,3 +318,30 @@ class CSTNodeTest(UnitTest):
     def test_visit(self) -> None:
         tree = cst.Module((cst.SimpleStatementLine((cst.Pass(),)),))
         tree.visit(_TestVisitor(self))
+
+    def test_trusted_construction_skips_validation(self) -> None:
+        with self.assertRaises(cst.CSTValidationError):
+            cst.Asynchronous(whitespace_after=cst.SimpleWhitespace(""))
+        with _trusted_construction():
+            node = cst.Asynchronous(whitespace_after=cst.SimpleWhitespace(""))
+        # validation is back on outside of the context
+        with self.assertRaises(cst.CSTValidationError):
+            cst.Asynchronous(whitespace_after=cst.SimpleWhitespace(""))
+
+        with self.assertRaisesRegex(cst.CSTValidationError, "at least one space"):
+            node.validate_deep()
+
+    def test_validate_deep(self) -> None:
+        with _trusted_construction():
+            tree = cst.Module(
+                body=[
+                    cst.SimpleStatementLine(
+                        [cst.Expr(cst.Name("foo", lpar=[cst.LeftParen()]))]
+                    )
+                ]
+            )
+        with self.assertRaisesRegex(
+            cst.CSTValidationError, "left paren without right paren"
+        ):
+            tree.validate_deep()
+        cst.parse_module("async def foo(): pass\n").validate_deep()
@@ -2250,8 +2250,6 @@ class FunctionDefParserTest(CSTNodeTest):
         )
     )
     def test_versions(self, **kwargs: Any) -> None:
-        if is_native() and not kwargs.get("expect_success", True):
-            self.skipTest("parse errors are disabled for native parser")
         self.assert_parses(**kwargs)
 
     @data_provider(
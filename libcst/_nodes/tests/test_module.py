@@ -191,6 +191,27 @@ class ModuleTest(CSTNodeTest):
         self.cmp_position(positions[expr], (1, 0), (2, 5))
         self.cmp_position(positions[string], (1, 0), (2, 5))
 
+    def test_code_reuses_source(self) -> None:
+        source = "x = 1\r\nif x:\r\n    pass\r\n"
+        module = parse_module(source)
+        self.assertIs(module.code, source)
+        self.assertEqual(module.code_for_node(module), source)
+        encoded = "# -*- coding: latin-1 -*-\nx = 'é'\n".encode("latin-1")
+        self.assertEqual(parse_module(encoded).bytes, encoded)
+        # Transforms that don't change anything return the same module.
+        self.assertIs(module.visit(cst.CSTTransformer()).code, source)
+
+        class Rename(cst.CSTTransformer):
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.Name:
+                return updated_node.with_changes(value="y")
+
+        self.assertEqual(module.visit(Rename()).code, source.replace("x", "y"))
+        self.assertEqual(module.with_changes(body=module.body[:1]).code, "x = 1\r\n")
+        self.assertEqual(module.deep_clone().code, source)
+        self.assertIsNot(module.deep_clone().code, source)
+
     def test_module_config_for_parsing(self) -> None:
         module = parse_module("pass\r")
         statement = parse_statement(
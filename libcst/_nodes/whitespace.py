@@ -16,8 +16,11 @@ from libcst._nodes.internal import (
     visit_optional,
     visit_required,
     visit_sequence,
+    walk_optional,
+    walk_required,
+    walk_sequence,
 )
-from libcst._visitors import CSTVisitorT
+from libcst._visitors import CSTVisitor, CSTVisitorT
 
 # SimpleWhitespace includes continuation characters, which must be followed immediately
 # by a newline. SimpleWhitespace does not include other kinds of newlines, because those
@@ -183,12 +186,17 @@ class TrailingWhitespace(CSTNode):
     newline: Newline = Newline.field()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "TrailingWhitespace":
-        return TrailingWhitespace(
+        return self._with_updated_children(
             whitespace=visit_required(self, "whitespace", self.whitespace, visitor),
             comment=visit_optional(self, "comment", self.comment, visitor),
             newline=visit_required(self, "newline", self.newline, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace", self.whitespace, visitor)
+        walk_optional(self, "comment", self.comment, visitor)
+        walk_required(self, "newline", self.newline, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.whitespace._codegen(state)
         comment = self.comment
@@ -221,13 +229,18 @@ class EmptyLine(CSTNode):
     newline: Newline = Newline.field()
 
     def _visit_and_replace_children(self, visitor: CSTVisitorT) -> "EmptyLine":
-        return EmptyLine(
+        return self._with_updated_children(
             indent=self.indent,
             whitespace=visit_required(self, "whitespace", self.whitespace, visitor),
             comment=visit_optional(self, "comment", self.comment, visitor),
             newline=visit_required(self, "newline", self.newline, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "whitespace", self.whitespace, visitor)
+        walk_optional(self, "comment", self.comment, visitor)
+        walk_required(self, "newline", self.newline, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         if self.indent:
             state.add_indent_tokens()
@@ -269,13 +282,18 @@ class ParenthesizedWhitespace(BaseParenthesizableWhitespace):
     def _visit_and_replace_children(
         self, visitor: CSTVisitorT
     ) -> "ParenthesizedWhitespace":
-        return ParenthesizedWhitespace(
+        return self._with_updated_children(
             first_line=visit_required(self, "first_line", self.first_line, visitor),
             empty_lines=visit_sequence(self, "empty_lines", self.empty_lines, visitor),
             indent=self.indent,
             last_line=visit_required(self, "last_line", self.last_line, visitor),
         )
 
+    def _visit_children(self, visitor: CSTVisitor) -> None:
+        walk_required(self, "first_line", self.first_line, visitor)
+        walk_sequence(self, "empty_lines", self.empty_lines, visitor)
+        walk_required(self, "last_line", self.last_line, visitor)
+
     def _codegen_impl(self, state: CodegenState) -> None:
         self.first_line._codegen(state)
         for line in self.empty_lines:
@@ -0,0 +1,229 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+An opt-in, on-disk cache of parsed modules. Loading a pickled tree is several times
+faster than parsing the source it came from, which adds up for tools that repeatedly
+parse the same mostly-unchanged files (e.g. running several codemods over a repo).
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple, TypeVar, Union
+
+from libcst._nodes.module import Module
+from libcst._parser.entrypoints import _set_source, is_native, parse_module
+from libcst._parser.interning import intern_strings
+from libcst._parser.types.config import AutoConfig, PartialParserConfig
+
+try:
+    from libcst._version import version as _LIBCST_VERSION
+except ImportError:
+    _LIBCST_VERSION = "unknown"
+
+_T = TypeVar("_T")
+
+_DEFAULT_PARTIAL_PARSER_CONFIG: PartialParserConfig = PartialParserConfig()
+
+# Bump this when the layout of cache entries or of their keys changes in an
+# incompatible way.
+_CACHE_FORMAT_VERSION = 2
+_ENTRY_SUFFIX = ".pickle"
+# When the cache grows past its budget, evict down to this fraction of it so that
+# we don't have to rescan the directory on every subsequent write.
+_EVICTION_TARGET = 0.9
+
+
+class ParseCache:
+    """
+    A content-addressed cache of parsed :class:`~libcst.Module` trees, stored on
+    disk in ``directory``. Entries are keyed by a hash of the source, the parser
+    configuration, the LibCST version, the running Python version and the parser
+    implementation, so a stale tree is never returned for changed inputs.
+
+    The cache is bounded to roughly ``max_size`` bytes. When it grows larger, the
+    least recently used entries are evicted. Several processes may share the same
+    directory; entries are written atomically.
+
+    Entries are stored using :mod:`pickle`, so the cache directory must only be
+    writable by users you trust.
+    """
+
+    #: The directory holding the cache entries.
+    directory: Path
+
+    #: The approximate upper bound on the total size of the cache, in bytes.
+    max_size: int
+
+    def __init__(
+        self, directory: Union[str, "os.PathLike[str]"], *, max_size: int = 2**30
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative")
+        self.directory = Path(directory)
+        self.max_size = max_size
+        # Lazily computed the first time we write an entry.
+        self._size: Optional[int] = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def parse_module(
+        self,
+        source: Union[str, bytes],
+        config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG,
+    ) -> Module:
+        """
+        Behaves like :func:`~libcst.parse_module`, but returns a previously parsed
+        tree from the cache if one exists, and stores freshly parsed trees in it.
+        Every call returns a new tree, so callers are free to use node identity
+        (e.g. for metadata) without affecting other callers.
+        """
+        key = self._key(source, config)
+        module = self._load(key)
+        if module is None:
+            module = parse_module(source, config)
+            self._store(key, module)
+            return module
+        if config.intern_strings:
+            # Unpickled strings are copies of the ones that were interned.
+            module = intern_strings(module)
+        # Entries don't store the source, which `source` is the same as.
+        _set_source(module, source)
+        return module
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            _remove(path)
+        self._size = 0
+
+    def _key(self, source: Union[str, bytes], config: PartialParserConfig) -> str:
+        digest = hashlib.sha256()
+        header = (
+            f"{_CACHE_FORMAT_VERSION}\0{_LIBCST_VERSION}\0{sys.version_info[:2]}\0"
+            + f"{is_native()}\0{pickle.HIGHEST_PROTOCOL}\0{_config_key(config)!r}\0"
+        )
+        digest.update(header.encode("utf-8"))
+        # The same text can produce different trees depending on whether it was
+        # given as bytes (which go through encoding detection) or str.
+        if isinstance(source, bytes):
+            digest.update(b"b\0")
+            digest.update(source)
+        else:
+            digest.update(b"s\0")
+            digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def _load(self, key: str) -> Optional[Module]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            module = pickle.loads(data)
+        except Exception:
+            # A truncated or otherwise unreadable entry. Drop it and reparse.
+            module = None
+        if not isinstance(module, Module):
+            _remove(path)
+            return None
+        try:
+            # Mark the entry as recently used, for eviction purposes.
+            os.utime(path)
+        except OSError:
+            pass
+        return module
+
+    def _store(self, key: str, module: Module) -> None:
+        try:
+            # The source the module was parsed from is part of the key, so it doesn't
+            # need to be stored as well. Modules derived from `module` don't keep it.
+            data = pickle.dumps(module.with_changes(), protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            # Extremely deeply nested trees can't be pickled. Just don't cache them.
+            return
+        if len(data) > self.max_size:
+            return
+        size = self._size
+        if size is None:
+            size = self._disk_size()
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            # The cache is best-effort; a full disk shouldn't break parsing.
+            _remove(Path(tmp_name))
+            return
+        self._size = size + len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                # Concurrently evicted by somebody else.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _disk_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        # Other processes may be writing to the same directory, so re-read the
+        # actual state of the cache instead of trusting our running total.
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        size = sum(size for _, size, _ in entries)
+        target = int(self.max_size * _EVICTION_TARGET)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            _remove(path)
+            size -= entry_size
+        self._size = size
+
+
+def _config_key(config: PartialParserConfig) -> Tuple[object, ...]:
+    """
+    Returns the fields of ``config`` that affect the parsed tree, as builtin values
+    whose ``repr`` doesn't change between versions of LibCST, unlike the ``repr`` of
+    the config itself.
+    """
+    future_imports = _explicit(config.future_imports)
+    return (
+        _explicit(config.python_version),
+        _explicit(config.encoding),
+        _explicit(config.default_newline),
+        _explicit(config.default_indent),
+        None if future_imports is None else tuple(sorted(future_imports)),
+    )
+
+
+def _explicit(value: Union[_T, AutoConfig]) -> Optional[_T]:
+    return None if isinstance(value, AutoConfig) else value
+
+
+def _remove(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
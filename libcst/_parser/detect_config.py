@@ -4,12 +4,14 @@
 # LICENSE file in the root directory of this source tree.
 
 
+import codecs
 import itertools
 import re
 from dataclasses import dataclass
 from io import BytesIO
+from mmap import mmap
 from tokenize import detect_encoding as py_tokenize_detect_encoding
-from typing import FrozenSet, Iterable, Iterator, Pattern, Set, Tuple, Union
+from typing import Callable, FrozenSet, Iterable, Iterator, Pattern, Set, Tuple, Union
 
 from libcst._nodes.whitespace import NEWLINE_RE
 from libcst._parser.parso.python.token import PythonTokenTypes, TokenType
@@ -26,6 +28,12 @@ _STRING: TokenType = PythonTokenTypes.STRING
 _FALLBACK_DEFAULT_NEWLINE = "\n"
 _FALLBACK_DEFAULT_INDENT = "    "
 _CONTINUATION_RE: Pattern[str] = re.compile(r"\\(\r\n?|\n)", re.UNICODE)
+# How many bytes of a buffer are searched for the end of a line at once.
+_READLINE_CHUNK_SIZE = 512
+
+#: Bytes-like objects that the native parser can parse without copying them, if
+#: they're UTF-8 encoded.
+BytesLike = Union[bytes, memoryview, mmap]
 
 
 @dataclass(frozen=True)
@@ -36,7 +44,7 @@ class ConfigDetectionResult:
     tokens: Iterator[Token]
 
 
-def _detect_encoding(source: Union[str, bytes]) -> str:
+def _detect_encoding(source: Union[str, BytesLike]) -> str:
     """
     Detects the encoding from the presence of a UTF-8 BOM or an encoding cookie as
     specified in PEP 263.
@@ -46,7 +54,35 @@ def _detect_encoding(source: Union[str, bytes]) -> str:
 
     if isinstance(source, str):
         return "utf-8"
-    return py_tokenize_detect_encoding(BytesIO(source).readline)[0]
+    if isinstance(source, bytes):
+        # `BytesIO` shares the memory of `bytes` instead of copying it.
+        return py_tokenize_detect_encoding(BytesIO(source).readline)[0]
+    return py_tokenize_detect_encoding(_make_readline(source))[0]
+
+
+def _make_readline(source: BytesLike) -> Callable[[], bytes]:
+    """
+    Returns a ``readline`` function for ``source`` that only copies the lines it
+    reads, since the encoding is detected from the first two lines of a possibly
+    large buffer.
+    """
+    position = 0
+
+    def readline() -> bytes:
+        nonlocal position
+        end = position
+        while end < len(source):
+            chunk = bytes(source[end : end + _READLINE_CHUNK_SIZE])
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                end += newline + 1
+                break
+            end += len(chunk)
+        line = bytes(source[position:end])
+        position = end
+        return line
+
+    return readline
 
 
 def _detect_default_newline(source_str: str) -> str:
@@ -115,7 +151,7 @@ def _detect_future_imports(tokens: Iterable[Token]) -> FrozenSet[str]:
 
 
 def convert_to_utf8(
-    source: Union[str, bytes], *, partial: PartialParserConfig
+    source: Union[str, BytesLike], *, partial: PartialParserConfig
 ) -> Tuple[str, str]:
     """
     Returns an (original encoding, converted source) tuple.
@@ -127,10 +163,32 @@ def convert_to_utf8(
         else partial_encoding
     )
 
-    source_str = source if isinstance(source, str) else source.decode(encoding)
+    source_str = source if isinstance(source, str) else str(source, encoding)
     return (encoding, source_str)
 
 
+def convert_to_native_source(
+    source: Union[str, BytesLike], *, partial: PartialParserConfig
+) -> Tuple[str, Union[str, BytesLike]]:
+    """
+    Returns an (original encoding, converted source) tuple like
+    :func:`convert_to_utf8`, but leaves UTF-8 encoded sources as they are, since the
+    native parser decodes them in place.
+    """
+    if isinstance(source, str):
+        return convert_to_utf8(source, partial=partial)
+    partial_encoding = partial.encoding
+    encoding = (
+        _detect_encoding(source)
+        if isinstance(partial_encoding, AutoConfig)
+        else partial_encoding
+    )
+    if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+        # The native parser skips a BOM, like decoding "utf-8-sig" does.
+        return (encoding, source)
+    return (encoding, str(source, encoding))
+
+
 def detect_config(
     source: Union[str, bytes],
     *,
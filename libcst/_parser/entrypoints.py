@@ -9,18 +9,29 @@ parser. A parser entrypoint should take the source code and some configuration
 information
 """
 
+import mmap
 import os
+from dataclasses import replace
 from functools import partial
-from typing import Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
-from libcst._nodes.base import CSTNode
+from libcst._exceptions import ParserSyntaxError
+from libcst._nodes.base import _trusted_construction, CSTNode
 from libcst._nodes.expression import BaseExpression
 from libcst._nodes.module import Module
 from libcst._nodes.statement import BaseCompoundStatement, SimpleStatementLine
-from libcst._parser.detect_config import convert_to_utf8, detect_config
+from libcst._parser.detect_config import (
+    BytesLike,
+    convert_to_native_source,
+    convert_to_utf8,
+    detect_config,
+)
 from libcst._parser.grammar import get_grammar, validate_grammar
+from libcst._parser.interning import intern_strings
+from libcst._parser.lazy_bodies import attach_function_bodies, build_skeleton
+from libcst._parser.lazy_statements import LazyStatements
 from libcst._parser.python_parser import PythonCSTParser
-from libcst._parser.types.config import PartialParserConfig
+from libcst._parser.types.config import AutoConfig, PartialParserConfig
 
 _DEFAULT_PARTIAL_PARSER_CONFIG: PartialParserConfig = PartialParserConfig()
 
@@ -30,9 +41,40 @@ def is_native() -> bool:
     return typ != "pure"
 
 
+def _get_native_python_version(
+    config: PartialParserConfig,
+) -> Optional[Tuple[int, int]]:
+    # Unless a version is requested, the native parser accepts all of the syntax it
+    # supports, rather than that of the running interpreter.
+    if isinstance(config.python_version, AutoConfig):
+        return None
+    version = config.parsed_python_version
+    return (version.major, version.minor)
+
+
 def _parse(
     entrypoint: str,
-    source: Union[str, bytes],
+    source: Union[str, BytesLike],
+    config: PartialParserConfig,
+    *,
+    detect_trailing_newline: bool,
+    detect_default_newline: bool,
+) -> CSTNode:
+    result = _parse_impl(
+        entrypoint,
+        source,
+        config,
+        detect_trailing_newline=detect_trailing_newline,
+        detect_default_newline=detect_default_newline,
+    )
+    if config.intern_strings:
+        result = intern_strings(result)
+    return result
+
+
+def _parse_impl(
+    entrypoint: str,
+    source: Union[str, BytesLike],
     config: PartialParserConfig,
     *,
     detect_trailing_newline: bool,
@@ -41,18 +83,26 @@ def _parse(
     if is_native():
         from libcst.native import parse_expression, parse_module, parse_statement
 
-        encoding, source_str = convert_to_utf8(source, partial=config)
+        # UTF-8 encoded sources are parsed in place, without decoding them first.
+        encoding, native_source = convert_to_native_source(source, partial=config)
+        python_version = _get_native_python_version(config)
 
         if entrypoint == "file_input":
-            parse = partial(parse_module, encoding=encoding)
+            parse = partial(
+                parse_module, encoding=encoding, python_version=python_version
+            )
         elif entrypoint == "stmt_input":
-            parse = parse_statement
+            parse = partial(parse_statement, python_version=python_version)
         elif entrypoint == "expression_input":
-            parse = parse_expression
+            parse = partial(parse_expression, python_version=python_version)
         else:
             raise ValueError(f"Unknown parser entry point: {entrypoint}")
 
-        return parse(source_str)
+        # The native grammar rejects everything that node validation would, so
+        # there's no need to validate the nodes it builds. The pure python parser
+        # is more lenient, and relies on validation for some syntax errors.
+        with _trusted_construction():
+            return parse(native_source)
     return _pure_python_parse(
         entrypoint,
         source,
@@ -64,12 +114,14 @@ def _parse(
 
 def _pure_python_parse(
     entrypoint: str,
-    source: Union[str, bytes],
+    source: Union[str, BytesLike],
     config: PartialParserConfig,
     *,
     detect_trailing_newline: bool,
     detect_default_newline: bool,
 ) -> CSTNode:
+    if not isinstance(source, (str, bytes)):
+        source = bytes(source)
     detection_result = detect_config(
         source,
         partial=config,
@@ -92,13 +144,14 @@ def _pure_python_parse(
 
 
 def parse_module(
-    source: Union[str, bytes],  # the only entrypoint that accepts bytes
+    source: Union[str, BytesLike],  # the only entrypoint that accepts bytes
     config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG,
 ) -> Module:
     """
     Accepts an entire python module, including all leading and trailing whitespace.
 
-    If source is ``bytes``, the encoding will be inferred and preserved. If
+    If source is ``bytes`` (or another bytes-like object, like a ``memoryview`` or
+    an ``mmap``), the encoding will be inferred and preserved. If
     the source is a ``string``, we will default to assuming UTF-8 encoding if the
     module is rendered back out to source as bytes. It is recommended that when
     calling :func:`~libcst.parse_module` with a string you access the serialized
@@ -106,6 +159,12 @@ def parse_module(
     bytes you access the serialized code using :class:`~libcst.Module`'s bytes
     attribute.
     """
+    if config.lazy_function_bodies:
+        lazy_result = _parse_module_with_lazy_bodies(source, config)
+        if lazy_result is not None:
+            return lazy_result
+    if config.lazy_statements and is_native():
+        return _parse_module_with_lazy_statements(source, config)
     result = _parse(
         "file_input",
         source,
@@ -114,9 +173,162 @@ def parse_module(
         detect_default_newline=True,
     )
     assert isinstance(result, Module)
+    _set_source(result, source)
+    return result
+
+
+def parse_file(
+    path: Union[str, "os.PathLike[str]"],
+    config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG,
+) -> Module:
+    """
+    Accepts the path of a python module, and parses the bytes of the file like
+    :func:`~libcst.parse_module` does, inferring and preserving their encoding.
+
+    With the native parser, the file is memory-mapped and UTF-8 encoded files are
+    parsed in place, without reading and decoding them into a copy first. Since the
+    file may change once it's parsed, the :attr:`~libcst.Module.code` of the
+    resulting module is then generated from the tree when it's needed.
+    """
+    with open(path, "rb") as file:
+        if (
+            not is_native()
+            or config.lazy_function_bodies
+            # The statements keep a copy of the source anyway.
+            or config.lazy_statements
+            # Empty files can't be memory-mapped.
+            or os.fstat(file.fileno()).st_size == 0
+        ):
+            return parse_module(file.read(), config)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            result = _parse(
+                "file_input",
+                source,
+                config,
+                detect_trailing_newline=True,
+                detect_default_newline=True,
+            )
+    assert isinstance(result, Module)
     return result
 
 
+def _parse_module_with_lazy_bodies(
+    source: Union[str, BytesLike], config: PartialParserConfig
+) -> Optional[Module]:
+    """
+    Parses the skeleton of ``source`` for
+    :attr:`~libcst.PartialParserConfig.lazy_function_bodies`, or returns ``None`` if
+    ``source`` needs to be parsed as usual.
+    """
+    encoding, source_str = convert_to_utf8(source, partial=config)
+    skeleton = build_skeleton(source_str, config)
+    if skeleton is None:
+        return None
+    try:
+        result = _parse(
+            "file_input",
+            skeleton.code,
+            replace(skeleton.config, encoding=encoding),
+            detect_trailing_newline=True,
+            detect_default_newline=True,
+        )
+    except ParserSyntaxError:
+        # Let the whole module report the error, with the right position.
+        return None
+    assert isinstance(result, Module)
+    if not attach_function_bodies(result, skeleton):
+        return None
+    _set_source(result, source_str)
+    return result
+
+
+def _parse_module_with_lazy_statements(
+    source: Union[str, BytesLike], config: PartialParserConfig
+) -> Module:
+    """
+    Parses ``source`` with the native parser for
+    :attr:`~libcst.PartialParserConfig.lazy_statements`.
+    """
+    from libcst.native import parse_module_lazily
+
+    encoding, native_source = convert_to_native_source(source, partial=config)
+    with _trusted_construction():
+        result, statements = parse_module_lazily(
+            native_source, encoding, python_version=_get_native_python_version(config)
+        )
+    if config.intern_strings:
+        result = intern_strings(result)
+    # The module was just built by the parser and isn't referenced from anywhere
+    # else, so it's safe to update it in place.
+    object.__setattr__(
+        result, "body", LazyStatements(statements, config.intern_strings)
+    )
+    _set_source(result, source)
+    return result
+
+
+def _set_source(module: Module, source: Union[str, BytesLike]) -> None:
+    # Parsing round-trips, so the code of a freshly parsed module is the source it
+    # was parsed from, and `Module.code` doesn't need to generate it again. Bytes
+    # are only decoded once the code is needed. Other buffers (e.g. memory-mapped
+    # files) may change after they're parsed, so the code of their modules is
+    # generated instead.
+    if isinstance(source, (str, bytes)):
+        object.__setattr__(module, "_source", source)
+
+
+def parse_modules(
+    sources: Iterable[Union[str, bytes]],
+    config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG,
+    *,
+    jobs: Optional[int] = None,
+) -> Sequence[Module]:
+    """
+    Accepts many entire python modules and parses each of them like
+    :func:`~libcst.parse_module`, returning the modules in the same order as
+    ``sources``.
+
+    With the native parser, sources are tokenized and parsed on up to ``jobs``
+    threads (defaulting to the number of CPUs) without holding the GIL, which is
+    only taken to build the resulting :class:`~libcst.Module` objects. This is
+    considerably cheaper than parsing each file in a separate process. The pure
+    python parser parses the sources one at a time and ignores ``jobs``, as does
+    the native parser with :attr:`~libcst.PartialParserConfig.lazy_function_bodies`,
+    which needs to parse each module's skeleton before the rest of it, or with
+    :attr:`~libcst.PartialParserConfig.lazy_statements`.
+
+    If any of the sources fails to parse, the :class:`~libcst.ParserSyntaxError`
+    for the first such source is raised.
+    """
+    if not is_native() or config.lazy_function_bodies or config.lazy_statements:
+        return [parse_module(source, config) for source in sources]
+
+    from libcst.native import parse_modules as native_parse_modules
+
+    encodings: List[Optional[str]] = []
+    source_strs: List[str] = []
+    for source in sources:
+        encoding, source_str = convert_to_utf8(source, partial=config)
+        encodings.append(encoding)
+        source_strs.append(source_str)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    with _trusted_construction():
+        modules = native_parse_modules(
+            source_strs,
+            encodings,
+            max(jobs, 1),
+            python_version=_get_native_python_version(config),
+        )
+    results: List[Module] = []
+    for module, source_str in zip(modules, source_strs):
+        _set_source(module, source_str)
+        if config.intern_strings:
+            module = intern_strings(module)
+        results.append(module)
+    return results
+
+
 def parse_statement(
     source: str, config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG
 ) -> Union[SimpleStatementLine, BaseCompoundStatement]:
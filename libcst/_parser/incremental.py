@@ -0,0 +1,475 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Implements :func:`~libcst.incremental_parse`, which updates a parsed module after an
+edit to its source code by only parsing the top-level statements that the edit
+touched again.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from typing import FrozenSet, List, Optional, Sequence, Set, Tuple, Union
+
+from libcst._add_slots import add_slots
+from libcst._exceptions import ParserSyntaxError
+from libcst._nodes.base import CSTNode, CSTValidationError
+from libcst._nodes.deep_equals import deep_equals
+from libcst._nodes.expression import ConcatenatedString, Name, SimpleString
+from libcst._nodes.module import Module
+from libcst._nodes.statement import (
+    BaseStatement,
+    Expr,
+    ImportFrom,
+    IndentedBlock,
+    Pass,
+    SimpleStatementLine,
+)
+from libcst._nodes.whitespace import EmptyLine
+from libcst._parser.entrypoints import _DEFAULT_PARTIAL_PARSER_CONFIG, parse_module
+from libcst._parser.types.config import AutoConfig, PartialParserConfig
+
+
+@add_slots
+@dataclass(frozen=True)
+class TextEdit:
+    """
+    Replaces the characters of a module's code between ``start`` and ``end`` with
+    ``text``. Offsets are indices into :attr:`Module.code <libcst.Module.code>`, so
+    an insertion has ``start == end`` and a deletion has an empty ``text``.
+    """
+
+    #: The offset of the first replaced character.
+    start: int
+    #: The offset just past the last replaced character.
+    end: int
+    #: The text that replaces the characters between ``start`` and ``end``.
+    text: str
+
+
+def incremental_parse(
+    module: Module,
+    edit: TextEdit,
+    config: PartialParserConfig = _DEFAULT_PARTIAL_PARSER_CONFIG,
+) -> Module:
+    """
+    Returns the module that :func:`~libcst.parse_module` would parse from the code of
+    ``module`` after applying ``edit`` to it, keeping the encoding of ``module``.
+
+    Only the top-level statements that ``edit`` touches are parsed again, along with
+    the statement before them if it ends with an indented block, since the lines
+    following an indented block may belong to it. Every other statement is reused
+    as-is from ``module``, so the result shares most of its nodes with ``module``,
+    and parsing takes time proportional to the size of the edited statements rather
+    than to the size of the module. Edits that could change how the rest of the module is
+    parsed, like edits to the module's header or to its ``__future__`` imports, or
+    edits that change the inferred indentation, fall back to parsing the whole
+    module.
+
+    ``module`` should be the result of :func:`~libcst.parse_module` (or of a previous
+    call to :func:`incremental_parse`) with the same ``config``. Raises
+    :class:`ValueError` if ``edit`` is out of the bounds of the module's code, and
+    :class:`~libcst.ParserSyntaxError` if the edited code doesn't parse.
+    """
+    old_code = module.code
+    if not 0 <= edit.start <= edit.end <= len(old_code):
+        raise ValueError(
+            f"Expected an edit within the module's {len(old_code)} characters, "
+            + f"but got one from {edit.start} to {edit.end}."
+        )
+    new_code = old_code[: edit.start] + edit.text + old_code[edit.end :]
+    if isinstance(config.encoding, AutoConfig):
+        # The edited code is a string, so the encoding can't be detected again.
+        config = replace(config, encoding=module.encoding)
+
+    result = _parse_edited_statements(module, edit, new_code, config)
+    if result is None:
+        return parse_module(new_code, config)
+    return result
+
+
+@add_slots
+@dataclass(frozen=True)
+class _ParsedRegion:
+    # The index of the first statement of the module that was parsed again.
+    start_index: int
+    # The module parsed from the edited region.
+    module: Module
+    # The statements parsed from the edited region, followed by the placeholder for
+    # the statement after the region, if any.
+    statements: List[BaseStatement]
+    # The default indent that the region was parsed with, which is only
+    # `AutoConfig.token` if it was inferred from the region.
+    default_indent: Union[str, AutoConfig]
+
+
+def _parse_edited_statements(
+    module: Module, edit: TextEdit, new_code: str, config: PartialParserConfig
+) -> Optional[Module]:
+    """
+    Parses the statements touched by ``edit`` again, and returns the updated module,
+    or ``None`` if the whole module needs to be parsed again.
+    """
+    old_code = module.code
+    body = module.body
+    count = len(body)
+    offsets = _get_statement_offsets(module)
+
+    # The edited region starts at the statement that contains the start of the edit,
+    # or at the footer, and ends before the first statement that starts after the
+    # end of the edit.
+    start_index = bisect_right(offsets, edit.start) - 1
+    end_index = bisect_right(offsets, edit.end, max(start_index, 0), count)
+    region_end = offsets[end_index] if end_index < count else len(old_code)
+
+    default_newline = config.default_newline
+    if isinstance(default_newline, AutoConfig):
+        # The unchanged statements before the edited region contain the first
+        # newline of the module, which is the one that's inferred.
+        default_newline = module.default_newline
+    suffix = ""
+    if end_index < count:
+        # How the leading lines of the next statement are parsed depends on the
+        # statements before them, so they're parsed again. The rest of the next
+        # statement is parsed the same way wherever it is, and a placeholder stands
+        # in for it.
+        leading_end = region_end + _get_leading_lines_length(module, body[end_index])
+        suffix = old_code[region_end:leading_end] + "pass" + default_newline
+
+    region = _parse_region(
+        module,
+        edit,
+        replace(config, default_newline=default_newline),
+        start_index,
+        region_end,
+        suffix,
+    )
+    if region is None:
+        return None
+    spliced = _splice_following_statements(module, region, end_index)
+    if spliced is None:
+        return None
+    new_statements, following_statements, footer, has_trailing_newline = spliced
+    start_index = region.start_index
+    new_default_indent = _get_new_default_indent(
+        module, region, new_statements, end_index
+    )
+    if new_default_indent is None:
+        return None
+
+    result = module.with_changes(
+        body=(*body[:start_index], *new_statements, *following_statements),
+        footer=footer,
+        default_indent=new_default_indent,
+        has_trailing_newline=has_trailing_newline,
+    )
+    new_offsets = list(offsets[:start_index])
+    position = offsets[start_index]
+    region_codes: List[str] = []
+    for statement in new_statements:
+        new_offsets.append(position)
+        region_codes.append(result.code_for_node(statement))
+        position += len(region_codes[-1])
+    # The next statement, or the footer, starts right after them, since the lines
+    # before it may have changed.
+    new_offsets.append(min(position, len(new_code)))
+    delta = len(new_code) - len(old_code)
+    if end_index < count:
+        region_code_end: Optional[int] = offsets[end_index] + delta
+    else:
+        region_code_end = None
+        region_codes.extend(result.code_for_node(line) for line in footer)
+    if not _region_matches(
+        new_code,
+        offsets[start_index],
+        region_code_end,
+        "".join(region_codes),
+        has_trailing_newline,
+    ):
+        return None
+    new_offsets.extend(offset + delta for offset in offsets[end_index + 1 :])
+    # Nodes are frozen, so bypass the dataclass' `__setattr__`. The code of the
+    # region was checked above, and the rest of the module is unchanged, so
+    # `new_code` is the code of `result`.
+    object.__setattr__(result, "_source", new_code)
+    object.__setattr__(result, "_statement_offsets", tuple(new_offsets))
+    return result
+
+
+def _region_matches(
+    new_code: str,
+    start: int,
+    end: Optional[int],
+    region_code: str,
+    has_trailing_newline: bool,
+) -> bool:
+    """
+    Returns whether ``region_code``, the code generated for the parsed region, is the
+    code of ``new_code`` from ``start`` to ``end``, or to the end of the module if
+    ``end`` is ``None``. A region that doesn't round-trip this way needs the whole
+    module to be parsed again, since `Module.code` would otherwise return code that
+    doesn't match the tree.
+    """
+    if end is not None:
+        return new_code[start:end] == region_code
+    expected = new_code[start:]
+    if has_trailing_newline or not region_code:
+        return expected == region_code
+    # The module's code leaves out the trailing newline of its last line.
+    return region_code.startswith(expected) and region_code[len(expected) :] in (
+        "\n",
+        "\r\n",
+        "\r",
+    )
+
+
+def _parse_region(
+    module: Module,
+    edit: TextEdit,
+    config: PartialParserConfig,
+    start_index: int,
+    region_end: int,
+    suffix: str,
+) -> Optional[_ParsedRegion]:
+    """
+    Parses the code from the statement at ``start_index`` to ``region_end`` with
+    ``edit`` applied, followed by ``suffix``. The region starts at an earlier
+    statement if it continues the statement before it. Returns ``None`` if the
+    whole module needs to be parsed again.
+    """
+    old_code = module.code
+    offsets = _get_statement_offsets(module)
+    while True:
+        if start_index <= 0:
+            # The header determines the encoding and default newline, and isn't
+            # owned by a statement.
+            return None
+        region_start = offsets[start_index]
+        fragment = (
+            old_code[region_start : edit.start]
+            + edit.text
+            + old_code[edit.end : region_end]
+        )
+        if (
+            "__future__" in fragment
+            or "__future__" in old_code[region_start:region_end]
+        ):
+            return None
+        prefix = _get_prefix(module, start_index)
+        region_config = _get_region_config(module, config, start_index)
+        try:
+            parsed = parse_module(prefix + fragment + suffix, region_config)
+        except (ParserSyntaxError, CSTValidationError):
+            # The error may be caused by cutting the module at the wrong place, so
+            # let the whole module report it.
+            return None
+
+        statements: List[BaseStatement] = list(parsed.body)
+        default_indent = region_config.default_indent
+        if not prefix:
+            if statements:
+                # The parser moves the leading lines of the first statement into
+                # the header.
+                statements[0] = statements[0].with_changes(
+                    leading_lines=(*parsed.header, *statements[0].leading_lines)
+                )
+            return _ParsedRegion(start_index, parsed, statements, default_indent)
+        if statements and parsed.code_for_node(statements[0]) == prefix:
+            return _ParsedRegion(start_index, parsed, statements[1:], default_indent)
+        # The edited region continues the statement before it, which has to be
+        # parsed again too.
+        start_index -= 1
+
+
+def _get_prefix(module: Module, start_index: int) -> str:
+    """
+    Returns the code of the statement before the one at ``start_index`` that's
+    parsed along with the edited region, which is empty unless it ends with an
+    indented block.
+    """
+    previous = module.body[start_index - 1]
+    if _find_indented_block((previous,)) is None:
+        return ""
+    # Lines following an indented block belong to it if they're indented as deeply,
+    # and the indentation of the lines after that depends on how deeply the block is
+    # nested. So the statement before the edited region is parsed along with it, but
+    # without its own leading lines, which may depend on the statements before it in
+    # the same way.
+    offsets = _get_statement_offsets(module)
+    return module.code[
+        offsets[start_index - 1]
+        + _get_leading_lines_length(module, previous) : offsets[start_index]
+    ]
+
+
+def _get_region_config(
+    module: Module, config: PartialParserConfig, start_index: int
+) -> PartialParserConfig:
+    """
+    Returns the config to parse the edited region starting at the statement at
+    ``start_index`` with, which has what the parser would infer from the statements
+    before it.
+    """
+    preceding = module.body[:start_index]
+    future_imports = config.future_imports
+    if isinstance(future_imports, AutoConfig):
+        future_imports = _get_future_imports(preceding)
+    default_indent = config.default_indent
+    if isinstance(default_indent, AutoConfig):
+        default_indent = _get_first_indent(module, preceding)
+    return replace(config, future_imports=future_imports, default_indent=default_indent)
+
+
+def _splice_following_statements(
+    module: Module, region: _ParsedRegion, end_index: int
+) -> Optional[
+    Tuple[List[BaseStatement], Sequence[BaseStatement], Sequence[EmptyLine], bool]
+]:
+    """
+    Returns the statements parsed from the edited region, the statements that follow
+    them, and the footer and ``has_trailing_newline`` of the updated module, or
+    ``None`` if the whole module needs to be parsed again.
+    """
+    body = module.body
+    parsed = region.module
+    new_statements = list(region.statements)
+    if end_index >= len(body):
+        footer = (
+            (*parsed.header, *parsed.footer) if not new_statements else parsed.footer
+        )
+        return new_statements, (), footer, parsed.has_trailing_newline
+
+    next_statement = body[end_index]
+    placeholder = new_statements.pop() if new_statements else None
+    if placeholder is None or not placeholder.deep_equals(
+        SimpleStatementLine([Pass()], leading_lines=placeholder.leading_lines)
+    ):
+        # The end of the fragment continued into the placeholder.
+        return None
+    if not deep_equals(placeholder.leading_lines, next_statement.leading_lines):
+        next_statement = next_statement.with_changes(
+            leading_lines=placeholder.leading_lines
+        )
+    following_statements = (next_statement, *body[end_index + 1 :])
+    return (
+        new_statements,
+        following_statements,
+        module.footer,
+        module.has_trailing_newline,
+    )
+
+
+def _get_new_default_indent(
+    module: Module,
+    region: _ParsedRegion,
+    new_statements: Sequence[BaseStatement],
+    end_index: int,
+) -> Optional[str]:
+    """
+    Returns the default indent of the updated module, or ``None`` if the whole
+    module needs to be parsed again.
+    """
+    body = module.body
+    new_default_indent = region.module.default_indent
+    if (
+        isinstance(region.default_indent, AutoConfig)
+        and _find_indented_block(new_statements) is None
+    ):
+        # The first indented block of the module, if any, follows the fragment.
+        following_indent = _get_first_indent(module, body[end_index:])
+        if not isinstance(following_indent, AutoConfig):
+            new_default_indent = following_indent
+    if new_default_indent != module.default_indent and (
+        _find_indented_block(body[: region.start_index]) is not None
+        or _find_indented_block(body[end_index:]) is not None
+    ):
+        # The indented blocks of the unchanged statements store their indentation
+        # relative to the default indent, and would have to be updated.
+        return None
+    return new_default_indent
+
+
+def _get_statement_offsets(module: Module) -> Sequence[int]:
+    """
+    Returns the offset at which each statement of ``module`` starts in its code,
+    followed by the offset at which its footer starts.
+    """
+    offsets = module._statement_offsets
+    if offsets is None:
+        position = sum(len(module.code_for_node(line)) for line in module.header)
+        starts: List[int] = []
+        for statement in module.body:
+            starts.append(position)
+            position += len(module.code_for_node(statement))
+        # The trailing newline is left out of the code if the module doesn't have one.
+        starts.append(min(position, len(module.code)))
+        offsets = tuple(starts)
+        object.__setattr__(module, "_statement_offsets", offsets)
+    return offsets
+
+
+def _get_leading_lines_length(module: Module, statement: BaseStatement) -> int:
+    return sum(len(module.code_for_node(line)) for line in statement.leading_lines)
+
+
+def _get_future_imports(statements: Sequence[BaseStatement]) -> FrozenSet[str]:
+    """
+    Finds the ``__future__`` imports at the start of ``statements``, like the parser
+    finds them in the tokens at the start of a module.
+    """
+    future_imports: Set[str] = set()
+    for statement in statements:
+        if not isinstance(statement, SimpleStatementLine):
+            break
+        for small_statement in statement.body:
+            if isinstance(small_statement, Expr) and isinstance(
+                small_statement.value, (SimpleString, ConcatenatedString)
+            ):
+                continue
+            if (
+                isinstance(small_statement, ImportFrom)
+                and not small_statement.relative
+                and isinstance(small_statement.module, Name)
+                and small_statement.module.value == "__future__"
+                and isinstance(small_statement.names, Sequence)
+            ):
+                for alias in small_statement.names:
+                    if isinstance(alias.name, Name):
+                        future_imports.add(alias.name.value)
+                continue
+            return frozenset(future_imports)
+    return frozenset(future_imports)
+
+
+def _find_indented_block(
+    nodes: Sequence[CSTNode],
+) -> Optional[IndentedBlock]:
+    """
+    Returns the first indented block in ``nodes``, which is the one whose INDENT
+    token the default indent is inferred from.
+    """
+    for node in nodes:
+        if isinstance(node, IndentedBlock):
+            return node
+        if isinstance(node, SimpleStatementLine):
+            # Simple statements never contain indented blocks.
+            continue
+        block = _find_indented_block(node.children)
+        if block is not None:
+            return block
+    return None
+
+
+def _get_first_indent(
+    module: Module, statements: Sequence[BaseStatement]
+) -> Union[str, AutoConfig]:
+    """
+    Returns the indentation of the first indented block of ``statements``, or
+    ``AutoConfig.token`` if there's none.
+    """
+    block = _find_indented_block(statements)
+    if block is None:
+        return AutoConfig.token
+    return module.default_indent if block.indent is None else block.indent
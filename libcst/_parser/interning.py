@@ -0,0 +1,66 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Implements :attr:`~libcst.PartialParserConfig.intern_strings`, which interns the
+values of names and whitespace, the strings that are repeated most in a tree.
+"""
+
+import sys
+from dataclasses import fields
+from typing import Dict, List, Mapping, Tuple, Type
+
+from libcst._nodes.base import CSTNode
+from libcst._nodes.expression import Name
+from libcst._nodes.statement import IndentedBlock
+from libcst._nodes.whitespace import Newline, SimpleWhitespace
+from libcst._types import CSTNodeT
+
+# The string field of each node type whose values are interned. Only strings are
+# shared, never nodes, so that every node keeps its own identity, which metadata
+# and functions like `deep_replace` rely on.
+_INTERNED_FIELDS: Mapping[Type[CSTNode], str] = {
+    Name: "value",
+    SimpleWhitespace: "value",
+    Newline: "value",
+    IndentedBlock: "indent",
+}
+
+# The names of the fields of every node type seen so far.
+_field_names: Dict[Type[CSTNode], Tuple[str, ...]] = {}
+
+
+def _get_field_names(node_type: Type[CSTNode]) -> Tuple[str, ...]:
+    names = _field_names.get(node_type)
+    if names is None:
+        names = tuple(f.name for f in fields(node_type))
+        _field_names[node_type] = names
+    return names
+
+
+def intern_strings(tree: CSTNodeT) -> CSTNodeT:
+    """
+    Interns the values of the names and whitespace in the freshly parsed ``tree``
+    with :func:`sys.intern`, in place, and returns ``tree``.
+    """
+    stack: List[CSTNode] = [tree]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        interned_field = _INTERNED_FIELDS.get(node_type)
+        for name in _get_field_names(node_type):
+            value = getattr(node, name)
+            if isinstance(value, CSTNode):
+                stack.append(value)
+            elif isinstance(value, (tuple, list)):
+                # Unparsed function bodies aren't tuples or lists, so they're
+                # interned once they're parsed, with the same config.
+                stack.extend(item for item in value if isinstance(item, CSTNode))
+            elif name == interned_field and isinstance(value, str):
+                # The tree was just built by the parser and isn't referenced from
+                # anywhere else, so it's safe to update it in place. The new value
+                # is equal to the old one.
+                object.__setattr__(node, name, sys.intern(value))
+    return tree
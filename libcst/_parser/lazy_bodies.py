@@ -0,0 +1,397 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Implements :attr:`~libcst.PartialParserConfig.lazy_function_bodies`.
+
+The body of every function is replaced by a placeholder in a skeleton of the module,
+which is what's actually parsed. The placeholder has the same nesting as the end of
+the body, so that the lines following the body are parsed exactly like they would be
+in the original module. The statements of each body are parsed on demand from their
+own source, nested in as many blocks as the function is.
+"""
+
+import threading
+from dataclasses import dataclass, field, replace
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from libcst._add_slots import add_slots
+from libcst._exceptions import ParserSyntaxError
+from libcst._nodes.base import CSTNode
+from libcst._nodes.expression import BaseExpression
+from libcst._nodes.internal import CodegenState
+from libcst._nodes.module import Module
+from libcst._nodes.statement import (
+    BaseStatement,
+    FunctionDef,
+    If,
+    IndentedBlock,
+    SimpleStatementLine,
+)
+from libcst._parser.detect_config import (
+    _detect_future_imports,
+    _detect_trailing_newline,
+)
+from libcst._parser.parso.python.token import PythonTokenTypes, TokenType
+from libcst._parser.parso.utils import split_lines
+from libcst._parser.types.config import AutoConfig, PartialParserConfig
+from libcst._parser.wrapped_tokenize import tokenize
+
+if TYPE_CHECKING:
+    from libcst._parser.types.token import Token
+
+_NAME: TokenType = PythonTokenTypes.NAME
+_OP: TokenType = PythonTokenTypes.OP
+_NEWLINE: TokenType = PythonTokenTypes.NEWLINE
+_INDENT: TokenType = PythonTokenTypes.INDENT
+_DEDENT: TokenType = PythonTokenTypes.DEDENT
+
+_OPENING_BRACKETS = frozenset("([{")
+_CLOSING_BRACKETS = frozenset(")]}")
+
+# Materializing a body swaps its statements in, which shouldn't happen twice.
+_materialize_lock = threading.Lock()
+
+
+@add_slots
+@dataclass(frozen=False)
+class _FunctionBody:
+    # The indentation of each block that the function is nested in, starting with
+    # the module's (which is empty), and ending with the function's own.
+    function_indents: Tuple[str, ...]
+    # The 1-indexed lines of the body, from the line after the function's header to
+    # the last line of its last statement.
+    start_line: int
+    end_line: int = 0
+    # The indentation of each block that the last line of the body is nested in,
+    # starting with the body's.
+    end_indents: Tuple[str, ...] = ()
+
+
+@add_slots
+@dataclass(frozen=True)
+class Skeleton:
+    #: The source code of the module, with the body of every function replaced.
+    code: str
+    #: The lines of the original source code.
+    lines: Sequence[str]
+    bodies: Sequence[_FunctionBody]
+    #: The configuration that function bodies are parsed with, apart from the
+    #: indentation and newline, which are only known once the skeleton is parsed.
+    config: PartialParserConfig = field(default_factory=PartialParserConfig)
+
+
+@add_slots
+@dataclass(frozen=False)
+class _BodyFinder:
+    bodies: List[_FunctionBody] = field(default_factory=list)
+    indents: List[str] = field(default_factory=lambda: [""])
+    bracket_depth: int = 0
+    # How far into a function header followed by an indented block the tokens are:
+    # 1 after `def`, 2 after the colon, and 3 after the newline.
+    header_state: int = 0
+    function_indents: Tuple[str, ...] = ()
+    header_end_line: int = 0
+    body: Optional[_FunctionBody] = None
+    body_depth: int = 0
+    last_newline_line: int = 0
+    last_newline_indents: Tuple[str, ...] = ()
+
+    def on_indent(self, token: "Token") -> None:
+        relative_indent = token.relative_indent
+        assert relative_indent is not None
+        self.indents.append(self.indents[-1] + relative_indent)
+        if self.header_state == 3 and self.body is None:
+            self.body = _FunctionBody(self.function_indents, self.header_end_line + 1)
+            self.body_depth = len(self.indents)
+        self.header_state = 0
+
+    def on_dedent(self) -> None:
+        self.indents.pop()
+        body = self.body
+        if body is not None and len(self.indents) < self.body_depth:
+            if self.last_newline_line >= body.start_line:
+                body.end_line = self.last_newline_line
+                body.end_indents = self.last_newline_indents[self.body_depth - 1 :]
+                self.bodies.append(body)
+            # Otherwise the body doesn't end with a newline (e.g. because of an
+            # unclosed bracket), and is parsed with the rest of the module.
+            self.body = None
+        self.header_state = 0
+
+    def on_newline(self, token: "Token") -> None:
+        self.last_newline_line = token.start_pos[0]
+        self.last_newline_indents = tuple(self.indents)
+        if self.header_state == 2:
+            self.header_state = 3
+            self.header_end_line = self.last_newline_line
+        else:
+            self.header_state = 0
+
+    def on_op(self, string: str) -> None:
+        if string in _OPENING_BRACKETS:
+            self.bracket_depth += 1
+        elif string in _CLOSING_BRACKETS:
+            self.bracket_depth -= 1
+        elif string == ":" and self.bracket_depth == 0 and self.header_state == 1:
+            self.header_state = 2
+            return
+        if self.header_state != 1:
+            self.header_state = 0
+
+    def on_def(self) -> None:
+        if self.body is None and self.bracket_depth == 0:
+            self.header_state = 1
+            self.function_indents = tuple(self.indents)
+
+    def on_other(self) -> None:
+        if self.header_state != 1:
+            self.header_state = 0
+
+
+def _find_function_bodies(tokens: Sequence["Token"]) -> List[_FunctionBody]:
+    """
+    Finds the body of every function that isn't nested in another function and
+    whose body is an indented block.
+    """
+    finder = _BodyFinder()
+    for token in tokens:
+        token_type = token.type
+        if token_type is _INDENT:
+            finder.on_indent(token)
+        elif token_type is _DEDENT:
+            finder.on_dedent()
+        elif token_type is _NEWLINE:
+            finder.on_newline(token)
+        elif token_type is _OP:
+            finder.on_op(token.string)
+        elif token_type is _NAME and token.string == "def":
+            finder.on_def()
+        else:
+            finder.on_other()
+    return finder.bodies
+
+
+def _get_placeholder(indents: Sequence[str], newline: str) -> str:
+    """
+    Returns statements that are nested in blocks with the given indentation, like
+    the last line of a function body.
+    """
+    *outer_indents, inner_indent = indents
+    return (
+        "".join(
+            [*(f"{indent}if 1:\n" for indent in outer_indents), f"{inner_indent}pass"]
+        )
+        + newline
+    )
+
+
+def build_skeleton(source: str, config: PartialParserConfig) -> Optional[Skeleton]:
+    """
+    Returns the skeleton of ``source`` that's parsed in place of it, or ``None`` if
+    it has no function bodies to leave unparsed, or can't be tokenized.
+    """
+    if not _detect_trailing_newline(source):
+        # The parser adds the missing newline, which would end the last body.
+        return None
+    try:
+        tokens = list(tokenize(source, config.parsed_python_version))
+    except ParserSyntaxError:
+        # Let the parser report the error.
+        return None
+    bodies = _find_function_bodies(tokens)
+    if not bodies:
+        return None
+
+    future_imports = config.future_imports
+    if isinstance(future_imports, AutoConfig):
+        future_imports = _detect_future_imports(tokens)
+    lines = split_lines(source, keepends=True)
+    parts: List[str] = []
+    position = 0
+    for body in bodies:
+        parts.extend(lines[position : body.start_line - 1])
+        last_line = lines[body.end_line - 1]
+        newline = last_line[len(last_line.rstrip("\r\n")) :]
+        parts.append(_get_placeholder(body.end_indents, newline))
+        position = body.end_line
+    parts.extend(lines[position:])
+    return Skeleton(
+        "".join(parts),
+        lines,
+        bodies,
+        replace(
+            config,
+            future_imports=future_imports,
+            lazy_function_bodies=False,
+            lazy_statements=False,
+        ),
+    )
+
+
+def _iter_function_defs(node: CSTNode) -> Iterator[FunctionDef]:
+    """
+    Yields the functions in ``node`` that aren't nested in other functions, in the
+    order in which they appear in the code.
+    """
+    for child in node.children:
+        if isinstance(child, FunctionDef):
+            yield child
+        elif not isinstance(child, (BaseExpression, SimpleStatementLine)):
+            # Only statements can contain functions.
+            yield from _iter_function_defs(child)
+
+
+def attach_function_bodies(module: Module, skeleton: Skeleton) -> bool:
+    """
+    Replaces the placeholders in ``module``, the freshly parsed skeleton, with the
+    statements of the original function bodies, which are parsed when they're first
+    accessed. Returns ``False`` if the module doesn't match the skeleton.
+    """
+    blocks: List[IndentedBlock] = [
+        function.body
+        for function in _iter_function_defs(module)
+        if isinstance(function.body, IndentedBlock)
+    ]
+    if len(blocks) != len(skeleton.bodies):
+        return False
+    config = replace(
+        skeleton.config,
+        default_indent=module.default_indent,
+        default_newline=module.default_newline,
+    )
+    lines = skeleton.lines
+    for block, body in zip(blocks, skeleton.bodies):
+        # The lines after the body that are indented more deeply than the body
+        # belong to the blocks nested at the end of it.
+        end_line = body.end_line + _count_nested_footer_lines(block)
+        source = "".join(lines[body.start_line - 1 : end_line])
+        # The tree was just built by the parser and isn't referenced from anywhere
+        # else, so it's safe to update it in place.
+        object.__setattr__(
+            block,
+            "body",
+            _LazyStatements(source, body.function_indents, body.end_indents[0], config),
+        )
+    return True
+
+
+def _count_nested_footer_lines(block: IndentedBlock) -> int:
+    count = 0
+    statement = block.body[0]
+    while isinstance(statement, If):
+        nested_block = statement.body
+        assert isinstance(nested_block, IndentedBlock)
+        count += len(nested_block.footer)
+        statement = nested_block.body[0]
+    return count
+
+
+class _LazyStatements(Sequence[BaseStatement]):
+    """
+    The statements of a function body, which are parsed from their source when
+    they're first accessed.
+    """
+
+    __slots__ = ("_source", "_function_indents", "_indent", "_config", "_statements")
+
+    def __init__(
+        self,
+        source: str,
+        function_indents: Tuple[str, ...],
+        indent: str,
+        config: PartialParserConfig,
+    ) -> None:
+        self._source = source
+        self._function_indents = function_indents
+        # The indentation of the statements, including the function's.
+        self._indent = indent
+        self._config = config
+        self._statements: Optional[Sequence[BaseStatement]] = None
+
+    def _materialize(self) -> Sequence[BaseStatement]:
+        statements = self._statements
+        if statements is None:
+            with _materialize_lock:
+                statements = self._statements
+                if statements is None:
+                    statements = self._parse()
+                    self._statements = statements
+        return statements
+
+    def _parse(self) -> Sequence[BaseStatement]:
+        from libcst._parser.entrypoints import parse_module
+
+        # Nest the statements in as many blocks as the function is, so that they're
+        # indented and parsed just like they are in the function.
+        headers = "".join(f"{indent}if 1:\n" for indent in self._function_indents)
+        module = parse_module(headers + self._source, self._config)
+        block = None
+        statement: CSTNode = module.body[0]
+        for _ in self._function_indents:
+            assert isinstance(statement, If)
+            block = statement.body
+            assert isinstance(block, IndentedBlock)
+            statement = block.body[0]
+        assert block is not None
+        return tuple(block.body)
+
+    def codegen_unparsed(self, state: CodegenState) -> bool:
+        """
+        Adds the source of the statements to ``state`` if they weren't parsed yet,
+        and if the source is still what their code would be. Returns whether it did.
+        """
+        source = self._source
+        code = source.rstrip("\r\n")
+        if (
+            self._statements is not None
+            # Other states record the positions of the statements.
+            or type(state) is not CodegenState
+            or "".join(state.indent_tokens) != self._indent
+            or state.default_indent != self._config.default_indent
+            or state.default_newline != self._config.default_newline
+            # The module removes its last newline if it doesn't have a trailing one,
+            # which has to be a token of its own.
+            or code == source
+        ):
+            return False
+        state.add_token(code)
+        state.add_token(source[len(code) :])
+        return True
+
+    @overload
+    def __getitem__(self, index: int) -> BaseStatement:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[BaseStatement]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[BaseStatement, Sequence[BaseStatement]]:
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self) -> Iterator[BaseStatement]:
+        return iter(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __reduce__(self) -> Tuple[object, ...]:
+        # Pickle the statements, so that unpickling doesn't need the parser.
+        return (tuple, (tuple(self._materialize()),))
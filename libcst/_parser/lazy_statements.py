@@ -0,0 +1,105 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+"""
+Implements :attr:`~libcst.PartialParserConfig.lazy_statements`.
+
+The native parser returns the module without its statements, along with a handle to
+the statements of the tree it built, which stays alive in native memory. Each
+statement is converted into python nodes when it's first accessed.
+"""
+
+import threading
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from libcst._nodes.base import _trusted_construction
+from libcst._nodes.statement import BaseStatement
+from libcst._parser.interning import intern_strings
+
+if TYPE_CHECKING:
+    from libcst.native import LazyStatements as NativeStatements
+
+# Each native statement can only be taken once.
+_take_lock = threading.Lock()
+
+
+class LazyStatements(Sequence[BaseStatement]):
+    """
+    The statements of a module, which are converted from the native parser's tree
+    when they're first accessed.
+    """
+
+    __slots__ = ("_native", "_statements", "_remaining", "_intern")
+
+    def __init__(self, native: "NativeStatements", intern: bool) -> None:
+        self._native: Optional["NativeStatements"] = native
+        self._statements: List[Optional[BaseStatement]] = [None] * len(native)
+        # The number of statements that weren't converted yet. The native tree is
+        # released once they all are.
+        self._remaining: int = len(self._statements)
+        self._intern = intern
+
+    def _get(self, index: int) -> BaseStatement:
+        statement = self._statements[index]
+        if statement is None:
+            with _take_lock:
+                statement = self._statements[index]
+                if statement is None:
+                    statement = self._take(index)
+                    self._statements[index] = statement
+        return statement
+
+    def _take(self, index: int) -> BaseStatement:
+        native = self._native
+        assert native is not None
+        with _trusted_construction():
+            statement = native.take(index)
+        if self._intern:
+            statement = intern_strings(statement)
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._native = None
+        return statement
+
+    @overload
+    def __getitem__(self, index: int) -> BaseStatement:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[BaseStatement]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[BaseStatement, Sequence[BaseStatement]]:
+        # Indexing a range validates the index, and resolves negative ones.
+        indices = range(len(self._statements))[index]
+        if isinstance(indices, int):
+            return self._get(indices)
+        return tuple(self._get(i) for i in indices)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def __iter__(self) -> Iterator[BaseStatement]:
+        # Statements after the ones the caller stops at aren't converted.
+        for index in range(len(self._statements)):
+            yield self._get(index)
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+    def __reduce__(self) -> Tuple[object, ...]:
+        # Pickle the statements, since the native tree can't be pickled.
+        return (tuple, (tuple(self),))
@@ -0,0 +1,122 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from textwrap import dedent
+
+import libcst as cst
+from libcst._parser.incremental import _region_matches
+from libcst.testing.utils import data_provider, UnitTest
+
+_CODE = dedent(
+    """\
+    # header comment
+    import os
+
+    x = 1  # one
+
+    def f(a):
+        return a
+        # trailing comment in f
+
+    # comment before y
+    y = [
+        1,
+        2,
+    ]
+
+    class C:
+    \tdef g(self):
+    \t\tpass
+    z = 3
+    # footer
+    """
+)
+
+
+class IncrementalParseTest(UnitTest):
+    @data_provider(
+        {
+            "replace_value": ("x = 1", "x = 2"),
+            "add_statement": ("x = 1  # one\n", "x = 1  # one\nw = 0\n"),
+            "remove_statement": ("z = 3\n", ""),
+            "edit_function_body": ("return a\n", "return a + 1\n"),
+            "indent_after_block": ("# comment before y", "    # comment before y"),
+            "new_block_captures_comment": ("x = 1  # one\n", "if x:\n    x = 1\n"),
+            "edit_inside_brackets": ("    2,\n", "    2, 3,\n"),
+            "edit_footer": ("# footer\n", "# new footer\n\n"),
+            "remove_trailing_newline": ("# footer\n", "# footer"),
+            "comment_out_statement": ("z = 3\n", "# z = 3\n"),
+            "edit_header": ("# header comment", "# -*- coding: latin-1 -*-"),
+            "edit_first_indent": (
+                "\tdef g(self):\n\t\tpass",
+                "  def g(self):\n    pass",
+            ),
+            "add_future_import": (
+                "import os\n",
+                "from __future__ import annotations\n",
+            ),
+        }
+    )
+    def test_matches_full_parse(self, old: str, new: str) -> None:
+        module = cst.parse_module(_CODE)
+        start = _CODE.index(old)
+        edit = cst.TextEdit(start, start + len(old), new)
+        new_code = _CODE.replace(old, new, 1)
+
+        updated = cst.incremental_parse(module, edit)
+        self.assertEqual(updated.code, new_code)
+        self.assertEqual(cst.Module([]).code_for_node(updated), new_code)
+        self.assertTrue(updated.deep_equals(cst.parse_module(new_code)))
+
+        # Further edits of the updated module work too.
+        again = cst.incremental_parse(updated, cst.TextEdit(0, 0, "# again\n"))
+        self.assertTrue(again.deep_equals(cst.parse_module("# again\n" + new_code)))
+        end = len(new_code)
+        again = cst.incremental_parse(updated, cst.TextEdit(end, end, "v = 4\n"))
+        self.assertTrue(again.deep_equals(cst.parse_module(new_code + "v = 4\n")))
+
+    def test_reuses_untouched_statements(self) -> None:
+        module = cst.parse_module(_CODE)
+        start = _CODE.index("2,")
+        updated = cst.incremental_parse(module, cst.TextEdit(start, start + 1, "5"))
+        self.assertEqual(len(updated.body), len(module.body))
+        reused = [old is new for old, new in zip(module.body, updated.body)]
+        self.assertEqual(reused, [True, True, True, False, True, True])
+        self.assertIs(updated.header, module.header)
+        self.assertIs(updated.footer, module.footer)
+
+    def test_region_matches(self) -> None:
+        # The code of the updated module is only reused if the parsed region
+        # generates the same code again.
+        code = "x = 1\ny = 2"
+        self.assertTrue(_region_matches(code, 0, 6, "x = 1\n", True))
+        self.assertFalse(_region_matches(code, 0, 6, "x = 2\n", True))
+        self.assertTrue(_region_matches(code, 6, None, "y = 2\n", False))
+        self.assertFalse(_region_matches(code, 6, None, "y = 2\n", True))
+        self.assertFalse(_region_matches(code, 6, None, "y = 2;\n", False))
+
+    def test_syntax_error(self) -> None:
+        module = cst.parse_module(_CODE)
+        start = _CODE.index("x = 1")
+        with self.assertRaises(cst.ParserSyntaxError):
+            cst.incremental_parse(module, cst.TextEdit(start, start, "("))
+        with self.assertRaises(cst.ParserSyntaxError):
+            cst.incremental_parse(module, cst.TextEdit(start, start, "  "))
+
+    def test_invalid_edit(self) -> None:
+        module = cst.parse_module(_CODE)
+        with self.assertRaisesRegex(ValueError, "within the module"):
+            cst.incremental_parse(module, cst.TextEdit(5, 4, ""))
+        with self.assertRaisesRegex(ValueError, "within the module"):
+            cst.incremental_parse(module, cst.TextEdit(0, len(_CODE) + 1, ""))
+
+    def test_keeps_encoding(self) -> None:
+        module = cst.parse_module(b"# -*- coding: latin-1 -*-\nx = 1\ny = '\xe9'\n")
+        start = module.code.index("= 1") + 2
+        updated = cst.incremental_parse(module, cst.TextEdit(start, start + 1, "2"))
+        self.assertEqual(updated.encoding, "iso-8859-1")
+        self.assertEqual(
+            updated.bytes, b"# -*- coding: latin-1 -*-\nx = 2\ny = '\xe9'\n"
+        )
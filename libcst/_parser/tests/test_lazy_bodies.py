@@ -0,0 +1,119 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import pickle
+from textwrap import dedent
+from typing import List
+
+import libcst as cst
+from libcst.testing.utils import data_provider, UnitTest
+
+_CONFIG = cst.PartialParserConfig(lazy_function_bodies=True)
+
+_CODE = dedent(
+    """\
+    import os
+
+    def f(a, b=(1,
+                2)):
+        x = a + b
+        if x:
+            for y in x:
+                pass
+                # nested comment
+
+        # comment after nested blocks
+    # comment after f
+
+    class C:
+        def g(self) -> None:
+            def h():
+                return 1
+            return h()
+
+        async def i(self): return 2
+
+    @decorator
+    def j(): pass
+    y = lambda: 3
+    """
+)
+
+
+class _SkipFunctionBodies(cst.CSTVisitor):
+    def __init__(self) -> None:
+        self.names: List[str] = []
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        self.names.append(node.name.value)
+        return False
+
+
+class LazyFunctionBodiesTest(UnitTest):
+    @data_provider(
+        {
+            "module": (_CODE,),
+            "no_trailing_newline": ("def f():\n    return 1",),
+            "crlf": ("def f():\r\n    if 1:\r\n        pass\r\nx = 1\r\n",),
+            "tabs": ("class C:\n\tdef f(self):\n\t\treturn 1\n\n\t# c\nx = 1\n",),
+            "no_functions": ("x = 1\n",),
+            "future_import": (
+                "from __future__ import annotations\ndef f():\n    return x\n",
+            ),
+        }
+    )
+    def test_matches_full_parse(self, code: str) -> None:
+        module = cst.parse_module(code, _CONFIG)
+        self.assertEqual(module.code, code)
+        self.assertEqual(module.code_for_node(module), code)
+        self.assertTrue(module.deep_equals(cst.parse_module(code)))
+        self.assertEqual(module.materialize().code_for_node(module), code)
+
+    def test_bodies_are_parsed_on_access(self) -> None:
+        module = cst.parse_module(_CODE, _CONFIG)
+        visitor = _SkipFunctionBodies()
+        module.visit(visitor)
+        self.assertEqual(visitor.names, ["f", "g", "i", "j"])
+        function = module.body[1]
+        self.assertIsInstance(function, cst.FunctionDef)
+        body = function.body.body
+        self.assertIsNone(body._statements)
+
+        # The code of the body is generated from its source, even after the header
+        # of the function changed.
+        renamed = function.with_changes(name=cst.Name("renamed"))
+        self.assertEqual(
+            module.code_for_node(renamed),
+            module.code_for_node(function).replace("def f", "def renamed"),
+        )
+        self.assertIsNone(body._statements)
+
+        self.assertEqual(len(body), 2)
+        self.assertIsNotNone(body._statements)
+        self.assertIsInstance(body[0], cst.SimpleStatementLine)
+
+    def test_syntax_error_in_body(self) -> None:
+        code = "def f():\n    return (\nx = 1\n"
+        with self.assertRaises(cst.ParserSyntaxError):
+            cst.parse_module(code)
+        with self.assertRaises(cst.ParserSyntaxError):
+            cst.parse_module(code, _CONFIG)
+
+        code = "def f():\n    x = = 1\ny = 1\n"
+        module = cst.parse_module(code, _CONFIG)
+        with self.assertRaises(cst.ParserSyntaxError):
+            module.materialize()
+
+    def test_pickle(self) -> None:
+        module = cst.parse_module(_CODE, _CONFIG)
+        unpickled = pickle.loads(pickle.dumps(module))
+        self.assertTrue(unpickled.deep_equals(cst.parse_module(_CODE)))
+        self.assertEqual(unpickled.code, _CODE)
+
+    def test_parse_modules(self) -> None:
+        sources = [_CODE, "def f():\n    pass\n"]
+        for code, module in zip(sources, cst.parse_modules(sources, _CONFIG)):
+            self.assertEqual(module.code, code)
+            self.assertTrue(module.deep_equals(cst.parse_module(code)))
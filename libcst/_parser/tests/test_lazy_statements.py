@@ -0,0 +1,105 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+
+import libcst as cst
+from libcst._parser.entrypoints import is_native
+from libcst.testing.utils import data_provider, UnitTest
+
+_CONFIG = cst.PartialParserConfig(lazy_statements=True)
+
+_CODE = dedent(
+    """\
+    # header comment
+    import os
+    from typing import List
+
+    def f(a: List[int]) -> int:
+        return os.sep.join(a)
+
+    class C:
+        x = 1
+    # footer
+    """
+)
+
+
+class LazyStatementsTest(UnitTest):
+    @data_provider(
+        {
+            "module": (_CODE,),
+            "no_trailing_newline": ("x = 1",),
+            "crlf": ("if x:\r\n    pass\r\ny = 1\r\n",),
+            "empty": ("",),
+            "only_comments": ("# a\n\n# b\n",),
+        }
+    )
+    def test_matches_full_parse(self, code: str) -> None:
+        module = cst.parse_module(code, _CONFIG)
+        self.assertEqual(module.code, code)
+        self.assertEqual(module.code_for_node(module), code)
+        self.assertTrue(module.deep_equals(cst.parse_module(code)))
+        self.assertEqual(module.materialize().code_for_node(module), code)
+
+    def test_statements_are_converted_on_access(self) -> None:
+        if not is_native():
+            self.skipTest("only the native parser keeps its tree")
+        module = cst.parse_module(_CODE, _CONFIG)
+        body = module.body
+        self.assertEqual(len(body), 4)
+        self.assertEqual(body._statements, [None] * 4)
+
+        # Statements after the ones that are looked at aren't converted.
+        for statement in body:
+            if not isinstance(statement, cst.SimpleStatementLine):
+                break
+        self.assertEqual(
+            [s is not None for s in body._statements], [True, True, True, False]
+        )
+        self.assertIs(body[2], body[-2])
+        self.assertEqual(body[1:3], (body[1], body[2]))
+        with self.assertRaises(IndexError):
+            body[4]
+
+        self.assertIsNotNone(body._native)
+        module.materialize()
+        self.assertIsNone(body._native)
+        self.assertTrue(module.deep_equals(cst.parse_module(_CODE)))
+
+    def test_concurrent_access(self) -> None:
+        module = cst.parse_module(_CODE, _CONFIG)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: tuple(module.body), range(8)))
+        for result in results:
+            self.assertEqual([id(s) for s in result], [id(s) for s in results[0]])
+
+    def test_intern_strings(self) -> None:
+        config = cst.PartialParserConfig(lazy_statements=True, intern_strings=True)
+        module = cst.parse_module("some_name = other_name\n", config)
+        statement = cst.ensure_type(module.body[0], cst.SimpleStatementLine)
+        assign = cst.ensure_type(statement.body[0], cst.Assign)
+        value = cst.ensure_type(assign.value, cst.Name).value
+        self.assertIs(value, sys.intern("other_name"))
+
+    def test_syntax_error(self) -> None:
+        # The whole module is still parsed up front.
+        with self.assertRaises(cst.ParserSyntaxError):
+            cst.parse_module("x = 1\ny = = 2\n", _CONFIG)
+
+    def test_pickle(self) -> None:
+        module = cst.parse_module(_CODE, _CONFIG)
+        unpickled = pickle.loads(pickle.dumps(module))
+        self.assertTrue(unpickled.deep_equals(cst.parse_module(_CODE)))
+        self.assertEqual(unpickled.code, _CODE)
+
+    def test_parse_modules(self) -> None:
+        sources = [_CODE, "x = 1\n"]
+        for code, module in zip(sources, cst.parse_modules(sources, _CONFIG)):
+            self.assertEqual(module.code, code)
+            self.assertTrue(module.deep_equals(cst.parse_module(code)))
@@ -2,13 +2,25 @@
 #
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
+import gc
+import tracemalloc
 from collections import Counter
 from textwrap import dedent
+from typing import List
 
 import libcst as cst
+from libcst._parser.entrypoints import is_native
+from libcst.metadata import PositionProvider
 from libcst.testing.utils import data_provider, UnitTest
 
 
+def _all_nodes(node: cst.CSTNode) -> List[cst.CSTNode]:
+    nodes = [node]
+    for child in node.children:
+        nodes.extend(_all_nodes(child))
+    return nodes
+
+
 class DuplicateLeafNodeTest(UnitTest):
     @data_provider(
         (
@@ -44,3 +56,113 @@ class DuplicateLeafNodeTest(UnitTest):
 
         module = cst.parse_module(dedent(code))
         module.visit(CountVisitor())
+
+    def test_node_classes(self) -> None:
+        # The native parser looks up the class of each node type once and caches
+        # it, so every node must still be an instance of its own public class.
+        code = dedent(
+            """
+            @decorator
+            async def f(a, /, b: int = 1, *args, c, **kwargs) -> None:
+                x = [a, *args]
+                y = {a: b, **kwargs}
+                z = {a, *args}
+                del x[0], y.z
+                w = (v := lambda p=1: p) if a else not b
+                async with a as b, c:
+                    await f"{a!r:>{b}} {c=}"
+                try:
+                    yield from g()
+                except (A, B) as e:
+                    raise E from e
+            class C(Base, metaclass=M):
+                x: int = 1
+            """
+        )
+        if is_native():
+            code += dedent(
+                """
+                try:
+                    pass
+                except* A:
+                    pass
+                match x:
+                    case [1, *rest] | {"k": _} if rest:
+                        pass
+                type Alias[T] = list[T]
+                """
+            )
+        module = cst.parse_module(code)
+        self.assertEqual(module.code, code)
+        for node in _all_nodes(module):
+            self.assertIs(type(node), getattr(cst, type(node).__name__))
+
+
+class InternStringsTest(UnitTest):
+    _CODE = "if x:\n    foo(a,  b)\n    foo(a, [b,  c])\n"
+
+    def test_interns_strings(self) -> None:
+        config = cst.PartialParserConfig(intern_strings=True)
+        module = cst.parse_module(self._CODE, config)
+        self.assertEqual(module.code_for_node(module), self._CODE)
+        self.assertTrue(module.deep_equals(cst.parse_module(self._CODE)))
+
+        # Every node keeps its own identity.
+        nodes = _all_nodes(module)
+        self.assertEqual(len({id(node) for node in nodes}), len(nodes))
+
+        # The values of names are shared, within and between trees.
+        names = [node for node in nodes if isinstance(node, cst.Name)]
+        self.assertIs(names[1].value, names[4].value)
+        other = cst.parse_expression("foo", config)
+        self.assertIs(cst.ensure_type(other, cst.Name).value, names[1].value)
+        # As are the values of whitespace.
+        spaces = [
+            node.value
+            for node in nodes
+            if isinstance(node, cst.SimpleWhitespace) and node.value == "  "
+        ]
+        self.assertEqual(len(spaces), 2)
+        self.assertIs(spaces[0], spaces[1])
+
+    def test_deep_replace(self) -> None:
+        module = cst.parse_module(
+            "f(a, b)\ng(c, d)\n", cst.PartialParserConfig(intern_strings=True)
+        )
+        comma = next(node for node in _all_nodes(module) if isinstance(node, cst.Comma))
+        replaced = module.deep_replace(comma, cst.Comma())
+        self.assertEqual(
+            cst.ensure_type(replaced, cst.Module).code, "f(a,b)\ng(c, d)\n"
+        )
+
+    def test_metadata_wrapper(self) -> None:
+        module = cst.parse_module(
+            self._CODE, cst.PartialParserConfig(intern_strings=True)
+        )
+        wrapper = cst.MetadataWrapper(module, unsafe_skip_copy=True)
+        positions = wrapper.resolve(PositionProvider)
+        nodes = _all_nodes(module)
+        self.assertEqual(len(positions), len(nodes))
+
+    def test_retains_less_memory(self) -> None:
+        code = "".join(
+            f"result_{i} = compute_value(argument_one, argument_two)\n"
+            for i in range(20)
+        )
+
+        def retained(config: cst.PartialParserConfig) -> int:
+            cst.parse_module(code, config)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                trees = [cst.parse_module(code, config) for _ in range(5)]
+                gc.collect()
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(len(trees), 5)
+            return size
+
+        plain = retained(cst.PartialParserConfig())
+        interned = retained(cst.PartialParserConfig(intern_strings=True))
+        self.assertLess(interned, plain * 0.95)
@@ -0,0 +1,148 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List, Union
+from unittest import mock
+
+import libcst as cst
+from libcst.testing.utils import data_provider, UnitTest
+
+_SOURCES = [
+    ("import os\n",),
+    (b"# -*- coding: latin-1 -*-\nx = '\xe9'\n",),
+    ("def foo(a, b):\n    return a + b\n",),
+    ("",),
+]
+
+
+def _entries(directory: str) -> List[Path]:
+    return sorted(Path(directory).glob("*.pickle"))
+
+
+class ParseCacheTest(UnitTest):
+    @data_provider(_SOURCES)
+    def test_matches_parse_module(self, source: Union[str, bytes]) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            expected = cst.parse_module(source)
+            for _ in range(2):
+                module = cache.parse_module(source)
+                self.assertTrue(module.deep_equals(expected))
+                self.assertEqual(module.encoding, expected.encoding)
+                self.assertEqual(module.bytes, expected.bytes)
+            self.assertEqual(len(_entries(directory)), 1)
+
+    def test_hit_skips_parsing(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            first = cache.parse_module("x = 1\n")
+            with mock.patch("libcst._parser.cache.parse_module") as parse:
+                second = cache.parse_module("x = 1\n")
+            parse.assert_not_called()
+            self.assertIsNot(first, second)
+            self.assertTrue(first.deep_equals(second))
+
+    def test_entries_do_not_store_source(self) -> None:
+        source = "x = 'a long string that would end up in the entry twice'\n"
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            cache.parse_module(source)
+            (entry,) = _entries(directory)
+            self.assertEqual(entry.read_bytes().count(b"a long string"), 1)
+            # Loaded modules get the source back, without having to generate it.
+            with mock.patch.object(cst.Module, "code_for_node") as code_for_node:
+                self.assertEqual(cache.parse_module(source).code, source)
+            code_for_node.assert_not_called()
+
+    def test_key_includes_config(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            cache.parse_module("x = 1\n")
+            cache.parse_module("x = 1\n", cst.PartialParserConfig(python_version="3.7"))
+            cache.parse_module(b"x = 1\n")
+            self.assertEqual(len(_entries(directory)), 3)
+
+    def test_key_ignores_config_repr(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            config = cst.PartialParserConfig(
+                python_version="3.7", future_imports=frozenset({"b", "a"})
+            )
+            key = cache._key("x = 1\n", config)
+            with mock.patch.object(
+                cst.PartialParserConfig, "__repr__", return_value="changed"
+            ):
+                self.assertEqual(cache._key("x = 1\n", config), key)
+            self.assertEqual(
+                cache._key(
+                    "x = 1\n",
+                    cst.PartialParserConfig(
+                        python_version="3.7", future_imports=frozenset({"a", "b"})
+                    ),
+                ),
+                key,
+            )
+            for changed in (
+                cst.PartialParserConfig(python_version="3.7"),
+                cst.PartialParserConfig(
+                    python_version="3.7",
+                    future_imports=frozenset({"a", "b"}),
+                    default_indent="\t",
+                ),
+            ):
+                self.assertNotEqual(cache._key("x = 1\n", changed), key)
+
+    def test_syntax_errors_are_not_cached(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            for _ in range(2):
+                with self.assertRaises(cst.ParserSyntaxError):
+                    cache.parse_module("x = )\n")
+            self.assertEqual(_entries(directory), [])
+
+    def test_corrupt_entry_is_reparsed(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            cache.parse_module("x = 1\n")
+            (entry,) = _entries(directory)
+            entry.write_bytes(b"not a pickle")
+            module = cst.ParseCache(directory).parse_module("x = 1\n")
+            self.assertEqual(module.code, "x = 1\n")
+            self.assertNotEqual(entry.read_bytes(), b"not a pickle")
+
+    def test_evicts_least_recently_used(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            sources = [f"x{i} = {i}\n" for i in range(3)]
+            paths = []
+            for i, source in enumerate(sources):
+                cache.parse_module(source)
+                path = cache._path(cache._key(source, cst.PartialParserConfig()))
+                os.utime(path, (1000 + i, 1000 + i))
+                paths.append(path)
+
+            # Reading the oldest entry makes the second one least recently used.
+            cache.parse_module(sources[0])
+            size = sum(path.stat().st_size for path in paths)
+
+            cache = cst.ParseCache(directory, max_size=size * 6 // 5)
+            cache.parse_module("y = 2\n")
+            remaining = _entries(directory)
+            self.assertNotIn(paths[1], remaining)
+            self.assertIn(paths[0], remaining)
+            self.assertEqual(len(remaining), 3)
+            self.assertLessEqual(
+                sum(path.stat().st_size for path in remaining), cache.max_size
+            )
+
+    def test_clear(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = cst.ParseCache(directory)
+            cache.parse_module("x = 1\n")
+            cache.clear()
+            self.assertEqual(_entries(directory), [])
@@ -178,7 +178,7 @@ class ParseErrorsTest(UnitTest):
             self.assertEqual(str(cm.exception), expected)
 
     def test_native_fallible_into_py(self) -> None:
-        with patch("libcst._nodes.expression.Name._validate") as await_validate:
-            await_validate.side_effect = CSTValidationError("validate is broken")
+        with patch("libcst._nodes.expression.Name.__post_init__") as name_post_init:
+            name_post_init.side_effect = CSTValidationError("post_init is broken")
             with self.assertRaises((SyntaxError, cst.ParserSyntaxError)):
                 cst.parse_module("foo")
@@ -0,0 +1,74 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import libcst as cst
+from libcst.testing.utils import data_provider, UnitTest
+
+
+class ParseFileTest(UnitTest):
+    @data_provider(
+        {
+            "utf8": (b"x = '\xc3\xa9'\n", "utf-8"),
+            "bom": (b"\xef\xbb\xbfx = 1\r\n", "utf-8-sig"),
+            "latin1": (b"# -*- coding: latin-1 -*-\nx = '\xe9'\n", "iso-8859-1"),
+            "empty": (b"", "utf-8"),
+        }
+    )
+    def test_parse_file(self, source: bytes, encoding: str) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "module.py"
+            path.write_bytes(source)
+            module = cst.parse_file(path)
+            self.assertEqual(cst.parse_file(os.fspath(path)).bytes, source)
+        self.assertEqual(module.encoding, encoding)
+        self.assertEqual(module.bytes, source)
+        self.assertEqual(module.code, source.decode(encoding))
+        self.assertTrue(module.deep_equals(cst.parse_module(source)))
+
+    def test_bytes_like_sources(self) -> None:
+        # The encoding cookie can follow a line that's longer than what's searched
+        # for a newline at once.
+        source = (
+            b"#!" + b"x" * 1000 + b"\n# -*- coding: latin-1 -*-\n"
+            b"def f():\n    return '\xe9'\n"
+        )
+        expected = cst.parse_module(source)
+        self.assertEqual(expected.bytes, source)
+        self.assertEqual(expected.encoding, "iso-8859-1")
+        self.assertEqual(expected.code, source.decode("latin-1"))
+        self.assertTrue(
+            cst.parse_module(memoryview(source)).deep_equals(expected),
+        )
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "module.py"
+            path.write_bytes(source)
+            with open(path, "rb") as file, mmap(
+                file.fileno(), 0, access=ACCESS_READ
+            ) as buffer:
+                module = cst.parse_module(buffer)
+        # The module doesn't refer to the closed buffer.
+        self.assertTrue(module.deep_equals(expected))
+        self.assertEqual(module.bytes, source)
+
+    def test_utf8_buffers(self) -> None:
+        source = b"def f():\n    return '\xc3\xa9'\n"
+        expected = cst.parse_module(source)
+        for buffer in (memoryview(source), memoryview(bytearray(source))):
+            self.assertTrue(cst.parse_module(buffer).deep_equals(expected))
+        # Writable buffers can change after they're parsed, which doesn't affect the
+        # module.
+        writable = bytearray(source)
+        module = cst.parse_module(writable)
+        writable[:3] = b"xyz"
+        self.assertTrue(module.deep_equals(expected))
+        self.assertEqual(module.bytes, source)
+        # Only the first two lines are decoded to detect the encoding.
+        with self.assertRaises(UnicodeDecodeError):
+            cst.parse_module(memoryview(b"x = 1\ny = 2\nz = '\xff'\n"))
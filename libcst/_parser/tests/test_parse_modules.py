@@ -0,0 +1,62 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import libcst as cst
+from libcst._parser.entrypoints import is_native
+from libcst.testing.utils import data_provider, UnitTest
+
+_SOURCES = [
+    "import os\n",
+    b"# -*- coding: latin-1 -*-\nx = '\xe9'\n",
+    "def foo(a, b):\n    return a + b\n",
+    "",
+    "class Foo:\n    pass",
+]
+
+
+class ParseModulesTest(UnitTest):
+    @data_provider({"serial": (1,), "parallel": (4,), "default": (None,)})
+    def test_matches_parse_module(self, jobs: int) -> None:
+        modules = cst.parse_modules(_SOURCES, jobs=jobs)
+        self.assertEqual(len(modules), len(_SOURCES))
+        for source, module in zip(_SOURCES, modules):
+            expected = cst.parse_module(source)
+            self.assertTrue(module.deep_equals(expected))
+            self.assertEqual(module.encoding, expected.encoding)
+            if isinstance(source, bytes):
+                self.assertEqual(module.bytes, source)
+            else:
+                self.assertEqual(module.code, source)
+
+    def test_empty(self) -> None:
+        self.assertEqual(list(cst.parse_modules([], jobs=4)), [])
+
+    def test_raises_first_error(self) -> None:
+        with self.assertRaisesRegex(cst.ParserSyntaxError, "@ 1:"):
+            cst.parse_modules(["x = 1\n", "y = )\n", "\n\nz = )\n"], jobs=2)
+
+    def test_more_sources_than_jobs(self) -> None:
+        # Sources of different sizes finish out of order on the worker threads.
+        sources = [
+            "x = 1\n" * (200 if i % 3 == 0 else 1) + f"y{i} = {i}\n" for i in range(64)
+        ]
+        modules = cst.parse_modules(sources, jobs=4)
+        self.assertEqual([module.code for module in modules], sources)
+        for source, module in zip(sources, modules):
+            self.assertTrue(module.deep_equals(cst.parse_module(source)))
+
+    def test_concurrent_parse_module(self) -> None:
+        if not is_native():
+            self.skipTest("only the native parser releases the GIL")
+        # Each call borrows its source while the GIL is released, so the calls
+        # parse at the same time.
+        sources = [f"def f{i}(a, b):\n    return a + {i}\n" * 50 for i in range(16)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            modules = list(executor.map(cst.parse_module, sources))
+        self.assertEqual([module.code for module in modules], sources)
+        for source, module in zip(sources, modules):
+            self.assertTrue(module.deep_equals(cst.parse_module(source)))
@@ -73,7 +73,9 @@ class PartialParserConfig:
     #: interpreter.
     #:
     #: If unspecified, it will default to the syntax of the running interpreter
-    #: (rounding down from among the following list).
+    #: (rounding down from among the following list). The native parser instead
+    #: accepts all of the syntax it supports, including that of newer versions, unless
+    #: a version is specified.
     #:
     #: Currently, only Python 3.0, 3.1, 3.3, 3.5, 3.6, 3.7 and 3.8 syntax is supported.
     #: The gaps did not have any syntax changes from the version prior.
@@ -100,6 +102,44 @@ class PartialParserConfig:
     #: inferred from the contents of the parsed source code by default.
     default_newline: Union[str, AutoConfig] = AutoConfig.token
 
+    #: Intern the values of :class:`~libcst.Name` nodes and of whitespace (like
+    #: indentation) with :func:`sys.intern`, so that all of the trees parsed with
+    #: this option share a single copy of each distinct name. This reduces the
+    #: memory used by trees that are kept around, e.g. by tools that analyze a whole
+    #: repository at once: the trees of LibCST's own modules retain about 10% less
+    #: memory. Only the strings are shared, never the nodes, so node identity, and
+    #: the metadata that's keyed on it, work as usual.
+    intern_strings: bool = False
+
+    #: Only parse the signatures of functions, and keep the source code of their
+    #: bodies (the statements of the :class:`~libcst.IndentedBlock` of each
+    #: :class:`~libcst.FunctionDef` that isn't nested in another function) until the
+    #: statements are first accessed, e.g. by a visitor that visits them, or until
+    #: :meth:`~libcst.Module.materialize` is called. For modules whose code is
+    #: mostly in functions, this makes parsing about twice as fast for tools that
+    #: only look at the module-level statements and signatures of a module, and
+    #: whose visitors return ``False`` from ``visit_FunctionDef`` (or from visiting
+    #: its ``body``). Since the module is tokenized an extra time to find the
+    #: bodies, it makes parsing slightly slower for other modules. The code of the
+    #: module is generated from the source of the bodies that weren't parsed, so
+    #: it's unchanged.
+    #:
+    #: Syntax errors in the body of a function are only raised once the body is
+    #: parsed.
+    lazy_function_bodies: bool = False
+
+    #: With the native parser, keep the tree that the parser built, and only convert
+    #: each statement of :attr:`Module.body <libcst.Module.body>` into python nodes
+    #: when it's first accessed, e.g. by indexing ``body`` or by iterating over it.
+    #: This saves the cost of building the nodes of the statements that are never
+    #: looked at, e.g. by tools that stop reading a module after its imports.
+    #: Visiting the module, generating code that isn't the parsed source, and
+    #: :meth:`~libcst.Module.materialize` convert every statement. Until all of
+    #: them are converted, the module keeps a copy of its source, along with the
+    #: native tree. The pure python parser, and modules parsed with
+    #: :attr:`lazy_function_bodies`, ignore this option.
+    lazy_statements: bool = False
+
     def __post_init__(self) -> None:
         raw_python_version = self.python_version
 
@@ -161,7 +201,7 @@ class PartialParserConfig:
             if f.name == "parsed_python_version":
                 continue
             value = getattr(self, f.name)
-            if not isinstance(value, AutoConfig):
+            if not isinstance(value, AutoConfig) and value != f.default:
                 init_keys.append(f"{f.name}={value!r}")
 
         return f"{self.__class__.__name__}({', '.join(init_keys)})"
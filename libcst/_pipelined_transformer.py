@@ -0,0 +1,238 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import (
+    cast,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from libcst._flatten_sentinel import FlattenSentinel
+from libcst._removal_sentinel import RemovalSentinel
+from libcst._types import CSTNodeT
+from libcst._visitors import _DispatchTable, CSTTransformer
+
+if TYPE_CHECKING:
+    from libcst._nodes.base import CSTNode  # noqa: F401
+
+_LeaveResult = Union["CSTNode", RemovalSentinel, FlattenSentinel["CSTNode"]]
+
+
+def _is_leave_only(transformer: CSTTransformer) -> bool:
+    if getattr(transformer.on_visit, "__func__", None) is not CSTTransformer.on_visit:
+        return False
+    if transformer._has_attribute_hooks:
+        return False
+    for name in dir(transformer):
+        if name.startswith("visit_"):
+            if not getattr(getattr(transformer, name), "_is_no_op", False):
+                return False
+    return True
+
+
+def _can_join_pipeline(transformer: CSTTransformer) -> bool:
+    """
+    Returns whether ``transformer`` can be fused into the traversal of the
+    transformers before it. That's the case when all of its work happens in
+    ``leave_<Type[CSTNode]>`` methods (or ``on_leave``) and it needs no metadata,
+    since any metadata would have to be computed on the tree the transformers
+    before it produce.
+    """
+    return _is_leave_only(transformer) and not (
+        transformer.get_inherited_dependencies()
+    )
+
+
+def _pipeline_stages(
+    transformers: Sequence[CSTTransformer],
+) -> Sequence[Sequence[CSTTransformer]]:
+    """
+    Splits ``transformers`` into runs that can each be performed in one traversal.
+    Every run starts with an arbitrary transformer, followed by as many transformers
+    as can join it.
+    """
+    stages: List[List[CSTTransformer]] = []
+    for transformer in transformers:
+        if stages and _can_join_pipeline(transformer):
+            stages[-1].append(transformer)
+        else:
+            stages.append([transformer])
+    return stages
+
+
+class _StageTransformer(CSTTransformer):
+    """
+    Internal transformer that visits a node with one fused transformer, reusing the
+    results in ``results`` for any subtree that the transformer has already visited.
+    """
+
+    def __init__(
+        self,
+        transformer: CSTTransformer,
+        results: MutableMapping[int, Tuple["CSTNode", _LeaveResult]],
+    ) -> None:
+        super().__init__()
+        self.transformer = transformer
+        self.results = results
+        # If the transformer doesn't override `on_leave`, it returns the node it's
+        # given for every node type without a `leave_<Type[CSTNode]>` method.
+        self.leave_funcs: Optional[_DispatchTable] = (
+            transformer._leave_funcs
+            if getattr(transformer.on_leave, "__func__", None)
+            is CSTTransformer.on_leave
+            else None
+        )
+
+    def on_visit(self, node: "CSTNode") -> bool:
+        return id(node) not in self.results
+
+    def on_leave(
+        self, original_node: "CSTNode", updated_node: "CSTNode"
+    ) -> _LeaveResult:
+        result = self.results.get(id(original_node))
+        if result is not None:
+            return result[1]
+        return self.transformer.on_leave(original_node, updated_node)
+
+
+class _PipelinedTransformer(CSTTransformer):
+    """
+    Internal transformer that runs a stage of fused transformers in one traversal.
+
+    The traversal itself is the first transformer's. Every time it leaves a node,
+    we pass what the first transformer returned to the second transformer, what
+    that returned to the third, and so on. Each transformer's results are recorded
+    by the identity of the node they replace, so that when a later transformer
+    gets to the parent node, it doesn't need to visit the children again. When
+    none of the fused transformers changed any of the children, the parent is
+    passed straight to their ``on_leave`` methods.
+    """
+
+    def __init__(self, transformers: Sequence[CSTTransformer]) -> None:
+        super().__init__()
+        self.first = transformers[0]
+        # One for each of the fused transformers after the first, each of which
+        # records that transformer's results.
+        self.rest: Sequence[_StageTransformer] = [
+            _StageTransformer(transformer, {}) for transformer in transformers[1:]
+        ]
+        # For each node that we haven't left yet, whether the first transformer
+        # visited its children, and whether any fused transformer changed them.
+        self.visited_children: List[bool] = []
+        self.changed_children: List[bool] = []
+        # What the whole stage returned for the last node we left.
+        self.result: Optional[_LeaveResult] = None
+
+    def on_visit(self, node: "CSTNode") -> bool:
+        visit_children = self.first.on_visit(node)
+        self.visited_children.append(visit_children)
+        self.changed_children.append(False)
+        return visit_children
+
+    def on_leave(
+        self, original_node: "CSTNode", updated_node: "CSTNode"
+    ) -> _LeaveResult:
+        visited_children = self.visited_children.pop()
+        changed_children = self.changed_children.pop()
+        first_result = self.first.on_leave(original_node, updated_node)
+        # We can skip visiting the children again while each fused transformer
+        # returns the node it was given, and as long as none of them changed any
+        # of its children.
+        unchanged = (
+            visited_children and not changed_children and first_result is updated_node
+        )
+        result = first_result
+        changed = False
+        for stage in self.rest:
+            if unchanged:
+                leave_funcs = stage.leave_funcs
+                if leave_funcs is not None and leave_funcs[type(result)] is None:
+                    new_result = result
+                else:
+                    # pyre-ignore[6]: `result` is always a node while it's unchanged.
+                    new_result = stage.transformer.on_leave(result, result)
+                    unchanged = new_result is result
+                stage.results[id(result)] = (result, new_result)
+            else:
+                new_result = _visit_stage_result(stage, result)
+            changed = changed or new_result is not result
+            result = new_result
+        if changed and self.changed_children:
+            self.changed_children[-1] = True
+        self.result = result
+        # The traversal builds the tree as the first transformer sees it.
+        return first_result
+
+
+def _visit_stage_result(stage: _StageTransformer, value: _LeaveResult) -> _LeaveResult:
+    """
+    Visits ``value``, which is what the transformer before ``stage`` returned, with
+    ``stage``, and records the result.
+    """
+    if isinstance(value, RemovalSentinel):
+        return value
+    if isinstance(value, FlattenSentinel):
+        nodes: List["CSTNode"] = []
+        changed = False
+        for node in value:
+            result = _visit_stage_result(stage, node)
+            changed = changed or result is not node
+            if isinstance(result, FlattenSentinel):
+                nodes.extend(result)
+            elif not isinstance(result, RemovalSentinel):
+                nodes.append(result)
+        return FlattenSentinel(nodes) if changed else value
+    result = value.visit(stage)
+    stage.results[id(value)] = (value, result)
+    return result
+
+
+def visit_pipelined(
+    node: CSTNodeT, transformers: Sequence[CSTTransformer]
+) -> Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]]:
+    """
+    Visits ``node`` with each of ``transformers`` in turn, like calling
+    :func:`~libcst.CSTNode.visit` once per transformer, but fusing as many of the
+    traversals as possible into one.
+
+    A transformer is fused into the traversal of the transformers before it if
+    it only implements ``leave_<Type[CSTNode]>`` methods (or overrides
+    :func:`~libcst.CSTTransformer.on_leave`) and has no metadata dependencies.
+    Any other transformer starts a new traversal, in which it can be followed by
+    more fused transformers.
+
+    Fused transformers receive the same ``original_node`` and ``updated_node``
+    arguments, in the same order, as they would in separate traversals: every time
+    the traversal leaves a node, the node is passed through each transformer in
+    turn. A transformer only visits the children of what the transformer before it
+    returned again if they're nodes it hasn't seen yet. The one difference is that
+    a node appearing several times (by identity) in the tree given to a fused
+    transformer is only passed to its ``on_leave`` once.
+
+    See :func:`~libcst.MetadataWrapper.visit_pipelined` to also resolve the
+    metadata that each traversal needs.
+    """
+    result: Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]] = node
+    for stage in _pipeline_stages(transformers):
+        if not isinstance(result, (RemovalSentinel, FlattenSentinel)):
+            result = _visit_stage(result, stage)
+    return result
+
+
+def _visit_stage(
+    node: CSTNodeT, stage: Sequence[CSTTransformer]
+) -> Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]]:
+    if len(stage) == 1:
+        return node.visit(stage[0])
+    pipelined = _PipelinedTransformer(stage)
+    node.visit(pipelined)
+    return cast(
+        Union[CSTNodeT, RemovalSentinel, FlattenSentinel[CSTNodeT]], pipelined.result
+    )
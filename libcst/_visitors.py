@@ -3,12 +3,18 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import TYPE_CHECKING, Union
+import weakref
+from functools import cached_property
+from typing import Dict, Optional, Tuple, Type, TYPE_CHECKING, Union
 
 from libcst._flatten_sentinel import FlattenSentinel
 from libcst._metadata_dependent import MetadataDependent
 from libcst._removal_sentinel import RemovalSentinel
-from libcst._typed_visitor import CSTTypedTransformerFunctions, CSTTypedVisitorFunctions
+from libcst._typed_visitor import (
+    CSTTypedBaseFunctions,
+    CSTTypedTransformerFunctions,
+    CSTTypedVisitorFunctions,
+)
 from libcst._types import CSTNodeT
 
 if TYPE_CHECKING:
@@ -19,6 +25,60 @@ if TYPE_CHECKING:
 CSTVisitorT = Union["CSTTransformer", "CSTVisitor"]
 
 
+# The typed visitor functions only define no-op stubs, so there's no need to look for
+# attribute hooks in them.
+_STUB_CLASSES = frozenset(
+    (CSTTypedBaseFunctions, CSTTypedVisitorFunctions, CSTTypedTransformerFunctions)
+)
+
+
+class _DispatchTable(Dict[Type["CSTNode"], Optional[str]]):
+    """
+    Maps node types to the name of a visitor's callback for them (e.g.
+    ``visit_Name``), or to ``None`` if the visitor only has the no-op stub inherited
+    from the typed visitor functions. Each node type is looked up once per visitor
+    instance, the first time it is visited, so callbacks that were set on the
+    instance or on its class before then are found.
+    """
+
+    def __init__(self, visitor: object, prefix: str) -> None:
+        super().__init__()
+        # The visitor refers to its tables, so they don't refer back to it.
+        self.visitor: object = weakref.proxy(visitor)
+        self.prefix = prefix
+
+    def __missing__(self, node_type: Type["CSTNode"]) -> Optional[str]:
+        name = f"{self.prefix}{node_type.__name__}"
+        func = getattr(self.visitor, name, None)
+        result = None if func is None or getattr(func, "_is_no_op", False) else name
+        self[node_type] = result
+        return result
+
+
+def _has_attribute_hooks(visitor: object, defaults: Tuple[object, object]) -> bool:
+    """
+    Returns whether visiting with ``visitor`` needs to call ``on_visit_attribute``
+    and ``on_leave_attribute`` at all, which is only the case if either is
+    overridden or if any ``visit_<Node>_<attribute>`` or
+    ``leave_<Node>_<attribute>`` method is something other than a no-op stub.
+    """
+    for name, default in zip(("on_visit_attribute", "on_leave_attribute"), defaults):
+        func = getattr(visitor, name)
+        if getattr(func, "__func__", func) is not default and not getattr(
+            func, "_is_no_op", False
+        ):
+            return True
+    namespaces = [vars(visitor)] + [
+        vars(cls) for cls in type(visitor).__mro__ if cls not in _STUB_CLASSES
+    ]
+    for namespace in namespaces:
+        for name in namespace:
+            if name.startswith(("visit_", "leave_")) and name.count("_") >= 2:
+                if not getattr(getattr(visitor, name), "_is_no_op", False):
+                    return True
+    return False
+
+
 class CSTTransformer(CSTTypedTransformerFunctions, MetadataDependent):
     """
     The low-level base visitor class for traversing a CST and creating an
@@ -30,8 +90,29 @@ class CSTTransformer(CSTTypedTransformerFunctions, MetadataDependent):
     When visiting nodes using a :class:`CSTTransformer`, the return value of
     :func:`~libcst.CSTNode.visit` will be a new tree with any changes made in
     :func:`~libcst.CSTTransformer.on_leave` calls reflected in its children.
+    Any node whose children were all returned unchanged is reused as-is, so the
+    new tree shares every unmodified subtree with the original tree by identity.
     """
 
+    # The tables of the callbacks for each node type, and whether
+    # `on_visit_attribute` and `on_leave_attribute` need to be called at all. These
+    # are set up the first time they're needed rather than in `__init__`, since many
+    # visitors don't call `super().__init__()`.
+
+    @cached_property
+    def _visit_funcs(self) -> _DispatchTable:
+        return _DispatchTable(self, "visit_")
+
+    @cached_property
+    def _leave_funcs(self) -> _DispatchTable:
+        return _DispatchTable(self, "leave_")
+
+    @cached_property
+    def _has_attribute_hooks(self) -> bool:
+        return _has_attribute_hooks(
+            self, (CSTTransformer.on_visit_attribute, CSTTransformer.on_leave_attribute)
+        )
+
     def on_visit(self, node: "CSTNode") -> bool:
         """
         Called every time a node is visited, before we've visited its children.
@@ -39,11 +120,10 @@ class CSTTransformer(CSTTypedTransformerFunctions, MetadataDependent):
         Returns ``True`` if children should be visited, and returns ``False``
         otherwise.
         """
-        visit_func = getattr(self, f"visit_{type(node).__name__}", None)
-        if visit_func is not None:
-            retval = visit_func(node)
-        else:
-            retval = True
+        visit_name = self._visit_funcs[type(node)]
+        if visit_name is None:
+            return True
+        retval = getattr(self, visit_name)(node)
         # Don't visit children IFF the visit function returned False.
         return False if retval is False else True
 
@@ -66,9 +146,9 @@ class CSTTransformer(CSTTypedTransformerFunctions, MetadataDependent):
         exception if this node is required. As a convenience, you can use
         :func:`RemoveFromParent` as an alias to :attr:`RemovalSentinel.REMOVE`.
         """
-        leave_func = getattr(self, f"leave_{type(original_node).__name__}", None)
-        if leave_func is not None:
-            updated_node = leave_func(original_node, updated_node)
+        leave_name = self._leave_funcs[type(original_node)]
+        if leave_name is not None:
+            updated_node = getattr(self, leave_name)(original_node, updated_node)
 
         return updated_node
 
@@ -111,6 +191,25 @@ class CSTVisitor(CSTTypedVisitorFunctions, MetadataDependent):
     :func:`~libcst.CSTNode.visit` will equal the passed in tree.
     """
 
+    # The tables of the callbacks for each node type, and whether
+    # `on_visit_attribute` and `on_leave_attribute` need to be called at all. These
+    # are set up the first time they're needed rather than in `__init__`, since many
+    # visitors don't call `super().__init__()`.
+
+    @cached_property
+    def _visit_funcs(self) -> _DispatchTable:
+        return _DispatchTable(self, "visit_")
+
+    @cached_property
+    def _leave_funcs(self) -> _DispatchTable:
+        return _DispatchTable(self, "leave_")
+
+    @cached_property
+    def _has_attribute_hooks(self) -> bool:
+        return _has_attribute_hooks(
+            self, (CSTVisitor.on_visit_attribute, CSTVisitor.on_leave_attribute)
+        )
+
     def on_visit(self, node: "CSTNode") -> bool:
         """
         Called every time a node is visited, before we've visited its children.
@@ -118,11 +217,10 @@ class CSTVisitor(CSTTypedVisitorFunctions, MetadataDependent):
         Returns ``True`` if children should be visited, and returns ``False``
         otherwise.
         """
-        visit_func = getattr(self, f"visit_{type(node).__name__}", None)
-        if visit_func is not None:
-            retval = visit_func(node)
-        else:
-            retval = True
+        visit_name = self._visit_funcs[type(node)]
+        if visit_name is None:
+            return True
+        retval = getattr(self, visit_name)(node)
         # Don't visit children IFF the visit function returned False.
         return False if retval is False else True
 
@@ -132,9 +230,9 @@ class CSTVisitor(CSTTypedVisitorFunctions, MetadataDependent):
         the :func:`~libcst.CSTVisitor.on_visit` function for this node returns
         ``False``, this function will still be called on that node.
         """
-        leave_func = getattr(self, f"leave_{type(original_node).__name__}", None)
-        if leave_func is not None:
-            leave_func(original_node)
+        leave_name = self._leave_funcs[type(original_node)]
+        if leave_name is not None:
+            getattr(self, leave_name)(original_node)
 
     def on_visit_attribute(self, node: "CSTNode", attribute: str) -> None:
         """
@@ -146,7 +146,7 @@ def _calc_node_usage(typeobj: object) -> None:
 
 for node in all_libcst_nodes:
     for field in fields(node) or []:
-        if field.name == "_metadata":
+        if field.name.startswith("_"):
             continue
 
         _calc_node_usage(field.type)
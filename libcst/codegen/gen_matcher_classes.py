@@ -419,7 +419,7 @@ def _get_fields(node: Type[cst.CSTNode]) -> Generator[Field, None, None]:
     """
 
     for field in fields(node) or []:
-        if field.name == "_metadata":
+        if field.name.startswith("_"):
             continue
 
         fieldtype, aliases = _get_clean_type_and_aliases(field.type)
@@ -447,7 +447,7 @@ generated_code.append("from typing import Literal, Optional, Sequence, Union")
 generated_code.append("import libcst as cst")
 generated_code.append("")
 generated_code.append(
-    "from libcst.matchers._matcher_base import AbstractBaseMatcherNodeMeta, BaseMatcherNode, DoNotCareSentinel, DoNotCare, TypeOf, OneOf, AllOf, DoesNotMatch, MatchIfTrue, MatchRegex, MatchMetadata, MatchMetadataIfTrue, ZeroOrMore, AtLeastN, ZeroOrOne, AtMostN, SaveMatchedNode, extract, extractall, findall, matches, replace"
+    "from libcst.matchers._matcher_base import AbstractBaseMatcherNodeMeta, BaseMatcherNode, DoNotCareSentinel, DoNotCare, TypeOf, OneOf, AllOf, DoesNotMatch, MatchIfTrue, MatchRegex, MatchMetadata, MatchMetadataIfTrue, ZeroOrMore, AtLeastN, ZeroOrOne, AtMostN, SaveMatchedNode, CompiledMatcher, compile, extract, extractall, findall, findall_many, matches, replace"
 )
 all_exports.update(
     [
@@ -467,9 +467,12 @@ all_exports.update(
         "ZeroOrOne",
         "AtMostN",
         "SaveMatchedNode",
+        "CompiledMatcher",
+        "compile",
         "extract",
         "extractall",
         "findall",
+        "findall_many",
         "matches",
         "replace",
     ]
@@ -0,0 +1,316 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import inspect
+import textwrap
+from ast import literal_eval
+from collections import defaultdict
+from dataclasses import fields
+from typing import (
+    Dict,
+    get_args,
+    get_origin,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+import libcst as cst
+from libcst.codegen.gather import all_libcst_nodes
+
+# The helpers from `libcst._nodes.internal` that `_visit_children` implementations
+# use to walk each field.
+_WALK_REQUIRED = "walk_required"
+_WALK_OPTIONAL = "walk_optional"
+_WALK_SENTINEL = "walk_sentinel"
+_WALK_SEQUENCE = "walk_sequence"
+_WALKS = {_WALK_REQUIRED, _WALK_OPTIONAL, _WALK_SENTINEL, _WALK_SEQUENCE}
+
+
+def _code(node: cst.CSTNode) -> str:
+    return cst.Module(body=()).code_for_node(node).strip()
+
+
+def _get_visit_children_body(node: Type[cst.CSTNode]) -> Sequence[cst.BaseStatement]:
+    """
+    Parse the `_visit_children` implementation of ``node``, which is the source of
+    truth for what its children are, and in which order they're visited.
+    """
+    source = textwrap.dedent(inspect.getsource(node._visit_children))
+    function = cst.ensure_type(cst.parse_module(source).body[0], cst.FunctionDef)
+    return cst.ensure_type(function.body, cst.IndentedBlock).body
+
+
+def _get_walk(statement: cst.BaseStatement) -> Optional[Tuple[str, str, str]]:
+    """
+    If ``statement`` is a call to one of the walk helpers, returns the name of the
+    helper, the name of the field it walks and the code of the walked value.
+    """
+    if not isinstance(statement, cst.SimpleStatementLine) or len(statement.body) != 1:
+        return None
+    expr = statement.body[0]
+    if not isinstance(expr, cst.Expr) or not isinstance(expr.value, cst.Call):
+        return None
+    call = expr.value
+    if not isinstance(call.func, cst.Name) or call.func.value not in _WALKS:
+        return None
+    fieldname = literal_eval(
+        cst.ensure_type(call.args[1].value, cst.SimpleString).value
+    )
+    return call.func.value, fieldname, _code(call.args[2].value)
+
+
+def _flush_children(lines: List[str], pending: List[str], indent: str) -> None:
+    """
+    Adds ``pending``, the consecutive children that are always present, to the
+    children with a single statement.
+    """
+    if len(pending) == 1 and not pending[0].startswith("*"):
+        lines.append(f"{indent}children.append({pending[0]})")
+    elif len(pending) == 1:
+        lines.append(f"{indent}children.extend({pending[0][1:]})")
+    elif pending:
+        lines.append(f"{indent}children += [{', '.join(pending)}]")
+    pending.clear()
+
+
+def _add_walk(
+    lines: List[str], pending: List[str], helper: str, value: str, indent: str
+) -> None:
+    """
+    Adds the children that a call to the walk ``helper`` with ``value`` visits.
+    """
+    if helper == _WALK_REQUIRED:
+        pending.append(value)
+    elif helper == _WALK_SEQUENCE:
+        pending.append(f"*{value}")
+    else:
+        _flush_children(lines, pending, indent)
+        if helper == _WALK_OPTIONAL:
+            lines.append(f"{indent}if {value} is not None:")
+        else:
+            lines.append(f"{indent}if not isinstance({value}, MaybeSentinel):")
+        lines.append(f"{indent}    children.append({value})")
+
+
+def _generate_children_block(
+    statements: Sequence[cst.BaseStatement], indent: str
+) -> List[str]:
+    lines: List[str] = []
+    # Consecutive children that are always present, as list display items.
+    pending: List[str] = []
+
+    for statement in statements:
+        walk = _get_walk(statement)
+        if walk is not None:
+            helper, _, value = walk
+            _add_walk(lines, pending, helper, value, indent)
+        elif isinstance(statement, cst.If):
+            _flush_children(lines, pending, indent)
+            lines.append(f"{indent}if {_code(statement.test)}:")
+            lines.extend(
+                _generate_children_block(
+                    cst.ensure_type(statement.body, cst.IndentedBlock).body,
+                    f"{indent}    ",
+                )
+            )
+            orelse = statement.orelse
+            if orelse is not None:
+                lines.append(f"{indent}else:")
+                lines.extend(
+                    _generate_children_block(
+                        cst.ensure_type(
+                            cst.ensure_type(orelse, cst.Else).body, cst.IndentedBlock
+                        ).body,
+                        f"{indent}    ",
+                    )
+                )
+        elif isinstance(statement, cst.SimpleStatementLine) and not all(
+            isinstance(small, cst.Pass) for small in statement.body
+        ):
+            # Anything else, like assigning a field to a local, is kept as-is.
+            _flush_children(lines, pending, indent)
+            lines.append(f"{indent}{_code(statement)}")
+    _flush_children(lines, pending, indent)
+    return lines or [f"{indent}pass"]
+
+
+def _generate_children(node: Type[cst.CSTNode]) -> Optional[List[str]]:
+    body = _get_visit_children_body(node)
+    # Straight-line walks over fields that are always present can be returned as
+    # a single list display.
+    walks = [
+        _get_walk(statement)
+        for statement in body
+        if not (
+            isinstance(statement, cst.SimpleStatementLine)
+            and all(isinstance(small, cst.Pass) for small in statement.body)
+        )
+    ]
+    name = node.__name__
+    signature = f"def _{name}_children(self: {name}) -> Sequence[CSTNode]:"
+    if all(walk is not None for walk in walks):
+        if not walks:
+            # A node without any children, like a leaf.
+            return None
+        if all(walk[0] in (_WALK_REQUIRED, _WALK_SEQUENCE) for walk in walks if walk):
+            items = [
+                f"*{walk[2]}" if walk[0] == _WALK_SEQUENCE else walk[2]
+                for walk in walks
+                if walk
+            ]
+            return [signature, f"    return [{', '.join(items)}]"]
+    return [
+        signature,
+        "    children: TypingList[CSTNode] = []",
+        *_generate_children_block(body, "    "),
+        "    return children",
+    ]
+
+
+def _is_primitive(typeobj: object) -> bool:
+    """
+    Whether values of this type are immutable and don't contain any nodes, so
+    `deep_clone` can reuse them.
+    """
+    if typeobj in (str, bool, int, type(None)):
+        return True
+    if isinstance(typeobj, type) and issubclass(typeobj, cst.MaybeSentinel):
+        return True
+    origin = get_origin(typeobj)
+    if origin is Literal:
+        return True
+    if origin is Union:
+        return all(_is_primitive(arg) for arg in get_args(typeobj))
+    return False
+
+
+def _generate_deep_clone(node: Type[cst.CSTNode]) -> List[str]:
+    # How each field is walked, for the fields that are walked unconditionally.
+    walked: Dict[str, str] = {}
+    for statement in _get_visit_children_body(node):
+        walk = _get_walk(statement)
+        if walk is not None and walk[2] == f"self.{walk[1]}":
+            walked[walk[1]] = walk[0]
+
+    name = node.__name__
+    lines = [f"def _{name}_deep_clone(self: {name}) -> {name}:", f"    return {name}("]
+    for field in fields(node):
+        key = field.name
+        if key[0] == "_":
+            continue
+        value = f"self.{key}"
+        helper = walked.get(key)
+        if helper == _WALK_REQUIRED:
+            clone = f"{value}.deep_clone()"
+        elif helper == _WALK_OPTIONAL:
+            clone = f"None if {value} is None else {value}.deep_clone()"
+        elif helper == _WALK_SENTINEL:
+            clone = (
+                f"{value} if isinstance({value}, MaybeSentinel) "
+                + f"else {value}.deep_clone()"
+            )
+        elif helper == _WALK_SEQUENCE:
+            clone = f"tuple([child.deep_clone() for child in {value}])"
+        elif _is_primitive(field.type):
+            clone = value
+        else:
+            clone = f"_clone_field({value})"
+        lines.append(f"        {key}={clone},")
+    lines.append("    )")
+    return lines
+
+
+def _generate_with_changes(node: Type[cst.CSTNode]) -> List[str]:
+    name = node.__name__
+    # Fields that aren't passed to the constructor keep their default value.
+    keys = [field.name for field in fields(node) if field.init]
+    arguments = "".join(f", {key}: Any = _UNCHANGED" for key in keys)
+    lines = [
+        f"def _{name}_with_changes(self: {name}{', *' if keys else ''}{arguments})"
+        + f" -> {name}:",
+        f"    return {name}(",
+    ]
+    for key in keys:
+        lines.append(f"        {key}=self.{key} if {key} is _UNCHANGED else {key},")
+    lines.append("    )")
+    return lines
+
+
+nodes: Sequence[Type[cst.CSTNode]] = [
+    node for node in all_libcst_nodes if not inspect.isabstract(node)
+]
+imports: Mapping[str, Set[str]] = defaultdict(set)
+for node in nodes:
+    imports[node.__module__].add(node.__name__)
+
+generated_code: List[str] = []
+generated_code.append("# Copyright (c) Meta Platforms, Inc. and affiliates.")
+generated_code.append("#")
+generated_code.append(
+    "# This source code is licensed under the MIT license found in the"
+)
+generated_code.append("# LICENSE file in the root directory of this source tree.")
+generated_code.append("")
+generated_code.append("")
+generated_code.append("# This file was generated by libcst.codegen.gen_node_methods")
+generated_code.append('"""')
+generated_code.append(
+    "Implementations of `children`, `deep_clone` and `with_changes` for every node"
+)
+generated_code.append(
+    "class, specialized to its fields so that they don't need to inspect them at"
+)
+generated_code.append("runtime.")
+generated_code.append('"""')
+generated_code.append("from typing import Any, List as TypingList, Sequence")
+generated_code.append("")
+generated_code.append("from libcst._maybe_sentinel import MaybeSentinel")
+generated_code.append(
+    "from libcst._nodes.base import _clone_field, _install_generated_methods, "
+    + "_UNCHANGED, CSTNode"
+)
+for module, objects in sorted(imports.items()):
+    generated_code.append(f"from {module} import (")
+    generated_code.append(f"    {', '.join(sorted(objects))}")
+    generated_code.append(")")
+
+for node in nodes:
+    generated_code.append("")
+    generated_code.append("")
+    children = _generate_children(node)
+    if children is not None:
+        generated_code.extend(children)
+        generated_code.append("")
+        generated_code.append("")
+    generated_code.extend(_generate_deep_clone(node))
+    generated_code.append("")
+    generated_code.append("")
+    generated_code.extend(_generate_with_changes(node))
+
+generated_code.append("")
+generated_code.append("")
+for node in nodes:
+    name = node.__name__
+    keys = ", ".join(f'"{field.name}"' for field in fields(node))
+    if len(fields(node)) == 1:
+        keys += ","
+    children_name = (
+        f"_{name}_children" if _generate_children(node) is not None else "None"
+    )
+    generated_code.append(
+        f"_install_generated_methods({name}, ({keys}), {children_name}, "
+        + f"_{name}_deep_clone, _{name}_with_changes)"
+    )
+
+if __name__ == "__main__":
+    # Output the code
+    print("\n".join(generated_code))
@@ -52,7 +52,7 @@ for node in sorted(nodebases.keys(), key=lambda node: node.__name__):
     )
     generated_code.append("        pass")
     for field in fields(node) or []:
-        if field.name == "_metadata":
+        if field.name.startswith("_"):
             continue
         generated_code.append("")
         generated_code.append("    @mark_no_op")
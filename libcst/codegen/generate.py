@@ -141,12 +141,60 @@ def codegen_return_types() -> None:
     print(f"Successfully generated a new {type_mapping_file} file.")
 
 
+def codegen_node_methods() -> None:
+    # Like visitors, the generated file is imported by libcst itself, so back up
+    # the original file in case the new one can't be imported.
+    base = os.path.abspath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "../")
+    )
+    methods_file = os.path.join(base, "_nodes/_node_methods.py")
+    shutil.copyfile(methods_file, f"{methods_file}.bak")
+
+    try:
+        import libcst.codegen.gen_node_methods as node_methods_codegen
+
+        new_code = clean_generated_code("\n".join(node_methods_codegen.generated_code))
+        with open(methods_file, "w") as fp:
+            fp.write(new_code)
+            fp.close()
+
+        # Now, see if the file we generated causes any import errors
+        # by attempting to run codegen again in a new process.
+        subprocess.check_call(
+            [sys.executable, "-m", "libcst.codegen.gen_node_methods"],
+            cwd=base,
+            stdout=subprocess.DEVNULL,
+        )
+
+        # If it worked, lets format the file
+        format_file(methods_file)
+
+        # Since we were successful with importing, we can remove the backup.
+        os.remove(f"{methods_file}.bak")
+
+        # Inform the user
+        print(f"Successfully generated a new {methods_file} file.")
+    except Exception:
+        # On failure, we put the original file back, and keep the failed version
+        # for developers to look at.
+        print(
+            f"Failed to generated a new {methods_file} file, failure "
+            + f"is saved in {methods_file}.failed_generate.",
+            file=sys.stderr,
+        )
+        os.rename(methods_file, f"{methods_file}.failed_generate")
+        os.rename(f"{methods_file}.bak", methods_file)
+
+        # Reraise so we can debug
+        raise
+
+
 def main(cli_args: List[str]) -> int:
     # Parse out arguments, run codegen
     parser = argparse.ArgumentParser(description="Generate code for libcst.")
     parser.add_argument(
         "system",
-        choices=["all", "visitors", "matchers", "return_types"],
+        choices=["all", "visitors", "matchers", "return_types", "node_methods"],
         help="System to generate code for.",
         type=str,
     )
@@ -155,6 +203,7 @@ def main(cli_args: List[str]) -> int:
         codegen_visitors()
         codegen_matchers()
         codegen_return_types()
+        codegen_node_methods()
         return 0
     if args.system == "visitors":
         codegen_visitors()
@@ -165,6 +214,9 @@ def main(cli_args: List[str]) -> int:
     elif args.system == "return_types":
         codegen_return_types()
         return 0
+    elif args.system == "node_methods":
+        codegen_node_methods()
+        return 0
     else:
         print(f'Invalid system "{args.system}".')
         return 1
@@ -7,6 +7,7 @@ import os
 import os.path
 
 import libcst.codegen.gen_matcher_classes as matcher_codegen
+import libcst.codegen.gen_node_methods as node_methods_codegen
 import libcst.codegen.gen_type_mapping as type_codegen
 import libcst.codegen.gen_visitor_functions as visitor_codegen
 from libcst.codegen.generate import clean_generated_code, format_file
@@ -123,3 +124,37 @@ class TestCodegenClean(UnitTest):
 
         # Now that we've done simple codegen, verify that it matches.
         self.assert_code_matches(old_code, new_code, "libcst.matchers._return_types")
+
+    def test_codegen_clean_node_methods(self) -> None:
+        """
+        Verifies that codegen of node methods would not result in a
+        changed file. If this test fails, please run 'python -m libcst.codegen.generate all'
+        to generate new files.
+        """
+        new_code = clean_generated_code("\n".join(node_methods_codegen.generated_code))
+        new_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "node_methods_codegen.deleteme.py",
+        )
+        with open(new_file, "w") as fp:
+            fp.write(new_code)
+        try:
+            format_file(new_file)
+        except Exception:
+            # We failed to format, but this is probably due to invalid code that
+            # black doesn't like. This test will still fail and report to run codegen.
+            pass
+        with open(new_file, "r") as fp:
+            new_code = fp.read()
+        os.remove(new_file)
+        with open(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "../../_nodes/_node_methods.py",
+            ),
+            "r",
+        ) as fp:
+            old_code = fp.read()
+
+        # Now that we've done simple codegen, verify that it matches.
+        self.assert_code_matches(old_code, new_code, "libcst._nodes._node_methods")
@@ -20,7 +20,7 @@ from multiprocessing import cpu_count, Pool
 from pathlib import Path
 from typing import Any, AnyStr, cast, Dict, List, Optional, Sequence, Union
 
-from libcst import parse_module, PartialParserConfig
+from libcst import parse_module, ParseCache, PartialParserConfig
 from libcst.codemod._codemod import Codemod
 from libcst.codemod._dummy_pool import DummyPool
 from libcst.codemod._runner import (
@@ -206,6 +206,7 @@ class ExecutionConfig:
     formatter_args: Sequence[str] = ()
     generated_code_marker: str = _DEFAULT_GENERATED_CODE_MARKER
     include_generated: bool = False
+    parse_cache: Optional[ParseCache] = None
     python_version: Optional[str] = None
     repo_root: Optional[str] = None
     unified_diff: Optional[int] = None
@@ -273,14 +274,15 @@ def _execute_transform(  # noqa: C901
 
         # Run the transform, bail if we failed or if we aren't formatting code
         try:
-            input_tree = parse_module(
-                oldcode,
-                config=(
-                    PartialParserConfig(python_version=str(config.python_version))
-                    if config.python_version is not None
-                    else PartialParserConfig()
-                ),
+            parser_config = (
+                PartialParserConfig(python_version=str(config.python_version))
+                if config.python_version is not None
+                else PartialParserConfig()
             )
+            if config.parse_cache is not None:
+                input_tree = config.parse_cache.parse_module(oldcode, parser_config)
+            else:
+                input_tree = parse_module(oldcode, config=parser_config)
             output_tree = transformer.transform_module(input_tree)
             newcode = output_tree.bytes
             encoding = output_tree.encoding
@@ -528,6 +530,7 @@ def parallel_exec_transform_with_prettyprint(  # noqa: C901
     blacklist_patterns: Sequence[str] = (),
     python_version: Optional[str] = None,
     repo_root: Optional[str] = None,
+    parse_cache: Optional[ParseCache] = None,
 ) -> ParallelTransformResult:
     """
     Given a list of files and an instantiated codemod we should apply to them,
@@ -540,7 +543,8 @@ def parallel_exec_transform_with_prettyprint(  # noqa: C901
     themselves will be updated with changes and formatting. If a
     ``python_version`` is provided, then we will parse each source file using
     this version. Otherwise, we will use the version of the currently executing python
-    binary.
+    binary. If a ``parse_cache`` is provided, parsed files are loaded from and stored
+    in it, which speeds up running codemods repeatedly over mostly-unchanged files.
 
     A progress indicator as well as any generated warnings will be printed to stderr.
     To supress the interactive progress indicator, set ``hide_progress`` to ``True``.
@@ -589,6 +593,7 @@ def parallel_exec_transform_with_prettyprint(  # noqa: C901
             repo_root,
             files,
             transform.get_inherited_dependencies(),
+            parse_cache=parse_cache,
         )
         metadata_manager.resolve_cache()
         transform.context = replace(
@@ -605,6 +610,7 @@ def parallel_exec_transform_with_prettyprint(  # noqa: C901
         format_code=format_code,
         formatter_args=formatter_args,
         blacklist_patterns=blacklist_patterns,
+        parse_cache=parse_cache,
         python_version=python_version,
     )
 
@@ -33,6 +33,11 @@ from libcst.helpers.node_fields import (
     is_syntax_node_field,
     is_whitespace_node_field,
 )
+from libcst.helpers.node_path import (
+    get_node_path,
+    replace_node_at_path,
+    with_changes_at_path,
+)
 
 __all__ = [
     "calculate_module_and_package",
@@ -56,4 +61,7 @@ __all__ = [
     "is_syntax_node_field",
     "is_default_node_field",
     "filter_node_fields",
+    "get_node_path",
+    "replace_node_at_path",
+    "with_changes_at_path",
 ]
@@ -19,9 +19,10 @@ if TYPE_CHECKING:
 
 def get_node_fields(node: CSTNode) -> Sequence[dataclasses.Field[CSTNode]]:
     """
-    Returns the sequence of a given CST-node's fields.
+    Returns the sequence of a given CST-node's fields, without hidden fields (those
+    prefixed with "_").
     """
-    return dataclasses.fields(node)
+    return [f for f in dataclasses.fields(node) if f.name[0] != "_"]
 
 
 def is_whitespace_node_field(node: CSTNode, field: dataclasses.Field[CSTNode]) -> bool:
@@ -0,0 +1,102 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+from typing import Any, List, Mapping, Sequence, Union
+
+import libcst as cst
+
+
+class _ChildReplacer(cst.CSTTransformer):
+    """
+    Replaces one of the immediate children of a node, without descending into any
+    of them.
+    """
+
+    def __init__(
+        self,
+        old_child: cst.CSTNode,
+        new_child: Union[
+            cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]
+        ],
+    ) -> None:
+        super().__init__()
+        self.old_child = old_child
+        self.new_child = new_child
+        self.found = False
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        return False
+
+    def on_leave(
+        self, original_node: cst.CSTNode, updated_node: cst.CSTNode
+    ) -> Union[cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]]:
+        if original_node is self.old_child:
+            self.found = True
+            return self.new_child
+        return updated_node
+
+
+def get_node_path(
+    node: cst.CSTNode, parents: Mapping[cst.CSTNode, cst.CSTNode]
+) -> Sequence[cst.CSTNode]:
+    """
+    Returns the path from the root of the tree to ``node``: the root, followed by
+    each of the ancestors of ``node`` in turn, and finally ``node`` itself.
+    ``parents`` maps nodes to their parent, as computed by
+    :class:`~libcst.metadata.ParentNodeProvider`.
+    """
+    path: List[cst.CSTNode] = [node]
+    while node in parents:
+        node = parents[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def replace_node_at_path(
+    path: Sequence[cst.CSTNode],
+    new_node: Union[cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]],
+) -> Union[cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]]:
+    """
+    Replaces the last node of ``path`` with ``new_node`` in the tree whose root is
+    the first node of ``path``, where every other node of ``path`` is the parent of
+    the next one (see :func:`get_node_path`). Returns the new root.
+
+    Only the nodes along ``path`` are rebuilt, so this takes time proportional to
+    the depth of the replaced node rather than to the size of the tree, unlike
+    :meth:`~libcst.CSTNode.deep_replace`. ``new_node`` may also be
+    :attr:`~libcst.RemoveFromParent` or a :class:`~libcst.FlattenSentinel`, which
+    behave like they do when returned from a transformer.
+
+    Raises :class:`ValueError` if a node of ``path`` isn't a child of the node
+    before it.
+    """
+    if not path:
+        raise ValueError("Expected a path with at least one node.")
+    for parent, child in zip(reversed(path[:-1]), reversed(path[1:])):
+        replacer = _ChildReplacer(child, new_node)
+        # This rebuilds the parent the same way a transformer would, so removals
+        # and flattening are handled exactly like they are there.
+        new_node = parent._visit_and_replace_children(replacer)
+        if not replacer.found:
+            raise ValueError(
+                "Expected the path to lead from each node to one of its children, "
+                + f"but {type(child).__name__} isn't a child of "
+                + f"{type(parent).__name__}."
+            )
+    return new_node
+
+
+def with_changes_at_path(
+    path: Sequence[cst.CSTNode], **changes: Any
+) -> Union[cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]]:
+    """
+    Applies :meth:`~libcst.CSTNode.with_changes` to the last node of ``path``, and
+    replaces it with the result like :func:`replace_node_at_path`. Returns the new
+    root.
+    """
+    if not path:
+        raise ValueError("Expected a path with at least one node.")
+    return replace_node_at_path(path, path[-1].with_changes(**changes))
@@ -0,0 +1,75 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from textwrap import dedent
+
+import libcst as cst
+from libcst.helpers import (
+    ensure_type,
+    get_node_path,
+    replace_node_at_path,
+    with_changes_at_path,
+)
+from libcst.metadata import MetadataWrapper, ParentNodeProvider
+from libcst.testing.utils import UnitTest
+
+_CODE = """
+    def foo(a, b):
+        return bar(a, b)
+
+    x = 1
+"""
+
+
+class NodePathTest(UnitTest):
+    def setUp(self) -> None:
+        self.wrapper = MetadataWrapper(cst.parse_module(dedent(_CODE)))
+        self.parents = self.wrapper.resolve(ParentNodeProvider)
+        module = self.wrapper.module
+        function = ensure_type(module.body[0], cst.FunctionDef)
+        statement = ensure_type(
+            ensure_type(function.body, cst.IndentedBlock).body[0],
+            cst.SimpleStatementLine,
+        )
+        self.call = ensure_type(
+            ensure_type(statement.body[0], cst.Return).value, cst.Call
+        )
+
+    def test_get_node_path(self) -> None:
+        path = get_node_path(self.call.args[1], self.parents)
+        self.assertIs(path[0], self.wrapper.module)
+        self.assertIs(path[-1], self.call.args[1])
+        for parent, child in zip(path, path[1:]):
+            self.assertIs(self.parents[child], parent)
+
+    def test_replace_node_at_path(self) -> None:
+        module = self.wrapper.module
+        path = get_node_path(self.call.func, self.parents)
+        new_module = ensure_type(
+            replace_node_at_path(path, cst.Name("baz")), cst.Module
+        )
+        self.assertEqual(
+            new_module.code, dedent(_CODE).replace("bar(a, b)", "baz(a, b)")
+        )
+        # Nodes outside of the path are reused.
+        self.assertIs(new_module.body[1], module.body[1])
+
+    def test_remove_node_at_path(self) -> None:
+        path = get_node_path(self.call.args[0], self.parents)
+        new_module = ensure_type(
+            replace_node_at_path(path, cst.RemoveFromParent()), cst.Module
+        )
+        self.assertEqual(new_module.code, dedent(_CODE).replace("bar(a, b)", "bar(b)"))
+
+    def test_with_changes_at_path(self) -> None:
+        path = get_node_path(self.call.args[0].value, self.parents)
+        new_module = ensure_type(with_changes_at_path(path, value="c"), cst.Module)
+        self.assertEqual(
+            new_module.code, dedent(_CODE).replace("bar(a, b)", "bar(c, b)")
+        )
+
+    def test_invalid_path(self) -> None:
+        with self.assertRaises(ValueError):
+            replace_node_at_path([self.wrapper.module, self.call.func], cst.Name("baz"))
@@ -17,12 +17,15 @@ from libcst.matchers._matcher_base import (
     AtLeastN,
     AtMostN,
     BaseMatcherNode,
+    compile,
+    CompiledMatcher,
     DoesNotMatch,
     DoNotCare,
     DoNotCareSentinel,
     extract,
     extractall,
     findall,
+    findall_many,
     matches,
     MatchIfTrue,
     MatchMetadata,
@@ -16142,6 +16145,7 @@ __all__ = [
     "CompIf",
     "Comparison",
     "ComparisonTarget",
+    "CompiledMatcher",
     "ConcatenatedString",
     "Continue",
     "Decorator",
@@ -16293,9 +16297,11 @@ __all__ = [
     "ZeroOrOne",
     "call_if_inside",
     "call_if_not_inside",
+    "compile",
     "extract",
     "extractall",
     "findall",
+    "findall_many",
     "leave",
     "matches",
     "replace",
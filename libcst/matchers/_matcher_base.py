@@ -7,13 +7,16 @@ import collections.abc
 import inspect
 import re
 from abc import ABCMeta
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, is_dataclass
 from enum import auto, Enum
 from typing import (
+    Any,
     Callable,
     cast,
     Dict,
+    FrozenSet,
     Generic,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -21,6 +24,7 @@ from typing import (
     Optional,
     Pattern,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -57,6 +61,8 @@ _MatcherTypeT = TypeVar("_MatcherTypeT", bound=Type["BaseMatcherNode"])
 _OtherNodeMatcherTypeT = TypeVar(
     "_OtherNodeMatcherTypeT", bound=Type["BaseMatcherNode"]
 )
+_MatcherKeyT = TypeVar("_MatcherKeyT")
+_IndexedValueT = TypeVar("_IndexedValueT")
 
 
 _METADATA_MISSING_SENTINEL = object()
@@ -1487,6 +1493,658 @@ def _matches(
         return _node_matches(node, matcher, metadata_lookup)
 
 
+_CaptureT = Dict[str, Union[libcst.CSTNode, Sequence[libcst.CSTNode]]]
+_MetadataLookupT = Callable[[meta.ProviderT, libcst.CSTNode], object]
+# pyre-ignore[33]: Compiled matchers are called with whatever value the matcher
+# they were compiled from would have been interpreted against.
+_CompiledMatchT = Callable[[Any, _MetadataLookupT], Optional[_CaptureT]]
+
+
+def _compile_matches(matcher: object) -> _CompiledMatchT:  # noqa: C901
+    # Compiled equivalent of _matches.
+    if isinstance(matcher, (OneOf, TypeOf)):
+        one_of_options = tuple(_compile_node_matches(m) for m in matcher.options)
+
+        def _match_one_of(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            if isinstance(node, MaybeSentinel):
+                return None
+            for option in one_of_options:
+                node_capture = option(node, lookup)
+                if node_capture is not None:
+                    return node_capture
+            return None
+
+        return _match_one_of
+
+    if isinstance(matcher, AllOf):
+        all_of_options = tuple(_compile_node_matches(m) for m in matcher.options)
+
+        def _match_all_of(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            if isinstance(node, MaybeSentinel):
+                return None
+            all_captures = {}
+            for option in all_of_options:
+                node_capture = option(node, lookup)
+                if node_capture is None:
+                    return None
+                all_captures.update(node_capture)
+            return all_captures
+
+        return _match_all_of
+
+    match_node = _compile_node_matches(matcher)
+    # We can't possibly match on a maybe sentinel, so it only matches if the
+    # matcher we have is a _InverseOf.
+    maybe_sentinel_capture = {} if isinstance(matcher, _InverseOf) else None
+
+    def _match(node: object, lookup: _MetadataLookupT) -> Optional[_CaptureT]:
+        if isinstance(node, MaybeSentinel):
+            return None if maybe_sentinel_capture is None else {}
+        return match_node(node, lookup)
+
+    return _match
+
+
+def _compile_node_matches(matcher: object) -> _CompiledMatchT:  # noqa: C901
+    # Compiled equivalent of _node_matches.
+    if isinstance(matcher, _InverseOf):
+        match_inverse = _compile_node_matches(matcher.matcher)
+        return lambda node, lookup: {} if match_inverse(node, lookup) is None else None
+
+    if isinstance(matcher, _ExtractMatchingNode):
+        return _compile_extract(_compile_node_matches(matcher.matcher), matcher.name)
+
+    if isinstance(matcher, MatchIfTrue):
+        func = matcher.func
+        return lambda node, lookup: {} if func(node) else None
+
+    if isinstance(matcher, (MatchMetadata, MatchMetadataIfTrue)):
+        return _compile_metadata_matches(matcher)
+
+    type_name = matcher.__class__.__name__
+    if not is_dataclass(matcher):
+        # This isn't a concrete matcher, so at best it could only match a node
+        # that happens to share its class name. Leave that to the interpreter.
+        def _match_unknown(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            if node.__class__.__name__ != type_name:
+                return None
+            # pyre-ignore[6]: We're passing through whatever we were given.
+            return _node_matches(node, matcher, lookup)
+
+        return _match_unknown
+
+    # Precompute the checks for each attribute we care about, in field order so
+    # that captures override each other in the same order as when interpreting.
+    checks: List[Tuple[Optional[str], _CompiledMatchT]] = []
+    for field in fields(matcher):
+        if field.name == "_metadata":
+            # We don't care about this field, its a dataclasses implementation detail.
+            continue
+        desired = getattr(matcher, field.name)
+        if isinstance(desired, DoNotCareSentinel):
+            # We don't care about this, so there's nothing to check.
+            continue
+        if field.name == "metadata":
+            # Special field we respect for matching metadata on a particular node.
+            checks.append((None, _compile_metadata_matches(desired)))
+        else:
+            checks.append((field.name, _compile_attribute_matches(desired)))
+
+    if not checks:
+        return lambda node, lookup: {} if node.__class__.__name__ == type_name else None
+
+    def _match_node(node: object, lookup: _MetadataLookupT) -> Optional[_CaptureT]:
+        # Check that the node and matcher classes are the same before anything else.
+        if node.__class__.__name__ != type_name:
+            return None
+        all_captures = {}
+        for attribute, check in checks:
+            value = node if attribute is None else getattr(node, attribute)
+            capture = check(value, lookup)
+            if capture is None:
+                return None
+            if capture:
+                all_captures.update(capture)
+        return all_captures
+
+    return _match_node
+
+
+def _compile_extract(match: _CompiledMatchT, name: str) -> _CompiledMatchT:
+    def _match_extract(node: object, lookup: _MetadataLookupT) -> Optional[_CaptureT]:
+        capture = match(node, lookup)
+        if capture is not None:
+            # Our own match capture comes last, since its higher in the tree
+            # so we want to override any child match captures by the same name.
+            return {**capture, name: node}
+        return None
+
+    return _match_extract
+
+
+def _compile_metadata_matches(metadata: object) -> _CompiledMatchT:  # noqa: C901
+    # Compiled equivalent of _metadata_matches.
+    if isinstance(metadata, OneOf):
+        one_of_options = tuple(_compile_metadata_matches(m) for m in metadata.options)
+
+        def _match_one_of(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            for option in one_of_options:
+                metadata_capture = option(node, lookup)
+                if metadata_capture is not None:
+                    return metadata_capture
+            return None
+
+        return _match_one_of
+
+    if isinstance(metadata, AllOf):
+        all_of_options = tuple(_compile_metadata_matches(m) for m in metadata.options)
+
+        def _match_all_of(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            all_captures = {}
+            for option in all_of_options:
+                metadata_capture = option(node, lookup)
+                if metadata_capture is None:
+                    return None
+                all_captures.update(metadata_capture)
+            return all_captures
+
+        return _match_all_of
+
+    if isinstance(metadata, _InverseOf):
+        match_inverse = _compile_metadata_matches(metadata.matcher)
+        return lambda node, lookup: {} if match_inverse(node, lookup) is None else None
+
+    if isinstance(metadata, _ExtractMatchingNode):
+        return _compile_extract(
+            _compile_metadata_matches(metadata.matcher), metadata.name
+        )
+
+    if isinstance(metadata, MatchMetadataIfTrue):
+        key = metadata.key
+        func = metadata.func
+
+        def _match_if_true(
+            node: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            # pyre-ignore[6]: This is only ever called on nodes.
+            actual_value = lookup(key, node)
+            if actual_value is _METADATA_MISSING_SENTINEL:
+                return None
+            return {} if func(actual_value) else None
+
+        return _match_if_true
+
+    if isinstance(metadata, MatchMetadata):
+        key = metadata.key
+        value = metadata.value
+
+        def _match_value(node: object, lookup: _MetadataLookupT) -> Optional[_CaptureT]:
+            # pyre-ignore[6]: This is only ever called on nodes.
+            actual_value = lookup(key, node)
+            if actual_value is _METADATA_MISSING_SENTINEL:
+                return None
+            return {} if actual_value == value else None
+
+        return _match_value
+
+    def _logic_error(node: object, lookup: _MetadataLookupT) -> NoReturn:
+        raise Exception("Logic error!")
+
+    return _logic_error
+
+
+def _compile_attribute_matches(matcher: object) -> _CompiledMatchT:  # noqa: C901
+    # Compiled equivalent of _attribute_matches.
+    if isinstance(matcher, DoNotCareSentinel):
+        # We don't care what this is, so don't penalize a non-match.
+        return lambda node, lookup: {}
+
+    if isinstance(matcher, _InverseOf):
+        match_inverse = _compile_attribute_matches(matcher.matcher)
+        return lambda node, lookup: {} if match_inverse(node, lookup) is None else None
+
+    if isinstance(matcher, _ExtractMatchingNode):
+        return _compile_extract(
+            _compile_attribute_matches(matcher.matcher), matcher.name
+        )
+
+    if isinstance(matcher, MatchIfTrue):
+        func = matcher.func
+        return lambda node, lookup: {} if func(node) else None
+
+    if matcher is None:
+        return lambda node, lookup: {} if node is None else None
+
+    if isinstance(matcher, str):
+        return lambda node, lookup: {} if node == matcher else None
+
+    if isinstance(matcher, bool):
+        return lambda node, lookup: {} if node is matcher else None
+
+    match_sequence = _compile_sequence_attribute_matches(matcher)
+    match_node = _compile_matches(matcher)
+
+    def _match(node: object, lookup: _MetadataLookupT) -> Optional[_CaptureT]:
+        # Nodes are by far the most common value here, and are never sequences,
+        # so check for them before doing the (slower) abstract sequence check.
+        if not isinstance(node, libcst.CSTNode) and isinstance(
+            node, collections.abc.Sequence
+        ):
+            return None if match_sequence is None else match_sequence(node, lookup)
+        return match_node(node, lookup)
+
+    return _match
+
+
+def _compile_sequence_attribute_matches(  # noqa: C901
+    matcher: object,
+) -> Optional[_CompiledMatchT]:
+    # Compiled equivalent of the sequence half of _attribute_matches. Returns None
+    # if the matcher can never match a sequence.
+    if isinstance(matcher, OneOf):
+        # We should compare against each of the sequences in the OneOf
+        one_of_options: List[Tuple[bool, _CompiledMatchT]] = []
+        for m in matcher.options:
+            if isinstance(m, collections.abc.Sequence):
+                one_of_options.append((False, _compile_sequence_matches(m)))
+            elif isinstance(m, MatchIfTrue):
+                func = m.func
+                one_of_options.append(
+                    (True, lambda nodes, lookup, func=func: {} if func(nodes) else None)
+                )
+
+        def _match_one_of(
+            nodes: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            for returns_directly, option in one_of_options:
+                sequence_capture = option(nodes, lookup)
+                if returns_directly or sequence_capture is not None:
+                    return sequence_capture
+            return None
+
+        return _match_one_of
+
+    if isinstance(matcher, AllOf):
+        # We should compare against each of the sequences in the AllOf. If any of
+        # them isn't a sequence, it can't match.
+        if not all(isinstance(m, collections.abc.Sequence) for m in matcher.options):
+            return None
+        all_of_options = tuple(_compile_sequence_matches(m) for m in matcher.options)
+
+        def _match_all_of(
+            nodes: object, lookup: _MetadataLookupT
+        ) -> Optional[_CaptureT]:
+            all_captures = {}
+            for option in all_of_options:
+                sequence_capture = option(nodes, lookup)
+                if sequence_capture is None:
+                    return None
+                all_captures.update(sequence_capture)
+            return all_captures
+
+        return _match_all_of
+
+    if isinstance(matcher, collections.abc.Sequence):
+        return _compile_sequence_matches(matcher)
+
+    # We exhausted our possibilities, there's no match
+    return None
+
+
+class _SequenceItemKind(Enum):
+    DO_NOT_CARE = auto()
+    AT_LEAST_N = auto()
+    AT_MOST_N = auto()
+    EXTRACT = auto()
+    NODE = auto()
+
+
+@dataclass(frozen=True)
+class _CompiledSequenceItem:
+    kind: _SequenceItemKind
+    match: Optional[_CompiledMatchT] = None
+    n: int = 0
+    name: str = ""
+    inner: Optional["_CompiledSequenceItem"] = None
+
+    def with_n(self, n: int) -> "_CompiledSequenceItem":
+        return _CompiledSequenceItem(self.kind, self.match, n)
+
+    def matches_zero_nodes(self) -> bool:
+        # Compiled equivalent of _matches_zero_nodes.
+        if self.kind is _SequenceItemKind.AT_LEAST_N:
+            return self.n == 0
+        if self.kind is _SequenceItemKind.AT_MOST_N:
+            return True
+        if self.inner is not None:
+            return self.inner.matches_zero_nodes()
+        return False
+
+
+def _compile_sequence_item(matcher: object) -> _CompiledSequenceItem:
+    if isinstance(matcher, DoNotCareSentinel):
+        return _CompiledSequenceItem(_SequenceItemKind.DO_NOT_CARE)
+    if isinstance(matcher, AtMostN):
+        return _CompiledSequenceItem(
+            _SequenceItemKind.AT_MOST_N,
+            _compile_attribute_matches(matcher.matcher),
+            matcher.n,
+        )
+    if isinstance(matcher, AtLeastN):
+        return _CompiledSequenceItem(
+            _SequenceItemKind.AT_LEAST_N,
+            _compile_attribute_matches(matcher.matcher),
+            matcher.n,
+        )
+    if isinstance(matcher, _ExtractMatchingNode):
+        return _CompiledSequenceItem(
+            _SequenceItemKind.EXTRACT,
+            name=matcher.name,
+            inner=_compile_sequence_item(matcher.matcher),
+        )
+    return _CompiledSequenceItem(_SequenceItemKind.NODE, _compile_matches(matcher))
+
+
+def _compile_sequence_matches(  # noqa: C901
+    matchers: Sequence[object],
+) -> _CompiledMatchT:
+    # Compiled equivalent of _sequence_matches, returning the sequence capture.
+    # Instead of slicing the node and matcher sequences like the interpreter does,
+    # we walk them by index. The matchers still left to match are ``head`` (which
+    # can differ from items[index - 1] when a wildcard has been partially consumed
+    # or a capture has been unwrapped) followed by items[index:].
+    items = tuple(_compile_sequence_item(m) for m in matchers)
+    item_count = len(items)
+
+    def _match_from(
+        nodes: Sequence[object],
+        position: int,
+        head: Optional[_CompiledSequenceItem],
+        index: int,
+        lookup: _MetadataLookupT,
+    ) -> Tuple[Optional[_CaptureT], object]:
+        if position == len(nodes):
+            if head is None:
+                # Base case, empty lists are always matches
+                return {}, None
+            # Base case, we have one or more matcher that wasn't matched
+            remaining = (head, *items[index:])
+            if all(item.matches_zero_nodes() for item in remaining):
+                return (
+                    {
+                        item.name: ()
+                        for item in remaining
+                        if item.kind is _SequenceItemKind.EXTRACT
+                    },
+                    (),
+                )
+            return None, None
+        if head is None:
+            # Base case, we have nodes left that don't match any matcher
+            return None, None
+
+        node = nodes[position]
+        if index < item_count:
+            next_head, next_index = items[index], index + 1
+        else:
+            next_head, next_index = None, index
+        kind = head.kind
+
+        if kind is _SequenceItemKind.DO_NOT_CARE:
+            # We don't care about the value for this node.
+            return (
+                _match_from(nodes, position + 1, next_head, next_index, lookup)[0],
+                node,
+            )
+
+        if kind is _SequenceItemKind.AT_MOST_N:
+            match = head.match
+            assert match is not None
+            if head.n > 0:
+                # First, assume that this does match a node (greedy).
+                # Consume one node since it matched this matcher.
+                attribute_capture = match(node, lookup)
+                if attribute_capture is not None:
+                    sequence_capture, matched = _match_from(
+                        nodes, position + 1, head.with_n(head.n - 1), index, lookup
+                    )
+                    if sequence_capture is not None:
+                        assert isinstance(matched, tuple)
+                        return (
+                            {**attribute_capture, **sequence_capture},
+                            (node, *matched),
+                        )
+            # Finally, assume that this does not match the current node.
+            # Consume the matcher but not the node.
+            return (
+                _match_from(nodes, position, next_head, next_index, lookup)[0],
+                (),
+            )
+
+        if kind is _SequenceItemKind.AT_LEAST_N:
+            match = head.match
+            assert match is not None
+            # Consume one node if it matches. Until we've matched N nodes we
+            # count down, afterwards we greedily keep consuming with the same N.
+            attribute_capture = match(node, lookup)
+            if attribute_capture is not None:
+                sequence_capture, matched = _match_from(
+                    nodes,
+                    position + 1,
+                    head.with_n(head.n - 1) if head.n > 0 else head,
+                    index,
+                    lookup,
+                )
+                if sequence_capture is not None:
+                    assert isinstance(matched, tuple)
+                    return (
+                        {**attribute_capture, **sequence_capture},
+                        (node, *matched),
+                    )
+            if head.n > 0:
+                # We still need to match N nodes, so we can't skip ahead.
+                return None, None
+            # Now, assume that this does not match the current node.
+            # Consume the matcher but not the node.
+            return (
+                _match_from(nodes, position, next_head, next_index, lookup)[0],
+                (),
+            )
+
+        if kind is _SequenceItemKind.EXTRACT:
+            # See if the raw matcher matches. If it does, capture the sequence we
+            # matched and store it.
+            sequence_capture, matched = _match_from(
+                nodes, position, head.inner, index, lookup
+            )
+            if sequence_capture is not None:
+                # Our own match capture comes first, since we want to allow the
+                # same name later in the sequence to override us.
+                return {head.name: matched, **sequence_capture}, matched
+            return None, None
+
+        match = head.match
+        assert match is not None
+        match_capture = match(node, lookup)
+        if match_capture is not None:
+            # These values match directly
+            sequence_capture, _ = _match_from(
+                nodes, position + 1, next_head, next_index, lookup
+            )
+            if sequence_capture is not None:
+                return {**match_capture, **sequence_capture}, node
+
+        # Failed recursive case, no match
+        return None, None
+
+    first_head = items[0] if items else None
+    first_index = 1 if items else 0
+
+    def _match(
+        nodes: Sequence[object], lookup: _MetadataLookupT
+    ) -> Optional[_CaptureT]:
+        return _match_from(nodes, 0, first_head, first_index, lookup)[0]
+
+    return _match
+
+
+class CompiledMatcher:
+    """
+    A matcher that has been lowered by :func:`compile` into a specialized
+    predicate. It can be passed anywhere the matcher it was compiled from is
+    accepted, such as :func:`matches`, :func:`extract`, :func:`findall`,
+    :func:`extractall` or :func:`replace`, and produces the same results.
+    """
+
+    __slots__ = ("_matcher", "_match")
+
+    def __init__(self, matcher: object, match: _CompiledMatchT) -> None:
+        self._matcher = matcher
+        self._match = match
+
+    @property
+    def matcher(self) -> object:
+        """
+        The matcher that this was compiled from.
+        """
+        return self._matcher
+
+    def __repr__(self) -> str:
+        return f"compile({self._matcher!r})"
+
+
+def compile(
+    matcher: Union[
+        BaseMatcherNode,
+        MatchIfTrue[libcst.CSTNode],
+        _BaseMetadataMatcher,
+        CompiledMatcher,
+    ],
+) -> CompiledMatcher:
+    """
+    Lowers a matcher into a :class:`CompiledMatcher`. Matching works by walking
+    the matcher and the node side by side, and normally every call re-inspects the
+    matcher to figure out what each part of it means. Compiling does that work once
+    up front: attributes set to :func:`DoNotCare` are dropped, node types are
+    checked before any attributes, and :class:`OneOf`/:class:`AllOf` and sequence
+    wildcards are resolved ahead of time. Compile a matcher that you are going to
+    match against many nodes, and pass the result to :func:`matches`,
+    :func:`extract`, :func:`findall`, :func:`extractall` or :func:`replace`.
+
+    Note that :func:`findall`, :func:`extractall` and :func:`replace` already
+    compile the matcher they are given once per call, as do
+    :class:`~libcst.matchers.MatcherDecoratableVisitor` and
+    :class:`~libcst.matchers.MatcherDecoratableTransformer` for their decorators.
+    Compiling an already compiled matcher returns it unchanged.
+    """
+    if isinstance(matcher, CompiledMatcher):
+        return matcher
+    return CompiledMatcher(matcher, _compile_matches(matcher))
+
+
+def _unwrap_compiled(
+    matcher: object,
+) -> Tuple[object, Optional[CompiledMatcher]]:
+    if isinstance(matcher, CompiledMatcher):
+        return matcher.matcher, matcher
+    return matcher, None
+
+
+def _get_possible_option_type_names(matcher: object) -> Optional[FrozenSet[str]]:
+    # Mirrors the checks in _node_matches, which is what each option of a
+    # OneOf/AllOf/TypeOf matcher (or a plain matcher) gets evaluated with.
+    if isinstance(matcher, _ExtractMatchingNode):
+        return _get_possible_option_type_names(matcher.matcher)
+    if isinstance(
+        matcher, (_InverseOf, MatchIfTrue, MatchMetadata, MatchMetadataIfTrue)
+    ):
+        return None
+    return frozenset((matcher.__class__.__name__,))
+
+
+def _get_possible_match_type_names(matcher: object) -> Optional[FrozenSet[str]]:
+    """
+    Returns the names of the node types that ``matcher`` could possibly match, or
+    ``None`` if it could match a node of any type.
+    """
+    if isinstance(matcher, (OneOf, TypeOf)):
+        names: Set[str] = set()
+        for option in matcher.options:
+            option_names = _get_possible_option_type_names(option)
+            if option_names is None:
+                return None
+            names.update(option_names)
+        return frozenset(names)
+    elif isinstance(matcher, AllOf):
+        all_names: Optional[FrozenSet[str]] = None
+        for option in matcher.options:
+            option_names = _get_possible_option_type_names(option)
+            if option_names is not None:
+                all_names = (
+                    option_names if all_names is None else all_names & option_names
+                )
+        return all_names
+    else:
+        return _get_possible_option_type_names(matcher)
+
+
+class _TypeIndexedMatchers(Generic[_MatcherKeyT, _IndexedValueT]):
+    """
+    A collection of matchers paired with values, indexed by the node types each
+    matcher could possibly match. This lets us skip evaluating matchers that could
+    never match a node because of its type. Each matcher is also compiled once up
+    front. Entries keep the order they were given in, since that is the order
+    decorated functions get called in.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[_MatcherKeyT, _IndexedValueT]]) -> None:
+        self._entries: List[
+            Tuple[
+                _MatcherKeyT,
+                CompiledMatcher,
+                _IndexedValueT,
+                Optional[FrozenSet[str]],
+            ]
+        ] = [
+            (
+                matcher,
+                compile(matcher),
+                value,
+                _get_possible_match_type_names(_unwrap_compiled(matcher)[0]),
+            )
+            for matcher, value in entries
+        ]
+        # Lazily filled in as we encounter new node types, since most trees only
+        # contain a small fraction of all node types.
+        self._by_type_name: Dict[
+            str, Sequence[Tuple[_MatcherKeyT, CompiledMatcher, _IndexedValueT]]
+        ] = {}
+
+    def for_node(
+        self, node: libcst.CSTNode
+    ) -> Sequence[Tuple[_MatcherKeyT, CompiledMatcher, _IndexedValueT]]:
+        type_name = type(node).__name__
+        entries = self._by_type_name.get(type_name)
+        if entries is None:
+            entries = tuple(
+                (matcher, compiled, value)
+                for matcher, compiled, value, type_names in self._entries
+                if type_names is None or type_name in type_names
+            )
+            self._by_type_name[type_name] = entries
+        return entries
+
+
 def _construct_metadata_fetcher_null() -> (
     Callable[[meta.ProviderT, libcst.CSTNode], object]
 ):
@@ -1527,7 +2185,7 @@ def _construct_metadata_fetcher_wrapper(
 
 def extract(
     node: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode],
-    matcher: BaseMatcherNode,
+    matcher: Union[BaseMatcherNode, CompiledMatcher],
     *,
     metadata_resolver: Optional[
         Union[libcst.MetadataDependent, libcst.MetadataWrapper]
@@ -1551,12 +2209,14 @@ def extract(
     or a :class:`OneOf`/:class:`AllOf` special matcher. It cannot be a
     :class:`MatchIfTrue` or a :func:`DoesNotMatch` matcher since these are redundant.
     It cannot be a :class:`AtLeastN` or :class:`AtMostN` matcher because these types are
-    wildcards which can only be used inside sequences.
+    wildcards which can only be used inside sequences. It can also be the result of
+    calling :func:`compile` on any of the above.
     """
     if isinstance(node, RemovalSentinel):
         # We can't possibly match on a removal sentinel, so it doesn't match.
         return None
-    if isinstance(matcher, (AtLeastN, AtMostN, MatchIfTrue, _BaseMetadataMatcher)):
+    raw_matcher, compiled = _unwrap_compiled(matcher)
+    if isinstance(raw_matcher, (AtLeastN, AtMostN, MatchIfTrue, _BaseMetadataMatcher)):
         # We can't match this, since these matchers are forbidden at top level.
         # These are not subclasses of BaseMatcherNode, but in the case that the
         # user is not using type checking, this should still behave correctly.
@@ -1569,12 +2229,15 @@ def extract(
     else:
         fetcher = _construct_metadata_fetcher_dependent(metadata_resolver)
 
+    if compiled is not None:
+        return compiled._match(node, fetcher)
+    # pyre-ignore[6]: We checked above that this isn't a compiled matcher.
     return _matches(node, matcher, fetcher)
 
 
 def matches(
     node: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode],
-    matcher: BaseMatcherNode,
+    matcher: Union[BaseMatcherNode, CompiledMatcher],
     *,
     metadata_resolver: Optional[
         Union[libcst.MetadataDependent, libcst.MetadataWrapper]
@@ -1591,7 +2254,8 @@ def matches(
     or a :class:`OneOf`/:class:`AllOf` special matcher. It cannot be a
     :class:`MatchIfTrue` or a :func:`DoesNotMatch` matcher since these are redundant.
     It cannot be a :class:`AtLeastN` or :class:`AtMostN` matcher because these types
-    are wildcards which can only be used inside sequences.
+    are wildcards which can only be used inside sequences. It can also be the result
+    of calling :func:`compile` on any of the above.
     """
     return extract(node, matcher, metadata_resolver=metadata_resolver) is not None
 
@@ -1599,21 +2263,10 @@ def matches(
 class _FindAllVisitor(libcst.CSTVisitor):
     def __init__(
         self,
-        matcher: Union[
-            BaseMatcherNode,
-            MatchIfTrue[libcst.CSTNode],
-            _BaseMetadataMatcher,
-            _InverseOf[
-                Union[
-                    BaseMatcherNode,
-                    MatchIfTrue[libcst.CSTNode],
-                    _BaseMetadataMatcher,
-                ]
-            ],
-        ],
+        matcher: CompiledMatcher,
         metadata_lookup: Callable[[meta.ProviderT, libcst.CSTNode], object],
     ) -> None:
-        self.matcher = matcher
+        self.match: _CompiledMatchT = matcher._match
         self.metadata_lookup = metadata_lookup
         self.found_nodes: List[libcst.CSTNode] = []
         self.extracted_nodes: List[
@@ -1621,7 +2274,7 @@ class _FindAllVisitor(libcst.CSTVisitor):
         ] = []
 
     def on_visit(self, node: libcst.CSTNode) -> bool:
-        match = _matches(node, self.matcher, self.metadata_lookup)
+        match = self.match(node, self.metadata_lookup)
         if match is not None:
             self.found_nodes.append(node)
             self.extracted_nodes.append(match)
@@ -1647,6 +2300,7 @@ def _find_or_extract_all(
                 _BaseMetadataMatcher,
             ]
         ],
+        CompiledMatcher,
     ],
     *,
     metadata_resolver: Optional[
@@ -1659,7 +2313,7 @@ def _find_or_extract_all(
     if isinstance(tree, (RemovalSentinel, MaybeSentinel)):
         # We can't possibly match on a removal sentinel, so it doesn't match.
         return [], []
-    if isinstance(matcher, (AtLeastN, AtMostN)):
+    if isinstance(_unwrap_compiled(matcher)[0], (AtLeastN, AtMostN)):
         # We can't match this, since these matchers are forbidden at top level.
         # These are not subclasses of BaseMatcherNode, but in the case that the
         # user is not using type checking, this should still behave correctly.
@@ -1676,14 +2330,19 @@ def _find_or_extract_all(
     else:
         fetcher = _construct_metadata_fetcher_dependent(metadata_resolver)
 
-    finder = _FindAllVisitor(matcher, fetcher)
+    finder = _FindAllVisitor(compile(matcher), fetcher)
     tree.visit(finder)
     return finder.found_nodes, finder.extracted_nodes
 
 
 def findall(
     tree: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode, meta.MetadataWrapper],
-    matcher: Union[BaseMatcherNode, MatchIfTrue[libcst.CSTNode], _BaseMetadataMatcher],
+    matcher: Union[
+        BaseMatcherNode,
+        MatchIfTrue[libcst.CSTNode],
+        _BaseMetadataMatcher,
+        CompiledMatcher,
+    ],
     *,
     metadata_resolver: Optional[
         Union[libcst.MetadataDependent, libcst.MetadataWrapper]
@@ -1708,7 +2367,8 @@ def findall(
     also be a :class:`MatchIfTrue` or :func:`DoesNotMatch` matcher, since we are
     traversing the tree looking for matches. It cannot be a :class:`AtLeastN` or
     :class:`AtMostN` matcher because these types are wildcards which can only be used
-    inside sequences.
+    inside sequences. It can also be the result of calling :func:`compile` on any
+    of the above.
     """
     nodes, _ = _find_or_extract_all(tree, matcher, metadata_resolver=metadata_resolver)
     return nodes
@@ -1716,7 +2376,12 @@ def findall(
 
 def extractall(
     tree: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode, meta.MetadataWrapper],
-    matcher: Union[BaseMatcherNode, MatchIfTrue[libcst.CSTNode], _BaseMetadataMatcher],
+    matcher: Union[
+        BaseMatcherNode,
+        MatchIfTrue[libcst.CSTNode],
+        _BaseMetadataMatcher,
+        CompiledMatcher,
+    ],
     *,
     metadata_resolver: Optional[
         Union[libcst.MetadataDependent, libcst.MetadataWrapper]
@@ -1743,7 +2408,8 @@ def extractall(
     also be a :class:`MatchIfTrue` or :func:`DoesNotMatch` matcher, since we are
     traversing the tree looking for matches. It cannot be a :class:`AtLeastN` or
     :class:`AtMostN` matcher because these types are wildcards which can only be usedi
-    inside sequences.
+    inside sequences. It can also be the result of calling :func:`compile` on any
+    of the above.
     """
     _, extractions = _find_or_extract_all(
         tree, matcher, metadata_resolver=metadata_resolver
@@ -1751,21 +2417,112 @@ def extractall(
     return extractions
 
 
-class _ReplaceTransformer(libcst.CSTTransformer):
+class _FindManyVisitor(libcst.CSTVisitor):
     def __init__(
         self,
-        matcher: Union[
+        matchers: _TypeIndexedMatchers[object, str],
+        metadata_lookup: Callable[[meta.ProviderT, libcst.CSTNode], object],
+        found: Dict[
+            str,
+            List[
+                Tuple[
+                    libcst.CSTNode,
+                    Dict[str, Union[libcst.CSTNode, Sequence[libcst.CSTNode]]],
+                ]
+            ],
+        ],
+    ) -> None:
+        self.matchers = matchers
+        self.metadata_lookup = metadata_lookup
+        self.found = found
+
+    def on_visit(self, node: libcst.CSTNode) -> bool:
+        for _, compiled, name in self.matchers.for_node(node):
+            match = compiled._match(node, self.metadata_lookup)
+            if match is not None:
+                self.found[name].append((node, match))
+        return True
+
+
+def findall_many(
+    matchers: Mapping[
+        str,
+        Union[
             BaseMatcherNode,
             MatchIfTrue[libcst.CSTNode],
             _BaseMetadataMatcher,
-            _InverseOf[
-                Union[
-                    BaseMatcherNode,
-                    MatchIfTrue[libcst.CSTNode],
-                    _BaseMetadataMatcher,
-                ]
-            ],
+            CompiledMatcher,
+        ],
+    ],
+    tree: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode, meta.MetadataWrapper],
+    *,
+    metadata_resolver: Optional[
+        Union[libcst.MetadataDependent, libcst.MetadataWrapper]
+    ] = None,
+) -> Dict[
+    str,
+    Sequence[
+        Tuple[
+            libcst.CSTNode,
+            Dict[str, Union[libcst.CSTNode, Sequence[libcst.CSTNode]]],
+        ]
+    ],
+]:
+    """
+    Given a mapping of names to matchers and an arbitrary node from a LibCST tree,
+    iterates over that node and all children once, matching every node against all
+    of the matchers. This is equivalent to, but much faster than, running
+    :func:`findall` and :func:`extractall` separately for each matcher, since each
+    node is only checked against the matchers that could possibly match its type.
+
+    Returns a dictionary with the same keys as ``matchers``, where each value is a
+    sequence of ``(node, extracted)`` pairs in traversal order: ``node`` is a node
+    that matched the matcher with that name, and ``extracted`` is the dictionary
+    that :func:`extract` would return for it. The tree and ``metadata_resolver``
+    are treated the same way as by :func:`findall`, and each matcher can be
+    anything that can be passed to :func:`findall`.
+    """
+    found: Dict[
+        str,
+        List[
+            Tuple[
+                libcst.CSTNode,
+                Dict[str, Union[libcst.CSTNode, Sequence[libcst.CSTNode]]],
+            ]
         ],
+    ] = {name: [] for name in matchers}
+    if isinstance(tree, (RemovalSentinel, MaybeSentinel)):
+        # We can't possibly match on a removal sentinel, so it doesn't match.
+        # pyre-ignore[7]: A list is a sequence.
+        return found
+
+    if isinstance(tree, meta.MetadataWrapper) and metadata_resolver is None:
+        # Provide a convenience for calling findall_many directly on a
+        # MetadataWrapper.
+        metadata_resolver = tree
+
+    if metadata_resolver is None:
+        fetcher = _construct_metadata_fetcher_null()
+    elif isinstance(metadata_resolver, libcst.MetadataWrapper):
+        fetcher = _construct_metadata_fetcher_wrapper(metadata_resolver)
+    else:
+        fetcher = _construct_metadata_fetcher_dependent(metadata_resolver)
+
+    indexed_matchers: _TypeIndexedMatchers[object, str] = _TypeIndexedMatchers(
+        (matcher, name)
+        for name, matcher in matchers.items()
+        # We can't match these, since these matchers are forbidden at top level.
+        if not isinstance(_unwrap_compiled(matcher)[0], (AtLeastN, AtMostN))
+    )
+    tree.visit(_FindManyVisitor(indexed_matchers, fetcher, found))
+    # pyre-ignore[7]: A list is a sequence.
+    return found
+
+
+class _ReplaceTransformer(libcst.CSTTransformer):
+    def __init__(
+        self,
+        matcher: CompiledMatcher,
         metadata_lookup: Callable[[meta.ProviderT, libcst.CSTNode], object],
         replacement: Union[
             MaybeSentinel,
@@ -1780,7 +2537,7 @@ class _ReplaceTransformer(libcst.CSTTransformer):
             ],
         ],
     ) -> None:
-        self.matcher = matcher
+        self.match: _CompiledMatchT = matcher._match
         self.metadata_lookup = metadata_lookup
         self.replacement: Callable[
             [
@@ -1835,7 +2592,7 @@ class _ReplaceTransformer(libcst.CSTTransformer):
         # but we want to do the extraction on the updated node. This is so
         # metadata works properly in matchers. So, if we get a match, we fix
         # up the nodes in the match and return that to the replacement lambda.
-        extracted = _matches(original_node, self.matcher, self.metadata_lookup)
+        extracted = self.match(original_node, self.metadata_lookup)
         if extracted is not None:
             try:
                 # Attempt to do a translation from original to updated node.
@@ -1856,7 +2613,12 @@ class _ReplaceTransformer(libcst.CSTTransformer):
 
 def replace(
     tree: Union[MaybeSentinel, RemovalSentinel, libcst.CSTNode, meta.MetadataWrapper],
-    matcher: Union[BaseMatcherNode, MatchIfTrue[libcst.CSTNode], _BaseMetadataMatcher],
+    matcher: Union[
+        BaseMatcherNode,
+        MatchIfTrue[libcst.CSTNode],
+        _BaseMetadataMatcher,
+        CompiledMatcher,
+    ],
     replacement: Union[
         MaybeSentinel,
         RemovalSentinel,
@@ -1884,9 +2646,10 @@ def replace(
     the supplied matcher with the replacement node. If you provide a callable,
     :func:`replace` will run :func:`extract` over all matched nodes and call the
     callable with both the node that should be replaced and the dictionary returned
-    by :func:`extract`. Under all circumstances a new tree is returned.
-    :func:`extract` should be viewed as a short-cut to writing a transform which
-    also returns a new tree even when no changes are applied.
+    by :func:`extract`. Like any transform, subtrees which contain no matches are
+    shared with the original tree by identity, so when no changes are applied the
+    original tree is returned. :func:`replace` should be viewed as a short-cut to
+    writing a transform.
 
     Note that the tree can also be a :class:`~libcst.RemovalSentinel` or a
     :class:`~libcst.MaybeSentinel` in order to use replace directly on transform
@@ -1904,12 +2667,13 @@ def replace(
     also be a :class:`MatchIfTrue` or :func:`DoesNotMatch` matcher, since we are
     traversing the tree looking for matches. It cannot be a :class:`AtLeastN` or
     :class:`AtMostN` matcher because these types are wildcards which can only be usedi
-    inside sequences.
+    inside sequences. It can also be the result of calling :func:`compile` on any
+    of the above.
     """
     if isinstance(tree, (RemovalSentinel, MaybeSentinel)):
         # We can't do any replacements on this, so return the tree exactly.
         return tree
-    if isinstance(matcher, (AtLeastN, AtMostN)):
+    if isinstance(_unwrap_compiled(matcher)[0], (AtLeastN, AtMostN)):
         # We can't match this, since these matchers are forbidden at top level.
         # These are not subclasses of BaseMatcherNode, but in the case that the
         # user is not using type checking, this should still behave correctly.
@@ -1931,7 +2695,7 @@ def replace(
     else:
         fetcher = _construct_metadata_fetcher_dependent(metadata_resolver)
 
-    replacer = _ReplaceTransformer(matcher, fetcher, replacement)
+    replacer = _ReplaceTransformer(compile(matcher), fetcher, replacement)
     new_tree = tree.visit(replacer)
     if isinstance(new_tree, FlattenSentinel):
         # The above transform never returns FlattenSentinel, so this isn't possible
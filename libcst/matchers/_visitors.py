@@ -29,10 +29,12 @@ from libcst.matchers._decorators import (
     VISIT_POSITIVE_MATCHER_ATTR,
 )
 from libcst.matchers._matcher_base import (
+    _TypeIndexedMatchers,
     AllOf,
     AtLeastN,
     AtMostN,
     BaseMatcherNode,
+    CompiledMatcher,
     extract,
     extractall,
     findall,
@@ -363,35 +365,31 @@ def _gather_constructed_leave_funcs(
 
 def _visit_matchers(
     matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]],
+    indexed_matchers: _TypeIndexedMatchers[BaseMatcherNode, None],
     node: cst.CSTNode,
     metadata_resolver: cst.MetadataDependent,
-) -> Dict[BaseMatcherNode, Optional[cst.CSTNode]]:
-    new_matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]] = {}
-    for matcher, existing_node in matchers.items():
+) -> None:
+    for matcher, compiled, _ in indexed_matchers.for_node(node):
         # We don't care about visiting matchers that are already true.
-        if existing_node is None and matches(
-            node, matcher, metadata_resolver=metadata_resolver
+        if matchers[matcher] is None and matches(
+            node, compiled, metadata_resolver=metadata_resolver
         ):
             # This node matches! Remember which node it was so we can
             # cancel it later.
-            new_matchers[matcher] = node
-        else:
-            new_matchers[matcher] = existing_node
-    return new_matchers
+            matchers[matcher] = node
 
 
 def _leave_matchers(
-    matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]], node: cst.CSTNode
-) -> Dict[BaseMatcherNode, Optional[cst.CSTNode]]:
-    new_matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]] = {}
-    for matcher, existing_node in matchers.items():
-        if node is existing_node:
+    matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]],
+    indexed_matchers: _TypeIndexedMatchers[BaseMatcherNode, None],
+    node: cst.CSTNode,
+) -> None:
+    # A matcher can only have been activated by this node if it could match the
+    # node's type, so there is no need to look at any other matchers.
+    for matcher, _, _ in indexed_matchers.for_node(node):
+        if matchers[matcher] is node:
             # This node matches, so we are no longer inside it.
-            new_matchers[matcher] = None
-        else:
-            # We aren't leaving this node.
-            new_matchers[matcher] = existing_node
-    return new_matchers
+            matchers[matcher] = None
 
 
 def _all_positive_matchers_true(
@@ -426,13 +424,15 @@ def _should_allow_visit(
 
 
 def _visit_constructed_funcs(
-    visit_funcs: Dict[BaseMatcherNode, Sequence[Callable[[cst.CSTNode], None]]],
+    visit_funcs: _TypeIndexedMatchers[
+        BaseMatcherNode, Sequence[Callable[[cst.CSTNode], None]]
+    ],
     all_matchers: Dict[BaseMatcherNode, Optional[cst.CSTNode]],
     node: cst.CSTNode,
     metadata_resolver: cst.MetadataDependent,
 ) -> None:
-    for matcher, visit_funcs in visit_funcs.items():
-        if matches(node, matcher, metadata_resolver=metadata_resolver):
+    for _, compiled, visit_funcs in visit_funcs.for_node(node):
+        if matches(node, compiled, metadata_resolver=metadata_resolver):
             for visit_func in visit_funcs:
                 if _should_allow_visit(all_matchers, visit_func):
                     visit_func(node)
@@ -485,13 +485,26 @@ class MatcherDecoratableTransformer(CSTTransformer):
             expected_param_count=2,
             expected_none_return=False,
         )
+        # The above tables, indexed by the node types each matcher could match so
+        # that we only evaluate the matchers that are relevant to a given node.
+        self._matchers_by_type: _TypeIndexedMatchers[
+            BaseMatcherNode, None
+        ] = _TypeIndexedMatchers((m, None) for m in self._matchers)
+        self._extra_visit_funcs_by_type: _TypeIndexedMatchers[
+            BaseMatcherNode, Sequence[Callable[[cst.CSTNode], None]]
+        ] = _TypeIndexedMatchers(self._extra_visit_funcs.items())
+        self._extra_leave_funcs_by_type = _TypeIndexedMatchers(
+            self._extra_leave_funcs.items()
+        )
 
     def on_visit(self, node: cst.CSTNode) -> bool:
         # First, evaluate any matchers that we have which we are not inside already.
-        self._matchers = _visit_matchers(self._matchers, node, self)
+        _visit_matchers(self._matchers, self._matchers_by_type, node, self)
 
         # Now, call any visitors that were hooked using a visit decorator.
-        _visit_constructed_funcs(self._extra_visit_funcs, self._matchers, node, self)
+        _visit_constructed_funcs(
+            self._extra_visit_funcs_by_type, self._matchers, node, self
+        )
 
         # Now, evaluate whether this current function has any matchers it requires.
         if not _should_allow_visit(
@@ -517,8 +530,10 @@ class MatcherDecoratableTransformer(CSTTransformer):
             retval = updated_node
 
         # Now, call any visitors that were hooked using a leave decorator.
-        for matcher, leave_funcs in reversed(list(self._extra_leave_funcs.items())):
-            if not self.matches(original_node, matcher):
+        for _, compiled, leave_funcs in reversed(
+            self._extra_leave_funcs_by_type.for_node(original_node)
+        ):
+            if not self.matches(original_node, compiled):
                 continue
             for leave_func in leave_funcs:
                 if _should_allow_visit(self._matchers, leave_func) and isinstance(
@@ -527,7 +542,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
                     retval = leave_func(original_node, retval)
 
         # Now, see if we have any matchers we should deactivate.
-        self._matchers = _leave_matchers(self._matchers, original_node)
+        _leave_matchers(self._matchers, self._matchers_by_type, original_node)
 
         # pyre-ignore The return value of on_leave is subtly wrong in that we can
         # actually return any value that passes this node's parent's constructor
@@ -558,7 +573,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
     def matches(
         self,
         node: Union[cst.MaybeSentinel, cst.RemovalSentinel, cst.CSTNode],
-        matcher: BaseMatcherNode,
+        matcher: Union[BaseMatcherNode, CompiledMatcher],
     ) -> bool:
         """
         A convenience method to call :func:`~libcst.matchers.matches` without requiring
@@ -577,6 +592,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
     ) -> Sequence[cst.CSTNode]:
         """
@@ -591,7 +607,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
     def extract(
         self,
         node: Union[cst.MaybeSentinel, cst.RemovalSentinel, cst.CSTNode],
-        matcher: BaseMatcherNode,
+        matcher: Union[BaseMatcherNode, CompiledMatcher],
     ) -> Optional[Dict[str, Union[cst.CSTNode, Sequence[cst.CSTNode]]]]:
         """
         A convenience method to call :func:`~libcst.matchers.extract` without requiring
@@ -610,6 +626,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
     ) -> Sequence[Dict[str, Union[cst.CSTNode, Sequence[cst.CSTNode]]]]:
         """
@@ -629,6 +646,7 @@ class MatcherDecoratableTransformer(CSTTransformer):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
         replacement: Union[
             cst.MaybeSentinel,
@@ -692,13 +710,26 @@ class MatcherDecoratableVisitor(CSTVisitor):
             expected_param_count=1,
             expected_none_return=True,
         )
+        # The above tables, indexed by the node types each matcher could match so
+        # that we only evaluate the matchers that are relevant to a given node.
+        self._matchers_by_type: _TypeIndexedMatchers[
+            BaseMatcherNode, None
+        ] = _TypeIndexedMatchers((m, None) for m in self._matchers)
+        self._extra_visit_funcs_by_type: _TypeIndexedMatchers[
+            BaseMatcherNode, Sequence[Callable[[cst.CSTNode], None]]
+        ] = _TypeIndexedMatchers(self._extra_visit_funcs.items())
+        self._extra_leave_funcs_by_type = _TypeIndexedMatchers(
+            self._extra_leave_funcs.items()
+        )
 
     def on_visit(self, node: cst.CSTNode) -> bool:
         # First, evaluate any matchers that we have which we are not inside already.
-        self._matchers = _visit_matchers(self._matchers, node, self)
+        _visit_matchers(self._matchers, self._matchers_by_type, node, self)
 
         # Now, call any visitors that were hooked using a visit decorator.
-        _visit_constructed_funcs(self._extra_visit_funcs, self._matchers, node, self)
+        _visit_constructed_funcs(
+            self._extra_visit_funcs_by_type, self._matchers, node, self
+        )
 
         # Now, evaluate whether this current function has a decorator on it.
         if not _should_allow_visit(
@@ -720,15 +751,17 @@ class MatcherDecoratableVisitor(CSTVisitor):
             CSTVisitor.on_leave(self, original_node)
 
         # Now, call any visitors that were hooked using a leave decorator.
-        for matcher, leave_funcs in reversed(list(self._extra_leave_funcs.items())):
-            if not self.matches(original_node, matcher):
+        for _, compiled, leave_funcs in reversed(
+            self._extra_leave_funcs_by_type.for_node(original_node)
+        ):
+            if not self.matches(original_node, compiled):
                 continue
             for leave_func in leave_funcs:
                 if _should_allow_visit(self._matchers, leave_func):
                     leave_func(original_node)
 
         # Now, see if we have any matchers we should deactivate.
-        self._matchers = _leave_matchers(self._matchers, original_node)
+        _leave_matchers(self._matchers, self._matchers_by_type, original_node)
 
     def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
         # Evaluate whether this current function has a decorator on it.
@@ -753,7 +786,7 @@ class MatcherDecoratableVisitor(CSTVisitor):
     def matches(
         self,
         node: Union[cst.MaybeSentinel, cst.RemovalSentinel, cst.CSTNode],
-        matcher: BaseMatcherNode,
+        matcher: Union[BaseMatcherNode, CompiledMatcher],
     ) -> bool:
         """
         A convenience method to call :func:`~libcst.matchers.matches` without requiring
@@ -772,6 +805,7 @@ class MatcherDecoratableVisitor(CSTVisitor):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
     ) -> Sequence[cst.CSTNode]:
         """
@@ -786,7 +820,7 @@ class MatcherDecoratableVisitor(CSTVisitor):
     def extract(
         self,
         node: Union[cst.MaybeSentinel, cst.RemovalSentinel, cst.CSTNode],
-        matcher: BaseMatcherNode,
+        matcher: Union[BaseMatcherNode, CompiledMatcher],
     ) -> Optional[Dict[str, Union[cst.CSTNode, Sequence[cst.CSTNode]]]]:
         """
         A convenience method to call :func:`~libcst.matchers.extract` without requiring
@@ -805,6 +839,7 @@ class MatcherDecoratableVisitor(CSTVisitor):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
     ) -> Sequence[Dict[str, Union[cst.CSTNode, Sequence[cst.CSTNode]]]]:
         """
@@ -824,6 +859,7 @@ class MatcherDecoratableVisitor(CSTVisitor):
             MatchIfTrue[cst.CSTNode],
             MatchMetadata,
             MatchMetadataIfTrue,
+            CompiledMatcher,
         ],
         replacement: Union[
             cst.MaybeSentinel,
@@ -0,0 +1,121 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#
+from typing import Sequence
+
+import libcst as cst
+import libcst.matchers as m
+import libcst.metadata as meta
+from libcst.matchers._matcher_base import _construct_metadata_fetcher_null, _matches
+from libcst.testing.utils import data_provider, UnitTest
+
+
+def _all_nodes(tree: cst.CSTNode) -> Sequence[cst.CSTNode]:
+    return m.findall(tree, m.MatchIfTrue(lambda node: True))
+
+
+_CODE = """
+import os
+from typing import Dict, List
+
+def foo(a, b=1, *args, c, **kwargs):
+    return bar(a, b, 1, 2, 3, key=c)
+
+class Baz(Base, metaclass=Meta):
+    x: int = 5
+    def method(self):
+        self._private(1, 2)
+        return [x for x in range(10) if x]
+"""
+
+
+class MatchersCompileTest(UnitTest):
+    @data_provider(
+        (
+            (m.Name(),),
+            (m.Name("foo"),),
+            (m.Name(m.MatchRegex("_.*")) | m.Integer(),),
+            (m.TypeOf(m.Name, m.Integer)(),),
+            (m.Name() & m.DoesNotMatch(m.Name("self")),),
+            (m.DoesNotMatch(m.Name()),),
+            (m.SaveMatchedNode(m.Call(), "call"),),
+            (m.Call(func=m.Name() | m.Attribute(value=m.Name("self"))),),
+            (m.Call(args=[m.ZeroOrMore(), m.Arg(keyword=m.Name())]),),
+            (m.Call(args=[m.AtLeastN(n=2), m.ZeroOrOne(m.Arg(m.Integer()))]),),
+            (m.Call(args=[m.AtMostN(m.Arg(m.Name()), n=2), m.ZeroOrMore()]),),
+            (
+                m.Call(
+                    args=[
+                        m.SaveMatchedNode(m.ZeroOrMore(m.Arg(m.Name())), "names"),
+                        m.SaveMatchedNode(m.AtLeastN(m.Arg(m.Integer()), n=1), "ints"),
+                        m.DoNotCare(),
+                    ]
+                ),
+            ),
+            (m.Call(args=m.OneOf([m.DoNotCare()], [m.DoNotCare(), m.DoNotCare()])),),
+            (m.Call(args=m.AllOf([m.ZeroOrMore()], [m.Arg(), m.ZeroOrMore()])),),
+            (m.ClassDef(bases=m.MatchIfTrue(lambda bases: len(bases) == 2)),),
+            (m.Param(default=None),),
+            (m.Param(default=m.DoesNotMatch(None)),),
+            (m.FunctionDef(asynchronous=None, body=m.IndentedBlock()),),
+            (m.Return(value=m.SaveMatchedNode(m.DoesNotMatch(m.Name()), "value")),),
+        )
+    )
+    def test_compiled_matches_interpreted(self, matcher: m.BaseMatcherNode) -> None:
+        compiled = m.compile(matcher)
+        fetcher = _construct_metadata_fetcher_null()
+        for node in _all_nodes(cst.parse_module(_CODE)):
+            self.assertEqual(
+                m.extract(node, compiled), _matches(node, matcher, fetcher)
+            )
+
+    def test_compile_is_idempotent(self) -> None:
+        matcher = m.Name()
+        compiled = m.compile(matcher)
+        self.assertIs(m.compile(compiled), compiled)
+        self.assertIs(compiled.matcher, matcher)
+
+    def test_compiled_sentinels(self) -> None:
+        compiled = m.compile(m.Name())
+        self.assertFalse(m.matches(cst.RemovalSentinel.REMOVE, compiled))
+        self.assertFalse(m.matches(cst.MaybeSentinel.DEFAULT, compiled))
+        self.assertTrue(
+            m.matches(cst.MaybeSentinel.DEFAULT, m.compile(m.DoesNotMatch(m.Name())))
+        )
+
+    def test_compiled_wildcard_at_top_level(self) -> None:
+        module = cst.parse_module(_CODE)
+        compiled = m.compile(m.ZeroOrMore())
+        self.assertFalse(m.matches(module, compiled))
+        self.assertEqual(m.findall(module, compiled), [])
+
+    def test_compiled_findall_and_replace(self) -> None:
+        module = cst.parse_module("a = b + c\n")
+        compiled = m.compile(m.Name())
+        self.assertEqual(
+            [node.value for node in m.findall(module, compiled)], ["a", "b", "c"]
+        )
+        new_module = m.replace(
+            module,
+            compiled,
+            lambda node, _: cst.ensure_type(node, cst.Name).with_changes(
+                value=cst.ensure_type(node, cst.Name).value.upper()
+            ),
+        )
+        self.assertEqual(cst.ensure_type(new_module, cst.Module).code, "A = B + C\n")
+
+    def test_compiled_metadata(self) -> None:
+        wrapper = meta.MetadataWrapper(cst.parse_module("a = 1\nb = a\n"))
+        compiled = m.compile(
+            m.Name(
+                metadata=m.MatchMetadata(
+                    meta.ExpressionContextProvider, meta.ExpressionContext.STORE
+                )
+            )
+        )
+        names = m.findall(wrapper, compiled)
+        self.assertEqual(
+            [cst.ensure_type(node, cst.Name).value for node in names], ["a", "b"]
+        )
@@ -10,7 +10,7 @@ from typing import Optional, Sequence
 import libcst as cst
 import libcst.matchers as m
 import libcst.metadata as meta
-from libcst.matchers import extractall, findall
+from libcst.matchers import extractall, findall, findall_many
 from libcst.testing.utils import UnitTest
 
 
@@ -209,3 +209,80 @@ class MatchersExtractAllTest(UnitTest):
             matches,
             [{"expr": extracted_args[1].value}, {"expr": extracted_args[2].value}],
         )
+
+
+class MatchersFindAllManyTest(UnitTest):
+    def test_findall_many_with_sentinels(self) -> None:
+        self.assertEqual(
+            findall_many({"name": m.Name()}, cst.RemovalSentinel.REMOVE),
+            {"name": []},
+        )
+        self.assertEqual(
+            findall_many({"name": m.Name()}, cst.MaybeSentinel.DEFAULT),
+            {"name": []},
+        )
+
+    def test_findall_many_matches_findall_and_extractall(self) -> None:
+        module = cst.parse_module(
+            dedent(
+                """
+                a = 1
+                b = foo(a, 2)
+                if b:
+                    c = bar(b, self.x)
+                """
+            )
+        )
+        matchers = {
+            "names": m.Name(),
+            "calls": m.Call(func=m.SaveMatchedNode(m.Name(), "func")),
+            "not_names": m.Arg(m.SaveMatchedNode(~m.Name(), "expr")),
+            "anything": m.MatchIfTrue(lambda node: isinstance(node, cst.If)),
+            "compiled": m.compile(m.Integer() | m.Attribute()),
+            "wildcard": m.ZeroOrMore(),
+        }
+        results = findall_many(matchers, module)
+        self.assertEqual(list(results), list(matchers))
+        for name, matcher in matchers.items():
+            self.assertEqual(
+                [node for node, _ in results[name]], findall(module, matcher)
+            )
+            self.assertEqual(
+                [captures for _, captures in results[name]],
+                extractall(module, matcher),
+            )
+        self.assertEqual(len(results["names"]), 10)
+        self.assertEqual(results["wildcard"], [])
+
+    def test_findall_many_shared_matcher(self) -> None:
+        matcher = m.Name("a")
+        results = findall_many(
+            {"first": matcher, "second": matcher}, cst.parse_expression("a + a")
+        )
+        self.assertEqual(len(results["first"]), 2)
+        self.assertEqual(results["first"], results["second"])
+
+    def test_findall_many_with_metadata_wrapper(self) -> None:
+        wrapper = meta.MetadataWrapper(cst.parse_module("a = 1\nb = a\n"))
+        results = findall_many(
+            {
+                "stores": m.Name(
+                    metadata=m.MatchMetadata(
+                        meta.ExpressionContextProvider, meta.ExpressionContext.STORE
+                    )
+                ),
+                "loads": m.Name(
+                    metadata=m.MatchMetadata(
+                        meta.ExpressionContextProvider, meta.ExpressionContext.LOAD
+                    )
+                ),
+            },
+            wrapper,
+        )
+        self.assertEqual(
+            {
+                name: [cst.ensure_type(node, cst.Name).value for node, _ in found]
+                for name, found in results.items()
+            },
+            {"stores": ["a", "b"], "loads": ["a"]},
+        )
@@ -46,10 +46,8 @@ class MatchersReplaceTest(UnitTest):
             m.replace(original, m.Name("True") | m.Name("False"), _swap_bools),
             cst.Module,
         )
-        # Should be identical tree contents
-        self.assertTrue(original.deep_equals(replaced))
-        # However, should be a new tree by identity
-        self.assertNotEqual(id(original), id(replaced))
+        # Nothing changed, so the original tree should be returned by identity
+        self.assertIs(original, replaced)
 
     def test_replace_simple(self) -> None:
         # Verify behavior when there's a static node as a replacement
@@ -4,18 +4,20 @@
 # LICENSE file in the root directory of this source tree.
 
 import pickle
-from typing import Union
+from typing import FrozenSet, List, Optional, Union
 
 import libcst as cst
 import libcst.matchers as m
 from libcst.matchers import (
+    call_if_inside,
     leave,
     MatchDecoratorMismatch,
     MatcherDecoratableTransformer,
     MatcherDecoratableVisitor,
     visit,
 )
-from libcst.testing.utils import UnitTest
+from libcst.matchers._matcher_base import _get_possible_match_type_names
+from libcst.testing.utils import data_provider, UnitTest
 
 
 class MatchersVisitLeaveDecoratorTypingTest(UnitTest):
@@ -508,3 +510,66 @@ class MatchersVisitLeaveDecoratorTypingTest(UnitTest):
         unserialized = pickle.loads(serialized)
         self.assertEqual(original.message, unserialized.message)
         self.assertEqual(original.func, unserialized.func)
+
+
+class MatchersTypeIndexTest(UnitTest):
+    @data_provider(
+        (
+            (m.Name(), frozenset({"Name"})),
+            (m.Name() | m.Attribute(), frozenset({"Name", "Attribute"})),
+            (m.TypeOf(m.Name, m.Attribute)(), frozenset({"Name", "Attribute"})),
+            (m.Name() & m.Name(value="x"), frozenset({"Name"})),
+            (m.Name() & m.Attribute(), frozenset()),
+            (m.Name() & m.DoesNotMatch(m.Name(value="x")), frozenset({"Name"})),
+            (m.SaveMatchedNode(m.Call(), "call"), frozenset({"Call"})),
+            (m.DoesNotMatch(m.Name()), None),
+            (m.MatchIfTrue(lambda node: True), None),
+            (m.Name() | m.MatchIfTrue(lambda node: True), None),
+        )
+    )
+    def test_possible_match_type_names(
+        self, matcher: object, expected: Optional[FrozenSet[str]]
+    ) -> None:
+        self.assertEqual(_get_possible_match_type_names(matcher), expected)
+
+    def test_decorators_only_evaluated_for_matching_types(self) -> None:
+        class TestVisitor(MatcherDecoratableVisitor):
+            def __init__(self) -> None:
+                super().__init__()
+                self.calls: List[str] = []
+
+            @visit(m.Name() | m.SimpleString())
+            def _visit_name_or_string(
+                self, node: Union[cst.Name, cst.SimpleString]
+            ) -> None:
+                self.calls.append(f"visit {cst.Module([]).code_for_node(node)}")
+
+            @leave(m.SimpleString())
+            def _leave_string(self, original_node: cst.SimpleString) -> None:
+                self.calls.append("leave string")
+
+            @leave(m.Name() | m.SimpleString())
+            def _leave_name_or_string(
+                self, original_node: Union[cst.Name, cst.SimpleString]
+            ) -> None:
+                self.calls.append("leave name or string")
+
+            @call_if_inside(m.DoesNotMatch(m.Name()))
+            def visit_Integer(self, node: cst.Integer) -> None:
+                self.calls.append("integer")
+
+        visitor = TestVisitor()
+        cst.parse_module('a = "b"\nc = 1\n').visit(visitor)
+        self.assertEqual(
+            visitor.calls,
+            [
+                "visit a",
+                "leave name or string",
+                'visit "b"',
+                "leave string",
+                "leave name or string",
+                "visit c",
+                "leave name or string",
+                "integer",
+            ],
+        )
@@ -5,7 +5,7 @@
 
 
 from pathlib import Path
-from typing import Collection, Dict, List, Mapping, TYPE_CHECKING
+from typing import Collection, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 import libcst as cst
 from libcst._types import StrPath
@@ -22,6 +22,7 @@ class FullRepoManager:
         paths: Collection[str],
         providers: Collection["ProviderT"],
         timeout: int = 5,
+        parse_cache: Optional[cst.ParseCache] = None,
     ) -> None:
         """
         Given project root directory with pyre and watchman setup, :class:`~libcst.metadata.FullRepoManager`
@@ -34,12 +35,16 @@ class FullRepoManager:
             :class:`~libcst.metadata.FullyQualifiedNameProvider`.
         :param timeout: number of seconds. Raises `TimeoutExpired <https://docs.python.org/3/library/subprocess.html#subprocess.TimeoutExpired>`_
             when timeout.
+        :param parse_cache: an optional :class:`~libcst.ParseCache` used by
+            :meth:`~FullRepoManager.get_metadata_wrapper_for_path` to avoid reparsing
+            files that have been parsed before.
         """
         self.root_path: Path = Path(repo_root_dir)
         self._cache: Dict["ProviderT", Mapping[str, object]] = {}
         self._timeout = timeout
         self._providers = providers
         self._paths: List[str] = list(paths)
+        self._parse_cache = parse_cache
 
     @property
     def cache(self) -> Dict["ProviderT", Mapping[str, object]]:
@@ -105,6 +110,11 @@ class FullRepoManager:
             manager = FullRepoManager(".", {"a.py", "b.py"}, {TypeInferenceProvider})
             wrapper = manager.get_metadata_wrapper_for_path("a.py")
         """
-        module = cst.parse_module((self.root_path / path).read_text())
+        source = (self.root_path / path).read_text()
+        parse_cache = self._parse_cache
+        if parse_cache is not None:
+            module = parse_cache.parse_module(source)
+        else:
+            module = cst.parse_module(source)
         cache = self.get_cache_for_path(path)
         return MetadataWrapper(module, True, cache)
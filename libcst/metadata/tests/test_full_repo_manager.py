@@ -5,8 +5,10 @@
 
 import json
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
+from libcst import ParseCache
 from libcst.metadata.full_repo_manager import FullRepoManager
 from libcst.metadata.tests.test_type_inference_provider import _test_simple_class_helper
 from libcst.metadata.type_inference_provider import TypeInferenceProvider
@@ -35,6 +37,25 @@ class FullRepoManagerTest(UnitTest):
         wrapper = manager.get_metadata_wrapper_for_path(path)
         _test_simple_class_helper(self, wrapper)
 
+    @patch.object(TypeInferenceProvider, "gen_cache")
+    def test_get_metadata_wrapper_with_parse_cache(self, gen_cache: Mock) -> None:
+        path_prefix = "tests/pyre/simple_class"
+        path = f"{path_prefix}.py"
+        gen_cache.return_value = {
+            path: json.loads((Path(REPO_ROOT_DIR) / f"{path_prefix}.json").read_text())
+        }
+        with TemporaryDirectory() as directory:
+            manager = FullRepoManager(
+                REPO_ROOT_DIR,
+                [path],
+                [TypeInferenceProvider],
+                parse_cache=ParseCache(directory),
+            )
+            # The second wrapper is built from the tree stored by the first call.
+            for _ in range(2):
+                wrapper = manager.get_metadata_wrapper_for_path(path)
+                _test_simple_class_helper(self, wrapper)
+
     @patch.object(TypeInferenceProvider, "gen_cache")
     def test_get_metadata_wrapper_with_invalid_path(self, gen_cache: Mock) -> None:
         path = "tests/pyre/simple_class.py"
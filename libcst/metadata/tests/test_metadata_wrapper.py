@@ -4,7 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 
-from typing import Optional
+from typing import Iterator, Optional
 from unittest.mock import Mock
 
 import libcst as cst
@@ -16,6 +16,12 @@ from libcst.metadata import (
 from libcst.testing.utils import UnitTest
 
 
+def _all_nodes(node: cst.CSTNode) -> Iterator[cst.CSTNode]:
+    yield node
+    for child in node.children:
+        yield from _all_nodes(child)
+
+
 class MetadataWrapperTest(UnitTest):
     def test_copies_tree(self) -> None:
         m = cst.parse_module("pass")
@@ -23,6 +29,57 @@ class MetadataWrapperTest(UnitTest):
         self.assertTrue(mw.module.deep_equals(m))
         self.assertIsNot(mw.module, m)
 
+    def test_copies_tree_without_duplicates(self) -> None:
+        m = MetadataWrapper(cst.parse_module("x = 1\npass\n")).module
+        mw = MetadataWrapper(m)
+        self.assertIsNot(mw.module, m)
+        module_ids = {id(node) for node in _all_nodes(m)}
+        for node in _all_nodes(mw.module):
+            self.assertNotIn(id(node), module_ids)
+
+    def test_reuses_tree_without_duplicates(self) -> None:
+        m = MetadataWrapper(cst.parse_module("x = 1\npass\n")).module
+        mw = MetadataWrapper(m, copy_duplicates_only=True)
+        self.assertIs(mw.module, m)
+
+    def test_converts_lists_to_tuples(self) -> None:
+        pass_line = cst.SimpleStatementLine(body=[cst.Pass()])
+        m = cst.Module(body=[pass_line])
+        mw = MetadataWrapper(m, copy_duplicates_only=True)
+        self.assertTrue(mw.module.deep_equals(m))
+        self.assertIsInstance(mw.module.body, tuple)
+        (new_pass_line,) = mw.module.body
+        self.assertIsInstance(new_pass_line.body, tuple)
+        self.assertIs(new_pass_line.body[0], pass_line.body[0])
+
+    def test_copies_duplicate_nodes(self) -> None:
+        m = MetadataWrapper(cst.parse_module("x = 1\npass\n")).module
+        assign, pass_line = m.body
+        m = m.with_changes(body=(assign, pass_line, assign))
+        mw = MetadataWrapper(m, copy_duplicates_only=True)
+        self.assertTrue(mw.module.deep_equals(m))
+        self.assertIsNot(mw.module, m)
+        first, second, third = mw.module.body
+        self.assertIs(first, assign)
+        self.assertIs(second, pass_line)
+        self.assertIsNot(third, assign)
+        self.assertTrue(third.deep_equals(assign))
+
+    def test_copies_nested_duplicate_nodes(self) -> None:
+        name = cst.Name("x")
+        m = cst.Module(
+            body=[
+                cst.SimpleStatementLine([cst.Expr(name)]),
+                cst.SimpleStatementLine([cst.Expr(cst.Tuple([cst.Element(name)]))]),
+            ]
+        )
+        mw = MetadataWrapper(m, copy_duplicates_only=True)
+        self.assertEqual(mw.module.code, m.code)
+        ids = set()
+        for node in _all_nodes(mw.module):
+            self.assertNotIn(id(node), ids)
+            ids.add(id(node))
+
     def test_unsafe_skip_copy(self) -> None:
         m = cst.parse_module("pass")
         mw = MetadataWrapper(m, unsafe_skip_copy=True)
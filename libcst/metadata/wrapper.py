@@ -12,17 +12,25 @@ from typing import (
     cast,
     Collection,
     Iterable,
+    List,
     Mapping,
     MutableMapping,
     MutableSet,
     Optional,
+    Sequence,
     Type,
     TYPE_CHECKING,
     TypeVar,
+    Union,
 )
 
 from libcst._batched_visitor import BatchableCSTVisitor, visit_batched, VisitorMethod
 from libcst._exceptions import MetadataException
+from libcst._flatten_sentinel import FlattenSentinel
+from libcst._iterative_visitor import visit_iterative
+from libcst._pipelined_transformer import _pipeline_stages, _visit_stage
+from libcst._removal_sentinel import RemovalSentinel
+from libcst._visitors import CSTTransformer, CSTVisitor
 from libcst.metadata.base_provider import BatchableMetadataProvider
 
 if TYPE_CHECKING:
@@ -38,6 +46,91 @@ if TYPE_CHECKING:
 _T = TypeVar("_T")
 
 
+class _DuplicateNodeFinder(CSTVisitor):
+    """
+    Collects the identities of nodes that appear more than once in a tree, along
+    with the children attributes that hold lists (which can't be used as metadata
+    keys). The children of a repeated node are not revisited, since the whole
+    repeated subtree gets cloned anyway.
+    """
+
+    def __init__(self) -> None:
+        self.seen: MutableSet[int] = set()
+        self.duplicates: MutableSet[int] = set()
+        self.list_attributes: MutableMapping[int, List[str]] = {}
+
+    def on_visit(self, node: "CSTNode") -> bool:
+        node_id = id(node)
+        if node_id in self.seen:
+            self.duplicates.add(node_id)
+            return False
+        self.seen.add(node_id)
+        return True
+
+    def on_leave(self, original_node: "CSTNode") -> None:
+        pass
+
+    def on_visit_attribute(self, node: "CSTNode", attribute: str) -> None:
+        if type(getattr(node, attribute)) is list:
+            self.list_attributes.setdefault(id(node), []).append(attribute)
+
+    def on_leave_attribute(self, original_node: "CSTNode", attribute: str) -> None:
+        pass
+
+
+class _DuplicateNodeCloner(CSTTransformer):
+    """
+    Replaces every repeated occurrence of a node found by
+    :class:`_DuplicateNodeFinder` with a deep copy and turns lists of children
+    into tuples, leaving the first occurrence and every other subtree untouched.
+    """
+
+    def __init__(
+        self, duplicates: Collection[int], list_attributes: Mapping[int, List[str]]
+    ) -> None:
+        super().__init__()
+        self.duplicates = duplicates
+        self.list_attributes = list_attributes
+        # A node cannot contain itself, so its first occurrence has always been
+        # left before any repeated occurrence is visited.
+        self.left: MutableSet[int] = set()
+
+    def on_visit(self, node: "CSTNode") -> bool:
+        return id(node) not in self.left
+
+    def on_leave(
+        self, original_node: "CSTNode", updated_node: "CSTNode"
+    ) -> Union["CSTNode", RemovalSentinel, FlattenSentinel["CSTNode"]]:
+        node_id = id(original_node)
+        if node_id in self.duplicates:
+            if node_id in self.left:
+                return original_node.deep_clone()
+            self.left.add(node_id)
+        attributes = self.list_attributes.get(node_id)
+        if attributes:
+            return updated_node.with_changes(
+                **{
+                    attribute: tuple(getattr(updated_node, attribute))
+                    for attribute in attributes
+                }
+            )
+        return updated_node
+
+
+def _copy_duplicate_nodes(module: "Module") -> "Module":
+    """
+    Returns ``module`` with every repeated occurrence of a node replaced by a deep
+    copy and every list of children replaced by a tuple, or ``module`` itself if
+    there is nothing to replace.
+    """
+    finder = _DuplicateNodeFinder()
+    module.visit(finder)
+    if not finder.duplicates and not finder.list_attributes:
+        return module
+    cloner = _DuplicateNodeCloner(finder.duplicates, finder.list_attributes)
+    return cast("Module", module.visit(cloner))
+
+
 def _gen_batchable(
     wrapper: "MetadataWrapper",
     # pyre-fixme[2]: Parameter `providers` must have a type that does not contain `Any`
@@ -118,6 +211,11 @@ class MetadataWrapper:
     This copying operation ensures that a node will never appear twice (by identity) in
     the same tree. This allows us to uniquely look up metadata for a node based on a
     node's identity.
+
+    Copying a large module is expensive, so ``copy_duplicates_only=True`` instead
+    only copies the nodes that appear more than once (by identity), along with their
+    ancestors, and shares every other node with the original module. The wrapper
+    then stores the original module itself if no node appears twice in it.
     """
 
     __slots__ = ["__module", "_metadata", "_cache"]
@@ -131,6 +229,8 @@ class MetadataWrapper:
         module: "Module",
         unsafe_skip_copy: bool = False,
         cache: Mapping["ProviderT", object] = {},
+        *,
+        copy_duplicates_only: bool = False,
     ) -> None:
         """
         :param module: The module to wrap. This is deeply copied by default.
@@ -139,11 +239,20 @@ class MetadataWrapper:
             if you know that there are no duplicate nodes in your tree (e.g. this
             module came from the parser).
         :param cache: Pass the needed cache to wrapper to be used when resolving metadata.
+        :param copy_duplicates_only: When true, only nodes that appear more than once
+            in the module are deeply copied, and lists of children are turned into
+            tuples. The wrapped module shares every other node with ``module``, so
+            metadata computed by this wrapper is keyed by nodes that still belong to
+            ``module`` too: don't mutate those nodes in place, and don't wrap
+            ``module`` again expecting separate keys.
         """
         # Ensure that module is safe to use by copying the module to remove
         # any duplicate nodes.
         if not unsafe_skip_copy:
-            module = module.deep_clone()
+            if copy_duplicates_only:
+                module = _copy_duplicate_nodes(module)
+            else:
+                module = module.deep_clone()
         self.__module = module
         self._metadata = {}
         self._cache = cache
@@ -203,6 +312,15 @@ class MetadataWrapper:
         with visitor.resolve(self):
             return self.module.visit(visitor)
 
+    def visit_iterative(self, visitor: "CSTVisitorT") -> "Module":
+        """
+        Convenience method to resolve metadata before performing a traversal over
+        ``self.module`` with ``visitor``, without recursing once per level of the
+        tree. See :func:`~libcst.visit_iterative`.
+        """
+        with visitor.resolve(self):
+            return cast("Module", visit_iterative(self.module, visitor))
+
     def visit_batched(
         self,
         visitors: Iterable[BatchableCSTVisitor],
@@ -219,3 +337,28 @@ class MetadataWrapper:
                 stack.enter_context(v.resolve(self))
 
             return visit_batched(self.module, visitors, before_visit, after_leave)
+
+    def visit_pipelined(self, transformers: Sequence[CSTTransformer]) -> "Module":
+        """
+        Convenience method to resolve metadata before each of the traversals
+        performed by :func:`~libcst.visit_pipelined` over ``self.module`` with
+        ``transformers``. The first traversal uses the metadata of this wrapper.
+        Any later traversal that needs metadata wraps the tree it visits in a new
+        :class:`MetadataWrapper`, which shares this wrapper's cache.
+        """
+        wrapper: Optional[MetadataWrapper] = self
+        module = self.module
+        for stage in _pipeline_stages(transformers):
+            if wrapper is None and stage[0].get_inherited_dependencies():
+                # Nobody else holds the intermediate module, so it doesn't need a
+                # full copy of its own.
+                wrapper = MetadataWrapper(
+                    module, cache=self._cache, copy_duplicates_only=True
+                )
+            if wrapper is not None:
+                with stage[0].resolve(wrapper):
+                    module = cast("Module", _visit_stage(wrapper.module, stage))
+            else:
+                module = cast("Module", _visit_stage(module, stage))
+            wrapper = None
+        return module
@@ -3,8 +3,8 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import cast
-from unittest.mock import Mock
+from typing import cast, List
+from unittest.mock import Mock, patch
 
 import libcst as cst
 from libcst import BatchableCSTVisitor, parse_module, visit_batched
@@ -70,3 +70,56 @@ class BatchedVisitorTest(UnitTest):
         self.assertEqual(
             object.__getattribute__(if_, "whitespace_before_test"), mock.leave_If()
         )
+
+    def test_skips_subtrees_per_visitor(self) -> None:
+        class ModuleLevelNames(BatchableCSTVisitor):
+            def __init__(self) -> None:
+                super().__init__()
+                self.names: List[str] = []
+                self.left: List[str] = []
+
+            def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+                return False
+
+            def leave_FunctionDef(self, original_node: cst.FunctionDef) -> None:
+                self.left.append(original_node.name.value)
+
+            def visit_Name(self, node: cst.Name) -> None:
+                self.names.append(node.value)
+
+            def visit_Param_star(self, node: cst.Param) -> None:
+                self.names.append("star")
+
+        class AllNames(BatchableCSTVisitor):
+            def __init__(self) -> None:
+                super().__init__()
+                self.names: List[str] = []
+
+            def visit_Name(self, node: cst.Name) -> None:
+                self.names.append(node.value)
+
+        module = parse_module("a = b\ndef foo(c):\n    d = c\ne = f\n")
+        module_level, all_names = ModuleLevelNames(), AllNames()
+        visit_batched(module, [module_level, all_names])
+        self.assertEqual(module_level.names, ["a", "b", "e", "f"])
+        self.assertEqual(module_level.left, ["foo"])
+        self.assertEqual(all_names.names, ["a", "b", "foo", "c", "d", "c", "e", "f"])
+
+    def test_stops_descending_when_no_visitor_is_interested(self) -> None:
+        class ModuleOnly(BatchableCSTVisitor):
+            def visit_Module(self, node: cst.Module) -> bool:
+                return False
+
+        module = parse_module("a = b\n")
+        with patch.object(cst.SimpleStatementLine, "_visit_children") as children:
+            visit_batched(module, [ModuleOnly(), ModuleOnly()])
+        children.assert_not_called()
+
+        # The hooks are called for every node, so they still need a full traversal.
+        visited: List[str] = []
+        visit_batched(
+            module,
+            [ModuleOnly()],
+            before_visit=lambda node: visited.append(type(node).__name__),
+        )
+        self.assertIn("Name", visited)
@@ -135,3 +135,110 @@ class DeepReplaceTest(UnitTest):
             module.with_deep_changes(node, value='"Goodbye, world!"'), cst.Module
         )
         self.assertEqual(new_module.code, dedent(new_code))
+
+    def test_deep_replace_many(self) -> None:
+        old_code = """
+            foo(a, b)
+            bar(c)
+            pass
+        """
+        new_code = """
+            foo(x, b)
+            baz(c)
+        """
+
+        module = cst.parse_module(dedent(old_code))
+        foo_call = cst.ensure_type(
+            cst.ensure_type(
+                cst.ensure_type(module.body[0], cst.SimpleStatementLine).body[0],
+                cst.Expr,
+            ).value,
+            cst.Call,
+        )
+        bar_call = cst.ensure_type(
+            cst.ensure_type(
+                cst.ensure_type(module.body[1], cst.SimpleStatementLine).body[0],
+                cst.Expr,
+            ).value,
+            cst.Call,
+        )
+        new_module = cst.ensure_type(
+            module.deep_replace_many(
+                {
+                    foo_call.args[0].value: cst.Name("x"),
+                    bar_call.func: cst.Name("baz"),
+                    module.body[2]: cst.RemoveFromParent(),
+                }
+            ),
+            cst.Module,
+        )
+        self.assertEqual(new_module.code, dedent(new_code))
+        # Statements without any replaced nodes are reused.
+        unchanged = cst.parse_module("a = 1\nb = 2\n")
+        new_unchanged = unchanged.deep_replace_many(
+            {unchanged.body[1]: cst.parse_statement("c = 3\n")}
+        )
+        self.assertIs(
+            cst.ensure_type(new_unchanged, cst.Module).body[0], unchanged.body[0]
+        )
+
+    def test_with_deep_changes_many(self) -> None:
+        old_code = """
+            def a():
+                print("Hello, world!")
+        """
+        new_code = """
+            def b():
+                print("Goodbye, world!")
+        """
+
+        module = cst.parse_module(dedent(old_code))
+        function = cst.ensure_type(module.body[0], cst.FunctionDef)
+        string = cst.ensure_type(
+            cst.ensure_type(
+                cst.ensure_type(
+                    cst.ensure_type(
+                        cst.ensure_type(function.body, cst.IndentedBlock).body[0],
+                        cst.SimpleStatementLine,
+                    ).body[0],
+                    cst.Expr,
+                ).value,
+                cst.Call,
+            )
+            .args[0]
+            .value,
+            cst.SimpleString,
+        )
+        # The string is nested inside the function, which is changed too.
+        new_module = module.with_deep_changes_many(
+            {
+                function.name: {"value": "b"},
+                string: {"value": '"Goodbye, world!"'},
+                function: {"leading_lines": ()},
+            }
+        )
+        self.assertEqual(new_module.code, dedent(new_code))
+
+    def test_deep_replace_many_only_visits_ancestors(self) -> None:
+        visited = []
+
+        class RecordingName(cst.Name):
+            def _visit_and_replace_children(
+                self, visitor: cst.CSTVisitorT
+            ) -> "RecordingName":
+                visited.append(self)
+                return self
+
+        untouched = cst.SimpleStatementLine(
+            [cst.Assign([cst.AssignTarget(RecordingName("a"))], cst.Integer("1"))]
+        )
+        target = cst.Name("b")
+        module = cst.Module([untouched, cst.SimpleStatementLine([cst.Expr(target)])])
+        new_module = cst.ensure_type(
+            module.deep_replace_many({target: cst.Name("c")}), cst.Module
+        )
+        self.assertEqual(new_module.code, "a = 1\nc\n")
+        # Subtrees without anything to replace aren't descended into, let alone
+        # rebuilt.
+        self.assertEqual(visited, [])
+        self.assertIs(new_module.body[0], untouched)
@@ -72,7 +72,7 @@ class FuzzTest(unittest.TestCase):
         self.reject_invalid_code(source_code, mode="exec")
         self.reject_unsupported_code(source_code)
         tree = libcst.parse_module(source_code)
-        self.assertEqual(source_code, tree.code)
+        self.assertEqual(source_code, libcst.Module([]).code_for_node(tree))
 
     @unittest.skipUnless(
         bool(os.environ.get("HYPOTHESIS", False)), "Hypothesis not requested"
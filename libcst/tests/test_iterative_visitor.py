@@ -0,0 +1,171 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import List, Tuple, Union
+
+import libcst as cst
+from libcst.metadata import ExpressionContext, ExpressionContextProvider
+from libcst.testing.utils import UnitTest
+
+_CODE = """
+# comment
+def foo(a, b: int = 1, *args, c, **kwargs) -> None:
+    pass  # trailing
+    return bar(a, self.b, [x for x in range(10) if x], key=c)
+
+class Baz(Base, metaclass=Meta):
+    x: int = 5
+    del x
+"""
+
+
+class LoggingVisitor(cst.CSTVisitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.log: List[Tuple[str, object, str]] = []
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        self.log.append(("visit", node, ""))
+        return not isinstance(node, cst.ClassDef)
+
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        self.log.append(("visit_attribute", node, attribute))
+
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        self.log.append(("leave_attribute", original_node, attribute))
+
+    def on_leave(self, original_node: cst.CSTNode) -> None:
+        self.log.append(("leave", original_node, ""))
+
+
+class LoggingTransformer(cst.CSTTransformer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.log: List[Tuple[str, object, object]] = []
+
+    def on_visit(self, node: cst.CSTNode) -> bool:
+        self.log.append(("visit", node, None))
+        return not isinstance(node, cst.ClassDef)
+
+    def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+        self.log.append(("visit_attribute", node, attribute))
+
+    def on_leave_attribute(self, original_node: cst.CSTNode, attribute: str) -> None:
+        self.log.append(("leave_attribute", original_node, attribute))
+
+    def on_leave(
+        self, original_node: cst.CSTNode, updated_node: cst.CSTNode
+    ) -> Union[cst.CSTNode, cst.RemovalSentinel, cst.FlattenSentinel[cst.CSTNode]]:
+        self.log.append(("leave", original_node, updated_node.deep_clone()))
+        if isinstance(updated_node, cst.Name) and updated_node.value == "self":
+            return updated_node.with_changes(value="this")
+        if isinstance(updated_node, (cst.EmptyLine, cst.Arg)) or (
+            isinstance(updated_node, cst.SimpleStatementLine)
+            and isinstance(updated_node.body[0], cst.Pass)
+        ):
+            return cst.RemoveFromParent()
+        if isinstance(updated_node, cst.SimpleStatementLine):
+            return cst.FlattenSentinel([updated_node, updated_node])
+        return updated_node
+
+
+class IterativeVisitorTest(UnitTest):
+    def test_visitor_matches_recursive(self) -> None:
+        module = cst.parse_module(_CODE)
+        recursive = LoggingVisitor()
+        module.visit(recursive)
+        iterative = LoggingVisitor()
+        self.assertIs(cst.visit_iterative(module, iterative), module)
+        self.assertEqual(iterative.log, recursive.log)
+
+    def test_transformer_matches_recursive(self) -> None:
+        module = cst.parse_module(_CODE)
+        recursive = LoggingTransformer()
+        expected = cst.ensure_type(module.visit(recursive), cst.Module)
+        iterative = LoggingTransformer()
+        actual = cst.ensure_type(cst.visit_iterative(module, iterative), cst.Module)
+        self.assertEqual(actual.code, expected.code)
+        self.assertEqual(len(iterative.log), len(recursive.log))
+        for (kind, node, extra), (expected_kind, expected_node, expected_extra) in zip(
+            iterative.log, recursive.log
+        ):
+            self.assertEqual(kind, expected_kind)
+            self.assertIs(node, expected_node)
+            if isinstance(extra, cst.CSTNode):
+                self.assertTrue(extra.deep_equals(expected_extra))
+            else:
+                self.assertEqual(extra, expected_extra)
+
+    def test_reuses_unchanged_subtrees(self) -> None:
+        module = cst.parse_module(_CODE)
+        self.assertIs(cst.visit_iterative(module, cst.CSTTransformer()), module)
+
+    def test_module_removal(self) -> None:
+        class RemoveModule(cst.CSTTransformer):
+            def leave_Module(
+                self, original_node: cst.Module, updated_node: cst.Module
+            ) -> cst.RemovalSentinel:
+                return cst.RemoveFromParent()
+
+        module = cst.parse_module(_CODE)
+        expected = module.visit(RemoveModule())
+        actual = cst.ensure_type(
+            cst.visit_iterative(module, RemoveModule()), cst.Module
+        )
+        self.assertTrue(actual.deep_equals(expected))
+        self.assertEqual(actual.code, expected.code)
+        wrapper = cst.MetadataWrapper(module)
+        self.assertTrue(wrapper.visit_iterative(RemoveModule()).deep_equals(expected))
+
+    def test_invalid_removal(self) -> None:
+        class RemoveNames(cst.CSTTransformer):
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.RemovalSentinel:
+                return cst.RemoveFromParent()
+
+        with self.assertRaises(TypeError):
+            cst.visit_iterative(cst.parse_module("a.b\n"), RemoveNames())
+
+    def test_deep_tree(self) -> None:
+        depth = 10000
+        expression: cst.BaseExpression = cst.Name("x0")
+        for i in range(1, depth):
+            expression = cst.BinaryOperation(
+                left=expression, operator=cst.Add(), right=cst.Name(f"x{i}")
+            )
+
+        class Upper(cst.CSTTransformer):
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.Name:
+                return updated_node.with_changes(value=updated_node.value.upper())
+
+        with self.assertRaises(RecursionError):
+            expression.visit(Upper())
+        result = cst.visit_iterative(expression, Upper())
+        names = []
+        while isinstance(result, cst.BinaryOperation):
+            names.append(cst.ensure_type(result.right, cst.Name).value)
+            result = result.left
+        names.append(cst.ensure_type(result, cst.Name).value)
+        self.assertEqual(names, [f"X{i}" for i in reversed(range(depth))])
+
+    def test_metadata_wrapper(self) -> None:
+        class StoreToUnderscore(cst.CSTTransformer):
+            METADATA_DEPENDENCIES = (ExpressionContextProvider,)
+
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.Name:
+                if self.get_metadata(ExpressionContextProvider, original_node) == (
+                    ExpressionContext.STORE
+                ):
+                    return updated_node.with_changes(value=f"_{updated_node.value}")
+                return updated_node
+
+        wrapper = cst.MetadataWrapper(cst.parse_module("a = b\n"))
+        result = wrapper.visit_iterative(StoreToUnderscore())
+        self.assertEqual(result.code, "_a = b\n")
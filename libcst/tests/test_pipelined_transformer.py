@@ -0,0 +1,154 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import Callable, List, Sequence, Union
+
+import libcst as cst
+from libcst._pipelined_transformer import _pipeline_stages
+from libcst.metadata import ExpressionContext, ExpressionContextProvider
+from libcst.testing.utils import data_provider, UnitTest
+
+
+class Rename(cst.CSTTransformer):
+    def __init__(self, old: str, new: str) -> None:
+        super().__init__()
+        self.old = old
+        self.new = new
+        self.seen: List[str] = []
+
+    def leave_Name(self, original_node: cst.Name, updated_node: cst.Name) -> cst.Name:
+        self.seen.append(original_node.value)
+        if updated_node.value == self.old:
+            return updated_node.with_changes(value=self.new)
+        return updated_node
+
+
+class WrapIntegers(cst.CSTTransformer):
+    def leave_Integer(
+        self, original_node: cst.Integer, updated_node: cst.Integer
+    ) -> cst.BaseExpression:
+        return cst.BinaryOperation(
+            left=cst.Name("x"), operator=cst.Add(), right=updated_node
+        )
+
+
+class DuplicateAssigns(cst.CSTTransformer):
+    def leave_SimpleStatementLine(
+        self,
+        original_node: cst.SimpleStatementLine,
+        updated_node: cst.SimpleStatementLine,
+    ) -> Union[
+        cst.SimpleStatementLine,
+        cst.RemovalSentinel,
+        cst.FlattenSentinel[cst.SimpleStatementLine],
+    ]:
+        if isinstance(updated_node.body[0], cst.Pass):
+            return cst.RemoveFromParent()
+        return cst.FlattenSentinel([updated_node, updated_node.deep_clone()])
+
+
+class SkipFunctions(cst.CSTTransformer):
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> bool:
+        return False
+
+    def leave_Name(self, original_node: cst.Name, updated_node: cst.Name) -> cst.Name:
+        return updated_node.with_changes(value=updated_node.value.upper())
+
+
+class StoreToUnderscore(cst.CSTTransformer):
+    METADATA_DEPENDENCIES = (ExpressionContextProvider,)
+
+    def leave_Name(self, original_node: cst.Name, updated_node: cst.Name) -> cst.Name:
+        if self.get_metadata(ExpressionContextProvider, original_node, None) == (
+            ExpressionContext.STORE
+        ):
+            return updated_node.with_changes(value=f"_{updated_node.value}")
+        return updated_node
+
+
+_CODE = "a = b + 1\nif a:\n    pass\ndef f(a, c=2):\n    return a + c\n"
+
+
+class PipelinedTransformerTest(UnitTest):
+    @data_provider(
+        {
+            "renames": (lambda: [Rename("a", "b"), Rename("b", "c")],),
+            "new_nodes": (lambda: [WrapIntegers(), Rename("x", "y")],),
+            "flatten_and_remove": (
+                lambda: [DuplicateAssigns(), WrapIntegers(), DuplicateAssigns()],
+            ),
+            "new_stage": (
+                lambda: [Rename("a", "b"), SkipFunctions(), Rename("B", "d")],
+            ),
+            "chain": (
+                lambda: [
+                    Rename("a", "b"),
+                    WrapIntegers(),
+                    Rename("x", "a"),
+                    DuplicateAssigns(),
+                    Rename("a", "z"),
+                ],
+            ),
+        }
+    )
+    def test_matches_separate_traversals(
+        self, make_transformers: Callable[[], Sequence[cst.CSTTransformer]]
+    ) -> None:
+        module = cst.parse_module(_CODE)
+        expected: cst.Module = module
+        separate = make_transformers()
+        for transformer in separate:
+            expected = cst.ensure_type(expected.visit(transformer), cst.Module)
+
+        fused = make_transformers()
+        actual = cst.ensure_type(cst.visit_pipelined(module, fused), cst.Module)
+        self.assertEqual(actual.code, expected.code)
+        for separate_transformer, fused_transformer in zip(separate, fused):
+            if isinstance(separate_transformer, Rename):
+                self.assertEqual(
+                    cst.ensure_type(fused_transformer, Rename).seen,
+                    separate_transformer.seen,
+                )
+
+    def test_stages(self) -> None:
+        transformers = [
+            Rename("a", "b"),
+            WrapIntegers(),
+            SkipFunctions(),
+            Rename("b", "c"),
+            StoreToUnderscore(),
+        ]
+        self.assertEqual(
+            [list(stage) for stage in _pipeline_stages(transformers)],
+            [transformers[:2], transformers[2:4], transformers[4:]],
+        )
+
+    def test_fuses_traversals(self) -> None:
+        class CountVisits(cst.CSTTransformer):
+            def __init__(self) -> None:
+                super().__init__()
+                self.count = 0
+
+            def visit_Module(self, node: cst.Module) -> None:
+                self.count += 1
+
+        counter = CountVisits()
+        cst.visit_pipelined(
+            cst.parse_module(_CODE),
+            [counter, Rename("a", "b"), Rename("b", "c"), Rename("c", "d")],
+        )
+        self.assertEqual(counter.count, 1)
+
+    def test_metadata_wrapper(self) -> None:
+        module = cst.parse_module("a = b\n")
+        result = cst.MetadataWrapper(module).visit_pipelined(
+            [
+                StoreToUnderscore(),
+                Rename("b", "c"),
+                WrapIntegers(),
+                StoreToUnderscore(),
+            ]
+        )
+        self.assertEqual(result.code, "__a = c\n")
@@ -24,4 +24,5 @@ class RoundTripTests(TestCase):
                 src = file.read_text(encoding="utf-8")
                 mod = parse_module(src)
                 self.maxDiff = None
-                self.assertEqual(mod.code, src)
+                # `mod.code` would return `src` as-is, so generate the code.
+                self.assertEqual(mod.code_for_node(mod), src)
@@ -4,6 +4,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from typing import List
+from unittest.mock import patch
 
 import libcst as cst
 from libcst import CSTTransformer, CSTVisitor, parse_module
@@ -96,3 +97,125 @@ class VisitorTest(UnitTest):
                 "leave_If",
             ],
         )
+
+    def test_visitor_does_not_rebuild_nodes(self) -> None:
+        class NameCollector(CSTVisitor):
+            def __init__(self) -> None:
+                self.names: List[str] = []
+
+            def visit_Name(self, node: cst.Name) -> None:
+                self.names.append(node.value)
+
+        module = parse_module("def foo(a, b):\n    return a + b\n")
+        visitor = NameCollector()
+        with patch.object(cst.CSTNode, "__post_init__") as post_init:
+            self.assertIs(module.visit(visitor), module)
+        post_init.assert_not_called()
+        self.assertEqual(visitor.names, ["foo", "a", "b", "a", "b"])
+
+    def test_transformer_shares_unchanged_subtrees(self) -> None:
+        class RenameFoo(CSTTransformer):
+            def leave_Name(
+                self, original_node: cst.Name, updated_node: cst.Name
+            ) -> cst.Name:
+                if original_node.value == "foo":
+                    return updated_node.with_changes(value="bar")
+                return updated_node
+
+        module = parse_module("x = 1\nfoo(y)\nz = 2\n")
+        new_module = module.visit(RenameFoo())
+        self.assertIsNot(new_module, module)
+        self.assertEqual(new_module.code, "x = 1\nbar(y)\nz = 2\n")
+        self.assertIs(new_module.body[0], module.body[0])
+        self.assertIs(new_module.body[2], module.body[2])
+        new_call = cst.ensure_type(
+            cst.ensure_type(new_module.body[1], cst.SimpleStatementLine).body[0],
+            cst.Expr,
+        ).value
+        old_call = cst.ensure_type(
+            cst.ensure_type(module.body[1], cst.SimpleStatementLine).body[0],
+            cst.Expr,
+        ).value
+        self.assertIsNot(new_call, old_call)
+        self.assertIs(
+            cst.ensure_type(new_call, cst.Call).args[0],
+            cst.ensure_type(old_call, cst.Call).args[0],
+        )
+
+    def test_noop_transformer_returns_original_tree(self) -> None:
+        module = parse_module("def foo(a, b):\n    return a + b\n")
+        self.assertIs(module.visit(CSTTransformer()), module)
+
+    def test_skips_attribute_hooks_when_unused(self) -> None:
+        class NameCollector(CSTVisitor):
+            def visit_Name(self, node: cst.Name) -> None:
+                pass
+
+        class AttributeVisitor(CSTVisitor):
+            def visit_If_test(self, node: cst.If) -> None:
+                pass
+
+        class AttributeOverride(CSTTransformer):
+            def on_visit_attribute(self, node: cst.CSTNode, attribute: str) -> None:
+                pass
+
+        self.assertFalse(CSTVisitor()._has_attribute_hooks)
+        self.assertFalse(CSTTransformer()._has_attribute_hooks)
+        self.assertFalse(NameCollector()._has_attribute_hooks)
+        self.assertTrue(AttributeVisitor()._has_attribute_hooks)
+        self.assertTrue(AttributeOverride()._has_attribute_hooks)
+
+        module = parse_module("if True:\n    pass")
+        with patch.object(CSTVisitor, "on_visit_attribute") as on_visit_attribute:
+            module.visit(NameCollector())
+        on_visit_attribute.assert_not_called()
+
+    def test_dispatch_is_per_class(self) -> None:
+        class Counter(CSTVisitor):
+            def __init__(self) -> None:
+                self.count = 0
+
+            def visit_Name(self, node: cst.Name) -> None:
+                self.count += 1
+
+        class SubCounter(Counter):
+            def visit_Name(self, node: cst.Name) -> bool:
+                self.count += 10
+                return False
+
+        module = parse_module("a = b\n")
+        for visitor_type, expected in ((Counter, 2), (SubCounter, 20), (Counter, 2)):
+            visitor = visitor_type()
+            module.visit(visitor)
+            self.assertEqual(visitor.count, expected)
+
+    def test_instance_callbacks(self) -> None:
+        module = parse_module("if a:\n    b\n")
+        seen: List[str] = []
+        visitor = CSTVisitor()
+        visitor.visit_Name = lambda node: seen.append(node.value)
+        visitor.leave_If_test = lambda node: seen.append("leave_If_test")
+        module.visit(visitor)
+        self.assertEqual(seen, ["a", "leave_If_test", "b"])
+
+        transformer = CSTTransformer()
+        transformer.leave_Name = lambda original, updated: updated.with_changes(
+            value=updated.value.upper()
+        )
+        self.assertEqual(module.visit(transformer).code, "if A:\n    B\n")
+
+    def test_callbacks_added_to_class(self) -> None:
+        class NameCollector(CSTVisitor):
+            def __init__(self) -> None:
+                self.names: List[str] = []
+
+        module = parse_module("a = b\n")
+        module.visit(NameCollector())
+
+        def visit_Name(self: NameCollector, node: cst.Name) -> None:
+            self.names.append(node.value)
+
+        NameCollector.visit_Name = visit_Name
+        visitor = NameCollector()
+        module.visit(visitor)
+        self.assertEqual(visitor.names, ["a", "b"])
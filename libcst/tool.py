@@ -21,7 +21,7 @@ from typing import Any, Callable, Dict, List, Tuple, Type
 
 import yaml
 
-from libcst import LIBCST_VERSION, parse_module, PartialParserConfig
+from libcst import LIBCST_VERSION, parse_module, ParseCache, PartialParserConfig
 from libcst._parser.parso.utils import parse_version_string
 from libcst.codemod import (
     CodemodCommand,
@@ -351,6 +351,16 @@ def _codemod_impl(proc_name: str, command_args: List[str]) -> int:  # noqa: C901
         action="store_true",
         help="Do not print progress indicator. Useful if calling from a script.",
     )
+    parser.add_argument(
+        "--parse-cache-dir",
+        metavar="DIR",
+        help=(
+            "Cache parsed files in this directory, so that running codemods again "
+            + "over unchanged files skips reparsing them."
+        ),
+        type=str,
+        default=None,
+    )
     command_class.add_args(parser)
     args = parser.parse_args(command_args)
 
@@ -368,6 +378,7 @@ def _codemod_impl(proc_name: str, command_args: List[str]) -> int:  # noqa: C901
             "include_stubs",
             "jobs",
             "no_format",
+            "parse_cache_dir",
             "path",
             "python_version",
             "show_successes",
@@ -433,6 +444,11 @@ def _codemod_impl(proc_name: str, command_args: List[str]) -> int:  # noqa: C901
             blacklist_patterns=config["blacklist_patterns"],
             python_version=args.python_version,
             repo_root=config["repo_root"],
+            parse_cache=(
+                ParseCache(args.parse_cache_dir)
+                if args.parse_cache_dir is not None
+                else None
+            ),
         )
     except KeyboardInterrupt:
         print("Interrupted!", file=sys.stderr)
@@ -4,6 +4,9 @@
 // LICENSE file in the root directory of this source tree.
 
 use std::cmp::{max, min};
+use std::panic;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::thread;
 
 mod tokenizer;
 
@@ -15,6 +18,7 @@ use nodes::deflated::Module as DeflatedModule;
 pub use nodes::*;
 
 mod parser;
+pub use parser::GrammarConfig;
 use parser::{ParserError, Result, TokVec};
 
 #[cfg(feature = "py")]
@@ -33,9 +37,16 @@ pub fn tokenize(text: &str) -> Result<Vec<Token>> {
         .map_err(|err| ParserError::TokenizerError(err, text))
 }
 
-pub fn parse_module<'a>(
+pub fn parse_module<'a>(module_text: &'a str, encoding: Option<&str>) -> Result<'a, Module<'a>> {
+    parse_module_with_config(module_text, encoding, &GrammarConfig::default())
+}
+
+/// Parses `module_text` like [`parse_module`], but only accepts the syntax of the python
+/// version in `config`.
+pub fn parse_module_with_config<'a>(
     mut module_text: &'a str,
     encoding: Option<&str>,
+    config: &GrammarConfig,
 ) -> Result<'a, Module<'a>> {
     // Strip UTF-8 BOM
     if let Some(stripped) = module_text.strip_prefix('\u{feff}') {
@@ -44,34 +55,114 @@ pub fn parse_module<'a>(
     let tokens = tokenize(module_text)?;
     let conf = whitespace_parser::Config::new(module_text, &tokens);
     let tokvec = tokens.into();
-    let m = parse_tokens_without_whitespace(&tokvec, module_text, encoding)?;
+    let m = parser::python::file(&tokvec, module_text, config, encoding)
+        .map_err(|err| ParserError::ParserError(err, module_text))?;
     Ok(m.inflate(&conf)?)
 }
 
+// Parse results are sent back from the worker threads of `parse_modules`, and from the
+// closures that `py.rs` runs with the GIL released. Only the deflated nodes refer to
+// the tokens' `Rc`s, which must never leak into the inflated ones.
+const _: () = {
+    const fn assert_send<T: Send>() {}
+    assert_send::<Result<'static, Module<'static>>>();
+    assert_send::<Result<'static, Statement<'static>>>();
+    assert_send::<Result<'static, Expression<'static>>>();
+};
+
+/// Parses each `(module_text, encoding)` pair in `sources` like
+/// [`parse_module_with_config`], using up to `jobs` threads. Results are returned in the
+/// same order as `sources`.
+pub fn parse_modules<'a>(
+    sources: &[(&'a str, Option<&str>)],
+    config: &GrammarConfig,
+    jobs: usize,
+) -> Vec<Result<'a, Module<'a>>> {
+    let jobs = jobs.min(sources.len()).max(1);
+    if jobs == 1 {
+        return sources
+            .iter()
+            .map(|(module_text, encoding)| parse_module_with_config(module_text, *encoding, config))
+            .collect();
+    }
+    // Workers pull the next unparsed source off a shared counter, so one large file
+    // doesn't hold up a whole pre-assigned chunk of work.
+    let next = AtomicUsize::new(0);
+    let mut results: Vec<_> = thread::scope(|scope| {
+        let workers: Vec<_> = (0..jobs)
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut parsed = vec![];
+                    loop {
+                        let idx = next.fetch_add(1, Ordering::Relaxed);
+                        let Some((module_text, encoding)) = sources.get(idx) else {
+                            break;
+                        };
+                        parsed.push((
+                            idx,
+                            parse_module_with_config(module_text, *encoding, config),
+                        ));
+                    }
+                    parsed
+                })
+            })
+            .collect();
+        workers
+            .into_iter()
+            .flat_map(|worker| {
+                // Re-raise a worker's panic as is, rather than the scope's generic one.
+                worker
+                    .join()
+                    .unwrap_or_else(|payload| panic::resume_unwind(payload))
+            })
+            .collect()
+    });
+    results.sort_unstable_by_key(|(idx, _)| *idx);
+    results.into_iter().map(|(_, result)| result).collect()
+}
+
 pub fn parse_tokens_without_whitespace<'r, 'a>(
     tokens: &'r TokVec<'a>,
     module_text: &'a str,
     encoding: Option<&str>,
 ) -> Result<'a, DeflatedModule<'r, 'a>> {
-    let m = parser::python::file(tokens, module_text, encoding)
+    let m = parser::python::file(tokens, module_text, &GrammarConfig::default(), encoding)
         .map_err(|err| ParserError::ParserError(err, module_text))?;
     Ok(m)
 }
 
 pub fn parse_statement(text: &str) -> Result<Statement> {
+    parse_statement_with_config(text, &GrammarConfig::default())
+}
+
+/// Parses `text` like [`parse_statement`], but only accepts the syntax of the python
+/// version in `config`.
+pub fn parse_statement_with_config<'a>(
+    text: &'a str,
+    config: &GrammarConfig,
+) -> Result<'a, Statement<'a>> {
     let tokens = tokenize(text)?;
     let conf = whitespace_parser::Config::new(text, &tokens);
     let tokvec = tokens.into();
-    let stm = parser::python::statement_input(&tokvec, text)
+    let stm = parser::python::statement_input(&tokvec, text, config)
         .map_err(|err| ParserError::ParserError(err, text))?;
     Ok(stm.inflate(&conf)?)
 }
 
 pub fn parse_expression(text: &str) -> Result<Expression> {
+    parse_expression_with_config(text, &GrammarConfig::default())
+}
+
+/// Parses `text` like [`parse_expression`], but only accepts the syntax of the python
+/// version in `config`.
+pub fn parse_expression_with_config<'a>(
+    text: &'a str,
+    config: &GrammarConfig,
+) -> Result<'a, Expression<'a>> {
     let tokens = tokenize(text)?;
     let conf = whitespace_parser::Config::new(text, &tokens);
     let tokvec = tokens.into();
-    let expr = parser::python::expression_input(&tokvec, text)
+    let expr = parser::python::expression_input(&tokvec, text, config)
         .map_err(|err| ParserError::ParserError(err, text))?;
     Ok(expr.inflate(&conf)?)
 }
@@ -165,6 +256,80 @@ mod test {
         }
     }
 
+    #[test]
+    fn test_parse_modules_preserves_order() {
+        let sources = [
+            ("a = 1\n", None),
+            ("def f(): ...\n", None),
+            ("1_", None),
+            ("class C: pass\n", Some("latin-1")),
+        ];
+        for jobs in [1, 2, 8] {
+            let results = parse_modules(&sources, &GrammarConfig::default(), jobs);
+            assert_eq!(results.len(), sources.len());
+            for ((module_text, encoding), result) in sources.iter().zip(results) {
+                assert_eq!(result, parse_module(module_text, *encoding));
+            }
+        }
+    }
+
+    #[test]
+    fn test_parse_modules_more_sources_than_jobs() {
+        // Sources of different sizes finish out of order on the workers.
+        let texts: Vec<String> = (0..64)
+            .map(|i| {
+                "x = 1\n".repeat(if i % 3 == 0 { 200 } else { 1 }) + &format!("y{} = {}\n", i, i)
+            })
+            .collect();
+        let sources: Vec<_> = texts.iter().map(|text| (text.as_str(), None)).collect();
+        let results = parse_modules(&sources, &GrammarConfig::default(), 4);
+        assert_eq!(results.len(), sources.len());
+        for ((module_text, _), result) in sources.iter().zip(results) {
+            assert_eq!(result, parse_module(module_text, None));
+        }
+    }
+
+    #[test]
+    fn test_python_version() {
+        let py37 = GrammarConfig {
+            python_version: Some((3, 7)),
+        };
+        for src in [
+            "(a := 1)\n",
+            "def f(a, /): ...\n",
+            "f'{a=}'\n",
+            "with (a as b): ...\n",
+            "match a:\n    case 1: ...\n",
+            "def f[T](): ...\n",
+        ] {
+            parse_module(src, None).unwrap_or_else(|e| panic!("'{}' doesn't parse: {}", src, e));
+            assert!(
+                parse_module_with_config(src, None, &py37).is_err(),
+                "'{}' parses with python 3.7",
+                src
+            );
+        }
+        let py33 = GrammarConfig {
+            python_version: Some((3, 3)),
+        };
+        for src in [
+            "a @ b\n",
+            "async def f(): ...\n",
+            "[a, *b]\n",
+            "a: int = 1\n",
+            "f'{a}'\n",
+            "1_000\n",
+        ] {
+            parse_module_with_config(src, None, &py37)
+                .unwrap_or_else(|e| panic!("'{}' doesn't parse: {}", src, e));
+            assert!(
+                parse_module_with_config(src, None, &py33).is_err(),
+                "'{}' parses with python 3.3",
+                src
+            );
+        }
+    }
+
     #[test]
     fn bol_offset_first_line() {
         assert_eq!(0, bol_offset("hello", 1));
@@ -2524,35 +2524,36 @@ impl<'r, 'a> Inflate<'a> for DeflatedNamedExpr<'r, 'a> {
 #[cfg(feature = "py")]
 mod py {
 
-    use pyo3::types::PyModule;
+    use pyo3::sync::GILOnceCell;
+    use pyo3::types::{PyDict, PyModule};
+    use pyo3::{intern, PyObject, PyResult, Python};
 
     use super::*;
     use crate::nodes::traits::py::TryIntoPy;
 
+    fn cached_node_class<'py>(
+        py: Python<'py>,
+        cell: &'py GILOnceCell<PyObject>,
+        name: &str,
+    ) -> PyResult<&'py PyObject> {
+        cell.get_or_try_init(py, || -> PyResult<PyObject> {
+            Ok(PyModule::import(py, "libcst")?.getattr(name)?.into())
+        })
+    }
+
     // TODO: this could be a derive helper attribute to override the python class name
     impl<'a> TryIntoPy<pyo3::PyObject> for Element<'a> {
         fn try_into_py(self, py: pyo3::Python) -> pyo3::PyResult<pyo3::PyObject> {
+            static NODE_CLASS: GILOnceCell<PyObject> = GILOnceCell::new();
             match self {
                 Self::Starred(s) => s.try_into_py(py),
                 Self::Simple { value, comma } => {
-                    let libcst = PyModule::import(py, "libcst")?;
-                    let kwargs = [
-                        Some(("value", value.try_into_py(py)?)),
-                        comma
-                            .map(|x| x.try_into_py(py))
-                            .transpose()?
-                            .map(|x| ("comma", x)),
-                    ]
-                    .iter()
-                    .filter(|x| x.is_some())
-                    .map(|x| x.as_ref().unwrap())
-                    .collect::<Vec<_>>()
-                    .into_py_dict(py);
-                    Ok(libcst
-                        .getattr("Element")
-                        .expect("no Element found in libcst")
-                        .call((), Some(kwargs))?
-                        .into())
+                    let kwargs = PyDict::new(py);
+                    kwargs.set_item(intern!(py, "value"), value.try_into_py(py)?)?;
+                    if let Some(comma) = comma {
+                        kwargs.set_item(intern!(py, "comma"), comma.try_into_py(py)?)?;
+                    }
+                    cached_node_class(py, &NODE_CLASS, "Element")?.call(py, (), Some(kwargs))
                 }
             }
         }
@@ -2561,6 +2562,7 @@ mod py {
     // TODO: this could be a derive helper attribute to override the python class name
     impl<'a> TryIntoPy<pyo3::PyObject> for DictElement<'a> {
         fn try_into_py(self, py: pyo3::Python) -> pyo3::PyResult<pyo3::PyObject> {
+            static NODE_CLASS: GILOnceCell<PyObject> = GILOnceCell::new();
             match self {
                 Self::Starred(s) => s.try_into_py(py),
                 Self::Simple {
@@ -2571,33 +2573,21 @@ mod py {
                     whitespace_before_colon,
                     ..
                 } => {
-                    let libcst = PyModule::import(py, "libcst")?;
-                    let kwargs = [
-                        Some(("key", key.try_into_py(py)?)),
-                        Some(("value", value.try_into_py(py)?)),
-                        Some((
-                            "whitespace_before_colon",
-                            whitespace_before_colon.try_into_py(py)?,
-                        )),
-                        Some((
-                            "whitespace_after_colon",
-                            whitespace_after_colon.try_into_py(py)?,
-                        )),
-                        comma
-                            .map(|x| x.try_into_py(py))
-                            .transpose()?
-                            .map(|x| ("comma", x)),
-                    ]
-                    .iter()
-                    .filter(|x| x.is_some())
-                    .map(|x| x.as_ref().unwrap())
-                    .collect::<Vec<_>>()
-                    .into_py_dict(py);
-                    Ok(libcst
-                        .getattr("DictElement")
-                        .expect("no Element found in libcst")
-                        .call((), Some(kwargs))?
-                        .into())
+                    let kwargs = PyDict::new(py);
+                    kwargs.set_item(intern!(py, "key"), key.try_into_py(py)?)?;
+                    kwargs.set_item(intern!(py, "value"), value.try_into_py(py)?)?;
+                    kwargs.set_item(
+                        intern!(py, "whitespace_before_colon"),
+                        whitespace_before_colon.try_into_py(py)?,
+                    )?;
+                    kwargs.set_item(
+                        intern!(py, "whitespace_after_colon"),
+                        whitespace_after_colon.try_into_py(py)?,
+                    )?;
+                    if let Some(comma) = comma {
+                        kwargs.set_item(intern!(py, "comma"), comma.try_into_py(py)?)?;
+                    }
+                    cached_node_class(py, &NODE_CLASS, "DictElement")?.call(py, (), Some(kwargs))
                 }
             }
         }
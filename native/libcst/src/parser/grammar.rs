@@ -87,8 +87,28 @@ impl<'input, 'a: 'input> ParseElem<'input> for TokVec<'a> {
 
 const MAX_RECURSION_DEPTH: usize = 3000;
 
+// What the parser expects when it finds syntax that the configured python version doesn't
+// have.
+const SUPPORTED_SYNTAX: &str = "syntax supported by the configured python version";
+
+/// Restricts the syntax that the parser accepts to that of a python version.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct GrammarConfig {
+    /// The `(major, minor)` version of python whose syntax is accepted. Syntax that was
+    /// added in a later version is rejected. `None` accepts all of the syntax that the
+    /// parser supports.
+    pub python_version: Option<(u8, u8)>,
+}
+
+impl GrammarConfig {
+    fn supports(&self, version: (u8, u8)) -> bool {
+        self.python_version
+            .map_or(true, |python_version| python_version >= version)
+    }
+}
+
 parser! {
-    pub grammar python<'a>(input: &'a str) for TokVec<'a> {
+    pub grammar python<'a>(input: &'a str, config: &GrammarConfig) for TokVec<'a> {
 
         // Starting Rules
 
@@ -164,13 +184,13 @@ parser! {
         // Simple statements
 
         rule assignment() -> SmallStatement<'input, 'a>
-            = a:name() col:lit(":") ann:expression()
+            = a:name() col:lit(":") since((3, 6)) ann:expression()
                 rhs:(eq:lit("=") d:annotated_rhs() {(eq, d)})? {
                     SmallStatement::AnnAssign(make_ann_assignment(
                         AssignTargetExpression::Name(Box::new(a)), col, ann, rhs))
             }
             // TODO: there's an extra '(' single_target ')' clause here in upstream
-            / a:single_subscript_attribute_target() col:lit(":") ann:expression()
+            / a:single_subscript_attribute_target() col:lit(":") since((3, 6)) ann:expression()
                 rhs:(eq:lit("=") d:annotated_rhs() {(eq, d)})? {
                     SmallStatement::AnnAssign(make_ann_assignment(a, col, ann, rhs))
             }
@@ -188,7 +208,6 @@ parser! {
             = &(lit("+=")
                 / lit("-=")
                 / lit("*=")
-                / lit("@=")
                 /  lit("/=")
                 / lit("%=")
                 / lit("&=")
@@ -200,6 +219,9 @@ parser! {
                 / lit("//=")) tok:_ {?
                     make_aug_op(tok).map_err(|_| "aug_op")
             }
+            / tok:lit("@=") since((3, 5)) {?
+                make_aug_op(tok).map_err(|_| "aug_op")
+            }
 
         rule return_stmt() -> Return<'input, 'a>
             = kw:lit("return") a:star_expressions()? {
@@ -342,7 +364,7 @@ parser! {
                 cp:lit(")") ty:_returns()? c:lit(":") b:block() {
                     make_function_def(None, def, n, t, op, params, cp, ty, c, b)
             }
-            / asy:tok(Async, "ASYNC") def:lit("def") n:name() t:type_params()? op:lit("(") params:params()?
+            / asy:tok(Async, "ASYNC") since((3, 5)) def:lit("def") n:name() t:type_params()? op:lit("(") params:params()?
                 cp:lit(")") ty:_returns()? c:lit(":") b:block() {
                     make_function_def(Some(asy), def, n, t, op, params, cp, ty, c, b)
             }
@@ -353,10 +375,11 @@ parser! {
             = parameters()
 
         rule parameters() -> Parameters<'input, 'a>
-            = a:slash_no_default() b:param_no_default()* c:param_with_default()*  d:star_etc()? {
+            = a:slash_no_default() since((3, 8)) b:param_no_default()* c:param_with_default()*
+                d:star_etc()? {
                 make_parameters(Some(a), concat(b, c), d)
             }
-            / a:slash_with_default() b:param_with_default()* d:star_etc()? {
+            / a:slash_with_default() since((3, 8)) b:param_with_default()* d:star_etc()? {
                 make_parameters(Some(a), b, d)
             }
             / a:param_no_default()+ b:param_with_default()* d:star_etc()? {
@@ -499,7 +522,7 @@ parser! {
                 c:lit(":") b:block() el:else_block()? {
                     make_for(None, f, t, i, it, c, b, el)
             }
-            / asy:tok(Async, "ASYNC") f:lit("for") t:star_targets() i:lit("in")
+            / asy:tok(Async, "ASYNC") since((3, 5)) f:lit("for") t:star_targets() i:lit("in")
                 it:star_expressions()
                 c:lit(":") b:block() el:else_block()? {
                     make_for(Some(asy), f, t, i, it, c, b, el)
@@ -508,23 +531,33 @@ parser! {
         // With statement
 
         rule with_stmt() -> With<'input, 'a>
-            = kw:lit("with") l:lpar() items:separated_trailer(<with_item()>, <comma()>) r:rpar()
+            = kw:lit("with") since((3, 9)) l:lpar() items:separated_trailer(<with_item()>, <comma()>) r:rpar()
                 col:lit(":") b:block() {
                     make_with(None, kw, Some(l), comma_separate(items.0, items.1, items.2), Some(r), col, b)
             }
-            / kw:lit("with") items:separated(<with_item()>, <comma()>)
+            / kw:lit("with") items:with_items()
                 col:lit(":") b:block() {
                     make_with(None, kw, None, comma_separate(items.0, items.1, None), None, col, b)
             }
-            / asy:tok(Async, "ASYNC") kw:lit("with") l:lpar() items:separated_trailer(<with_item()>, <comma()>) r:rpar()
+            / asy:tok(Async, "ASYNC") since((3, 9)) kw:lit("with") l:lpar() items:separated_trailer(<with_item()>, <comma()>) r:rpar()
                 col:lit(":") b:block() {
                     make_with(Some(asy), kw, Some(l), comma_separate(items.0, items.1, items.2), Some(r), col, b)
             }
-            / asy:tok(Async, "ASYNC") kw:lit("with") items:separated(<with_item()>, <comma()>)
+            / asy:tok(Async, "ASYNC") since((3, 5)) kw:lit("with") items:with_items()
                 col:lit(":") b:block() {
                     make_with(Some(asy), kw, None, comma_separate(items.0, items.1, None), None, col, b)
             }
 
+        // Several items without parentheses need python 3.1.
+        rule with_items() -> (WithItem<'input, 'a>, Vec<(Comma<'input, 'a>, WithItem<'input, 'a>)>)
+            = items:separated(<with_item()>, <comma()>) {?
+                if items.1.is_empty() || config.supports((3, 1)) {
+                    Ok(items)
+                } else {
+                    Err(SUPPORTED_SYNTAX)
+                }
+            }
+
         rule with_item() -> WithItem<'input, 'a>
             = e:expression() a:lit("as") t:star_target() &(lit(",") / lit(":") / rpar()) {
                 make_with_item(e, Some(a), Some(t))
@@ -563,7 +596,7 @@ parser! {
             }
 
         rule except_star_block() -> ExceptStarHandler<'input, 'a>
-            = kw:lit("except") star:lit("*") e:expression()
+            = kw:lit("except") star:lit("*") since((3, 11)) e:expression()
                 a:(k:lit("as") n:name() {(k, n)})? col:lit(":") b:block() {
                     make_except_star(kw, star, e, a, col, b)
             }
@@ -577,7 +610,7 @@ parser! {
         // Match statement
 
         rule match_stmt() -> Match<'input, 'a>
-            = kw:lit("match") subject:subject_expr() col:lit(":") tok(NL, "NEWLINE")
+            = kw:lit("match") since((3, 10)) subject:subject_expr() col:lit(":") tok(NL, "NEWLINE")
                 i:tok(Indent, "INDENT") cases:case_block()+ d:tok(Dedent, "DEDENT") {
                     make_match(kw, subject, col, i, cases, d)
             }
@@ -789,14 +822,14 @@ parser! {
         // Type statement
 
         rule type_stmt() -> TypeAlias<'input, 'a>
-            = t:lit("type") n:name() ps:type_params()? eq:lit("=") v:expression() {
+            = t:lit("type") since((3, 12)) n:name() ps:type_params()? eq:lit("=") v:expression() {
                 make_type_alias(t, n, ps, eq, v)
             }
 
         // Type parameter declaration
 
         rule type_params() -> TypeParameters<'input, 'a>
-            = lb:lbrak() ps:separated_trailer(<type_param()>, <comma()>) rb:rbrak() {
+            = since((3, 12)) lb:lbrak() ps:separated_trailer(<type_param()>, <comma()>) rb:rbrak() {
                 make_type_parameters(lb, comma_separate(ps.0, ps.1, ps.2), rb)
             }
 
@@ -822,7 +855,7 @@ parser! {
             / disjunction()
 
         rule yield_expr() -> Expression<'input, 'a>
-            = y:lit("yield") f:lit("from") a:expression() {
+            = y:lit("yield") f:lit("from") since((3, 3)) a:expression() {
                 Expression::Yield(Box::new(make_yield(y, Some(f), Some(a))))
             }
             / y:lit("yield") a:star_expressions()? {
@@ -853,13 +886,13 @@ parser! {
             }
 
         rule star_named_expression() -> Element<'input, 'a>
-            = star:lit("*") e:bitwise_or() {
+            = star:lit("*") since((3, 5)) e:bitwise_or() {
                 Element::Starred(Box::new(make_starred_element(star, expr_to_element(e))))
             }
             / e:named_expression() { expr_to_element(e) }
 
         rule named_expression() -> Expression<'input, 'a>
-            = a:name() op:lit(":=") b:expression() {
+            = a:name() op:lit(":=") since((3, 8)) b:expression() {
                 Expression::NamedExpr(Box::new(make_named_expr(a, op, b)))
             }
             / e:expression() !lit(":=") { e }
@@ -976,7 +1009,7 @@ parser! {
             / a:term() op:lit("%") b:factor() {?
                 make_binary_op(a, op, b).map_err(|e| "expected term")
             }
-            / a:term() op:lit("@") b:factor() {?
+            / a:term() op:lit("@") since((3, 5)) b:factor() {?
                 make_binary_op(a, op, b).map_err(|e| "expected term")
             }
             / factor()
@@ -1003,7 +1036,7 @@ parser! {
         // Primary elements
 
         rule await_primary() -> Expression<'input, 'a>
-            = aw:tok(AWAIT, "AWAIT") e:primary() {
+            = aw:tok(AWAIT, "AWAIT") since((3, 5)) e:primary() {
                 Expression::Await(Box::new(make_await(aw, e)))
             }
             / primary()
@@ -1044,7 +1077,7 @@ parser! {
             / n:lit("False") { Expression::Name(Box::new(make_name(n))) }
             / n:lit("None") { Expression::Name(Box::new(make_name(n))) }
             / &(tok(STRING, "") / tok(FStringStart, "")) s:strings() {s.into()}
-            / n:tok(Number, "NUMBER") { make_number(n) }
+            / n:tok(Number, "NUMBER") supported_number(n) { make_number(n) }
             / &lit("(") e:(tuple() / group() / (g:genexp() {Expression::GeneratorExp(Box::new(g))})) {e}
             / &lit("[") e:(list() / listcomp()) {e}
             / &lit("{") e:(dict() / set() / dictcomp() / setcomp()) {e}
@@ -1070,11 +1103,11 @@ parser! {
         // close parenthesis.
 
         rule lambda_parameters() -> Parameters<'input, 'a>
-            = a:lambda_slash_no_default() b:lambda_param_no_default()*
+            = a:lambda_slash_no_default() since((3, 8)) b:lambda_param_no_default()*
                 c:lambda_param_with_default()* d:lambda_star_etc()? {
                     make_parameters(Some(a), concat(b, c), d)
             }
-            / a:lambda_slash_with_default() b:lambda_param_with_default()*
+            / a:lambda_slash_with_default() since((3, 8)) b:lambda_param_with_default()*
                 d:lambda_star_etc()? {
                     make_parameters(Some(a), b, d)
             }
@@ -1150,11 +1183,32 @@ parser! {
         // Literals
 
         rule strings() -> String<'input, 'a>
-            = s:(str:tok(STRING, "STRING") t:&_ {(make_string(str), t)}
-                / str:fstring() t:&_ {(String::Formatted(str), t)})+ {?
+            = s:(str:tok(STRING, "STRING") supported_string_prefix(str) t:&_ {(make_string(str), t)}
+                / since((3, 6)) str:fstring() t:&_ {(String::Formatted(str), t)})+ {?
                 make_strings(s)
             }
 
+        // The `u` prefix was removed in python 3.0, and reintroduced in 3.3.
+        rule supported_string_prefix(tok: TokenRef<'input, 'a>)
+            = position!() {?
+                if tok.string.starts_with(|c: char| c == 'u' || c == 'U') && !config.supports((3, 3)) {
+                    Err(SUPPORTED_SYNTAX)
+                } else {
+                    Ok(())
+                }
+            }
+
+        // Underscores in numeric literals were added in python 3.6. Numbers in match
+        // patterns don't need this check, since those were only added in 3.10.
+        rule supported_number(tok: TokenRef<'input, 'a>)
+            = position!() {?
+                if tok.string.contains('_') && !config.supports((3, 6)) {
+                    Err(SUPPORTED_SYNTAX)
+                } else {
+                    Ok(())
+                }
+            }
+
         rule list() -> Expression<'input, 'a>
             = lbrak:lbrak() e:star_named_expressions()? rbrak:rbrak() {
                 Expression::List(Box::new(
@@ -1194,7 +1248,7 @@ parser! {
             }
 
         rule double_starred_kvpair() -> DictElement<'input, 'a>
-            = s:lit("**") e:bitwise_or() {
+            = s:lit("**") since((3, 5)) e:bitwise_or() {
                 DictElement::Starred(make_double_starred_element(s, e))
             }
             / k:kvpair() { make_dict_element(k) }
@@ -1443,7 +1497,7 @@ parser! {
             }
 
         rule _f_replacement() -> FormattedStringContent<'input, 'a>
-            = lb:lit("{") e:_f_expr() eq:lit("=")?
+            = lb:lit("{") e:_f_expr() eq:(eq:lit("=") since((3, 8)) { eq })?
                 conv:(t:lit("!") c:_f_conversion() {(t,c)})?
                 spec:(t:lit(":") s:_f_spec() {(t,s)})?
                 rb:lit("}") {
@@ -1512,7 +1566,18 @@ parser! {
             t:tok(NameTok, "NAME") {make_name(t)}
 
         rule _async() -> TokenRef<'input, 'a>
-            = tok(Async, "ASYNC")
+            = t:tok(Async, "ASYNC") since((3, 6)) { t }
+
+        // Matches nothing, but only if the configured python version has the syntax
+        // that was added in `version`.
+        rule since(version: (u8, u8))
+            = position!() {?
+                if config.supports(version) {
+                    Ok(())
+                } else {
+                    Err(SUPPORTED_SYNTAX)
+                }
+            }
 
         rule separated_trailer<El, Sep>(el: rule<El>, sep: rule<Sep>) -> (El, Vec<(Sep, El)>, Option<Sep>)
             = e:el() rest:(s:sep() e:el() {(s, e)})* trailer:sep()? {(e, rest, trailer)}
@@ -9,4 +9,4 @@ mod numbers;
 
 pub use errors::ParserError;
 pub(crate) use grammar::TokVec;
-pub use grammar::{python, Result};
+pub use grammar::{python, GrammarConfig, Result};
@@ -4,28 +4,185 @@
 // LICENSE file in the root directory of this source tree
 
 use crate::nodes::traits::py::TryIntoPy;
+use crate::{GrammarConfig, Statement};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyIndexError, PyUnicodeDecodeError};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
+
+/// Calls `f` with the text of `source`, which is either a `str`, or a contiguous buffer
+/// of UTF-8 encoded bytes (e.g. `bytes`, a `memoryview` or an `mmap`). Strings and
+/// read-only buffers are borrowed for the duration of the call instead of being copied.
+fn with_source_text<R>(
+    py: Python,
+    source: &PyAny,
+    f: impl FnOnce(&str) -> PyResult<R>,
+) -> PyResult<R> {
+    if let Ok(text) = source.downcast::<PyString>() {
+        return f(text.to_str()?);
+    }
+    let buffer = PyBuffer::<u8>::get(source)?;
+    if !buffer.is_c_contiguous() {
+        return Err(PyBufferError::new_err("source must be a contiguous buffer"));
+    }
+    let copy;
+    let bytes: &[u8] = if buffer.len_bytes() == 0 {
+        &[]
+    } else if buffer.readonly() {
+        // Safety: the buffer stays exported until `buffer` is dropped at the end of
+        // this function, so its memory can't be released or resized until then, and
+        // it can't be written to through the buffer protocol.
+        unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes()) }
+    } else {
+        // Writable buffers could change while the GIL is released.
+        copy = buffer.to_vec(py)?;
+        &copy
+    };
+    let text = std::str::from_utf8(bytes).map_err(|err| {
+        match PyUnicodeDecodeError::new_utf8(py, bytes, err) {
+            Ok(err) => PyErr::from_value(err),
+            Err(err) => err,
+        }
+    })?;
+    f(text)
+}
+
+/// The top-level statements of a module parsed by `parse_module_lazily`, which are
+/// converted into python objects one at a time, when they're first needed.
+#[pyclass(module = "libcst.native")]
+struct LazyStatements {
+    // The statements borrow `source`, so they're declared, and dropped, before it.
+    statements: Vec<Option<Statement<'static>>>,
+    _source: Box<str>,
+}
+
+#[pymethods]
+impl LazyStatements {
+    fn __len__(&self) -> usize {
+        self.statements.len()
+    }
+
+    /// Converts the statement at `index` into a python object. Each statement can only
+    /// be taken once.
+    fn take(&mut self, py: Python, index: usize) -> PyResult<PyObject> {
+        match self.statements.get_mut(index).and_then(Option::take) {
+            Some(statement) => statement.try_into_py(py),
+            None => Err(PyIndexError::new_err(format!(
+                "statement {} was already taken",
+                index
+            ))),
+        }
+    }
+}
 
 #[pymodule]
 #[pyo3(name = "native")]
 pub fn libcst_native(_py: Python, m: &PyModule) -> PyResult<()> {
+    // Tokenizing, parsing and inflating only touch rust data, so they run with the GIL
+    // released. It is only reacquired to convert the result into python objects.
+    //
+    // `python_version` restricts the syntax that's accepted to that of a `(major, minor)`
+    // version of python. By default, all of the syntax the parser supports is accepted.
+    //
+    // Modules are either parsed from a `str`, or from a buffer of UTF-8 encoded bytes,
+    // which is validated and parsed in place.
+
+    #[pyfn(m)]
+    #[pyo3(signature = (source, encoding=None, python_version=None))]
+    fn parse_module(
+        py: Python,
+        source: &PyAny,
+        encoding: Option<&str>,
+        python_version: Option<(u8, u8)>,
+    ) -> PyResult<PyObject> {
+        let config = GrammarConfig { python_version };
+        with_source_text(py, source, |text| {
+            let m =
+                py.allow_threads(|| crate::parse_module_with_config(text, encoding, &config))?;
+            m.try_into_py(py)
+        })
+    }
+
+    // Like `parse_module`, but only converts the module itself, without its statements,
+    // which are returned separately.
+    #[pyfn(m)]
+    #[pyo3(signature = (source, encoding=None, python_version=None))]
+    fn parse_module_lazily(
+        py: Python,
+        source: &PyAny,
+        encoding: Option<&str>,
+        python_version: Option<(u8, u8)>,
+    ) -> PyResult<(PyObject, LazyStatements)> {
+        let config = GrammarConfig { python_version };
+        // The statements outlive this call, so they're parsed from a copy of the source
+        // that they keep alive.
+        let source: Box<str> = with_source_text(py, source, |text| Ok(text.into()))?;
+        // Safety: `text` points into the heap allocation of `source`, which doesn't move
+        // along with `source`, and which is only freed after the statements borrowing
+        // it, since `LazyStatements` declares them first. Errors are converted before
+        // `source` can be dropped.
+        let text: &'static str = unsafe { &*(&*source as *const str) };
+        let mut m =
+            py.allow_threads(|| crate::parse_module_with_config(text, encoding, &config))?;
+        let statements = std::mem::take(&mut m.body).into_iter().map(Some).collect();
+        Ok((
+            m.try_into_py(py)?,
+            LazyStatements {
+                statements,
+                _source: source,
+            },
+        ))
+    }
+
     #[pyfn(m)]
-    fn parse_module(source: String, encoding: Option<&str>) -> PyResult<PyObject> {
-        let m = crate::parse_module(source.as_str(), encoding)?;
-        Python::with_gil(|py| m.try_into_py(py))
+    #[pyo3(signature = (sources, encodings, jobs, python_version=None))]
+    fn parse_modules(
+        py: Python,
+        sources: Vec<&str>,
+        encodings: Vec<Option<String>>,
+        jobs: usize,
+        python_version: Option<(u8, u8)>,
+    ) -> PyResult<Vec<PyObject>> {
+        let inputs: Vec<_> = sources
+            .iter()
+            .zip(encodings.iter())
+            .map(|(source, encoding)| (*source, encoding.as_deref()))
+            .collect();
+        let config = GrammarConfig { python_version };
+        // The `&str`s borrow the UTF-8 data of the `str` objects, which the GIL pool
+        // keeps a reference to until this call returns, so they stay alive even if the
+        // caller's list changes while the GIL is released.
+        let results = py.allow_threads(|| crate::parse_modules(&inputs, &config, jobs));
+        results
+            .into_iter()
+            .map(|result| result?.try_into_py(py))
+            .collect()
     }
 
     #[pyfn(m)]
-    fn parse_expression(source: String) -> PyResult<PyObject> {
-        let expr = crate::parse_expression(source.as_str())?;
-        Python::with_gil(|py| expr.try_into_py(py))
+    #[pyo3(signature = (source, python_version=None))]
+    fn parse_expression(
+        py: Python,
+        source: &str,
+        python_version: Option<(u8, u8)>,
+    ) -> PyResult<PyObject> {
+        let config = GrammarConfig { python_version };
+        let expr = py.allow_threads(|| crate::parse_expression_with_config(source, &config))?;
+        expr.try_into_py(py)
     }
 
     #[pyfn(m)]
-    fn parse_statement(source: String) -> PyResult<PyObject> {
-        let stm = crate::parse_statement(source.as_str())?;
-        Python::with_gil(|py| stm.try_into_py(py))
+    #[pyo3(signature = (source, python_version=None))]
+    fn parse_statement(
+        py: Python,
+        source: &str,
+        python_version: Option<(u8, u8)>,
+    ) -> PyResult<PyObject> {
+        let config = GrammarConfig { python_version };
+        let stm = py.allow_threads(|| crate::parse_statement_with_config(source, &config))?;
+        stm.try_into_py(py)
     }
 
+    m.add_class::<LazyStatements>()?;
     Ok(())
 }
@@ -7,7 +7,7 @@ use proc_macro::TokenStream;
 use quote::{format_ident, quote, quote_spanned, ToTokens};
 use syn::{
     spanned::Spanned, Attribute, Data, DataEnum, DataStruct, DeriveInput, Fields, FieldsNamed,
-    FieldsUnnamed, Type, TypePath, Visibility,
+    FieldsUnnamed, Ident, Type, TypePath, Visibility,
 };
 
 pub(crate) fn impl_into_py(ast: &DeriveInput) -> TokenStream {
@@ -36,15 +36,12 @@ fn impl_into_py_enum(ast: &DeriveInput, e: &DataEnum) -> TokenStream {
                     fieldnames.push(field.ident.as_ref().unwrap());
                 }
                 let kwargs_toks = fields_to_kwargs(&var.fields, true);
+                let node_class_toks = node_class(varname);
                 toks.push(quote! {
                     Self::#varname { #(#fieldnames,)* .. } => {
-                        let libcst = pyo3::types::PyModule::import(py, "libcst")?;
+                        let node_class = #node_class_toks ;
                         let kwargs = #kwargs_toks ;
-                        Ok(libcst
-                            .getattr(stringify!(#varname))
-                            .expect(stringify!(no #varname found in libcst))
-                            .call((), Some(kwargs))?
-                            .into())
+                        node_class.call(py, (), Some(kwargs))
                     }
                 })
             }
@@ -65,7 +62,6 @@ fn impl_into_py_enum(ast: &DeriveInput, e: &DataEnum) -> TokenStream {
     let ident = &ast.ident;
     let generics = &ast.generics;
     let gen = quote! {
-        use pyo3::types::IntoPyDict as _;
         #[automatically_derived]
         impl#generics crate::nodes::traits::py::TryIntoPy<pyo3::PyObject> for #ident #generics {
             fn try_into_py(self, py: pyo3::Python) -> pyo3::PyResult<pyo3::PyObject> {
@@ -81,25 +77,38 @@ fn impl_into_py_enum(ast: &DeriveInput, e: &DataEnum) -> TokenStream {
 fn impl_into_py_struct(ast: &DeriveInput, e: &DataStruct) -> TokenStream {
     let kwargs_toks = fields_to_kwargs(&e.fields, false);
     let ident = &ast.ident;
+    let node_class_toks = node_class(ident);
     let generics = &ast.generics;
     let gen = quote! {
-        use pyo3::types::IntoPyDict as _;
         #[automatically_derived]
         impl#generics crate::nodes::traits::py::TryIntoPy<pyo3::PyObject> for #ident #generics {
             fn try_into_py(self, py: pyo3::Python) -> pyo3::PyResult<pyo3::PyObject> {
-                let libcst = pyo3::types::PyModule::import(py, "libcst")?;
+                let node_class = #node_class_toks ;
                 let kwargs = #kwargs_toks ;
-                Ok(libcst
-                    .getattr(stringify!(#ident))
-                    .expect(stringify!(no #ident found in libcst))
-                    .call((), Some(kwargs))?
-                    .into())
+                node_class.call(py, (), Some(kwargs))
             }
         }
     };
     gen.into()
 }
 
+/// Looks up `libcst.<name>` once and caches it for the lifetime of the interpreter,
+/// instead of going through the import machinery and the module's `__dict__` for
+/// every converted node.
+fn node_class(name: &Ident) -> quote::__private::TokenStream {
+    quote! {
+        {
+            static NODE_CLASS: pyo3::sync::GILOnceCell<pyo3::PyObject> =
+                pyo3::sync::GILOnceCell::new();
+            NODE_CLASS.get_or_try_init(py, || -> pyo3::PyResult<pyo3::PyObject> {
+                Ok(pyo3::types::PyModule::import(py, "libcst")?
+                    .getattr(stringify!(#name))?
+                    .into())
+            })?
+        }
+    }
+}
+
 fn fields_to_kwargs(fields: &Fields, is_enum: bool) -> quote::__private::TokenStream {
     let mut empty_kwargs = false;
     let mut py_varnames = vec![];
@@ -155,22 +164,30 @@ fn fields_to_kwargs(fields: &Fields, is_enum: bool) -> quote::__private::TokenSt
             empty_kwargs = true;
         }
     };
-    let kwargs_pairs = quote! {
-        #(Some((stringify!(#py_varnames), #rust_varnames.try_into_py(py)?)),)*
-    };
-    let optional_pairs = quote! {
-        #(#optional_rust_varnames.map(|x| x.try_into_py(py)).transpose()?.map(|x| (stringify!(#optional_py_varnames), x)),)*
-    };
     if empty_kwargs {
         quote! { pyo3::types::PyDict::new(py) }
     } else {
+        // Fill the dict in place, with interned keys, rather than collecting optional
+        // pairs into an intermediate Vec first.
         quote! {
-            [ #kwargs_pairs #optional_pairs ]
-                .iter()
-                .filter(|x| x.is_some())
-                .map(|x| x.as_ref().unwrap())
-                .collect::<Vec<_>>()
-                .into_py_dict(py)
+            {
+                let kwargs = pyo3::types::PyDict::new(py);
+                #(
+                    kwargs.set_item(
+                        pyo3::intern!(py, stringify!(#py_varnames)),
+                        #rust_varnames.try_into_py(py)?,
+                    )?;
+                )*
+                #(
+                    if let Some(x) = #optional_rust_varnames {
+                        kwargs.set_item(
+                            pyo3::intern!(py, stringify!(#optional_py_varnames)),
+                            x.try_into_py(py)?,
+                        )?;
+                    }
+                )*
+                kwargs
+            }
         }
     }
 }
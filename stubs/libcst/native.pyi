@@ -3,9 +3,33 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Optional
+from mmap import mmap
+from typing import List, Optional, Sequence, Tuple, Union
 import libcst
 
-def parse_module(source: str, encoding: Optional[str]) -> libcst.Module: ...
-def parse_expression(source: str) -> libcst.BaseExpression: ...
-def parse_statement(source: str) -> libcst.BaseStatement: ...
+def parse_module(
+    source: Union[str, bytes, memoryview, mmap],
+    encoding: Optional[str] = None,
+    python_version: Optional[Tuple[int, int]] = None,
+) -> libcst.Module: ...
+class LazyStatements:
+    def __len__(self) -> int: ...
+    def take(self, index: int) -> libcst.BaseStatement: ...
+
+def parse_module_lazily(
+    source: Union[str, bytes, memoryview, mmap],
+    encoding: Optional[str] = None,
+    python_version: Optional[Tuple[int, int]] = None,
+) -> Tuple[libcst.Module, LazyStatements]: ...
+def parse_modules(
+    sources: Sequence[str],
+    encodings: Sequence[Optional[str]],
+    jobs: int,
+    python_version: Optional[Tuple[int, int]] = None,
+) -> List[libcst.Module]: ...
+def parse_expression(
+    source: str, python_version: Optional[Tuple[int, int]] = None
+) -> libcst.BaseExpression: ...
+def parse_statement(
+    source: str, python_version: Optional[Tuple[int, int]] = None
+) -> libcst.BaseStatement: ...